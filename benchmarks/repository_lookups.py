@@ -0,0 +1,78 @@
+# benchmarks/repository_lookups.py
+"""
+Micro-benchmark de las búsquedas más frecuentes de los repositorios: cadena db.query(...)
+construida en cada llamada frente a las sentencias pre-construidas con parámetros ligados.
+
+Usa la base de datos de DATABASE_URL (solo lectura). Ejecutar desde la raíz del proyecto:
+
+    python -m benchmarks.repository_lookups [--calls 2000]
+"""
+import argparse
+import time
+
+from src.infrastructure.database import SessionLocal
+from src.models.cattle import Cattle
+from src.models.health_event import HealthEvent
+from src.repositories import CattleRepository, HealthEventRepository
+from src.repositories.cattle_repository import _BY_LOTE
+
+
+def per_call_us(fn, calls: int) -> float:
+    for _ in range(min(calls, 100)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        cattle = db.query(Cattle).order_by(Cattle.lote).first()
+        if cattle is None:
+            raise SystemExit("La base de datos no tiene ganado; ejecute src/seed_db.py primero")
+        lote, cattle_id = cattle.lote, cattle.id
+        cattle_repo = CattleRepository(db)
+        health_repo = HealthEventRepository(db)
+
+        cases = [
+            (
+                "get_by_lote",
+                lambda: db.query(Cattle).filter(Cattle.lote == lote).first(),
+                lambda: cattle_repo.get_by_lote(lote)
+            ),
+            (
+                "get_by_id",
+                lambda: db.query(Cattle).filter(Cattle.id == cattle_id).first(),
+                lambda: cattle_repo.get_by_id(cattle_id)
+            ),
+            (
+                "health get_by_cattle_id",
+                lambda: db.query(HealthEvent).filter(HealthEvent.cattle_id == cattle_id).offset(0).limit(100).all(),
+                lambda: health_repo.get_by_cattle_id(cattle_id)
+            ),
+        ]
+        # Solo el trabajo de Python antes del driver: construir la sentencia y su clave de caché
+        build_cases = [
+            (
+                "build + cache key",
+                lambda: db.query(Cattle).filter(Cattle.lote == lote).statement._generate_cache_key(),
+                lambda: _BY_LOTE._generate_cache_key()
+            ),
+        ]
+
+        print(f"{'consulta':<26}{'db.query (µs)':>15}{'pre-construida (µs)':>22}{'mejora':>9}")
+        for name, before, after in cases + build_cases:
+            old, new = per_call_us(before, args.calls), per_call_us(after, args.calls)
+            print(f"{name:<26}{old:>15.1f}{new:>22.1f}{old / new:>8.1f}x")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/tool_rendering.py
+"""
+Micro-benchmark del formato de las respuestas de las herramientas: concatenación con
+`result += ...` y date.today() por fila (formato anterior) frente a las plantillas de
+src/services/tools/render.py, en modo normal y compacto. No usa la base de datos.
+
+    python -m benchmarks.tool_rendering [--sizes 50 500 5000]
+"""
+import argparse
+import timeit
+import uuid
+from datetime import date, timedelta
+
+from src.models.health_event import EventTypeEnum
+from src.repositories.read_models import HealthEventRow, ReminderRow
+from src.services.tools import render
+from src.services.tools.health_tools import HEALTH_EVENT
+from src.services.tools.reminder_tools import PENDING_REMINDER
+
+
+def concat_health_history(events) -> str:
+    result = "Historial de salud:\n\n"
+    for event in events:
+        result += f"📅 {event.application_date} - {event.event_type.value.upper()}\n"
+        if event.disease_name:
+            result += f"   Enfermedad: {event.disease_name}\n"
+        if event.medicine_name:
+            result += f"   Medicamento: {event.medicine_name}\n"
+        if event.dosage:
+            result += f"   Dosis: {event.dosage}\n"
+        if event.next_dose_date:
+            result += f"   Próxima dosis: {event.next_dose_date}\n"
+        if event.veterinarian_name:
+            result += f"   Veterinario: {event.veterinarian_name}\n"
+        if event.notes:
+            result += f"   Notas: {event.notes}\n"
+        result += "\n"
+    return result
+
+
+def concat_pending_reminders(reminders) -> str:
+    result = "Recordatorios pendientes:\n\n"
+    for reminder in reminders:
+        days_until = (reminder.reminder_date - date.today()).days
+        status_text = "⚠️ VENCIDO" if days_until < 0 else f"en {days_until} días"
+        result += f"📋 {reminder.title}\n"
+        result += f"   Fecha: {reminder.reminder_date} ({status_text})\n"
+        result += f"   Tipo: {reminder.reminder_type}\n"
+        if reminder.description:
+            result += f"   Descripción: {reminder.description}\n"
+        result += "\n"
+    return result
+
+
+def health_rows(count: int):
+    start = date.today() - timedelta(days=count)
+    return [
+        HealthEventRow(
+            uuid.uuid4(), uuid.uuid4(), EventTypeEnum.vaccine, "Fiebre Aftosa", "Aftovacuna",
+            start + timedelta(days=i), start + timedelta(days=i + 180), "2ml", "Dr. García",
+            "Vacunación de rutina" if i % 2 else None
+        )
+        for i in range(count)
+    ]
+
+
+def reminder_rows(count: int):
+    start = date.today() - timedelta(days=count // 2)
+    return [
+        ReminderRow(
+            uuid.uuid4(), None, f"Vacuna de refuerzo {i}", "Aplicar segunda dosis" if i % 3 else None,
+            start + timedelta(days=i), "vaccine", "pending"
+        )
+        for i in range(count)
+    ]
+
+
+def per_call_ms(fn, repeat: int) -> float:
+    """Mejor de 5 tandas, para que el ruido de la máquina no decida la comparación"""
+    return min(timeit.repeat(fn, number=repeat, repeat=5)) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    args = parser.parse_args()
+
+    print(f"{'formato':<22}{'filas':>7}{'+= (ms)':>10}{'plantilla (ms)':>16}{'compacto (ms)':>15}{'bytes':>9}{'compacto':>10}")
+    for size in args.sizes:
+        repeat = max(3, 20000 // size)
+        cases = [
+            ("historial de salud", health_rows(size), concat_health_history, HEALTH_EVENT),
+            ("recordatorios", reminder_rows(size), concat_pending_reminders, PENDING_REMINDER),
+        ]
+        for name, rows, concat, template in cases:
+            with render.request_scope(compact=False):
+                old = per_call_ms(lambda: concat(rows), repeat)
+                new = per_call_ms(lambda: render.render_rows(template, rows, name), repeat)
+                full_size = len(render.render_rows(template, rows, name).encode())
+            with render.request_scope(compact=True):
+                compact = per_call_ms(lambda: render.render_rows(template, rows, name), repeat)
+                compact_size = len(render.render_rows(template, rows, name).encode())
+            print(f"{name:<22}{size:>7}{old:>10.2f}{new:>16.2f}{compact:>15.2f}{full_size:>9}{compact_size:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# src/api/errors.py
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
+
+from src.repositories.pagination import InvalidCursorError
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Traduce errores comunes de la capa de datos a respuestas HTTP"""
+
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+        return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+    @app.exception_handler(IntegrityError)
+    async def integrity_error_handler(request: Request, exc: IntegrityError):
+        # La sesión se revierte al cerrarse en get_db, ningún registro del lote queda guardado
+        return JSONResponse(
+            status_code=409,
+            content={"detail": f"Conflicto de integridad: {exc.orig}"}
+        )
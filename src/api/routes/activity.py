@@ -0,0 +1,20 @@
+# src/api/routes/activity.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.schemas.activity import ActivityBatchRequest, ActivityBatchResponse
+from src.services.activity_service import ActivityService
+
+
+router = APIRouter(prefix="/activity", tags=["Actividad"])
+
+
+@router.post("/batch", response_model=ActivityBatchResponse)
+def ingest_activity(payload: ActivityBatchRequest, db: Session = Depends(get_db)):
+    """
+    Carga lecturas de los collares de actividad (podómetros). Se agregan en intervalos de 2 horas
+    y se analizan por animal; los celos detectados se registran como eventos de celo.
+    Los lotes desconocidos se omiten y se informan.
+    """
+    return ActivityService(db).ingest(payload.readings)
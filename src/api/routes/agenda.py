@@ -0,0 +1,46 @@
+# src/api/routes/agenda.py
+from datetime import date, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.schemas.agenda import AgendaItemTypeEnum, AgendaResponse
+from src.services.agenda_service import AgendaService
+
+
+router = APIRouter(prefix="/agenda", tags=["Agenda"])
+
+
+@router.get("/", response_model=AgendaResponse)
+def get_agenda(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    days: int = Query(7, ge=0, le=366),
+    item_type: Optional[List[AgendaItemTypeEnum]] = Query(None),
+    lote: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Agenda del rancho ordenada por fecha: recordatorios pendientes, próximas dosis,
+    chequeos de preñez, celos esperados y partos previstos.
+    Sin fechas devuelve los próximos `days` días desde hoy.
+    """
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=days)
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date no puede ser anterior a start_date")
+
+    items = AgendaService(db).get_agenda(
+        start_date=start_date,
+        end_date=end_date,
+        item_types=item_type,
+        lotes=lote
+    )
+    return AgendaResponse(
+        start_date=start_date,
+        end_date=end_date,
+        total=len(items),
+        items=items
+    )
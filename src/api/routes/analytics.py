@@ -0,0 +1,45 @@
+# src/api/routes/analytics.py
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.models.cattle import GenderEnum
+from src.repositories import DemographicsRepository
+from src.schemas.demographics import HerdDemographics
+from src.schemas.reproduction import KpiPeriodEnum, ReproductiveKPIs
+from src.services.analytics_service import AnalyticsService
+
+
+router = APIRouter(prefix="/analytics", tags=["Analítica"])
+
+
+@router.get("/reproduction", response_model=ReproductiveKPIs)
+def get_reproductive_kpis(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    breed: Optional[str] = None,
+    period: KpiPeriodEnum = KpiPeriodEnum.month,
+    db: Session = Depends(get_db)
+):
+    """
+    Indicadores reproductivos: intervalo entre partos, días abiertos, servicios por concepción,
+    tasa de concepción (total, por raza y por periodo) y tasa de detección de celos.
+    """
+    if start_date and end_date and end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date no puede ser anterior a start_date")
+    return AnalyticsService(db).reproductive_kpis(start_date, end_date, breed, period)
+
+
+@router.get("/demographics", response_model=HerdDemographics)
+def get_herd_demographics(
+    breed: Optional[str] = None,
+    gender: Optional[GenderEnum] = None,
+    min_age_years: Optional[int] = Query(None, ge=0),
+    max_age_years: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Conteos, rangos de edad y estadísticas de peso (media, mediana, percentiles) por raza y género"""
+    return DemographicsRepository(db).get_demographics(breed, gender, min_age_years, max_age_years)
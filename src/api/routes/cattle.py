@@ -0,0 +1,122 @@
+# src/api/routes/cattle.py
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import CattleRepository, SnapshotRepository, UnitOfWork
+from src.schemas.cattle import (
+    GenderEnum,
+    CattleCreate,
+    CattleUpdate,
+    CattleBatchUpdate,
+    CattleResponse,
+    CattleListResponse
+)
+from src.schemas.batch import BatchDeleteRequest, BatchDeleteResponse
+from src.schemas.snapshot import AnimalSnapshot
+
+
+router = APIRouter(prefix="/cattle", tags=["Ganado"])
+
+
+@router.get("/", response_model=CattleListResponse)
+def list_cattle(
+    gender: Optional[GenderEnum] = None,
+    breed: Optional[str] = None,
+    name: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """Lista el ganado ordenado por lote. Usa `next_cursor` para pedir la siguiente página"""
+    items, total, next_cursor = CattleRepository(db).list_page(
+        gender=gender, breed=breed, name=name, cursor=cursor, limit=limit
+    )
+    return CattleListResponse(total=total, cattle=items, next_cursor=next_cursor)
+
+
+@router.post("/", response_model=CattleResponse, status_code=201)
+def create_cattle(cattle: CattleCreate, db: Session = Depends(get_db)):
+    """Registra un nuevo animal"""
+    repo = CattleRepository(db)
+    if repo.exists_lote(cattle.lote):
+        raise HTTPException(status_code=409, detail=f"Ya existe un ganado con el lote '{cattle.lote}'")
+    return repo.create(cattle)
+
+
+@router.post("/batch", response_model=List[CattleResponse], status_code=201)
+def create_cattle_batch(items: List[CattleCreate], db: Session = Depends(get_db)):
+    """Registra varios animales en una sola transacción (todos o ninguno)"""
+    lotes = [item.lote for item in items]
+    duplicated = {lote for lote in lotes if lotes.count(lote) > 1}
+    duplicated.update(CattleRepository(db).get_existing_lotes(lotes))
+    if duplicated:
+        raise HTTPException(status_code=409, detail=f"Lotes duplicados o ya registrados: {sorted(duplicated)}")
+    with UnitOfWork(db) as uow:
+        return uow.cattle.create_many(items)
+
+
+@router.patch("/batch", response_model=List[CattleResponse])
+def update_cattle_batch(items: List[CattleBatchUpdate], db: Session = Depends(get_db)):
+    """Actualiza varios animales en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        updated = uow.cattle.update_many(items)
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Uno o más IDs de ganado no existen")
+    return updated
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+def delete_cattle_batch(request: BatchDeleteRequest, db: Session = Depends(get_db)):
+    """Elimina varios animales (y sus eventos) en una sola sentencia"""
+    return BatchDeleteResponse(deleted=CattleRepository(db).delete_many(request.ids))
+
+
+@router.get("/lote/{lote}", response_model=CattleResponse)
+def get_cattle_by_lote(lote: str, db: Session = Depends(get_db)):
+    """Obtiene un animal por su lote"""
+    cattle = CattleRepository(db).get_by_lote(lote)
+    if not cattle:
+        raise HTTPException(status_code=404, detail=f"No se encontró ganado con el lote '{lote}'")
+    return cattle
+
+
+@router.get("/lote/{lote}/snapshot", response_model=AnimalSnapshot)
+def get_cattle_snapshot(lote: str, db: Session = Depends(get_db)):
+    """Ficha completa del animal (vacunas, dosis, reproducción y recordatorios pendientes) en una sola consulta"""
+    snapshot = SnapshotRepository(db).get_by_lote(lote)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail=f"No se encontró ganado con el lote '{lote}'")
+    return snapshot
+
+
+@router.get("/{cattle_id}", response_model=CattleResponse)
+def get_cattle(cattle_id: UUID, db: Session = Depends(get_db)):
+    """Obtiene un animal por su ID"""
+    cattle = CattleRepository(db).get_by_id(cattle_id)
+    if not cattle:
+        raise HTTPException(status_code=404, detail="Ganado no encontrado")
+    return cattle
+
+
+@router.patch("/{cattle_id}", response_model=CattleResponse)
+def update_cattle(cattle_id: UUID, cattle: CattleUpdate, db: Session = Depends(get_db)):
+    """Actualiza los datos de un animal"""
+    repo = CattleRepository(db)
+    if cattle.lote and repo.exists_lote(cattle.lote, exclude_id=cattle_id):
+        raise HTTPException(status_code=409, detail=f"Ya existe un ganado con el lote '{cattle.lote}'")
+    updated = repo.update(cattle_id, cattle)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Ganado no encontrado")
+    return updated
+
+
+@router.delete("/{cattle_id}", status_code=204)
+def delete_cattle(cattle_id: UUID, db: Session = Depends(get_db)):
+    """Elimina un animal y sus eventos"""
+    if not CattleRepository(db).delete(cattle_id):
+        raise HTTPException(status_code=404, detail="Ganado no encontrado")
+    return Response(status_code=204)
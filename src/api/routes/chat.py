@@ -2,10 +2,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 from src.infrastructure.database import get_db
 from src.services.agent_service import AgentService
+from src.services.tool_usage import tool_usage
 
 
 router = APIRouter(prefix="/chat", tags=["Chat Agent"])
@@ -19,6 +20,19 @@ class ChatResponse(BaseModel):
     response: str
     tool_used: Optional[str] = None
     tool_result: Optional[str] = None
+    # Tokens estimados de la respuesta de la herramienta enviada al modelo
+    tool_tokens: Optional[int] = None
+
+
+class ToolUsageResponse(BaseModel):
+    tool: str
+    calls: int
+    tokens_total: int
+    tokens_max: int
+    trimmed_calls: int
+    rows_total: int
+    rows_sent: int
+    prompt_tokens_total: int
 
 
 @router.post("/", response_model=ChatResponse)
@@ -42,10 +56,17 @@ async def chat(request: ChatRequest, db: Session = Depends(get_db)):
     return ChatResponse(
         response=result["response"],
         tool_used=result.get("tool_used"),
-        tool_result=result.get("tool_result")
+        tool_result=result.get("tool_result"),
+        tool_tokens=result.get("tool_tokens")
     )
 
 
+@router.get("/tool-usage", response_model=List[ToolUsageResponse])
+def get_tool_usage():
+    """Tokens enviados al modelo por cada herramienta desde que arrancó la API, las más costosas primero"""
+    return [ToolUsageResponse(**usage._asdict()) for usage in tool_usage.snapshot()]
+
+
 @router.get("/health")
 def health_check():
     """Verifica que el servicio de chat esté funcionando"""
@@ -0,0 +1,27 @@
+# src/api/routes/dashboard.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import HerdSummaryRepository
+from src.schemas.dashboard import HerdSummary
+
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("/summary", response_model=HerdSummary)
+def get_herd_summary(db: Session = Depends(get_db)):
+    """
+    Resumen del rancho: ganado por género y raza, preñadas, recordatorios pendientes
+    y vencidos, y dosis de los próximos 7 y 30 días. Se lee de contadores precalculados.
+    """
+    return HerdSummaryRepository(db).get_summary()
+
+
+@router.post("/summary/rebuild", response_model=HerdSummary)
+def rebuild_herd_summary(db: Session = Depends(get_db)):
+    """Recalcula los contadores desde cero (solo necesario si se modificaron datos saltándose los triggers)"""
+    repo = HerdSummaryRepository(db)
+    repo.rebuild()
+    return repo.get_summary()
@@ -0,0 +1,86 @@
+# src/api/routes/export.py
+from datetime import date
+from typing import Callable, Iterator, List, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import SessionLocal
+from src.models.health_event import EventTypeEnum
+from src.repositories import HealthEventRepository, HeatEventRepository
+from src.services.export_service import ExportFormat, MEDIA_TYPES, serialize
+
+
+router = APIRouter(prefix="/export", tags=["Exportación"])
+
+
+def _stream_export(query: Callable[[Session], Result], export_format: ExportFormat) -> Iterator[str]:
+    """
+    Abre su propia sesión para que siga viva mientras se envía la respuesta.
+    La sesión de `get_db` se cierra antes de que StreamingResponse termine de iterar.
+    """
+    db = SessionLocal()
+    try:
+        result = query(db)
+        yield from serialize(result, list(result.keys()), export_format)
+    finally:
+        db.close()
+
+
+def _streaming_response(name: str, query: Callable[[Session], Result], export_format: ExportFormat) -> StreamingResponse:
+    filename = f"{name}.{export_format.value}"
+    return StreamingResponse(
+        _stream_export(query, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/health-events")
+def export_health_events(
+    format: ExportFormat = ExportFormat.csv,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    lote: Optional[List[str]] = Query(None),
+    event_type: Optional[EventTypeEnum] = None
+):
+    """
+    Exporta el historial completo de eventos de salud en CSV o NDJSON.
+    Se puede filtrar por rango de fechas de aplicación, uno o varios lotes y tipo de evento.
+    """
+    return _streaming_response(
+        "health_events",
+        lambda db: HealthEventRepository(db).stream_for_export(
+            start_date=start_date,
+            end_date=end_date,
+            lotes=lote,
+            event_type=event_type
+        ),
+        format
+    )
+
+
+@router.get("/heat-events")
+def export_heat_events(
+    format: ExportFormat = ExportFormat.csv,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    lote: Optional[List[str]] = Query(None),
+    was_inseminated: Optional[bool] = None
+):
+    """
+    Exporta el historial completo de eventos de celo en CSV o NDJSON.
+    Se puede filtrar por rango de fechas de celo, uno o varios lotes y si hubo inseminación.
+    """
+    return _streaming_response(
+        "heat_events",
+        lambda db: HeatEventRepository(db).stream_for_export(
+            start_date=start_date,
+            end_date=end_date,
+            lotes=lote,
+            was_inseminated=was_inseminated
+        ),
+        format
+    )
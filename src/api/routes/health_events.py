@@ -0,0 +1,99 @@
+# src/api/routes/health_events.py
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import HealthEventRepository, UnitOfWork
+from src.schemas.health_event import (
+    EventTypeEnum,
+    HealthEventCreate,
+    HealthEventUpdate,
+    HealthEventBatchUpdate,
+    HealthEventResponse,
+    HealthEventListResponse
+)
+from src.schemas.batch import BatchDeleteRequest, BatchDeleteResponse
+
+
+router = APIRouter(prefix="/health-events", tags=["Eventos de salud"])
+
+
+@router.get("/", response_model=HealthEventListResponse)
+def list_health_events(
+    cattle_id: Optional[UUID] = None,
+    event_type: Optional[EventTypeEnum] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """Lista eventos de salud, los más recientes primero. Usa `next_cursor` para la siguiente página"""
+    items, total, next_cursor = HealthEventRepository(db).list_page(
+        cattle_id=cattle_id,
+        event_type=event_type,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        limit=limit
+    )
+    return HealthEventListResponse(total=total, events=items, next_cursor=next_cursor)
+
+
+@router.post("/", response_model=HealthEventResponse, status_code=201)
+def create_health_event(event: HealthEventCreate, db: Session = Depends(get_db)):
+    """Registra un evento de salud"""
+    return HealthEventRepository(db).create(event)
+
+
+@router.post("/batch", response_model=List[HealthEventResponse], status_code=201)
+def create_health_events_batch(items: List[HealthEventCreate], db: Session = Depends(get_db)):
+    """Registra varios eventos de salud en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        return uow.health_events.create_many(items)
+
+
+@router.patch("/batch", response_model=List[HealthEventResponse])
+def update_health_events_batch(items: List[HealthEventBatchUpdate], db: Session = Depends(get_db)):
+    """Actualiza varios eventos de salud en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        updated = uow.health_events.update_many(items)
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Uno o más IDs de eventos de salud no existen")
+    return updated
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+def delete_health_events_batch(request: BatchDeleteRequest, db: Session = Depends(get_db)):
+    """Elimina varios eventos de salud en una sola sentencia"""
+    return BatchDeleteResponse(deleted=HealthEventRepository(db).delete_many(request.ids))
+
+
+@router.get("/{event_id}", response_model=HealthEventResponse)
+def get_health_event(event_id: UUID, db: Session = Depends(get_db)):
+    """Obtiene un evento de salud por su ID"""
+    event = HealthEventRepository(db).get_by_id(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Evento de salud no encontrado")
+    return event
+
+
+@router.patch("/{event_id}", response_model=HealthEventResponse)
+def update_health_event(event_id: UUID, event: HealthEventUpdate, db: Session = Depends(get_db)):
+    """Actualiza un evento de salud"""
+    updated = HealthEventRepository(db).update(event_id, event)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Evento de salud no encontrado")
+    return updated
+
+
+@router.delete("/{event_id}", status_code=204)
+def delete_health_event(event_id: UUID, db: Session = Depends(get_db)):
+    """Elimina un evento de salud"""
+    if not HealthEventRepository(db).delete(event_id):
+        raise HTTPException(status_code=404, detail="Evento de salud no encontrado")
+    return Response(status_code=204)
@@ -0,0 +1,100 @@
+# src/api/routes/heat_events.py
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import HeatEventRepository, UnitOfWork
+from src.schemas.heat_event import (
+    HeatEventCreate,
+    HeatEventUpdate,
+    HeatEventBatchUpdate,
+    HeatEventResponse,
+    HeatEventListResponse
+)
+from src.schemas.batch import BatchDeleteRequest, BatchDeleteResponse
+
+
+router = APIRouter(prefix="/heat-events", tags=["Eventos de celo"])
+
+
+@router.get("/", response_model=HeatEventListResponse)
+def list_heat_events(
+    cattle_id: Optional[UUID] = None,
+    was_inseminated: Optional[bool] = None,
+    pregnancy_confirmed: Optional[bool] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """Lista eventos de celo, los más recientes primero. Usa `next_cursor` para la siguiente página"""
+    items, total, next_cursor = HeatEventRepository(db).list_page(
+        cattle_id=cattle_id,
+        was_inseminated=was_inseminated,
+        pregnancy_confirmed=pregnancy_confirmed,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        limit=limit
+    )
+    return HeatEventListResponse(total=total, events=items, next_cursor=next_cursor)
+
+
+@router.post("/", response_model=HeatEventResponse, status_code=201)
+def create_heat_event(event: HeatEventCreate, db: Session = Depends(get_db)):
+    """Registra un evento de celo"""
+    return HeatEventRepository(db).create(event)
+
+
+@router.post("/batch", response_model=List[HeatEventResponse], status_code=201)
+def create_heat_events_batch(items: List[HeatEventCreate], db: Session = Depends(get_db)):
+    """Registra varios eventos de celo en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        return uow.heat_events.create_many(items)
+
+
+@router.patch("/batch", response_model=List[HeatEventResponse])
+def update_heat_events_batch(items: List[HeatEventBatchUpdate], db: Session = Depends(get_db)):
+    """Actualiza varios eventos de celo en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        updated = uow.heat_events.update_many(items)
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Uno o más IDs de eventos de celo no existen")
+    return updated
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+def delete_heat_events_batch(request: BatchDeleteRequest, db: Session = Depends(get_db)):
+    """Elimina varios eventos de celo en una sola sentencia"""
+    return BatchDeleteResponse(deleted=HeatEventRepository(db).delete_many(request.ids))
+
+
+@router.get("/{event_id}", response_model=HeatEventResponse)
+def get_heat_event(event_id: UUID, db: Session = Depends(get_db)):
+    """Obtiene un evento de celo por su ID"""
+    event = HeatEventRepository(db).get_by_id(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Evento de celo no encontrado")
+    return event
+
+
+@router.patch("/{event_id}", response_model=HeatEventResponse)
+def update_heat_event(event_id: UUID, event: HeatEventUpdate, db: Session = Depends(get_db)):
+    """Actualiza un evento de celo"""
+    updated = HeatEventRepository(db).update(event_id, event)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Evento de celo no encontrado")
+    return updated
+
+
+@router.delete("/{event_id}", status_code=204)
+def delete_heat_event(event_id: UUID, db: Session = Depends(get_db)):
+    """Elimina un evento de celo"""
+    if not HeatEventRepository(db).delete(event_id):
+        raise HTTPException(status_code=404, detail="Evento de celo no encontrado")
+    return Response(status_code=204)
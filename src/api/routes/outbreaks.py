@@ -0,0 +1,29 @@
+# src/api/routes/outbreaks.py
+from datetime import date, timedelta
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import OutbreakRepository
+from src.schemas.outbreak import OutbreakAlertResponse, OutbreakStatus
+from src.services.outbreak_service import OutbreakService
+
+
+router = APIRouter(prefix="/outbreaks", tags=["Brotes"])
+
+
+@router.get("/", response_model=OutbreakStatus)
+def get_outbreak_status(db: Session = Depends(get_db)):
+    """
+    Enfermedades y lesiones con casos en la ventana configurada (OUTBREAK_WINDOW_DAYS),
+    por raza y grupo de edad. `outbreaks` son las que superan el umbral; `watch`, las que tienen varios casos.
+    """
+    return OutbreakService(db).status()
+
+
+@router.get("/alerts", response_model=List[OutbreakAlertResponse])
+def get_outbreak_alerts(days: int = Query(30, ge=1, le=365), db: Session = Depends(get_db)):
+    """Alertas de brote emitidas en los últimos `days` días"""
+    return OutbreakRepository(db).get_alerts(date.today() - timedelta(days=days))
@@ -0,0 +1,81 @@
+# src/api/routes/protocols.py
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import ProtocolRepository
+from src.schemas.vaccination_protocol import (
+    ProtocolPlanResponse,
+    VaccinationProtocolCreate,
+    VaccinationProtocolResponse,
+    VaccinationProtocolUpdate
+)
+
+
+router = APIRouter(prefix="/protocols", tags=["Protocolos de vacunación"])
+
+
+@router.post("/", response_model=VaccinationProtocolResponse, status_code=201)
+def create_protocol(data: VaccinationProtocolCreate, db: Session = Depends(get_db)):
+    """Crea un protocolo de vacunación"""
+    repo = ProtocolRepository(db)
+    if repo.exists_name(data.name):
+        raise HTTPException(status_code=400, detail=f"Ya existe un protocolo con el nombre '{data.name}'")
+    return repo.create(data)
+
+
+@router.get("/", response_model=List[VaccinationProtocolResponse])
+def list_protocols(db: Session = Depends(get_db)):
+    """Lista los protocolos de vacunación"""
+    return ProtocolRepository(db).get_all()
+
+
+@router.post("/plan", response_model=ProtocolPlanResponse)
+def plan_vaccinations(
+    dry_run: bool = True,
+    horizon_days: int = Query(30, ge=0, le=365),
+    protocol_id: Optional[List[UUID]] = Query(None),
+    limit: int = Query(200, ge=1, le=1000),
+    db: Session = Depends(get_db)
+):
+    """
+    Calcula la próxima dosis de cada protocolo activo para todo el rebaño hasta `horizon_days`.
+    Con `dry_run=true` (por defecto) solo devuelve la vista previa; con `dry_run=false` crea los
+    recordatorios de vacuna y cierra los pendientes cuya dosis ya se aplicó. Repetirlo no duplica.
+    """
+    repo = ProtocolRepository(db)
+    if dry_run:
+        return repo.preview_plan(horizon_days=horizon_days, protocol_ids=protocol_id, limit=limit)
+    return repo.apply_plan(horizon_days=horizon_days, protocol_ids=protocol_id)
+
+
+@router.get("/{protocol_id}", response_model=VaccinationProtocolResponse)
+def get_protocol(protocol_id: UUID, db: Session = Depends(get_db)):
+    """Obtiene un protocolo por su ID"""
+    protocol = ProtocolRepository(db).get_by_id(protocol_id)
+    if not protocol:
+        raise HTTPException(status_code=404, detail="Protocolo no encontrado")
+    return protocol
+
+
+@router.put("/{protocol_id}", response_model=VaccinationProtocolResponse)
+def update_protocol(protocol_id: UUID, data: VaccinationProtocolUpdate, db: Session = Depends(get_db)):
+    """Actualiza un protocolo; los recordatorios ya creados no se modifican"""
+    repo = ProtocolRepository(db)
+    if data.name and repo.exists_name(data.name, exclude_id=protocol_id):
+        raise HTTPException(status_code=400, detail=f"Ya existe un protocolo con el nombre '{data.name}'")
+    protocol = repo.update(protocol_id, data)
+    if not protocol:
+        raise HTTPException(status_code=404, detail="Protocolo no encontrado")
+    return protocol
+
+
+@router.delete("/{protocol_id}", status_code=204)
+def delete_protocol(protocol_id: UUID, db: Session = Depends(get_db)):
+    """Elimina un protocolo; sus recordatorios quedan como recordatorios normales"""
+    if not ProtocolRepository(db).delete(protocol_id):
+        raise HTTPException(status_code=404, detail="Protocolo no encontrado")
+    return Response(status_code=204)
@@ -0,0 +1,188 @@
+# src/api/routes/reminders.py
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import ReminderRepository, UnitOfWork
+from src.schemas.reminder import (
+    ReminderTypeEnum,
+    ReminderStatusEnum,
+    ReminderCreate,
+    ReminderUpdate,
+    ReminderBatchUpdate,
+    ReminderResponse,
+    ReminderOccurrenceResponse,
+    ReminderListResponse,
+    ReminderBulkFilter,
+    ReminderRescheduleRequest,
+    ReminderBulkResponse
+)
+from src.schemas.batch import BatchDeleteRequest, BatchDeleteResponse
+
+
+router = APIRouter(prefix="/reminders", tags=["Recordatorios"])
+
+
+@router.get("/", response_model=ReminderListResponse)
+def list_reminders(
+    cattle_id: Optional[UUID] = None,
+    status: Optional[ReminderStatusEnum] = None,
+    reminder_type: Optional[ReminderTypeEnum] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """Lista recordatorios ordenados por fecha. Usa `next_cursor` para la siguiente página"""
+    items, total, next_cursor = ReminderRepository(db).list_page(
+        cattle_id=cattle_id,
+        status=status,
+        reminder_type=reminder_type,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        limit=limit
+    )
+    return ReminderListResponse(total=total, reminders=items, next_cursor=next_cursor)
+
+
+@router.get("/upcoming", response_model=List[ReminderOccurrenceResponse])
+def get_upcoming_reminders(
+    days: int = Query(7, ge=0, le=365),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """Pendientes de los próximos `days` días, con las ocurrencias de los recordatorios recurrentes"""
+    return ReminderRepository(db).get_upcoming(days=days, limit=limit)
+
+
+@router.get("/overdue", response_model=List[ReminderOccurrenceResponse])
+def get_overdue_reminders(limit: int = Query(100, ge=1, le=500), db: Session = Depends(get_db)):
+    """Pendientes vencidos, incluidas las ocurrencias pasadas sin completar de los recordatorios recurrentes"""
+    return ReminderRepository(db).get_overdue(limit=limit)
+
+
+@router.post("/", response_model=ReminderResponse, status_code=201)
+def create_reminder(reminder: ReminderCreate, db: Session = Depends(get_db)):
+    """Crea un recordatorio"""
+    return ReminderRepository(db).create(reminder)
+
+
+@router.post("/batch", response_model=List[ReminderResponse], status_code=201)
+def create_reminders_batch(items: List[ReminderCreate], db: Session = Depends(get_db)):
+    """Crea varios recordatorios en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        return uow.reminders.create_many(items)
+
+
+@router.patch("/batch", response_model=List[ReminderResponse])
+def update_reminders_batch(items: List[ReminderBatchUpdate], db: Session = Depends(get_db)):
+    """Actualiza varios recordatorios en una sola transacción (todos o ninguno)"""
+    with UnitOfWork(db) as uow:
+        updated = uow.reminders.update_many(items)
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Uno o más IDs de recordatorios no existen")
+    return updated
+
+
+@router.post("/batch/delete", response_model=BatchDeleteResponse)
+def delete_reminders_batch(request: BatchDeleteRequest, db: Session = Depends(get_db)):
+    """Elimina varios recordatorios en una sola sentencia"""
+    return BatchDeleteResponse(deleted=ReminderRepository(db).delete_many(request.ids))
+
+
+@router.post("/bulk/complete", response_model=ReminderBulkResponse)
+def complete_reminders_bulk(request: ReminderBulkFilter, db: Session = Depends(get_db)):
+    """Completa los recordatorios pendientes que cumplan el filtro y las ocurrencias de las series en sus fechas"""
+    return ReminderRepository(db).complete_many(
+        request.reminder_type, request.lotes, request.date_from, request.date_to
+    )
+
+
+@router.post("/bulk/cancel", response_model=ReminderBulkResponse)
+def cancel_reminders_bulk(request: ReminderBulkFilter, db: Session = Depends(get_db)):
+    """Cancela los recordatorios pendientes que cumplan el filtro; con fechas, en las series solo sus ocurrencias"""
+    return ReminderRepository(db).cancel_many(
+        request.reminder_type, request.lotes, request.date_from, request.date_to
+    )
+
+
+@router.post("/bulk/reschedule", response_model=ReminderBulkResponse)
+def reschedule_reminders_bulk(request: ReminderRescheduleRequest, db: Session = Depends(get_db)):
+    """Mueve `days` días con un solo UPDATE los recordatorios pendientes que cumplan el filtro (no las series)"""
+    return ReminderRepository(db).reschedule_many(
+        request.days, request.reminder_type, request.lotes, request.date_from, request.date_to
+    )
+
+
+@router.get("/{reminder_id}", response_model=ReminderResponse)
+def get_reminder(reminder_id: UUID, db: Session = Depends(get_db)):
+    """Obtiene un recordatorio por su ID"""
+    reminder = ReminderRepository(db).get_by_id(reminder_id)
+    if not reminder:
+        raise HTTPException(status_code=404, detail="Recordatorio no encontrado")
+    return reminder
+
+
+@router.patch("/{reminder_id}", response_model=ReminderResponse)
+def update_reminder(reminder_id: UUID, reminder: ReminderUpdate, db: Session = Depends(get_db)):
+    """Actualiza un recordatorio"""
+    updated = ReminderRepository(db).update(reminder_id, reminder)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Recordatorio no encontrado")
+    return updated
+
+
+@router.post("/{reminder_id}/complete", response_model=ReminderResponse)
+def complete_reminder(reminder_id: UUID, db: Session = Depends(get_db)):
+    """Marca un recordatorio como completado"""
+    reminder = ReminderRepository(db).mark_completed(reminder_id)
+    if not reminder:
+        raise HTTPException(status_code=404, detail="Recordatorio no encontrado")
+    return reminder
+
+
+@router.post("/{reminder_id}/cancel", response_model=ReminderResponse)
+def cancel_reminder(reminder_id: UUID, db: Session = Depends(get_db)):
+    """Marca un recordatorio como cancelado"""
+    reminder = ReminderRepository(db).mark_cancelled(reminder_id)
+    if not reminder:
+        raise HTTPException(status_code=404, detail="Recordatorio no encontrado")
+    return reminder
+
+
+def _set_occurrence_status(db: Session, reminder_id: UUID, occurrence_date: date, status: ReminderStatusEnum):
+    repo = ReminderRepository(db)
+    reminder = repo.get_by_id(reminder_id)
+    if not reminder:
+        raise HTTPException(status_code=404, detail="Recordatorio no encontrado")
+    if not reminder.recurrence:
+        raise HTTPException(status_code=400, detail="El recordatorio no es recurrente")
+    if not repo.is_occurrence(reminder, occurrence_date):
+        raise HTTPException(status_code=400, detail=f"{occurrence_date} no es una fecha de la serie")
+    return repo.set_occurrence_status(reminder, occurrence_date, status)
+
+
+@router.post("/{reminder_id}/occurrences/{occurrence_date}/complete", response_model=ReminderResponse)
+def complete_occurrence(reminder_id: UUID, occurrence_date: date, db: Session = Depends(get_db)):
+    """Completa una sola fecha de un recordatorio recurrente"""
+    return _set_occurrence_status(db, reminder_id, occurrence_date, ReminderStatusEnum.completed)
+
+
+@router.post("/{reminder_id}/occurrences/{occurrence_date}/cancel", response_model=ReminderResponse)
+def cancel_occurrence(reminder_id: UUID, occurrence_date: date, db: Session = Depends(get_db)):
+    """Omite una sola fecha de un recordatorio recurrente; el resto de la serie sigue igual"""
+    return _set_occurrence_status(db, reminder_id, occurrence_date, ReminderStatusEnum.cancelled)
+
+
+@router.delete("/{reminder_id}", status_code=204)
+def delete_reminder(reminder_id: UUID, db: Session = Depends(get_db)):
+    """Elimina un recordatorio"""
+    if not ReminderRepository(db).delete(reminder_id):
+        raise HTTPException(status_code=404, detail="Recordatorio no encontrado")
+    return Response(status_code=204)
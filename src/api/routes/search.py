@@ -0,0 +1,32 @@
+# src/api/routes/search.py
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import SearchRepository
+from src.schemas.search import EventSearchHit, SearchSourceEnum
+
+
+router = APIRouter(prefix="/search", tags=["Búsqueda"])
+
+
+@router.get("/events", response_model=List[EventSearchHit])
+def search_events(
+    q: str = Query(..., min_length=2, max_length=200),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    lote: Optional[List[str]] = Query(None),
+    source: Optional[SearchSourceEnum] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """
+    Busca en enfermedades, medicamentos y notas de salud y en el comportamiento de celo, en español
+    ('cojera' encuentra 'cojeras'). Admite "frase exacta", 'or' y -palabra. Ordenado por relevancia.
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from no puede ser posterior a date_to")
+    return SearchRepository(db).search_events(q, date_from, date_to, lote, source, limit)
@@ -0,0 +1,62 @@
+# src/api/routes/weights.py
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import CattleRepository, WeightRepository
+from src.schemas.weight import WeightBatchRequest, WeightBatchResponse, WeightHistoryResponse, GrowthReport
+from src.services.growth_service import GrowthService
+
+
+router = APIRouter(prefix="/weights", tags=["Pesajes"])
+
+
+@router.post("/batch", response_model=WeightBatchResponse)
+def ingest_weights(payload: WeightBatchRequest, db: Session = Depends(get_db)):
+    """
+    Carga masiva de pesajes (báscula, manga). Las lecturas del mismo animal y día se promedian.
+    El peso del ganado se actualiza con su último pesaje. Los lotes desconocidos se omiten y se informan.
+    """
+    lotes = list({reading.lote for reading in payload.readings})
+    ids_by_lote = {cattle.lote: cattle.id for cattle in CattleRepository(db).get_by_lotes(lotes)}
+    readings = [
+        (ids_by_lote[reading.lote], reading.measured_on, reading.weight)
+        for reading in payload.readings
+        if reading.lote in ids_by_lote
+    ]
+    stored, updated = WeightRepository(db).ingest(readings) if readings else (0, 0)
+    return WeightBatchResponse(
+        stored=stored,
+        cattle_updated=updated,
+        unknown_lotes=sorted(lote for lote in lotes if lote not in ids_by_lote)
+    )
+
+
+@router.get("/lote/{lote}", response_model=WeightHistoryResponse)
+def get_weight_history(lote: str, limit: int = Query(365, ge=1, le=2000), db: Session = Depends(get_db)):
+    """Historial de pesajes de un animal, del más reciente al más antiguo"""
+    cattle = CattleRepository(db).get_by_lote(lote)
+    if not cattle:
+        raise HTTPException(status_code=404, detail=f"Ganado con lote '{lote}' no encontrado")
+    return WeightHistoryResponse(
+        lote=cattle.lote,
+        cattle_name=cattle.name,
+        current_weight=cattle.weight,
+        measurements=WeightRepository(db).get_history(cattle.id, limit)
+    )
+
+
+@router.get("/growth", response_model=GrowthReport)
+def get_growth_report(
+    days: int = Query(90, ge=14, le=730),
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Ganancia diaria media (kg/día) de cada animal en la ventana, percentiles del rebaño
+    y animales rezagados (ganancia <= 0 o por debajo del percentil 10).
+    """
+    return GrowthService(db).report(days, end_date)
@@ -0,0 +1,59 @@
+# src/api/routes/withdrawals.py
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import get_db
+from src.repositories import WithdrawalRepository
+from src.schemas.withdrawal import (
+    MedicineWithdrawalResponse,
+    MedicineWithdrawalUpdate,
+    WithdrawalProductEnum,
+    WithdrawalStatus
+)
+
+
+router = APIRouter(prefix="/withdrawals", tags=["Retiro de medicamentos"])
+
+
+@router.get("/", response_model=WithdrawalStatus)
+def get_animals_in_withdrawal(
+    on_date: Optional[date] = None,
+    product: Optional[WithdrawalProductEnum] = None,
+    lote: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Animales en periodo de retiro en `on_date` (hoy por defecto): su leche o su carne no se pueden vender.
+    Cada tratamiento trae la fecha desde la que el producto vuelve a estar libre.
+    """
+    on_date = on_date or date.today()
+    items = WithdrawalRepository(db).get_in_withdrawal(on_date, product, lote)
+    return WithdrawalStatus(on_date=on_date, animals=len({item.lote for item in items}), items=items)
+
+
+@router.get("/medicines", response_model=List[MedicineWithdrawalResponse])
+def list_medicine_withdrawals(db: Session = Depends(get_db)):
+    """Catálogo de días de retiro por medicamento"""
+    return WithdrawalRepository(db).get_medicines()
+
+
+@router.put("/medicines/{medicine}", response_model=MedicineWithdrawalResponse)
+def set_medicine_withdrawal(medicine: str, data: MedicineWithdrawalUpdate, db: Session = Depends(get_db)):
+    """
+    Define los días de retiro en leche y carne de un medicamento (el nombre no distingue mayúsculas).
+    Los periodos de los tratamientos ya registrados con ese medicamento se recalculan.
+    """
+    if not medicine.strip():
+        raise HTTPException(status_code=400, detail="El nombre del medicamento no puede estar vacío")
+    return WithdrawalRepository(db).upsert_medicine(medicine, data)
+
+
+@router.delete("/medicines/{medicine}", status_code=204)
+def delete_medicine_withdrawal(medicine: str, db: Session = Depends(get_db)):
+    """Quita un medicamento del catálogo; sus tratamientos dejan de generar periodos de retiro"""
+    if not WithdrawalRepository(db).delete_medicine(medicine):
+        raise HTTPException(status_code=404, detail="Medicamento no encontrado en el catálogo")
+    return Response(status_code=204)
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -5,6 +6,33 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     DATABASE_URL: str
     GOOGLE_API_KEY: str
+    # Hora local en la que se genera el resumen diario (0-23)
+    DIGEST_HOUR: int = 3
+    DIGEST_ENABLED: bool = True
+    # Detector de brotes: ventana en días y animales distintos con la misma enfermedad
+    # (en todo el rebaño, o dentro de una raza o grupo de edad) para emitir una alerta
+    OUTBREAK_WINDOW_DAYS: int = 7
+    OUTBREAK_MIN_ANIMALS: int = 3
+    OUTBREAK_GROUP_MIN_ANIMALS: int = 3
+    # Segundos entre evaluaciones de los umbrales tras escrituras en eventos de salud
+    OUTBREAK_CHECK_SECONDS: int = 60
+    # Avisos de recordatorios: hora local del aviso del día, lotes y workers de envío,
+    # y destinos (sin webhook ni SMTP los avisos van al log)
+    NOTIFY_ENABLED: bool = True
+    NOTIFY_HOUR: int = 7
+    NOTIFY_BATCH_SIZE: int = 50
+    NOTIFY_WORKERS: int = 2
+    NOTIFY_WEBHOOK_URL: Optional[str] = None
+    NOTIFY_EMAIL_TO: Optional[str] = None
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: int = 587
+    SMTP_FROM: str = "bovara@localhost"
+    SMTP_USER: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    # Respuestas de las herramientas en modo compacto (una fila por línea) para el modelo
+    TOOL_OUTPUT_COMPACT: bool = False
+    # Tokens (estimados) de la respuesta de una herramienta que se envían al modelo; el resto se recorta
+    TOOL_RESULT_TOKEN_BUDGET: int = 2000
     model_config = SettingsConfigDict(
         env_file=".env", 
         env_ignore_empty=True,
@@ -0,0 +1,76 @@
+# src/core/recurrence.py
+# Expansión de reglas de recurrencia de recordatorios (subconjunto de RRULE: FREQ, INTERVAL, UNTIL, COUNT)
+import calendar
+from datetime import date, timedelta
+from enum import Enum
+from typing import Iterator, Optional
+
+
+class RecurrenceFrequencyEnum(str, Enum):
+    daily = "daily"
+    weekly = "weekly"
+    monthly = "monthly"
+    yearly = "yearly"
+
+
+# Días por paso en las frecuencias de longitud fija
+_FIXED_STEP_DAYS = {
+    RecurrenceFrequencyEnum.daily: 1,
+    RecurrenceFrequencyEnum.weekly: 7,
+}
+
+
+def _add_months(start: date, months: int) -> date:
+    """Suma meses conservando el día de `start`; si el mes es más corto usa su último día (31 -> 30, 28...)"""
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def nth_occurrence(start: date, frequency: RecurrenceFrequencyEnum, interval: int, n: int) -> date:
+    """Fecha de la ocurrencia `n` (0 = `start`). Se calcula siempre desde `start`, sin acumular recortes de fin de mes"""
+    frequency = RecurrenceFrequencyEnum(frequency)
+    if frequency in _FIXED_STEP_DAYS:
+        return start + timedelta(days=_FIXED_STEP_DAYS[frequency] * interval * n)
+    months = interval * n * (12 if frequency == RecurrenceFrequencyEnum.yearly else 1)
+    return _add_months(start, months)
+
+
+def _first_index_from(start: date, frequency: RecurrenceFrequencyEnum, interval: int, window_start: date) -> int:
+    """Índice de la primera ocurrencia >= window_start, calculado directamente sin recorrer las anteriores"""
+    if window_start <= start:
+        return 0
+    if frequency in _FIXED_STEP_DAYS:
+        step = _FIXED_STEP_DAYS[frequency] * interval
+        return -(-(window_start - start).days // step)
+    months_per_step = interval * (12 if frequency == RecurrenceFrequencyEnum.yearly else 1)
+    months = (window_start.year - start.year) * 12 + window_start.month - start.month
+    n = max(months // months_per_step, 0)
+    # El recorte de fin de mes puede dejar la ocurrencia n un poco antes de window_start
+    while nth_occurrence(start, frequency, interval, n) < window_start:
+        n += 1
+    return n
+
+
+def iter_occurrences(
+    start: date,
+    frequency: RecurrenceFrequencyEnum,
+    interval: int,
+    window_start: date,
+    window_end: date,
+    until: Optional[date] = None,
+    count: Optional[int] = None
+) -> Iterator[date]:
+    """
+    Genera de forma perezosa las ocurrencias de la serie dentro de [window_start, window_end].
+    Salta directamente a la primera ocurrencia de la ventana: el coste depende de la ventana, no de la antigüedad de la serie.
+    """
+    frequency = RecurrenceFrequencyEnum(frequency)
+    last = min(window_end, until) if until else window_end
+    n = _first_index_from(start, frequency, interval, window_start)
+    while count is None or n < count:
+        occurrence = nth_occurrence(start, frequency, interval, n)
+        if occurrence > last:
+            return
+        yield occurrence
+        n += 1
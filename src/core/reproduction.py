@@ -0,0 +1,11 @@
+# src/core/reproduction.py
+# Parámetros reproductivos del ganado bovino usados para proyectar fechas
+
+# Duración media del ciclo estral
+HEAT_CYCLE_DAYS = 21
+
+# Días tras la inseminación en los que toca el chequeo de preñez
+PREGNANCY_CHECK_DAYS = 45
+
+# Duración media de la gestación
+GESTATION_DAYS = 283
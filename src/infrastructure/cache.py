@@ -0,0 +1,52 @@
+# src/infrastructure/cache.py
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Hashable, Iterable, Optional, Set
+
+from src.infrastructure import events
+
+
+class WriteInvalidatedCache:
+    """
+    Caché en memoria de resultados de consultas, válida solo durante el día en curso.
+    Se vacía entera cuando se confirma una escritura en cualquiera de las tablas observadas.
+    Cada proceso tiene su propia caché: solo ve las escrituras hechas en el mismo proceso.
+    """
+
+    def __init__(self, tables: Iterable[str], maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._day: Optional[date] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        events.subscribe(tables, self._on_change)
+
+    def _on_change(self, tables: Set[str]) -> None:
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        today = date.today()
+        with self._lock:
+            if self._day != today:
+                self._data.clear()
+                self._day = today
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+            generation = self._generation
+
+        value = compute()
+
+        with self._lock:
+            # Si hubo una escritura mientras se calculaba, el valor puede estar desactualizado
+            if self._generation == generation and self._day == today:
+                self._data[key] = value
+                if len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return value
@@ -0,0 +1,79 @@
+# src/infrastructure/events.py
+import logging
+from collections import defaultdict
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+ChangeListener = Callable[[Set[str]], None]
+
+_listeners: Dict[str, List[ChangeListener]] = defaultdict(list)
+
+# Clave en Session.info donde se acumulan las tablas modificadas en la transacción
+_PENDING_KEY = "changed_tables"
+
+
+def subscribe(tables: Iterable[str], listener: ChangeListener) -> None:
+    """Registra `listener` para que reciba las tablas modificadas después de cada commit que toque `tables`"""
+    for table in tables:
+        _listeners[table].append(listener)
+
+
+def unsubscribe(tables: Iterable[str], listener: ChangeListener) -> None:
+    """Quita un suscriptor registrado con `subscribe`"""
+    for table in tables:
+        if listener in _listeners.get(table, ()):
+            _listeners[table].remove(listener)
+
+
+def record_change(session: Session, *tables: str) -> None:
+    """Marca tablas como modificadas en la transacción actual de `session`"""
+    session.info.setdefault(_PENDING_KEY, set()).update(tables)
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _track_statement_writes(orm_execute_state) -> None:
+    # INSERT/UPDATE/DELETE ejecutados como sentencia (RETURNING, operaciones por lotes)
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            record_change(orm_execute_state.session, table.name)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _track_flushed_objects(session: Session, flush_context) -> None:
+    # Escrituras hechas con session.add()/delete() y objetos modificados
+    tables = {obj.__table__.name for obj in chain(session.new, session.dirty, session.deleted)}
+    if tables:
+        record_change(session, *tables)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _dispatch_changes(session: Session) -> None:
+    tables = session.info.pop(_PENDING_KEY, None)
+    if not tables:
+        return
+
+    notified = []
+    for table in tables:
+        for listener in _listeners.get(table, ()):
+            if listener in notified:
+                continue
+            notified.append(listener)
+            try:
+                listener(tables)
+            except Exception:
+                # Un suscriptor con errores no debe romper la escritura ya confirmada
+                logger.exception("Error notificando cambios en %s", ", ".join(sorted(tables)))
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,316 @@
+# src/infrastructure/herd_counters.py
+"""
+Triggers de PostgreSQL que mantienen herd_counters, herd_date_counters y
+disease_case_counts dentro de la misma transacción que cada escritura,
+incluidas las operaciones por lotes y los borrados en cascada.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from src.infrastructure.trigger_versions import installed_version, mark_installed, trigger_version
+
+
+FUNCTIONS = """
+CREATE OR REPLACE FUNCTION herd_counter_add(counter_key text, delta bigint) RETURNS void AS $$
+BEGIN
+    IF delta = 0 THEN
+        RETURN;
+    END IF;
+    INSERT INTO herd_counters (key, value) VALUES (counter_key, delta)
+    ON CONFLICT (key) DO UPDATE SET value = herd_counters.value + EXCLUDED.value;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_date_counter_add(counter_kind text, day date, delta bigint) RETURNS void AS $$
+BEGIN
+    IF day IS NULL THEN
+        RETURN;
+    END IF;
+    INSERT INTO herd_date_counters (kind, counter_date, value) VALUES (counter_kind, day, delta)
+    ON CONFLICT (kind, counter_date) DO UPDATE SET value = herd_date_counters.value + EXCLUDED.value;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Versión por sentencia: resta las fechas de old_days y suma las de new_days con un solo upsert por fecha
+CREATE OR REPLACE FUNCTION herd_date_counters_apply(counter_kind text, old_days date[], new_days date[]) RETURNS void AS $$
+BEGIN
+    INSERT INTO herd_date_counters (kind, counter_date, value)
+    SELECT counter_kind, day, sum(delta)
+    FROM (
+        SELECT unnest(old_days) AS day, -1 AS delta
+        UNION ALL
+        SELECT unnest(new_days), 1
+    ) AS changes
+    WHERE day IS NOT NULL
+    GROUP BY day
+    HAVING sum(delta) <> 0
+    ON CONFLICT (kind, counter_date) DO UPDATE SET value = herd_date_counters.value + EXCLUDED.value;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION disease_case_add(case_disease text, case_cattle uuid, day date, delta bigint) RETURNS void AS $$
+BEGIN
+    IF case_disease IS NULL OR case_disease = '' OR day IS NULL THEN
+        RETURN;
+    END IF;
+    IF delta > 0 THEN
+        INSERT INTO disease_case_counts (disease, case_date, cattle_id, value) VALUES (case_disease, day, case_cattle, delta)
+        ON CONFLICT (disease, case_date, cattle_id) DO UPDATE SET value = disease_case_counts.value + EXCLUDED.value;
+    ELSE
+        -- Sin INSERT: en un borrado en cascada del ganado la fila ya puede no existir
+        UPDATE disease_case_counts SET value = value + delta
+        WHERE disease = case_disease AND case_date = day AND cattle_id = case_cattle;
+        DELETE FROM disease_case_counts
+        WHERE disease = case_disease AND case_date = day AND cattle_id = case_cattle AND value <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_cattle() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.gender IS NOT DISTINCT FROM NEW.gender AND OLD.breed IS NOT DISTINCT FROM NEW.breed THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM herd_counter_add('cattle_total', -1);
+        PERFORM herd_counter_add('cattle_gender:' || OLD.gender::text, -1);
+        PERFORM herd_counter_add('cattle_breed:' || COALESCE(OLD.breed, ''), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM herd_counter_add('cattle_total', 1);
+        PERFORM herd_counter_add('cattle_gender:' || NEW.gender::text, 1);
+        PERFORM herd_counter_add('cattle_breed:' || COALESCE(NEW.breed, ''), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Preñada: su último celo con preñez confirmada no tiene un parto registrado después.
+-- herd_pregnant_cattle guarda el conjunto y su trigger mantiene el contador 'pregnant'
+CREATE OR REPLACE FUNCTION herd_pregnant_sync(animal uuid) RETURNS void AS $$
+BEGIN
+    IF animal IS NULL THEN
+        RETURN;
+    END IF;
+    IF EXISTS (
+        SELECT 1
+        FROM cattle
+        JOIN LATERAL (
+            SELECT COALESCE(insemination_date, heat_date) AS conceived
+            FROM heat_events
+            WHERE heat_events.cattle_id = cattle.id AND pregnancy_confirmed IS TRUE
+            ORDER BY 1 DESC
+            LIMIT 1
+        ) AS last_confirmed ON true
+        WHERE cattle.id = animal
+          AND (cattle.fecha_ultimo_parto IS NULL OR cattle.fecha_ultimo_parto < last_confirmed.conceived)
+    ) THEN
+        INSERT INTO herd_pregnant_cattle (cattle_id) VALUES (animal) ON CONFLICT DO NOTHING;
+    ELSE
+        DELETE FROM herd_pregnant_cattle WHERE cattle_id = animal;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_pregnant() RETURNS trigger AS $$
+BEGIN
+    -- También se dispara con el borrado en cascada al eliminar un animal
+    PERFORM herd_counter_add('pregnant', CASE WHEN TG_OP = 'INSERT' THEN 1 ELSE -1 END);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_calvings() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.fecha_ultimo_parto IS DISTINCT FROM NEW.fecha_ultimo_parto THEN
+        PERFORM herd_pregnant_sync(NEW.id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_heat_events() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.pregnancy_confirmed IS NOT DISTINCT FROM NEW.pregnancy_confirmed
+        AND OLD.insemination_date IS NOT DISTINCT FROM NEW.insemination_date
+        AND OLD.heat_date IS NOT DISTINCT FROM NEW.heat_date
+        AND OLD.cattle_id IS NOT DISTINCT FROM NEW.cattle_id THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM herd_pregnant_sync(OLD.cattle_id);
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND OLD.cattle_id IS DISTINCT FROM NEW.cattle_id) THEN
+        PERFORM herd_pregnant_sync(NEW.cattle_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Triggers por sentencia (old_rows / new_rows son las tablas de transición): un INSERT de
+-- miles de recordatorios o un UPDATE masivo de next_dose_date toca cada contador una sola vez
+CREATE OR REPLACE FUNCTION herd_counters_reminders() RETURNS trigger AS $$
+DECLARE
+    old_days date[] := '{}';
+    new_days date[] := '{}';
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        old_days := ARRAY(SELECT reminder_date FROM old_rows WHERE status = 'pending');
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        new_days := ARRAY(SELECT reminder_date FROM new_rows WHERE status = 'pending');
+    END IF;
+    PERFORM herd_counter_add('reminders_pending', cardinality(new_days) - cardinality(old_days));
+    PERFORM herd_date_counters_apply('reminder', old_days, new_days);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_health_events() RETURNS trigger AS $$
+DECLARE
+    old_days date[] := '{}';
+    new_days date[] := '{}';
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        old_days := ARRAY(SELECT next_dose_date FROM old_rows WHERE next_dose_date IS NOT NULL);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        new_days := ARRAY(SELECT next_dose_date FROM new_rows WHERE next_dose_date IS NOT NULL);
+    END IF;
+    PERFORM herd_date_counters_apply('dose', old_days, new_days);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_disease_cases() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.event_type IS NOT DISTINCT FROM NEW.event_type
+        AND OLD.disease_name IS NOT DISTINCT FROM NEW.disease_name
+        AND OLD.application_date IS NOT DISTINCT FROM NEW.application_date
+        AND OLD.cattle_id IS NOT DISTINCT FROM NEW.cattle_id THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.event_type::text IN ('illness', 'injury') THEN
+        PERFORM disease_case_add(lower(btrim(OLD.disease_name)), OLD.cattle_id, OLD.application_date, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.event_type::text IN ('illness', 'injury') THEN
+        PERFORM disease_case_add(lower(btrim(NEW.disease_name)), NEW.cattle_id, NEW.application_date, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION herd_counters_rebuild() RETURNS void AS $$
+BEGIN
+    -- Antes de vaciar herd_counters: su trigger mueve 'pregnant', que se recalcula abajo
+    DELETE FROM herd_pregnant_cattle;
+    INSERT INTO herd_pregnant_cattle (cattle_id)
+    SELECT cattle.id
+    FROM cattle
+    JOIN LATERAL (
+        SELECT COALESCE(insemination_date, heat_date) AS conceived
+        FROM heat_events
+        WHERE heat_events.cattle_id = cattle.id AND pregnancy_confirmed IS TRUE
+        ORDER BY 1 DESC
+        LIMIT 1
+    ) AS last_confirmed ON true
+    WHERE cattle.fecha_ultimo_parto IS NULL OR cattle.fecha_ultimo_parto < last_confirmed.conceived;
+
+    DELETE FROM herd_counters;
+    DELETE FROM herd_date_counters;
+    DELETE FROM disease_case_counts;
+
+    INSERT INTO herd_counters (key, value)
+    SELECT 'cattle_total', count(*) FROM cattle
+    UNION ALL
+    SELECT 'cattle_gender:' || gender::text, count(*) FROM cattle GROUP BY gender
+    UNION ALL
+    SELECT 'cattle_breed:' || COALESCE(breed, ''), count(*) FROM cattle GROUP BY COALESCE(breed, '')
+    UNION ALL
+    SELECT 'pregnant', count(*) FROM herd_pregnant_cattle
+    UNION ALL
+    SELECT 'reminders_pending', count(*) FROM reminders WHERE status = 'pending';
+
+    INSERT INTO herd_date_counters (kind, counter_date, value)
+    SELECT 'reminder', reminder_date, count(*) FROM reminders WHERE status = 'pending' GROUP BY reminder_date
+    UNION ALL
+    SELECT 'dose', next_dose_date, count(*) FROM health_events WHERE next_dose_date IS NOT NULL GROUP BY next_dose_date;
+
+    -- Misma ventana que DISEASE_CASE_RETENTION_DAYS
+    INSERT INTO disease_case_counts (disease, case_date, cattle_id, value)
+    SELECT lower(btrim(disease_name)), application_date, cattle_id, count(*)
+    FROM health_events
+    WHERE event_type::text IN ('illness', 'injury')
+      AND btrim(coalesce(disease_name, '')) <> ''
+      AND application_date >= current_date - 90
+    GROUP BY 1, 2, 3;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Días de casos de enfermedad que se conservan en disease_case_counts (la purga es nocturna)
+DISEASE_CASE_RETENTION_DAYS = 90
+
+# Evita que varios procesos instalen los triggers a la vez al arrancar
+INSTALL_LOCK_ID = 740031
+
+# (tabla, función): un trigger AFTER ... FOR EACH ROW por tabla
+TRIGGERS = [
+    ("cattle", "herd_counters_cattle"),
+    ("cattle", "herd_counters_calvings"),
+    ("heat_events", "herd_counters_heat_events"),
+    ("herd_pregnant_cattle", "herd_counters_pregnant"),
+    ("health_events", "herd_counters_disease_cases"),
+]
+
+# (tabla, función): triggers AFTER ... FOR EACH STATEMENT con tablas de transición.
+# PostgreSQL no admite tablas de transición en triggers de varios eventos: uno por evento.
+STATEMENT_TRIGGERS = [
+    ("reminders", "herd_counters_reminders"),
+    ("health_events", "herd_counters_health_events"),
+]
+
+STATEMENT_EVENTS = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+}
+
+
+VERSION = trigger_version(FUNCTIONS, TRIGGERS, STATEMENT_TRIGGERS, STATEMENT_EVENTS)
+
+
+def install_herd_counters(connection: Connection) -> None:
+    """
+    Crea o reemplaza las funciones y triggers de los contadores y los recalcula desde cero,
+    solo la primera vez o cuando cambia su definición (VERSION). Bloquea las escrituras en las
+    tablas de origen mientras recalcula para que ninguna fila quede contada dos veces o sin contar.
+    """
+    connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": INSTALL_LOCK_ID})
+    if installed_version(connection, "herd_counters_rebuild") == VERSION:
+        return
+    connection.execute(text(FUNCTIONS))
+    connection.execute(text(
+        "LOCK TABLE " + ", ".join(dict.fromkeys(table for table, _ in TRIGGERS + STATEMENT_TRIGGERS))
+        + " IN SHARE ROW EXCLUSIVE MODE"
+    ))
+    for table, function in TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {function}_trg ON {table}"))
+        connection.execute(text(
+            f"CREATE TRIGGER {function}_trg AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {function}()"
+        ))
+    for table, function in STATEMENT_TRIGGERS:
+        # Bases instaladas con la versión por fila
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {function}_trg ON {table}"))
+        for event, transition_tables in STATEMENT_EVENTS.items():
+            name = f"{function}_{event.lower()}_trg"
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {name} ON {table}"))
+            connection.execute(text(
+                f"CREATE TRIGGER {name} AFTER {event} ON {table} REFERENCING {transition_tables} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+            ))
+    connection.execute(text("SELECT herd_counters_rebuild()"))
+    mark_installed(connection, "herd_counters_rebuild", VERSION)
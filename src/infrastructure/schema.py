@@ -0,0 +1,24 @@
+# src/infrastructure/schema.py
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.database import Base
+from src.infrastructure.herd_counters import install_herd_counters
+from src.infrastructure.withdrawals import install_withdrawal_periods
+
+
+def ensure_schema(engine: Engine) -> None:
+    """
+    Crea las tablas que falten y los índices nuevos de tablas ya existentes.
+    create_all no agrega índices a una tabla que ya existe, por eso se revisan uno a uno.
+    En PostgreSQL instala además los triggers de los contadores del rancho y de los periodos de retiro.
+    Es idempotente: se puede ejecutar en cada arranque.
+    """
+    Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            install_herd_counters(connection)
+            install_withdrawal_periods(connection)
@@ -0,0 +1,42 @@
+# src/infrastructure/text_search.py
+"""
+Búsqueda de texto completo en español con tsvector de PostgreSQL.
+Los índices GIN son índices de expresión: la consulta tiene que usar exactamente
+la misma expresión que el índice (`weighted_document`) para que el planificador lo aproveche.
+"""
+from typing import Tuple
+
+from sqlalchemy import cast, func, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.sql.elements import ColumnElement
+
+
+# Configuración de texto en español: minúsculas, stemming ('cojera' encuentra 'cojeras') y stopwords
+SEARCH_CONFIG = cast(literal("spanish"), REGCONFIG)
+
+# El stemmer no iguala 'neumonía' y 'neumonia': se quitan las tildes del texto y de la consulta.
+# translate() es inmutable, así que vale en un índice de expresión (unaccent no, y requiere una extensión).
+# La ñ se conserva ('año' no es 'ano')
+_ACCENTED = "áéíóúüÁÉÍÓÚÜ"
+_PLAIN = "aeiouuAEIOUU"
+
+
+def strip_accents(value) -> ColumnElement:
+    return func.translate(value, _ACCENTED, _PLAIN)
+
+
+def weighted_document(*fields: Tuple[ColumnElement, str]) -> ColumnElement:
+    """tsvector de varias columnas, cada una con su peso ('A' más relevante ... 'D'); las nulas cuentan como vacías"""
+    vectors = [
+        func.setweight(func.to_tsvector(SEARCH_CONFIG, strip_accents(func.coalesce(column, ""))), weight)
+        for column, weight in fields
+    ]
+    document = vectors[0]
+    for vector in vectors[1:]:
+        document = document.op("||")(vector)
+    return document
+
+
+def search_query(text: str) -> ColumnElement:
+    """Consulta con la sintaxis de los buscadores: palabras sueltas (AND), "frase exacta", 'or' y -excluir"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, strip_accents(text))
@@ -0,0 +1,28 @@
+# src/infrastructure/trigger_versions.py
+"""
+Versión instalada de un conjunto de triggers, guardada como comentario de su función de recálculo.
+Así el arranque solo bloquea las tablas y recalcula desde cero la primera vez o cuando
+cambia el SQL de los triggers, no en cada despliegue o reinicio de un worker.
+"""
+import hashlib
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def trigger_version(*definitions: object) -> str:
+    """Huella del SQL y de la lista de triggers: cambia con cualquier cambio en su definición"""
+    return hashlib.sha1(repr(definitions).encode()).hexdigest()[:16]
+
+
+def installed_version(connection: Connection, function: str) -> Optional[str]:
+    """Versión guardada en la función `function()`; None si no existe o no tiene versión"""
+    return connection.execute(
+        text("SELECT obj_description(to_regprocedure(:function), 'pg_proc')"),
+        {"function": f"{function}()"}
+    ).scalar()
+
+
+def mark_installed(connection: Connection, function: str, version: str) -> None:
+    connection.execute(text(f"COMMENT ON FUNCTION {function}() IS '{version}'"))
@@ -0,0 +1,96 @@
+# src/infrastructure/withdrawals.py
+"""
+Triggers de PostgreSQL que mantienen withdrawal_periods a partir de
+health_events y del catálogo medicine_withdrawals, en la misma
+transacción que cada escritura. Borrar un evento de salud o un animal
+elimina sus periodos por la clave foránea en cascada.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from src.infrastructure.trigger_versions import installed_version, mark_installed, trigger_version
+
+
+FUNCTIONS = """
+CREATE OR REPLACE VIEW withdrawal_period_source AS
+SELECT e.id AS health_event_id,
+       p.product,
+       e.cattle_id,
+       m.medicine,
+       daterange(e.application_date, greatest(coalesce(e.treatment_end_date, e.application_date), e.application_date) + p.days, '[)') AS period
+FROM health_events e
+JOIN medicine_withdrawals m ON m.medicine = lower(btrim(e.medicine_name))
+CROSS JOIN LATERAL (VALUES ('milk', m.milk_days), ('meat', m.meat_days)) AS p(product, days)
+WHERE p.days > 0;
+
+CREATE OR REPLACE FUNCTION withdrawal_periods_health_events() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM withdrawal_periods WHERE health_event_id = NEW.id;
+    END IF;
+    INSERT INTO withdrawal_periods (health_event_id, product, cattle_id, medicine, period)
+    SELECT health_event_id, product, cattle_id, medicine, period
+    FROM withdrawal_period_source WHERE health_event_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION withdrawal_periods_medicines() RETURNS trigger AS $$
+DECLARE
+    changed text;
+BEGIN
+    FOR changed IN
+        SELECT DISTINCT medicine FROM (VALUES (CASE WHEN TG_OP <> 'INSERT' THEN OLD.medicine END),
+                                              (CASE WHEN TG_OP <> 'DELETE' THEN NEW.medicine END)) AS m(medicine)
+        WHERE medicine IS NOT NULL
+    LOOP
+        DELETE FROM withdrawal_periods WHERE medicine = changed;
+        INSERT INTO withdrawal_periods (health_event_id, product, cattle_id, medicine, period)
+        SELECT health_event_id, product, cattle_id, medicine, period
+        FROM withdrawal_period_source WHERE medicine = changed;
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION withdrawal_periods_rebuild() RETURNS void AS $$
+BEGIN
+    DELETE FROM withdrawal_periods;
+    INSERT INTO withdrawal_periods (health_event_id, product, cattle_id, medicine, period)
+    SELECT health_event_id, product, cattle_id, medicine, period FROM withdrawal_period_source;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Evita que varios procesos instalen los triggers a la vez al arrancar
+INSTALL_LOCK_ID = 740041
+
+TRIGGERS = [
+    (
+        "health_events",
+        "withdrawal_periods_health_events",
+        "AFTER INSERT OR UPDATE OF medicine_name, application_date, treatment_end_date, cattle_id"
+    ),
+    ("medicine_withdrawals", "withdrawal_periods_medicines", "AFTER INSERT OR UPDATE OR DELETE"),
+]
+
+
+VERSION = trigger_version(FUNCTIONS, TRIGGERS)
+
+
+def install_withdrawal_periods(connection: Connection) -> None:
+    """
+    Crea o reemplaza la vista, las funciones y los triggers de los periodos de retiro y los recalcula,
+    solo la primera vez o cuando cambia su definición (VERSION); después los triggers mantienen la tabla.
+    Bloquea las escrituras en las tablas de origen mientras recalcula.
+    """
+    connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": INSTALL_LOCK_ID})
+    if installed_version(connection, "withdrawal_periods_rebuild") == VERSION:
+        return
+    connection.execute(text(FUNCTIONS))
+    connection.execute(text("LOCK TABLE health_events, medicine_withdrawals IN SHARE ROW EXCLUSIVE MODE"))
+    for table, function, timing in TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {function}_trg ON {table}"))
+        connection.execute(text(f"CREATE TRIGGER {function}_trg {timing} ON {table} FOR EACH ROW EXECUTE FUNCTION {function}()"))
+    connection.execute(text("SELECT withdrawal_periods_rebuild()"))
+    mark_installed(connection, "withdrawal_periods_rebuild", VERSION)
@@ -1,20 +1,38 @@
 """
 Script para inicializar la base de datos creando todas las tablas
 """
-from src.infrastructure.database import engine, Base
-from src.models import Cattle, HealthEvent, HeatEventModel, Reminder
+from src.infrastructure.database import engine
+from src.infrastructure.schema import ensure_schema
+from src.models import Cattle, HealthEvent, HeatEventModel, Reminder, DailyDigest, DailyDigestStale, HerdCounter, HerdDateCounter, HerdPregnantCattle, WeightMeasurement, ActivityReading, ActivityDetectorState, DiseaseCaseCount, OutbreakAlert, MedicineWithdrawal, WithdrawalPeriod, VaccinationProtocol, ProtocolReminder, ReminderRecurrence, ReminderOccurrence, ReminderNotification
 
 
 def init_db():
     """Crea todas las tablas en la base de datos"""
     print("Creando tablas en la base de datos...")
-    Base.metadata.create_all(bind=engine)
+    ensure_schema(engine)
     print("✅ Tablas creadas exitosamente!")
     print("\nTablas creadas:")
     print("- cattle")
     print("- health_events")
     print("- heat_events")
     print("- reminders")
+    print("- daily_digests")
+    print("- daily_digest_stale")
+    print("- herd_counters")
+    print("- herd_date_counters")
+    print("- herd_pregnant_cattle")
+    print("- weight_measurements")
+    print("- activity_readings")
+    print("- activity_detector_states")
+    print("- disease_case_counts")
+    print("- outbreak_alerts")
+    print("- medicine_withdrawals")
+    print("- withdrawal_periods")
+    print("- vaccination_protocols")
+    print("- protocol_reminders")
+    print("- reminder_recurrences")
+    print("- reminder_occurrences")
+    print("- reminder_notifications")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,45 @@
 # src/main.py
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.core.config import settings
-from src.infrastructure.database import engine, Base
-from src.api.routes import chat
+from src.infrastructure.database import engine
+from src.infrastructure.schema import ensure_schema
+from src.api.routes import chat, export, cattle, health_events, heat_events, reminders, agenda, dashboard, analytics, weights, activity, outbreaks, withdrawals, protocols, search
+from src.api.errors import register_exception_handlers
+from src.services.maintenance_scheduler import run_nightly_maintenance
+from src.services.reminder_scheduler import ReminderScheduler
+from src.services.outbreak_service import run_outbreak_checks
+from src.services.cattle_index import cattle_index
+
+from src.models import Cattle, HealthEvent, HeatEventModel, Reminder, DailyDigest, DailyDigestStale, HerdCounter, HerdDateCounter, HerdPregnantCattle, WeightMeasurement, ActivityReading, ActivityDetectorState, DiseaseCaseCount, OutbreakAlert, MedicineWithdrawal, WithdrawalPeriod, VaccinationProtocol, ProtocolReminder, ReminderRecurrence, ReminderOccurrence, ReminderNotification
+
+ensure_schema(engine)
 
-from src.models import Cattle, HealthEvent, HeatEventModel, Reminder
 
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Índice en memoria de lotes y nombres; si falla se carga en la primera consulta
+    await asyncio.to_thread(cattle_index.warm_up)
+    # Tareas nocturnas (resumen diario, pesajes, purgas), dentro del mismo proceso
+    maintenance_task = asyncio.create_task(run_nightly_maintenance(settings.DIGEST_HOUR)) if settings.DIGEST_ENABLED else None
+    # Avisos de recordatorios al llegar su día
+    reminder_task = asyncio.create_task(ReminderScheduler.from_settings(settings).run()) if settings.NOTIFY_ENABLED else None
+    # Umbrales de brotes tras escrituras en eventos de salud, agrupadas por intervalo
+    outbreak_task = asyncio.create_task(run_outbreak_checks(settings.OUTBREAK_CHECK_SECONDS))
+    yield
+    for task in (maintenance_task, reminder_task, outbreak_task):
+        if task:
+            task.cancel()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="API de gestión ganadera con asistente IA integrado",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configurar CORS
@@ -24,8 +51,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+register_exception_handlers(app)
+
 # Incluir routers
 app.include_router(chat.router, prefix=settings.API_V1_STR)
+app.include_router(cattle.router, prefix=settings.API_V1_STR)
+app.include_router(health_events.router, prefix=settings.API_V1_STR)
+app.include_router(heat_events.router, prefix=settings.API_V1_STR)
+app.include_router(reminders.router, prefix=settings.API_V1_STR)
+app.include_router(agenda.router, prefix=settings.API_V1_STR)
+app.include_router(dashboard.router, prefix=settings.API_V1_STR)
+app.include_router(analytics.router, prefix=settings.API_V1_STR)
+app.include_router(weights.router, prefix=settings.API_V1_STR)
+app.include_router(activity.router, prefix=settings.API_V1_STR)
+app.include_router(outbreaks.router, prefix=settings.API_V1_STR)
+app.include_router(withdrawals.router, prefix=settings.API_V1_STR)
+app.include_router(protocols.router, prefix=settings.API_V1_STR)
+app.include_router(search.router, prefix=settings.API_V1_STR)
+app.include_router(export.router, prefix=settings.API_V1_STR)
 
 @app.get("/")
 def root():
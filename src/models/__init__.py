@@ -3,3 +3,12 @@ from src.models.cattle import Cattle, GenderEnum
 from src.models.health_event import HealthEvent, EventTypeEnum, AdministrationRouteEnum
 from src.models.heat_event import HeatEventModel
 from src.models.reminder import Reminder
+from src.models.daily_digest import DailyDigest, DailyDigestStale
+from src.models.herd_counter import HerdCounter, HerdDateCounter, HerdPregnantCattle
+from src.models.weight_measurement import WeightMeasurement
+from src.models.activity import ActivityReading, ActivityDetectorState
+from src.models.outbreak import DiseaseCaseCount, OutbreakAlert
+from src.models.withdrawal import MedicineWithdrawal, WithdrawalPeriod
+from src.models.vaccination_protocol import VaccinationProtocol, ProtocolReminder
+from src.models.reminder_recurrence import ReminderRecurrence, ReminderOccurrence
+from src.models.reminder_notification import ReminderNotification
@@ -0,0 +1,34 @@
+# src/models/activity.py
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Integer, SmallInteger
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from src.infrastructure.database import Base
+
+
+class ActivityReading(Base):
+    """
+    Actividad de los collares agregada en intervalos fijos (ver ACTIVITY_BUCKET_HOURS).
+    Una fila por animal e intervalo; las lecturas que caen en el mismo intervalo se suman.
+    """
+    __tablename__ = "activity_readings"
+
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    steps = Column(Integer, nullable=False)
+    samples = Column(SmallInteger, nullable=False, default=1)
+
+
+class ActivityDetectorState(Base):
+    """
+    Estado del detector de celos por animal, para continuar el análisis entre lotes de lecturas.
+    La línea base se guarda por franja horaria del día (una posición por intervalo).
+    """
+    __tablename__ = "activity_detector_states"
+
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
+    last_bucket = Column(DateTime)
+    baseline_mean = Column(ARRAY(Float))
+    baseline_var = Column(ARRAY(Float))
+    cusum = Column(Float, nullable=False, default=0.0)
+    buckets_seen = Column(Integer, nullable=False, default=0)
+    last_detection = Column(Date)
@@ -0,0 +1,28 @@
+# src/models/daily_digest.py
+from sqlalchemy import Column, Date, DateTime, JSON, String
+from datetime import datetime
+
+from src.infrastructure.database import Base
+
+
+class DailyDigest(Base):
+    """Resumen precalculado del día: lo que más se consulta a primera hora"""
+    __tablename__ = "daily_digests"
+
+    digest_date = Column(Date, primary_key=True)
+
+    # Cada sección es una lista de objetos JSON ya listos para mostrar
+    overdue_reminders = Column(JSON, nullable=False, default=list)
+    upcoming_doses = Column(JSON, nullable=False, default=list)
+    pending_pregnancy_checks = Column(JSON, nullable=False, default=list)
+
+    generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class DailyDigestStale(Base):
+    """Secciones del resumen cuyas tablas cambiaron desde que se calcularon; se recalculan en la próxima lectura"""
+    __tablename__ = "daily_digest_stale"
+
+    section = Column(String(50), primary_key=True)
+    marked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
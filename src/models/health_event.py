@@ -1,5 +1,5 @@
 # src/infrastructure/models/health_event.py
-from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Enum as SQLEnum, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -7,6 +7,7 @@ import uuid
 import enum
 
 from src.infrastructure.database import Base
+from src.infrastructure.text_search import weighted_document
 
 
 class EventTypeEnum(str, enum.Enum):
@@ -39,7 +40,7 @@ class HealthEvent(Base):
     medicine_name = Column(String(100))
     application_date = Column(Date, nullable=False)
     administration_route = Column(SQLEnum(AdministrationRouteEnum))
-    next_dose_date = Column(Date)
+    next_dose_date = Column(Date, index=True)
     treatment_end_date = Column(Date)
     dosage = Column(String(50))
     veterinarian_name = Column(String(100))
@@ -51,3 +52,13 @@ class HealthEvent(Base):
     # Relaciones
     cattle = relationship("Cattle", back_populates="health_events")
     reminders = relationship("Reminder", back_populates="health_event")
+
+
+# Texto buscable: la enfermedad pesa más que el medicamento y este más que las notas
+health_event_search_document = weighted_document(
+    # Columnas de la tabla (no atributos del modelo) para que el índice quede asociado a ella
+    (HealthEvent.__table__.c.disease_name, "A"),
+    (HealthEvent.__table__.c.medicine_name, "B"),
+    (HealthEvent.__table__.c.notes, "C")
+)
+Index("ix_health_events_search", health_event_search_document, postgresql_using="gin")
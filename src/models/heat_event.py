@@ -1,10 +1,11 @@
-from sqlalchemy import Column, String, Boolean, Date, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, Date, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 
 from src.infrastructure.database import Base
+from src.infrastructure.text_search import weighted_document
 
 
 class HeatEventModel(Base):
@@ -12,16 +13,26 @@ class HeatEventModel(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), nullable=False)
-    heat_date = Column(Date, nullable=False)
+    heat_date = Column(Date, nullable=False, index=True)
     allows_mounting = Column(Boolean)
     vaginal_discharge = Column(String(200))
     vulva_swelling = Column(String(200))
     comportamiento = Column(String(500))
     was_inseminated = Column(Boolean, default=False)
-    insemination_date = Column(Date)
+    insemination_date = Column(Date, index=True)
     pregnancy_confirmed = Column(Boolean)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relación con cattle
     cattle = relationship("Cattle", back_populates="heat_events")
+
+
+# Texto buscable: el comportamiento observado pesa más que las descripciones de flujo e hinchazón
+heat_event_search_document = weighted_document(
+    # Columnas de la tabla (no atributos del modelo) para que el índice quede asociado a ella
+    (HeatEventModel.__table__.c.comportamiento, "A"),
+    (HeatEventModel.__table__.c.vaginal_discharge, "B"),
+    (HeatEventModel.__table__.c.vulva_swelling, "B")
+)
+Index("ix_heat_events_search", heat_event_search_document, postgresql_using="gin")
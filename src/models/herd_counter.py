@@ -0,0 +1,39 @@
+# src/models/herd_counter.py
+from sqlalchemy import Column, String, Date, BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database import Base
+
+
+class HerdCounter(Base):
+    """
+    Contadores del rancho mantenidos por triggers (ver src/infrastructure/herd_counters.py).
+    Claves: 'cattle_total', 'cattle_gender:<género>', 'cattle_breed:<raza>', 'pregnant', 'reminders_pending'.
+    'pregnant' es el número de filas de herd_pregnant_cattle.
+    """
+    __tablename__ = "herd_counters"
+
+    key = Column(String(150), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+
+class HerdDateCounter(Base):
+    """
+    Contadores por fecha, para las cifras que dependen del día de hoy.
+    kind: 'reminder' (recordatorios pendientes por reminder_date) o 'dose' (próximas dosis por next_dose_date).
+    """
+    __tablename__ = "herd_date_counters"
+
+    kind = Column(String(20), primary_key=True)
+    counter_date = Column(Date, primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+
+class HerdPregnantCattle(Base):
+    """
+    Hembras preñadas ahora: su último celo con preñez confirmada no tiene un parto posterior.
+    La mantienen los triggers de heat_events y cattle; sus altas y bajas mueven el contador 'pregnant'.
+    """
+    __tablename__ = "herd_pregnant_cattle"
+
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,39 @@
+# src/models/outbreak.py
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, BigInteger, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+
+from src.infrastructure.database import Base
+
+
+class DiseaseCaseCount(Base):
+    """
+    Casos de enfermedad/lesión por día y animal, mantenidos por trigger sobre health_events
+    (ver src/infrastructure/herd_counters.py). La enfermedad se guarda normalizada (minúsculas, sin espacios).
+    Solo se conservan los días recientes: es la ventana que usa el detector de brotes.
+    """
+    __tablename__ = "disease_case_counts"
+
+    disease = Column(String(100), primary_key=True)
+    case_date = Column(Date, primary_key=True)
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+
+
+class OutbreakAlert(Base):
+    """
+    Alerta de brote emitida al superar el umbral. Como mucho una por enfermedad y grupo por día.
+    scope: 'disease' (todo el rebaño), 'breed' o 'age_group'.
+    """
+    __tablename__ = "outbreak_alerts"
+    __table_args__ = (UniqueConstraint("disease", "scope", "group_value", "raised_on"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    disease = Column(String(100), nullable=False)
+    scope = Column(String(20), nullable=False)
+    group_value = Column(String(100), nullable=False, default="")
+    animals = Column(Integer, nullable=False)
+    window_days = Column(Integer, nullable=False)
+    raised_on = Column(Date, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -14,13 +14,16 @@ class Reminder(Base):
     health_event_id = Column(UUID(as_uuid=True), ForeignKey("health_events.id", ondelete="SET NULL"))
     title = Column(String(200), nullable=False)
     description = Column(Text)
-    reminder_date = Column(Date, nullable=False)
+    reminder_date = Column(Date, nullable=False, index=True)
     reminder_type = Column(String(50), nullable=False)  # vaccine, checkup, treatment, feeding, breeding, other
     status = Column(String(20), default="pending", nullable=False)  # pending, completed, cancelled
     completed_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Indexado: el programador de avisos lee solo los recordatorios cambiados desde su última sincronización
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
     
     # Relationships (solo con tablas de este servicio)
     cattle = relationship("Cattle", back_populates="reminders")
     health_event = relationship("HealthEvent", back_populates="reminders")
+    # Solo en recordatorios recurrentes; selectin evita una consulta por fila en los listados
+    recurrence = relationship("ReminderRecurrence", uselist=False, lazy="selectin", passive_deletes=True)
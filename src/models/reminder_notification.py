@@ -0,0 +1,14 @@
+# src/models/reminder_notification.py
+from sqlalchemy import Column, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database import Base
+
+
+class ReminderNotification(Base):
+    """Ocurrencias ya notificadas por el programador de recordatorios; evita repetir avisos tras un reinicio"""
+    __tablename__ = "reminder_notifications"
+
+    reminder_id = Column(UUID(as_uuid=True), ForeignKey("reminders.id", ondelete="CASCADE"), primary_key=True)
+    occurrence_date = Column(Date, primary_key=True)
+    notified_at = Column(DateTime, nullable=False)
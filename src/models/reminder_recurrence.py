@@ -0,0 +1,32 @@
+# src/models/reminder_recurrence.py
+from sqlalchemy import Column, String, Integer, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database import Base
+
+
+class ReminderRecurrence(Base):
+    """
+    Regla de repetición de un recordatorio (la serie es una sola fila de reminders).
+    Las ocurrencias no se guardan: se generan al consultar. `reminders.reminder_date` es la
+    primera ocurrencia aún abierta, así resúmenes, agenda y contadores ven la serie una vez.
+    """
+    __tablename__ = "reminder_recurrences"
+
+    reminder_id = Column(UUID(as_uuid=True), ForeignKey("reminders.id", ondelete="CASCADE"), primary_key=True)
+    frequency = Column(String(10), nullable=False)  # daily, weekly, monthly, yearly
+    interval = Column(Integer, nullable=False, default=1)
+    start_date = Column(Date, nullable=False)
+    # Fin de la serie: fecha límite y/o número de ocurrencias; ambos NULL = sin fin
+    until = Column(Date)
+    count = Column(Integer)
+
+
+class ReminderOccurrence(Base):
+    """Excepciones de una serie: solo se guardan las ocurrencias completadas o canceladas"""
+    __tablename__ = "reminder_occurrences"
+
+    reminder_id = Column(UUID(as_uuid=True), ForeignKey("reminders.id", ondelete="CASCADE"), primary_key=True)
+    occurrence_date = Column(Date, primary_key=True)
+    status = Column(String(20), nullable=False)  # completed, cancelled
+    completed_at = Column(DateTime)
@@ -0,0 +1,52 @@
+# src/models/vaccination_protocol.py
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from datetime import datetime
+import uuid
+
+from src.infrastructure.database import Base
+from src.models.cattle import GenderEnum
+
+
+class VaccinationProtocol(Base):
+    """
+    Protocolo de vacunación: a qué animales aplica (género, raza, edad), cuándo va la primera dosis,
+    los refuerzos de la serie inicial y cada cuánto se revacuna.
+    Las dosis aplicadas se reconocen por health_events de tipo vacuna con el mismo `vaccine_name`
+    (sin distinguir mayúsculas).
+    """
+    __tablename__ = "vaccination_protocols"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String(100), nullable=False, unique=True)
+    vaccine_name = Column(String(100), nullable=False)
+    disease_name = Column(String(100))
+
+    # Animales a los que aplica; NULL = todos
+    gender = Column(SQLEnum(GenderEnum))
+    breed = Column(String(100))
+
+    # Edad (días) para la primera dosis, y edad máxima para iniciar la serie
+    min_age_days = Column(Integer, nullable=False, default=0)
+    max_age_days = Column(Integer)
+    # Días desde la dosis anterior para cada refuerzo de la serie inicial (ej: [21] = 2 dosis)
+    booster_days = Column(ARRAY(Integer), nullable=False, default=list)
+    # Revacunación tras completar la serie; NULL = no se repite
+    interval_days = Column(Integer)
+
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class ProtocolReminder(Base):
+    """Recordatorios generados por el planificador: qué protocolo y qué dosis programan"""
+    __tablename__ = "protocol_reminders"
+    __table_args__ = (
+        Index("ix_protocol_reminders_protocol_cattle", "protocol_id", "cattle_id"),
+    )
+
+    reminder_id = Column(UUID(as_uuid=True), ForeignKey("reminders.id", ondelete="CASCADE"), primary_key=True)
+    protocol_id = Column(UUID(as_uuid=True), ForeignKey("vaccination_protocols.id", ondelete="CASCADE"), nullable=False)
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), nullable=False)
+    dose_number = Column(Integer, nullable=False)
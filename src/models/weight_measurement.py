@@ -0,0 +1,19 @@
+# src/models/weight_measurement.py
+from sqlalchemy import Column, Date, ForeignKey, REAL, SmallInteger
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database import Base
+
+
+class WeightMeasurement(Base):
+    """
+    Historial de pesajes, una fila por animal y día (o por semana en los datos antiguos).
+    Tabla compacta: clave primaria compuesta y sin columnas de auditoría.
+    """
+    __tablename__ = "weight_measurements"
+
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), primary_key=True)
+    measured_on = Column(Date, primary_key=True)
+    weight = Column(REAL, nullable=False)
+    # Lecturas promediadas en esta fila (varias en el mismo día, o una semana al reducir el historial)
+    samples = Column(SmallInteger, nullable=False, default=1)
@@ -0,0 +1,36 @@
+# src/models/withdrawal.py
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, DATERANGE
+from datetime import datetime
+
+from src.infrastructure.database import Base
+
+
+class MedicineWithdrawal(Base):
+    """
+    Días de retiro por medicamento (leche y carne), contados desde el último día de tratamiento.
+    `medicine` se guarda normalizado (minúsculas, sin espacios en los extremos) para cruzarlo con health_events.
+    """
+    __tablename__ = "medicine_withdrawals"
+
+    medicine = Column(String(100), primary_key=True)
+    milk_days = Column(Integer, nullable=False, default=0)
+    meat_days = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class WithdrawalPeriod(Base):
+    """
+    Periodo de retiro de cada tratamiento y producto, mantenido por triggers
+    (ver src/infrastructure/withdrawals.py). `period` es [aplicación, fin de tratamiento + días de retiro).
+    """
+    __tablename__ = "withdrawal_periods"
+    __table_args__ = (
+        Index("ix_withdrawal_periods_period", "period", postgresql_using="gist"),
+    )
+
+    health_event_id = Column(UUID(as_uuid=True), ForeignKey("health_events.id", ondelete="CASCADE"), primary_key=True)
+    product = Column(String(10), primary_key=True)
+    cattle_id = Column(UUID(as_uuid=True), ForeignKey("cattle.id", ondelete="CASCADE"), nullable=False)
+    medicine = Column(String(100), nullable=False)
+    period = Column(DATERANGE, nullable=False)
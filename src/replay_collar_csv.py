@@ -0,0 +1,54 @@
+"""
+Script para reproducir lecturas grabadas de collares de actividad desde un CSV.
+
+Columnas: lote,recorded_at,steps (recorded_at en ISO 8601). Las filas se envían en el orden
+del archivo, en lotes, por el mismo camino que POST /activity/batch.
+
+Uso:
+    python -m src.replay_collar_csv lecturas.csv --batch-size 5000
+"""
+import argparse
+import csv
+from datetime import datetime
+from itertools import islice
+
+from src.infrastructure.database import SessionLocal
+from src.schemas.activity import ActivityReadingIn
+from src.services.activity_service import ActivityService
+
+
+def replay(path: str, batch_size: int) -> None:
+    db = SessionLocal()
+    batches = readings = analyzed = 0
+    unknown = set()
+    try:
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = csv.DictReader(file)
+            while True:
+                batch = [
+                    ActivityReadingIn(lote=row["lote"], recorded_at=datetime.fromisoformat(row["recorded_at"]), steps=int(row["steps"]))
+                    for row in islice(rows, batch_size)
+                ]
+                if not batch:
+                    break
+                result = ActivityService(db).ingest(batch)
+                batches += 1
+                readings += len(batch)
+                analyzed += result.analyzed_buckets
+                unknown.update(result.unknown_lotes)
+                for heat in result.heats_detected:
+                    print(f"🔥 Celo detectado: {heat.cattle_name} (Lote: {heat.lote}) el {heat.heat_date}, actividad x{heat.activity_ratio}")
+    finally:
+        db.close()
+
+    print(f"\n✅ {readings} lecturas en {batches} lotes, {analyzed} intervalos analizados")
+    if unknown:
+        print(f"⚠️ Lotes desconocidos: {', '.join(sorted(unknown))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reproduce lecturas de collares de actividad desde un CSV")
+    parser.add_argument("path", help="Archivo CSV con columnas lote,recorded_at,steps")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Lecturas por lote (máximo 50000)")
+    args = parser.parse_args()
+    replay(args.path, min(args.batch_size, 50000))
@@ -1,12 +1,40 @@
 # src/repositories/__init__.py
+from src.repositories.activity_repository import ActivityRepository
+from src.repositories.agenda_repository import AgendaRepository
 from src.repositories.cattle_repository import CattleRepository
+from src.repositories.demographics_repository import DemographicsRepository
+from src.repositories.digest_repository import DigestRepository
 from src.repositories.health_event_repository import HealthEventRepository
 from src.repositories.heat_event_repository import HeatEventRepository
+from src.repositories.herd_summary_repository import HerdSummaryRepository
+from src.repositories.outbreak_repository import OutbreakRepository
+from src.repositories.protocol_repository import ProtocolRepository
+from src.repositories.read_repository import ReadRepository
 from src.repositories.reminder_repository import ReminderRepository
+from src.repositories.reproduction_repository import ReproductionRepository
+from src.repositories.search_repository import SearchRepository
+from src.repositories.snapshot_repository import SnapshotRepository
+from src.repositories.unit_of_work import UnitOfWork
+from src.repositories.weight_repository import WeightRepository
+from src.repositories.withdrawal_repository import WithdrawalRepository
 
 __all__ = [
+    "ActivityRepository",
+    "AgendaRepository",
     "CattleRepository",
+    "DemographicsRepository",
+    "DigestRepository",
     "HealthEventRepository",
     "HeatEventRepository",
-    "ReminderRepository"
+    "HerdSummaryRepository",
+    "OutbreakRepository",
+    "ProtocolRepository",
+    "ReadRepository",
+    "ReminderRepository",
+    "ReproductionRepository",
+    "SearchRepository",
+    "SnapshotRepository",
+    "UnitOfWork",
+    "WeightRepository",
+    "WithdrawalRepository"
 ]
@@ -0,0 +1,88 @@
+# src/repositories/activity_repository.py
+from datetime import date, datetime
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.activity import ActivityDetectorState, ActivityReading
+from src.models.heat_event import HeatEventModel
+from src.repositories.base import BaseRepository, BATCH_SIZE, chunked
+
+
+class ActivityRepository(BaseRepository):
+    """Lecturas de los collares de actividad y estado del detector de celos"""
+
+    def upsert_buckets(self, rows: Sequence[dict], batch_size: int = BATCH_SIZE) -> int:
+        """
+        Guarda intervalos (cattle_id, bucket_start, steps, samples) ya agregados.
+        Si el intervalo existe se suman los pasos: los collares pueden enviar un intervalo en varias partes.
+        """
+        for batch in chunked(rows, batch_size):
+            stmt = insert(ActivityReading).values(list(batch))
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[ActivityReading.cattle_id, ActivityReading.bucket_start],
+                set_={
+                    "steps": ActivityReading.steps + stmt.excluded.steps,
+                    "samples": ActivityReading.samples + stmt.excluded.samples
+                }
+            ))
+        self._commit()
+        return len(rows)
+
+    def lock_states(self, cattle_ids: List[UUID]) -> Dict[UUID, ActivityDetectorState]:
+        """
+        Estado del detector de cada animal, bloqueado hasta el fin de la transacción
+        para que dos lotes simultáneos del mismo collar no lo pisen. Crea los que falten.
+        """
+        if not cattle_ids:
+            return {}
+        self.db.execute(
+            insert(ActivityDetectorState)
+            .values([{"cattle_id": cattle_id, "cusum": 0.0, "buckets_seen": 0} for cattle_id in cattle_ids])
+            .on_conflict_do_nothing(index_elements=[ActivityDetectorState.cattle_id])
+        )
+        states = self.db.scalars(
+            select(ActivityDetectorState)
+            .where(ActivityDetectorState.cattle_id.in_(cattle_ids))
+            .order_by(ActivityDetectorState.cattle_id)
+            .with_for_update()
+        ).all()
+        return {state.cattle_id: state for state in states}
+
+    def get_unprocessed_buckets(self, cattle_ids: List[UUID]) -> List[Tuple[UUID, datetime, int]]:
+        """
+        Intervalos posteriores al último analizado de cada animal, ordenados por animal y hora.
+        Incluye el último intervalo recibido, que puede seguir abierto; quien llama decide si lo analiza.
+        """
+        if not cattle_ids:
+            return []
+        return self.db.execute(
+            select(ActivityReading.cattle_id, ActivityReading.bucket_start, ActivityReading.steps)
+            .join(ActivityDetectorState, ActivityDetectorState.cattle_id == ActivityReading.cattle_id)
+            .where(
+                ActivityReading.cattle_id.in_(cattle_ids),
+                or_(
+                    ActivityDetectorState.last_bucket.is_(None),
+                    ActivityReading.bucket_start > ActivityDetectorState.last_bucket
+                )
+            )
+            .order_by(ActivityReading.cattle_id, ActivityReading.bucket_start)
+        ).all()
+
+    def get_heat_dates(self, cattle_ids: List[UUID], start_date: date, end_date: date) -> List[Tuple[UUID, date]]:
+        """Celos ya registrados de esos animales en el rango, para no duplicar detecciones"""
+        if not cattle_ids:
+            return []
+        return self.db.execute(
+            select(HeatEventModel.cattle_id, HeatEventModel.heat_date).where(
+                HeatEventModel.cattle_id.in_(cattle_ids),
+                HeatEventModel.heat_date.between(start_date, end_date)
+            )
+        ).all()
+
+    def delete_before(self, cutoff: datetime) -> int:
+        """Elimina los intervalos anteriores a `cutoff` (el detector solo necesita su estado)"""
+        result = self.db.execute(delete(ActivityReading).where(ActivityReading.bucket_start < cutoff))
+        self._commit()
+        return result.rowcount
@@ -0,0 +1,127 @@
+# src/repositories/agenda_repository.py
+from datetime import date, timedelta
+from typing import List, Optional, Sequence
+from sqlalchemy import String, cast, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from src.core.reproduction import GESTATION_DAYS, PREGNANCY_CHECK_DAYS
+from src.models.cattle import Cattle
+from src.models.health_event import HealthEvent
+from src.models.heat_event import HeatEventModel
+from src.models.reminder import Reminder
+from src.schemas.agenda import AgendaItem, AgendaItemTypeEnum
+
+
+def _item_type(item_type: AgendaItemTypeEnum):
+    return literal(item_type.value, String).label("item_type")
+
+
+def _dated_detail(prefix: str, column):
+    return literal(prefix, String).concat(cast(column, String)).label("detail")
+
+
+class AgendaRepository:
+    """
+    Agenda del rancho guardada en la base: una sola consulta UNION ALL sobre recordatorios,
+    próximas dosis, chequeos de preñez y partos previstos. Cada rama filtra por una columna
+    de fecha indexada; las fechas proyectadas se filtran sobre la fecha base desplazada para
+    poder usar el índice. Los celos esperados salen de la predicción (ver AgendaService).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _reminders(self, start: date, end: date):
+        return select(
+            Reminder.reminder_date.label("item_date"),
+            _item_type(AgendaItemTypeEnum.reminder),
+            Reminder.title.label("title"),
+            Reminder.reminder_type.label("detail"),
+            Reminder.id.label("source_id"),
+            Cattle.id.label("cattle_id"),
+            Cattle.lote.label("lote"),
+            Cattle.name.label("cattle_name")
+        ).outerjoin(Cattle, Reminder.cattle_id == Cattle.id).where(
+            Reminder.status == "pending",
+            Reminder.reminder_date.between(start, end)
+        )
+
+    def _doses(self, start: date, end: date):
+        return select(
+            HealthEvent.next_dose_date.label("item_date"),
+            _item_type(AgendaItemTypeEnum.dose),
+            func.coalesce(HealthEvent.medicine_name, HealthEvent.disease_name, "Dosis").label("title"),
+            HealthEvent.dosage.label("detail"),
+            HealthEvent.id.label("source_id"),
+            Cattle.id.label("cattle_id"),
+            Cattle.lote.label("lote"),
+            Cattle.name.label("cattle_name")
+        ).join(Cattle, HealthEvent.cattle_id == Cattle.id).where(
+            HealthEvent.next_dose_date.between(start, end)
+        )
+
+    def _pregnancy_checks(self, start: date, end: date):
+        offset = timedelta(days=PREGNANCY_CHECK_DAYS)
+        return select(
+            (HeatEventModel.insemination_date + PREGNANCY_CHECK_DAYS).label("item_date"),
+            _item_type(AgendaItemTypeEnum.pregnancy_check),
+            literal("Chequeo de preñez", String).label("title"),
+            _dated_detail("Inseminada ", HeatEventModel.insemination_date),
+            HeatEventModel.id.label("source_id"),
+            Cattle.id.label("cattle_id"),
+            Cattle.lote.label("lote"),
+            Cattle.name.label("cattle_name")
+        ).join(Cattle, HeatEventModel.cattle_id == Cattle.id).where(
+            HeatEventModel.was_inseminated.is_(True),
+            HeatEventModel.pregnancy_confirmed.is_(None),
+            HeatEventModel.insemination_date.between(start - offset, end - offset)
+        )
+
+    def _calvings(self, start: date, end: date):
+        offset = timedelta(days=GESTATION_DAYS)
+        return select(
+            (HeatEventModel.insemination_date + GESTATION_DAYS).label("item_date"),
+            _item_type(AgendaItemTypeEnum.calving),
+            literal("Parto previsto", String).label("title"),
+            _dated_detail("Inseminada ", HeatEventModel.insemination_date),
+            HeatEventModel.id.label("source_id"),
+            Cattle.id.label("cattle_id"),
+            Cattle.lote.label("lote"),
+            Cattle.name.label("cattle_name")
+        ).join(Cattle, HeatEventModel.cattle_id == Cattle.id).where(
+            HeatEventModel.pregnancy_confirmed.is_(True),
+            HeatEventModel.insemination_date.between(start - offset, end - offset),
+            # Si ya se registró un parto posterior a la inseminación, no hay parto pendiente
+            or_(Cattle.fecha_ultimo_parto.is_(None), Cattle.fecha_ultimo_parto < HeatEventModel.insemination_date)
+        )
+
+    def get_agenda(
+        self,
+        start_date: date,
+        end_date: date,
+        item_types: Optional[Sequence[AgendaItemTypeEnum]] = None,
+        lotes: Optional[List[str]] = None
+    ) -> List[AgendaItem]:
+        """Tareas del rango de fechas (ambos incluidos), ordenadas por fecha"""
+        branches = {
+            AgendaItemTypeEnum.reminder: self._reminders,
+            AgendaItemTypeEnum.dose: self._doses,
+            AgendaItemTypeEnum.pregnancy_check: self._pregnancy_checks,
+            AgendaItemTypeEnum.calving: self._calvings,
+        }
+        selected = [item_type for item_type in item_types or branches if item_type in branches]
+        if not selected:
+            return []
+
+        queries = []
+        for item_type in selected:
+            query = branches[item_type](start_date, end_date)
+            if lotes:
+                query = query.where(Cattle.lote.in_(lotes))
+            queries.append(query)
+
+        agenda = union_all(*queries).subquery()
+        rows = self.db.execute(
+            select(agenda).order_by(agenda.c.item_date, agenda.c.item_type, agenda.c.lote)
+        ).mappings()
+        return [AgendaItem(**row) for row in rows]
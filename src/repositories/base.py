@@ -0,0 +1,53 @@
+# src/repositories/base.py
+from typing import Iterator, List, Sequence, TypeVar
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, aliased
+
+
+T = TypeVar("T")
+
+# Filas por sentencia INSERT ... RETURNING en las escrituras por lotes
+BATCH_SIZE = 500
+
+
+def chunked(items: Sequence[T], size: int = BATCH_SIZE) -> Iterator[Sequence[T]]:
+    """Divide una secuencia en bloques de como máximo `size` elementos"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def top_n_per_group(model, partition_by, order_by: Sequence, n: int, *conditions) -> Select:
+    """
+    Consulta con las `n` primeras filas de `model` por cada valor de `partition_by`.
+    Usa ROW_NUMBER() OVER (PARTITION BY ...) para resolver varios grupos en una sola sentencia.
+    """
+    row_number = func.row_number().over(partition_by=partition_by, order_by=list(order_by)).label("row_number")
+    ranked = select(model, row_number).where(*conditions).subquery()
+    ranked_model = aliased(model, ranked)
+    return select(ranked_model).where(ranked.c.row_number <= n).order_by(ranked.c[partition_by.key], ranked.c.row_number)
+
+
+
+def top_n_rows_per_group(columns: Sequence, partition_by, order_by: Sequence, n: int, *conditions) -> Select:
+    """Como `top_n_per_group`, pero selecciona solo `columns` (sin cargar entidades ORM)"""
+    row_number = func.row_number().over(partition_by=partition_by, order_by=list(order_by)).label("row_number")
+    ranked = select(*columns, row_number).where(*conditions).subquery()
+    return select(*(ranked.c[column.key] for column in columns)).where(ranked.c.row_number <= n).order_by(
+        ranked.c[partition_by.key], ranked.c.row_number
+    )
+
+
+class BaseRepository:
+    """
+    Base común de los repositorios.
+    Con `auto_commit=False` las escrituras quedan en la transacción abierta y
+    es quien llama (normalmente un UnitOfWork) el que hace commit una sola vez.
+    """
+
+    def __init__(self, db: Session, auto_commit: bool = True):
+        self.db = db
+        self.auto_commit = auto_commit
+
+    def _commit(self) -> None:
+        if self.auto_commit:
+            self.db.commit()
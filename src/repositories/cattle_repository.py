@@ -1,33 +1,48 @@
 # src/repositories/cattle_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select, insert, update, delete
 
 from src.models.cattle import Cattle
-from src.schemas.cattle import CattleCreate, CattleUpdate
+from src.schemas.cattle import CattleCreate, CattleUpdate, CattleBatchUpdate
+from src.repositories.base import BaseRepository, BATCH_SIZE, chunked
+from src.repositories.pagination import paginate, count_rows
 
 
-class CattleRepository:
-    
-    def __init__(self, db: Session):
-        self.db = db
+# Consultas más frecuentes de las herramientas, construidas una sola vez con parámetros ligados:
+# cada llamada solo liga los valores y reutiliza la sentencia compilada de la caché de SQLAlchemy
+_BY_LOTE = select(Cattle).where(Cattle.lote == bindparam("lote"))
+
+
+class CattleRepository(BaseRepository):
     
     def create(self, cattle_data: CattleCreate) -> Cattle:
         """Crea un nuevo registro de ganado"""
-        db_cattle = Cattle(**cattle_data.model_dump())
-        self.db.add(db_cattle)
-        self.db.commit()
-        self.db.refresh(db_cattle)
+        db_cattle = self.db.scalars(insert(Cattle).returning(Cattle), [cattle_data.model_dump()]).one()
+        self._commit()
         return db_cattle
     
     def get_by_id(self, cattle_id: UUID) -> Optional[Cattle]:
-        """Obtiene un ganado por su ID"""
-        return self.db.query(Cattle).filter(Cattle.id == cattle_id).first()
+        """Obtiene un ganado por su ID (sin consulta si ya está cargado en la sesión)"""
+        return self.db.get(Cattle, cattle_id)
     
     def get_by_lote(self, lote: str) -> Optional[Cattle]:
         """Obtiene un ganado por su lote"""
-        return self.db.query(Cattle).filter(Cattle.lote == lote).first()
+        return self.db.scalars(_BY_LOTE, {"lote": lote}).first()
+    
+    def get_by_lotes(self, lotes: List[str]) -> List[Cattle]:
+        """Obtiene varios ganados por sus lotes con una sola consulta IN"""
+        if not lotes:
+            return []
+        return list(self.db.scalars(select(Cattle).where(Cattle.lote.in_(lotes))))
+    
+    def get_by_ids(self, cattle_ids: List[UUID]) -> List[Cattle]:
+        """Obtiene varios ganados por sus IDs con una sola consulta IN"""
+        if not cattle_ids:
+            return []
+        return list(self.db.scalars(select(Cattle).where(Cattle.id.in_(cattle_ids))))
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Cattle]:
         """Obtiene todos los registros de ganado con paginación"""
@@ -47,33 +62,84 @@ class CattleRepository:
             Cattle.name.ilike(f"%{name}%")
         ).offset(skip).limit(limit).all()
     
+    def list_page(
+        self,
+        gender: Optional[str] = None,
+        breed: Optional[str] = None,
+        name: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[Cattle], int, Optional[str]]:
+        """Lista ganado con filtros y paginación por cursor ordenada por lote"""
+        stmt = select(Cattle)
+        if gender:
+            stmt = stmt.where(Cattle.gender == gender)
+        if breed:
+            stmt = stmt.where(Cattle.breed == breed)
+        if name:
+            stmt = stmt.where(Cattle.name.ilike(f"%{name}%"))
+        
+        items, next_cursor = paginate(self.db, stmt, [Cattle.lote], cursor, limit)
+        return items, count_rows(self.db, stmt), next_cursor
+    
     def count(self) -> int:
         """Cuenta el total de registros de ganado"""
         return self.db.query(func.count(Cattle.id)).scalar()
     
     def update(self, cattle_id: UUID, cattle_data: CattleUpdate) -> Optional[Cattle]:
         """Actualiza un registro de ganado"""
-        db_cattle = self.get_by_id(cattle_id)
-        if not db_cattle:
-            return None
-        
         update_data = cattle_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_cattle, field, value)
+        if not update_data:
+            return self.get_by_id(cattle_id)
         
-        self.db.commit()
-        self.db.refresh(db_cattle)
+        db_cattle = self.db.scalars(
+            update(Cattle).where(Cattle.id == cattle_id).values(**update_data).returning(Cattle)
+        ).one_or_none()
+        self._commit()
         return db_cattle
     
     def delete(self, cattle_id: UUID) -> bool:
         """Elimina un registro de ganado"""
-        db_cattle = self.get_by_id(cattle_id)
-        if not db_cattle:
-            return False
+        result = self.db.execute(delete(Cattle).where(Cattle.id == cattle_id))
+        self._commit()
+        return result.rowcount > 0
+    
+    def create_many(self, items: List[CattleCreate], batch_size: int = BATCH_SIZE) -> List[Cattle]:
+        """Crea varios registros de ganado en una sola transacción"""
+        rows = [item.model_dump() for item in items]
+        created = []
+        for batch in chunked(rows, batch_size):
+            created.extend(self.db.scalars(
+                insert(Cattle).returning(Cattle, sort_by_parameter_order=True), batch
+            ).all())
+        self._commit()
+        return created
+    
+    def update_many(self, items: List[CattleBatchUpdate]) -> Optional[List[Cattle]]:
+        """Actualiza varios registros en una sola transacción. Devuelve None si algún ID no existe"""
+        ids = [item.id for item in items]
+        found = {c.id: c for c in self.db.scalars(select(Cattle).where(Cattle.id.in_(ids)))}
+        if len(found) != len(set(ids)):
+            return None
         
-        self.db.delete(db_cattle)
-        self.db.commit()
-        return True
+        for item in items:
+            db_cattle = found[item.id]
+            for field, value in item.model_dump(exclude_unset=True, exclude={"id"}).items():
+                setattr(db_cattle, field, value)
+        
+        self.db.flush()
+        self._commit()
+        return [found[item.id] for item in items]
+    
+    def delete_many(self, ids: List[UUID]) -> int:
+        """Elimina varios registros de ganado en una sola sentencia"""
+        result = self.db.execute(delete(Cattle).where(Cattle.id.in_(ids)))
+        self._commit()
+        return result.rowcount
+    
+    def get_existing_lotes(self, lotes: List[str]) -> List[str]:
+        """Devuelve cuáles de los lotes indicados ya están registrados"""
+        return list(self.db.scalars(select(Cattle.lote).where(Cattle.lote.in_(lotes))))
     
     def exists_lote(self, lote: str, exclude_id: Optional[UUID] = None) -> bool:
         """Verifica si un lote ya existe"""
@@ -81,3 +147,10 @@ class CattleRepository:
         if exclude_id:
             query = query.filter(Cattle.id != exclude_id)
         return query.first() is not None
+    
+    def get_identity_rows(self, changed_since: Optional[datetime] = None) -> List[Tuple[UUID, str, str]]:
+        """(id, lote, nombre) de todo el ganado, o solo del modificado desde `changed_since`"""
+        stmt = select(Cattle.id, Cattle.lote, Cattle.name)
+        if changed_since:
+            stmt = stmt.where(Cattle.updated_at >= changed_since)
+        return [tuple(row) for row in self.db.execute(stmt)]
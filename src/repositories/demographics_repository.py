@@ -0,0 +1,121 @@
+# src/repositories/demographics_repository.py
+from datetime import date
+from typing import Optional
+from sqlalchemy import Float, and_, case, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from src.models.cattle import Cattle, GenderEnum
+from src.schemas.demographics import DemographicsGroup, HerdDemographics
+
+
+# (etiqueta, edad mínima incluida, edad máxima excluida) en años cumplidos
+AGE_BUCKETS = [
+    ("0-1", 0, 1),
+    ("1-3", 1, 3),
+    ("3-5", 3, 5),
+    ("5-8", 5, 8),
+    ("8+", 8, None),
+]
+UNKNOWN_AGE = "sin fecha"
+
+
+def _years_ago(today: date, years: int) -> date:
+    """Misma fecha `years` años antes (el 29 de febrero pasa al 28)"""
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        return today.replace(year=today.year - years, day=28)
+
+
+def age_group(birth_date, today: date):
+    """Expresión CASE con la etiqueta de AGE_BUCKETS que corresponde a la columna `birth_date`"""
+    whens = [
+        (birth_date > _years_ago(today, max_years), label)
+        for label, _, max_years in AGE_BUCKETS if max_years is not None
+    ]
+    whens.append((birth_date.is_not(None), AGE_BUCKETS[-1][0]))
+    return case(*whens, else_=UNKNOWN_AGE)
+
+
+class DemographicsRepository:
+    """Agregados del rebaño por raza y género calculados en una sola consulta"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_demographics(
+        self,
+        breed: Optional[str] = None,
+        gender: Optional[GenderEnum] = None,
+        min_age_years: Optional[int] = None,
+        max_age_years: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> HerdDemographics:
+        today = today or date.today()
+        breed_column = func.coalesce(Cattle.breed, "Sin raza")
+
+        # Los rangos de edad se comparan sobre birth_date para usar fechas fijas en vez de calcular la edad por fila
+        age_counts = []
+        for label, min_years, max_years in AGE_BUCKETS:
+            conditions = [Cattle.birth_date <= _years_ago(today, min_years)]
+            if max_years is not None:
+                conditions.append(Cattle.birth_date > _years_ago(today, max_years))
+            age_counts.append(func.count().filter(and_(*conditions)).label(label))
+        age_counts.append(func.count().filter(Cattle.birth_date.is_(None)).label(UNKNOWN_AGE))
+
+        def percentile(fraction: float, label: str):
+            return func.percentile_cont(fraction).within_group(Cattle.weight).label(label)
+
+        stmt = select(
+            func.grouping(breed_column, Cattle.gender).label("is_total"),
+            breed_column.label("breed"),
+            Cattle.gender,
+            func.count().label("count"),
+            *age_counts,
+            func.avg(Cattle.weight).cast(Float).label("weight_mean"),
+            percentile(0.5, "weight_median"),
+            percentile(0.25, "weight_p25"),
+            percentile(0.75, "weight_p75"),
+            percentile(0.9, "weight_p90")
+        ).group_by(
+            func.grouping_sets(tuple_(breed_column, Cattle.gender), tuple_())
+        ).order_by(breed_column, Cattle.gender)
+
+        if breed:
+            stmt = stmt.where(func.lower(Cattle.breed) == breed.lower())
+        if gender:
+            stmt = stmt.where(Cattle.gender == gender)
+        if min_age_years is not None:
+            stmt = stmt.where(Cattle.birth_date <= _years_ago(today, min_age_years))
+        if max_age_years is not None:
+            # "hasta N años" incluye a los que tienen N años cumplidos
+            stmt = stmt.where(Cattle.birth_date > _years_ago(today, max_age_years + 1))
+
+        groups, total = [], None
+        for row in self.db.execute(stmt).mappings():
+            group = DemographicsGroup(
+                breed=row["breed"],
+                gender=row["gender"].value if row["gender"] else None,
+                count=row["count"],
+                age_buckets={label: row[label] for label, _, _ in AGE_BUCKETS} | {UNKNOWN_AGE: row[UNKNOWN_AGE]},
+                weight_mean=row["weight_mean"],
+                weight_median=row["weight_median"],
+                weight_p25=row["weight_p25"],
+                weight_p75=row["weight_p75"],
+                weight_p90=row["weight_p90"]
+            )
+            if row["is_total"]:
+                total = group.model_copy(update={"breed": None, "gender": None})
+            else:
+                groups.append(group)
+
+        return HerdDemographics(
+            as_of=today,
+            breed=breed,
+            gender=gender.value if gender else None,
+            min_age_years=min_age_years,
+            max_age_years=max_age_years,
+            groups=groups,
+            # El conjunto de agrupación vacío () devuelve el total incluso si ningún animal cumple los filtros
+            total=total
+        )
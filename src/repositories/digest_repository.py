@@ -0,0 +1,113 @@
+# src/repositories/digest_repository.py
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.reproduction import PREGNANCY_CHECK_DAYS
+from src.models.cattle import Cattle
+from src.models.daily_digest import DailyDigest, DailyDigestStale
+from src.models.health_event import HealthEvent
+from src.models.heat_event import HeatEventModel
+from src.repositories.base import BaseRepository
+from src.repositories.reminder_repository import ReminderRepository
+
+
+def _rows(result) -> List[Dict[str, Any]]:
+    """Convierte filas a dicts serializables en JSON"""
+    return [
+        {
+            key: value.isoformat() if isinstance(value, date) else getattr(value, "value", value)
+            for key, value in row.items()
+        }
+        for row in result.mappings()
+    ]
+
+
+class DigestRepository(BaseRepository):
+    """Lectura y escritura del resumen diario precalculado"""
+
+    # Elementos por sección, igual que el límite de las herramientas del agente
+    SECTION_LIMIT = 50
+
+    # Ventana de próximas dosis que se precalcula
+    DOSE_WINDOW_DAYS = 30
+
+    SECTIONS = ("overdue_reminders", "upcoming_doses", "pending_pregnancy_checks")
+
+    def get(self, digest_date: date) -> Optional[DailyDigest]:
+        return self.db.get(DailyDigest, digest_date)
+
+    def overdue_reminders(self, today: date) -> List[Dict[str, Any]]:
+        # Incluye las ocurrencias vencidas de los recordatorios recurrentes
+        return [
+            occurrence.model_dump(mode="json", include={"title", "reminder_date", "reminder_type", "description"})
+            for occurrence in ReminderRepository(self.db).get_overdue(limit=self.SECTION_LIMIT, today=today)
+        ]
+
+    def upcoming_doses(self, today: date) -> List[Dict[str, Any]]:
+        return _rows(self.db.execute(
+            select(
+                Cattle.name.label("cattle_name"),
+                Cattle.lote,
+                HealthEvent.next_dose_date,
+                HealthEvent.event_type,
+                HealthEvent.medicine_name,
+                HealthEvent.dosage
+            )
+            .join(Cattle, HealthEvent.cattle_id == Cattle.id)
+            .where(HealthEvent.next_dose_date.between(today, today + timedelta(days=self.DOSE_WINDOW_DAYS)))
+            .order_by(HealthEvent.next_dose_date)
+            .limit(self.SECTION_LIMIT)
+        ))
+
+    def pending_pregnancy_checks(self, today: date) -> List[Dict[str, Any]]:
+        return _rows(self.db.execute(
+            select(Cattle.name.label("cattle_name"), Cattle.lote, HeatEventModel.insemination_date)
+            .join(Cattle, HeatEventModel.cattle_id == Cattle.id)
+            .where(
+                HeatEventModel.was_inseminated.is_(True),
+                HeatEventModel.pregnancy_confirmed.is_(None),
+                HeatEventModel.insemination_date <= today - timedelta(days=PREGNANCY_CHECK_DAYS)
+            )
+            .order_by(HeatEventModel.insemination_date)
+            .limit(self.SECTION_LIMIT)
+        ))
+
+    def save(self, digest_date: date, sections: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Inserta el resumen del día o reemplaza solo las secciones recibidas.
+        INSERT ... ON CONFLICT permite que varios procesos lo generen a la vez sin chocar.
+        """
+        now = datetime.utcnow()
+        values = {section: [] for section in self.SECTIONS}
+        values.update(sections)
+        stmt = insert(DailyDigest).values(digest_date=digest_date, generated_at=now, updated_at=now, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailyDigest.digest_date],
+            set_={**{section: stmt.excluded[section] for section in sections}, "updated_at": now}
+        )
+        self.db.execute(stmt)
+        self._commit()
+
+    def mark_stale(self, sections: List[str]) -> None:
+        """Marca secciones para recalcular; varios procesos pueden marcar la misma a la vez"""
+        stmt = insert(DailyDigestStale).values([{"section": section, "marked_at": datetime.utcnow()} for section in sections])
+        self.db.execute(stmt.on_conflict_do_nothing(index_elements=[DailyDigestStale.section]))
+        self._commit()
+
+    def has_stale(self) -> bool:
+        return self.db.scalar(select(DailyDigestStale.section).limit(1)) is not None
+
+    def take_stale(self) -> List[str]:
+        """
+        Quita y devuelve las secciones marcadas, sin confirmar: se confirma junto con el
+        recálculo (save), así que si este falla las marcas siguen ahí.
+        """
+        return list(self.db.scalars(delete(DailyDigestStale).returning(DailyDigestStale.section)))
+
+    def delete_before(self, digest_date: date) -> int:
+        """Elimina los resúmenes de días anteriores"""
+        deleted = self.db.query(DailyDigest).filter(DailyDigest.digest_date < digest_date).delete(synchronize_session=False)
+        self._commit()
+        return deleted
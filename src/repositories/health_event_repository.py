@@ -1,30 +1,35 @@
 # src/repositories/health_event_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import bindparam, func, and_, select, insert, update, delete
+from sqlalchemy.engine import Result
 
+from src.models.cattle import Cattle
 from src.models.health_event import HealthEvent, EventTypeEnum
-from src.schemas.health_event import HealthEventCreate, HealthEventUpdate
+from src.schemas.health_event import HealthEventCreate, HealthEventUpdate, HealthEventBatchUpdate
+from src.repositories.base import BaseRepository, BATCH_SIZE, chunked, top_n_per_group
+from src.repositories.pagination import paginate, count_rows
 
 
-class HealthEventRepository:
-    
-    def __init__(self, db: Session):
-        self.db = db
+# Historial de un animal: sentencia construida una vez, con parámetros ligados (ver cattle_repository)
+_BY_CATTLE = select(HealthEvent).where(
+    HealthEvent.cattle_id == bindparam("cattle_id")
+).order_by(HealthEvent.application_date.desc()).offset(bindparam("skip")).limit(bindparam("limit"))
+
+
+class HealthEventRepository(BaseRepository):
     
     def create(self, event_data: HealthEventCreate) -> HealthEvent:
         """Crea un nuevo evento de salud"""
-        db_event = HealthEvent(**event_data.model_dump())
-        self.db.add(db_event)
-        self.db.commit()
-        self.db.refresh(db_event)
+        db_event = self.db.scalars(insert(HealthEvent).returning(HealthEvent), [event_data.model_dump()]).one()
+        self._commit()
         return db_event
     
     def get_by_id(self, event_id: UUID) -> Optional[HealthEvent]:
-        """Obtiene un evento de salud por su ID"""
-        return self.db.query(HealthEvent).filter(HealthEvent.id == event_id).first()
+        """Obtiene un evento de salud por su ID (sin consulta si ya está cargado en la sesión)"""
+        return self.db.get(HealthEvent, event_id)
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[HealthEvent]:
         """Obtiene todos los eventos de salud con paginación"""
@@ -32,9 +37,31 @@ class HealthEventRepository:
     
     def get_by_cattle_id(self, cattle_id: UUID, skip: int = 0, limit: int = 100) -> List[HealthEvent]:
         """Obtiene todos los eventos de salud de un ganado específico"""
-        return self.db.query(HealthEvent).filter(
-            HealthEvent.cattle_id == cattle_id
-        ).order_by(HealthEvent.application_date.desc()).offset(skip).limit(limit).all()
+        return list(self.db.scalars(_BY_CATTLE, {"cattle_id": cattle_id, "skip": skip, "limit": limit}))
+    
+    def get_latest_by_cattle_ids(
+        self,
+        cattle_ids: List[UUID],
+        per_cattle: int = 1,
+        event_type: Optional[EventTypeEnum] = None,
+        medicine_name: Optional[str] = None
+    ) -> List[HealthEvent]:
+        """Obtiene los `per_cattle` eventos más recientes de cada ganado en una sola consulta"""
+        if not cattle_ids:
+            return []
+        conditions = [HealthEvent.cattle_id.in_(cattle_ids)]
+        if event_type:
+            conditions.append(HealthEvent.event_type == event_type)
+        if medicine_name:
+            conditions.append(HealthEvent.medicine_name.ilike(f"%{medicine_name}%"))
+        stmt = top_n_per_group(
+            HealthEvent,
+            HealthEvent.cattle_id,
+            [HealthEvent.application_date.desc(), HealthEvent.id],
+            per_cattle,
+            *conditions
+        )
+        return list(self.db.scalars(stmt))
     
     def get_by_event_type(self, event_type: EventTypeEnum, skip: int = 0, limit: int = 100) -> List[HealthEvent]:
         """Obtiene eventos de salud por tipo"""
@@ -60,6 +87,69 @@ class HealthEventRepository:
             )
         ).order_by(HealthEvent.next_dose_date).offset(skip).limit(limit).all()
     
+    def stream_for_export(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        lotes: Optional[List[str]] = None,
+        event_type: Optional[EventTypeEnum] = None,
+        batch_size: int = 1000
+    ) -> Result:
+        """
+        Recorre los eventos de salud con un cursor del lado del servidor.
+        Las filas llegan en bloques de `batch_size`, así la memoria no crece con el tamaño de la exportación.
+        """
+        stmt = select(
+            HealthEvent.id,
+            Cattle.lote,
+            Cattle.name.label("cattle_name"),
+            HealthEvent.event_type,
+            HealthEvent.disease_name,
+            HealthEvent.medicine_name,
+            HealthEvent.application_date,
+            HealthEvent.administration_route,
+            HealthEvent.next_dose_date,
+            HealthEvent.treatment_end_date,
+            HealthEvent.dosage,
+            HealthEvent.veterinarian_name,
+            HealthEvent.notes,
+        ).join(Cattle, Cattle.id == HealthEvent.cattle_id)
+
+        if start_date:
+            stmt = stmt.where(HealthEvent.application_date >= start_date)
+        if end_date:
+            stmt = stmt.where(HealthEvent.application_date <= end_date)
+        if lotes:
+            stmt = stmt.where(Cattle.lote.in_(lotes))
+        if event_type:
+            stmt = stmt.where(HealthEvent.event_type == event_type)
+
+        stmt = stmt.order_by(HealthEvent.application_date, HealthEvent.id)
+        return self.db.execute(stmt.execution_options(yield_per=batch_size))
+    
+    def list_page(
+        self,
+        cattle_id: Optional[UUID] = None,
+        event_type: Optional[EventTypeEnum] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[HealthEvent], int, Optional[str]]:
+        """Lista eventos de salud con filtros y paginación por cursor (más recientes primero)"""
+        stmt = select(HealthEvent)
+        if cattle_id:
+            stmt = stmt.where(HealthEvent.cattle_id == cattle_id)
+        if event_type:
+            stmt = stmt.where(HealthEvent.event_type == event_type)
+        if start_date:
+            stmt = stmt.where(HealthEvent.application_date >= start_date)
+        if end_date:
+            stmt = stmt.where(HealthEvent.application_date <= end_date)
+        
+        items, next_cursor = paginate(self.db, stmt, [HealthEvent.application_date, HealthEvent.id], cursor, limit, descending=True)
+        return items, count_rows(self.db, stmt), next_cursor
+    
     def count(self) -> int:
         """Cuenta el total de eventos de salud"""
         return self.db.query(func.count(HealthEvent.id)).scalar()
@@ -72,24 +162,51 @@ class HealthEventRepository:
     
     def update(self, event_id: UUID, event_data: HealthEventUpdate) -> Optional[HealthEvent]:
         """Actualiza un evento de salud"""
-        db_event = self.get_by_id(event_id)
-        if not db_event:
-            return None
-        
         update_data = event_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_event, field, value)
+        if not update_data:
+            return self.get_by_id(event_id)
         
-        self.db.commit()
-        self.db.refresh(db_event)
+        db_event = self.db.scalars(
+            update(HealthEvent).where(HealthEvent.id == event_id).values(**update_data).returning(HealthEvent)
+        ).one_or_none()
+        self._commit()
         return db_event
     
+    def create_many(self, items: List[HealthEventCreate], batch_size: int = BATCH_SIZE) -> List[HealthEvent]:
+        """Crea varios eventos de salud en una sola transacción"""
+        rows = [item.model_dump() for item in items]
+        created = []
+        for batch in chunked(rows, batch_size):
+            created.extend(self.db.scalars(
+                insert(HealthEvent).returning(HealthEvent, sort_by_parameter_order=True), batch
+            ).all())
+        self._commit()
+        return created
+    
+    def update_many(self, items: List[HealthEventBatchUpdate]) -> Optional[List[HealthEvent]]:
+        """Actualiza varios eventos de salud en una sola transacción. Devuelve None si algún ID no existe"""
+        ids = [item.id for item in items]
+        found = {e.id: e for e in self.db.scalars(select(HealthEvent).where(HealthEvent.id.in_(ids)))}
+        if len(found) != len(set(ids)):
+            return None
+        
+        for item in items:
+            db_item = found[item.id]
+            for field, value in item.model_dump(exclude_unset=True, exclude={"id"}).items():
+                setattr(db_item, field, value)
+        
+        self.db.flush()
+        self._commit()
+        return [found[item.id] for item in items]
+    
+    def delete_many(self, ids: List[UUID]) -> int:
+        """Elimina varios eventos de salud en una sola sentencia"""
+        result = self.db.execute(delete(HealthEvent).where(HealthEvent.id.in_(ids)))
+        self._commit()
+        return result.rowcount
+    
     def delete(self, event_id: UUID) -> bool:
         """Elimina un evento de salud"""
-        db_event = self.get_by_id(event_id)
-        if not db_event:
-            return False
-        
-        self.db.delete(db_event)
-        self.db.commit()
-        return True
+        result = self.db.execute(delete(HealthEvent).where(HealthEvent.id == event_id))
+        self._commit()
+        return result.rowcount > 0
@@ -1,30 +1,35 @@
 # src/repositories/heat_event_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import bindparam, func, and_, select, insert, update, delete
+from sqlalchemy.engine import Result
 
+from src.models.cattle import Cattle, GenderEnum
 from src.models.heat_event import HeatEventModel
-from src.schemas.heat_event import HeatEventCreate, HeatEventUpdate
+from src.schemas.heat_event import HeatEventCreate, HeatEventUpdate, HeatEventBatchUpdate
+from src.repositories.base import BaseRepository, BATCH_SIZE, chunked, top_n_per_group
+from src.repositories.pagination import paginate, count_rows
 
 
-class HeatEventRepository:
-    
-    def __init__(self, db: Session):
-        self.db = db
+# Celos de un animal, del más reciente al más antiguo: sentencia construida una vez (ver cattle_repository)
+_BY_CATTLE = select(HeatEventModel).where(
+    HeatEventModel.cattle_id == bindparam("cattle_id")
+).order_by(HeatEventModel.heat_date.desc()).offset(bindparam("skip")).limit(bindparam("limit"))
+
+
+class HeatEventRepository(BaseRepository):
     
     def create(self, event_data: HeatEventCreate) -> HeatEventModel:
         """Crea un nuevo evento de celo"""
-        db_event = HeatEventModel(**event_data.model_dump())
-        self.db.add(db_event)
-        self.db.commit()
-        self.db.refresh(db_event)
+        db_event = self.db.scalars(insert(HeatEventModel).returning(HeatEventModel), [event_data.model_dump()]).one()
+        self._commit()
         return db_event
     
     def get_by_id(self, event_id: UUID) -> Optional[HeatEventModel]:
-        """Obtiene un evento de celo por su ID"""
-        return self.db.query(HeatEventModel).filter(HeatEventModel.id == event_id).first()
+        """Obtiene un evento de celo por su ID (sin consulta si ya está cargado en la sesión)"""
+        return self.db.get(HeatEventModel, event_id)
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[HeatEventModel]:
         """Obtiene todos los eventos de celo con paginación"""
@@ -32,15 +37,24 @@ class HeatEventRepository:
     
     def get_by_cattle_id(self, cattle_id: UUID, skip: int = 0, limit: int = 100) -> List[HeatEventModel]:
         """Obtiene todos los eventos de celo de un ganado específico"""
-        return self.db.query(HeatEventModel).filter(
-            HeatEventModel.cattle_id == cattle_id
-        ).order_by(HeatEventModel.heat_date.desc()).offset(skip).limit(limit).all()
+        return list(self.db.scalars(_BY_CATTLE, {"cattle_id": cattle_id, "skip": skip, "limit": limit}))
     
     def get_last_heat(self, cattle_id: UUID) -> Optional[HeatEventModel]:
         """Obtiene el último evento de celo de un ganado"""
-        return self.db.query(HeatEventModel).filter(
-            HeatEventModel.cattle_id == cattle_id
-        ).order_by(HeatEventModel.heat_date.desc()).first()
+        return self.db.scalars(_BY_CATTLE, {"cattle_id": cattle_id, "skip": 0, "limit": 1}).first()
+    
+    def get_latest_by_cattle_ids(self, cattle_ids: List[UUID], per_cattle: int = 1) -> List[HeatEventModel]:
+        """Obtiene los `per_cattle` celos más recientes de cada ganado en una sola consulta"""
+        if not cattle_ids:
+            return []
+        stmt = top_n_per_group(
+            HeatEventModel,
+            HeatEventModel.cattle_id,
+            [HeatEventModel.heat_date.desc(), HeatEventModel.id],
+            per_cattle,
+            HeatEventModel.cattle_id.in_(cattle_ids)
+        )
+        return list(self.db.scalars(stmt))
     
     def get_inseminated(self, skip: int = 0, limit: int = 100) -> List[HeatEventModel]:
         """Obtiene eventos de celo donde hubo inseminación"""
@@ -74,6 +88,91 @@ class HeatEventRepository:
             )
         ).order_by(HeatEventModel.heat_date.desc()).offset(skip).limit(limit).all()
     
+    def stream_for_export(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        lotes: Optional[List[str]] = None,
+        was_inseminated: Optional[bool] = None,
+        batch_size: int = 1000
+    ) -> Result:
+        """
+        Recorre los eventos de celo con un cursor del lado del servidor.
+        Las filas llegan en bloques de `batch_size`, así la memoria no crece con el tamaño de la exportación.
+        """
+        stmt = select(
+            HeatEventModel.id,
+            Cattle.lote,
+            Cattle.name.label("cattle_name"),
+            HeatEventModel.heat_date,
+            HeatEventModel.allows_mounting,
+            HeatEventModel.vaginal_discharge,
+            HeatEventModel.vulva_swelling,
+            HeatEventModel.comportamiento,
+            HeatEventModel.was_inseminated,
+            HeatEventModel.insemination_date,
+            HeatEventModel.pregnancy_confirmed,
+        ).join(Cattle, Cattle.id == HeatEventModel.cattle_id)
+
+        if start_date:
+            stmt = stmt.where(HeatEventModel.heat_date >= start_date)
+        if end_date:
+            stmt = stmt.where(HeatEventModel.heat_date <= end_date)
+        if lotes:
+            stmt = stmt.where(Cattle.lote.in_(lotes))
+        if was_inseminated is not None:
+            stmt = stmt.where(HeatEventModel.was_inseminated == was_inseminated)
+
+        stmt = stmt.order_by(HeatEventModel.heat_date, HeatEventModel.id)
+        return self.db.execute(stmt.execution_options(yield_per=batch_size))
+    
+    def get_herd_heat_history(self) -> List[Tuple]:
+        """
+        Historial de celos de todas las hembras, ordenado por animal y fecha.
+        Cada fila trae los datos del animal para no hacer una consulta por ganado.
+        """
+        return self.db.execute(
+            select(
+                HeatEventModel.cattle_id,
+                Cattle.lote,
+                Cattle.name,
+                Cattle.fecha_ultimo_parto,
+                HeatEventModel.heat_date,
+                HeatEventModel.was_inseminated,
+                HeatEventModel.pregnancy_confirmed,
+                HeatEventModel.id
+            )
+            .join(Cattle, Cattle.id == HeatEventModel.cattle_id)
+            .where(Cattle.gender == GenderEnum.female)
+            .order_by(HeatEventModel.cattle_id, HeatEventModel.heat_date)
+        ).all()
+    
+    def list_page(
+        self,
+        cattle_id: Optional[UUID] = None,
+        was_inseminated: Optional[bool] = None,
+        pregnancy_confirmed: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[HeatEventModel], int, Optional[str]]:
+        """Lista eventos de celo con filtros y paginación por cursor (más recientes primero)"""
+        stmt = select(HeatEventModel)
+        if cattle_id:
+            stmt = stmt.where(HeatEventModel.cattle_id == cattle_id)
+        if was_inseminated is not None:
+            stmt = stmt.where(HeatEventModel.was_inseminated == was_inseminated)
+        if pregnancy_confirmed is not None:
+            stmt = stmt.where(HeatEventModel.pregnancy_confirmed == pregnancy_confirmed)
+        if start_date:
+            stmt = stmt.where(HeatEventModel.heat_date >= start_date)
+        if end_date:
+            stmt = stmt.where(HeatEventModel.heat_date <= end_date)
+        
+        items, next_cursor = paginate(self.db, stmt, [HeatEventModel.heat_date, HeatEventModel.id], cursor, limit, descending=True)
+        return items, count_rows(self.db, stmt), next_cursor
+    
     def count(self) -> int:
         """Cuenta el total de eventos de celo"""
         return self.db.query(func.count(HeatEventModel.id)).scalar()
@@ -86,24 +185,51 @@ class HeatEventRepository:
     
     def update(self, event_id: UUID, event_data: HeatEventUpdate) -> Optional[HeatEventModel]:
         """Actualiza un evento de celo"""
-        db_event = self.get_by_id(event_id)
-        if not db_event:
-            return None
-        
         update_data = event_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_event, field, value)
+        if not update_data:
+            return self.get_by_id(event_id)
         
-        self.db.commit()
-        self.db.refresh(db_event)
+        db_event = self.db.scalars(
+            update(HeatEventModel).where(HeatEventModel.id == event_id).values(**update_data).returning(HeatEventModel)
+        ).one_or_none()
+        self._commit()
         return db_event
     
+    def create_many(self, items: List[HeatEventCreate], batch_size: int = BATCH_SIZE) -> List[HeatEventModel]:
+        """Crea varios eventos de celo en una sola transacción"""
+        rows = [item.model_dump() for item in items]
+        created = []
+        for batch in chunked(rows, batch_size):
+            created.extend(self.db.scalars(
+                insert(HeatEventModel).returning(HeatEventModel, sort_by_parameter_order=True), batch
+            ).all())
+        self._commit()
+        return created
+    
+    def update_many(self, items: List[HeatEventBatchUpdate]) -> Optional[List[HeatEventModel]]:
+        """Actualiza varios eventos de celo en una sola transacción. Devuelve None si algún ID no existe"""
+        ids = [item.id for item in items]
+        found = {e.id: e for e in self.db.scalars(select(HeatEventModel).where(HeatEventModel.id.in_(ids)))}
+        if len(found) != len(set(ids)):
+            return None
+        
+        for item in items:
+            db_item = found[item.id]
+            for field, value in item.model_dump(exclude_unset=True, exclude={"id"}).items():
+                setattr(db_item, field, value)
+        
+        self.db.flush()
+        self._commit()
+        return [found[item.id] for item in items]
+    
+    def delete_many(self, ids: List[UUID]) -> int:
+        """Elimina varios eventos de celo en una sola sentencia"""
+        result = self.db.execute(delete(HeatEventModel).where(HeatEventModel.id.in_(ids)))
+        self._commit()
+        return result.rowcount
+    
     def delete(self, event_id: UUID) -> bool:
         """Elimina un evento de celo"""
-        db_event = self.get_by_id(event_id)
-        if not db_event:
-            return False
-        
-        self.db.delete(db_event)
-        self.db.commit()
-        return True
+        result = self.db.execute(delete(HeatEventModel).where(HeatEventModel.id == event_id))
+        self._commit()
+        return result.rowcount > 0
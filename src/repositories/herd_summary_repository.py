@@ -0,0 +1,67 @@
+# src/repositories/herd_summary_repository.py
+from datetime import date, timedelta
+from typing import Optional
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.orm import Session
+
+from src.models.herd_counter import HerdCounter, HerdDateCounter
+from src.schemas.dashboard import HerdSummary
+
+
+class HerdSummaryRepository:
+    """
+    Lectura de los contadores del rancho que mantienen los triggers.
+    El costo de leer no depende del tamaño del rebaño: son unas pocas filas
+    por género/raza y, para las cifras por fecha, como mucho una fila por día.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_counter(self, key: str) -> int:
+        return self.db.scalar(select(HerdCounter.value).where(HerdCounter.key == key)) or 0
+
+    def get_summary(self, today: Optional[date] = None) -> HerdSummary:
+        today = today or date.today()
+        counters = dict(self.db.execute(select(HerdCounter.key, HerdCounter.value)).all())
+
+        def prefixed(prefix: str) -> dict:
+            return {
+                key[len(prefix):] or "Sin raza": value
+                for key, value in counters.items()
+                if key.startswith(prefix) and value
+            }
+
+        in_7_days = today + timedelta(days=7)
+        in_30_days = today + timedelta(days=30)
+        is_reminder = HerdDateCounter.kind == "reminder"
+        is_dose = HerdDateCounter.kind == "dose"
+        future_pending, doses_7, doses_30 = self.db.execute(
+            select(
+                func.coalesce(func.sum(HerdDateCounter.value).filter(is_reminder), 0),
+                func.coalesce(func.sum(HerdDateCounter.value).filter(is_dose, HerdDateCounter.counter_date <= in_7_days), 0),
+                func.coalesce(func.sum(HerdDateCounter.value).filter(is_dose), 0)
+            ).where(
+                HerdDateCounter.counter_date >= today,
+                or_(is_reminder, and_(is_dose, HerdDateCounter.counter_date <= in_30_days))
+            )
+        ).one()
+
+        reminders_pending = counters.get("reminders_pending", 0)
+        return HerdSummary(
+            as_of=today,
+            total_cattle=counters.get("cattle_total", 0),
+            by_gender=prefixed("cattle_gender:"),
+            by_breed=prefixed("cattle_breed:"),
+            pregnant=counters.get("pregnant", 0),
+            reminders_pending=reminders_pending,
+            # Pendientes con fecha pasada = todos los pendientes menos los de hoy en adelante
+            reminders_overdue=reminders_pending - future_pending,
+            doses_next_7_days=doses_7,
+            doses_next_30_days=doses_30
+        )
+
+    def rebuild(self) -> None:
+        """Recalcula todos los contadores desde las tablas de origen"""
+        self.db.execute(text("SELECT herd_counters_rebuild()"))
+        self.db.commit()
@@ -0,0 +1,68 @@
+# src/repositories/outbreak_repository.py
+from datetime import date
+from typing import List, Sequence
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.cattle import Cattle
+from src.models.outbreak import DiseaseCaseCount, OutbreakAlert
+from src.repositories.demographics_repository import age_group
+
+
+class OutbreakRepository:
+    """Conteos de casos por enfermedad en la ventana reciente (mantenidos por trigger) y alertas de brote"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_window_counts(self, since: date, today: date):
+        """
+        Animales y casos por enfermedad desde `since`, por raza y por grupo de edad, en una sola consulta.
+        Solo lee la tabla de conteos de la ventana: el costo no depende del historial de salud.
+        """
+        breed = func.coalesce(Cattle.breed, "Sin raza")
+        age = age_group(Cattle.birth_date, today)
+        stmt = select(
+            DiseaseCaseCount.disease,
+            func.grouping(breed).label("no_breed"),
+            func.grouping(age).label("no_age"),
+            breed.label("breed"),
+            age.label("age_group"),
+            func.count(func.distinct(DiseaseCaseCount.cattle_id)).label("animals"),
+            func.sum(DiseaseCaseCount.value).label("cases"),
+            func.min(DiseaseCaseCount.case_date).label("first_case"),
+            func.max(DiseaseCaseCount.case_date).label("last_case"),
+            func.array_agg(func.distinct(Cattle.lote)).label("lotes")
+        ).join(Cattle, Cattle.id == DiseaseCaseCount.cattle_id).where(
+            DiseaseCaseCount.case_date >= since,
+            DiseaseCaseCount.case_date <= today
+        ).group_by(
+            DiseaseCaseCount.disease,
+            func.grouping_sets(tuple_(), tuple_(breed), tuple_(age))
+        ).order_by(DiseaseCaseCount.disease)
+        return self.db.execute(stmt).mappings().all()
+
+    def save_alerts(self, alerts: Sequence[dict]) -> List[OutbreakAlert]:
+        """Registra las alertas que no existían ya hoy para esa enfermedad y grupo; devuelve solo las nuevas"""
+        if not alerts:
+            return []
+        created = self.db.scalars(
+            insert(OutbreakAlert).values(list(alerts))
+            .on_conflict_do_nothing(index_elements=["disease", "scope", "group_value", "raised_on"])
+            .returning(OutbreakAlert)
+        ).all()
+        self.db.commit()
+        return list(created)
+
+    def get_alerts(self, since: date, limit: int = 100) -> List[OutbreakAlert]:
+        return self.db.scalars(
+            select(OutbreakAlert).where(OutbreakAlert.raised_on >= since)
+            .order_by(OutbreakAlert.raised_on.desc(), OutbreakAlert.disease, OutbreakAlert.scope).limit(limit)
+        ).all()
+
+    def delete_counts_before(self, cutoff: date) -> int:
+        """Purga los conteos de casos fuera de la ventana que se conserva"""
+        result = self.db.execute(delete(DiseaseCaseCount).where(DiseaseCaseCount.case_date < cutoff))
+        self.db.commit()
+        return result.rowcount
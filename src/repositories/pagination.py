@@ -0,0 +1,76 @@
+# src/repositories/pagination.py
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+
+class InvalidCursorError(ValueError):
+    """El cursor recibido no corresponde a un cursor emitido por la API"""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Codifica los valores de la última fila de la página en un cursor opaco"""
+    raw = json.dumps([value.isoformat() if isinstance(value, (date, datetime)) else str(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _parse_value(column, raw: str) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is date:
+        return date.fromisoformat(raw)
+    if python_type is UUID:
+        return UUID(raw)
+    return python_type(raw)
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    """Decodifica un cursor y convierte cada valor al tipo de su columna"""
+    try:
+        raw_values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        if len(raw_values) != len(columns):
+            raise ValueError("longitud de cursor inválida")
+        return [_parse_value(column, raw) for column, raw in zip(columns, raw_values)]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Cursor inválido: {cursor}") from e
+
+
+def paginate(
+    db: Session,
+    stmt: Select,
+    order_columns: Sequence,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    descending: bool = False
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Paginación por cursor (keyset) sobre `order_columns`.
+    La última columna debe ser única (normalmente el id) para que el orden sea total.
+    Devuelve los elementos de la página y el cursor de la siguiente, o None si no hay más.
+    """
+    key = tuple_(*order_columns)
+    if cursor:
+        values = tuple_(*decode_cursor(cursor, order_columns))
+        stmt = stmt.where(key < values if descending else key > values)
+
+    ordering = [column.desc() if descending else column.asc() for column in order_columns]
+    items = db.scalars(stmt.order_by(*ordering).limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in order_columns])
+
+    return list(items), next_cursor
+
+
+def count_rows(db: Session, stmt: Select) -> int:
+    """Cuenta las filas que devuelve una consulta con sus filtros aplicados"""
+    return db.scalar(select(func.count()).select_from(stmt.order_by(None).subquery()))
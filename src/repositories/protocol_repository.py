@@ -0,0 +1,270 @@
+# src/repositories/protocol_repository.py
+from datetime import date, timedelta
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import Date, String, and_, case, cast, delete, exists, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, aggregate_order_by
+
+from src.infrastructure import events
+from src.models.cattle import Cattle
+from src.models.health_event import EventTypeEnum, HealthEvent
+from src.models.reminder import Reminder
+from src.models.vaccination_protocol import ProtocolReminder, VaccinationProtocol
+from src.repositories.base import BaseRepository
+from src.schemas.reminder import ReminderStatusEnum, ReminderTypeEnum
+from src.schemas.vaccination_protocol import (
+    PlannedDose,
+    ProtocolPlanResponse,
+    VaccinationProtocolCreate,
+    VaccinationProtocolUpdate
+)
+
+
+def _vaccine_key(column):
+    return func.lower(func.btrim(column))
+
+
+class ProtocolRepository(BaseRepository):
+    """Protocolos de vacunación y planificador de dosis para todo el rebaño"""
+
+    def create(self, data: VaccinationProtocolCreate) -> VaccinationProtocol:
+        protocol = self.db.scalars(insert(VaccinationProtocol).returning(VaccinationProtocol), [data.model_dump()]).one()
+        self._commit()
+        return protocol
+
+    def get_by_id(self, protocol_id: UUID) -> Optional[VaccinationProtocol]:
+        return self.db.get(VaccinationProtocol, protocol_id)
+
+    def get_all(self) -> List[VaccinationProtocol]:
+        return self.db.scalars(select(VaccinationProtocol).order_by(VaccinationProtocol.name)).all()
+
+    def exists_name(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
+        stmt = select(VaccinationProtocol.id).where(VaccinationProtocol.name == name)
+        if exclude_id:
+            stmt = stmt.where(VaccinationProtocol.id != exclude_id)
+        return self.db.scalar(stmt) is not None
+
+    def update(self, protocol_id: UUID, data: VaccinationProtocolUpdate) -> Optional[VaccinationProtocol]:
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            return self.get_by_id(protocol_id)
+        protocol = self.db.scalars(
+            update(VaccinationProtocol).where(VaccinationProtocol.id == protocol_id).values(**values)
+            .returning(VaccinationProtocol),
+            execution_options={"populate_existing": True}
+        ).one_or_none()
+        self._commit()
+        return protocol
+
+    def delete(self, protocol_id: UUID) -> bool:
+        result = self.db.execute(delete(VaccinationProtocol).where(VaccinationProtocol.id == protocol_id))
+        self._commit()
+        return result.rowcount > 0
+
+    # ---------------------------------------------------------------- planificador
+
+    def _doses_given(self):
+        """Dosis aplicadas por animal y vacuna (solo vacunas de protocolos activos), con la última"""
+        vaccine = _vaccine_key(HealthEvent.medicine_name)
+        return select(
+            HealthEvent.cattle_id,
+            vaccine.label("vaccine"),
+            func.count().label("doses"),
+            func.max(HealthEvent.application_date).label("last_date"),
+            func.array_agg(
+                aggregate_order_by(HealthEvent.id, HealthEvent.application_date.desc()),
+                type_=ARRAY(PG_UUID(as_uuid=True))
+            )[1].label("last_event_id")
+        ).where(
+            HealthEvent.event_type == EventTypeEnum.vaccine,
+            vaccine.in_(select(_vaccine_key(VaccinationProtocol.vaccine_name)).where(VaccinationProtocol.active))
+        ).group_by(HealthEvent.cattle_id, vaccine).subquery("doses")
+
+    def _plan(self, until: date, today: date, protocol_ids: Optional[List[UUID]] = None):
+        """
+        Próxima dosis de cada protocolo activo para cada animal al que aplica, en una sola consulta:
+        el cruce protocolos x ganado se resuelve con joins y la fecha con un CASE, sin recorrer animales.
+        Excluye las dosis que ya tienen un recordatorio pendiente del mismo protocolo.
+        """
+        p, c = VaccinationProtocol, Cattle
+        d = self._doses_given()
+
+        boosters = func.cardinality(p.booster_days)
+        due = case(
+            (d.c.doses.is_(None), func.coalesce(c.birth_date + p.min_age_days, literal(today, Date))),
+            (d.c.doses <= boosters, d.c.last_date + p.booster_days[d.c.doses]),
+            else_=d.c.last_date + p.interval_days
+        )
+        candidates = select(
+            p.id.label("protocol_id"),
+            p.name.label("protocol_name"),
+            p.vaccine_name,
+            c.id.label("cattle_id"),
+            c.lote,
+            c.name.label("cattle_name"),
+            (func.coalesce(d.c.doses, 0) + 1).label("dose_number"),
+            cast(due, Date).label("due_date"),
+            d.c.last_date,
+            d.c.last_event_id
+        ).select_from(c).join(p, and_(
+            p.active,
+            or_(p.gender.is_(None), p.gender == c.gender),
+            or_(p.breed.is_(None), func.lower(p.breed) == func.lower(c.breed))
+        )).outerjoin(d, and_(
+            d.c.cattle_id == c.id,
+            d.c.vaccine == _vaccine_key(p.vaccine_name)
+        )).where(
+            # La edad máxima solo limita el inicio de la serie
+            or_(
+                d.c.doses.is_not(None),
+                p.max_age_days.is_(None),
+                c.birth_date.is_(None),
+                c.birth_date + p.max_age_days >= literal(today, Date)
+            )
+        )
+        if protocol_ids:
+            candidates = candidates.where(p.id.in_(protocol_ids))
+        candidates = candidates.subquery("candidates")
+
+        already_planned = exists().where(
+            ProtocolReminder.protocol_id == candidates.c.protocol_id,
+            ProtocolReminder.cattle_id == candidates.c.cattle_id,
+            ProtocolReminder.dose_number == candidates.c.dose_number,
+            Reminder.id == ProtocolReminder.reminder_id,
+            Reminder.status == ReminderStatusEnum.pending.value
+        )
+        return select(candidates).where(
+            candidates.c.due_date.is_not(None),
+            candidates.c.due_date <= until,
+            ~already_planned
+        )
+
+    def preview_plan(
+        self,
+        horizon_days: int = 30,
+        protocol_ids: Optional[List[UUID]] = None,
+        limit: int = 200,
+        today: Optional[date] = None
+    ) -> ProtocolPlanResponse:
+        """Dry-run: qué dosis se programarían, sin escribir nada"""
+        today = today or date.today()
+        until = today + timedelta(days=horizon_days)
+        plan = self._plan(until, today, protocol_ids).subquery("plan")
+
+        by_protocol = dict(self.db.execute(
+            select(plan.c.protocol_name, func.count()).group_by(plan.c.protocol_name)
+        ).all())
+        rows = self.db.execute(
+            select(plan).order_by(plan.c.due_date, plan.c.lote, plan.c.protocol_name).limit(limit)
+        ).mappings()
+        return ProtocolPlanResponse(
+            dry_run=True,
+            until=until,
+            total=sum(by_protocol.values()),
+            by_protocol=by_protocol,
+            items=[
+                PlannedDose(
+                    protocol_name=row["protocol_name"],
+                    vaccine_name=row["vaccine_name"],
+                    lote=row["lote"],
+                    cattle_name=row["cattle_name"],
+                    dose_number=row["dose_number"],
+                    due_date=row["due_date"],
+                    last_dose_date=row["last_date"]
+                )
+                for row in rows
+            ]
+        )
+
+    def _complete_given_doses(self) -> int:
+        """Cierra los recordatorios del planificador cuya dosis ya se registró como evento de vacuna"""
+        d = self._doses_given()
+        given = select(ProtocolReminder.reminder_id).join(
+            VaccinationProtocol, VaccinationProtocol.id == ProtocolReminder.protocol_id
+        ).join(d, and_(
+            d.c.cattle_id == ProtocolReminder.cattle_id,
+            d.c.vaccine == _vaccine_key(VaccinationProtocol.vaccine_name)
+        )).where(ProtocolReminder.dose_number <= d.c.doses)
+        result = self.db.execute(
+            update(Reminder).where(
+                Reminder.status == ReminderStatusEnum.pending.value,
+                Reminder.id.in_(given)
+            ).values(status=ReminderStatusEnum.completed.value, completed_at=func.timezone("utc", func.now())),
+            execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+
+    def apply_plan(
+        self,
+        horizon_days: int = 30,
+        protocol_ids: Optional[List[UUID]] = None,
+        today: Optional[date] = None
+    ) -> ProtocolPlanResponse:
+        """
+        Programa las dosis del plan en una sola sentencia: crea los recordatorios (enlazados por
+        health_event_id a la última dosis aplicada), los registra en protocol_reminders y completa
+        next_dose_date en los eventos de vacuna que no lo tenían. Antes cierra los recordatorios
+        cuyas dosis ya se aplicaron.
+        """
+        today = today or date.today()
+        until = today + timedelta(days=horizon_days)
+        completed = self._complete_given_doses()
+
+        plan = self._plan(until, today, protocol_ids).add_columns(
+            func.gen_random_uuid().label("reminder_id")
+        ).cte("plan").prefix_with("MATERIALIZED")
+        now = func.timezone("utc", func.now())
+        dose_label = func.concat(plan.c.vaccine_name, " (", plan.c.protocol_name, ") - dosis ", cast(plan.c.dose_number, String))
+
+        new_reminders = insert(Reminder).from_select(
+            ["id", "cattle_id", "health_event_id", "title", "description", "reminder_date",
+             "reminder_type", "status", "created_at", "updated_at"],
+            select(
+                plan.c.reminder_id,
+                plan.c.cattle_id,
+                plan.c.last_event_id,
+                func.left(func.concat("Vacuna: ", dose_label), 200),
+                func.concat(
+                    "Programado por el protocolo ", plan.c.protocol_name,
+                    case((plan.c.due_date < today, func.concat(". Vencida desde ", cast(plan.c.due_date, String))), else_="")
+                ),
+                func.greatest(plan.c.due_date, literal(today, Date)),
+                literal(ReminderTypeEnum.vaccine.value),
+                literal(ReminderStatusEnum.pending.value),
+                now,
+                now
+            )
+        ).returning(Reminder.id).cte("new_reminders")
+
+        links = insert(ProtocolReminder).from_select(
+            ["reminder_id", "protocol_id", "cattle_id", "dose_number"],
+            select(plan.c.reminder_id, plan.c.protocol_id, plan.c.cattle_id, plan.c.dose_number)
+        ).returning(ProtocolReminder.protocol_id).cte("links")
+
+        scheduled = update(HealthEvent).where(
+            HealthEvent.id == plan.c.last_event_id,
+            HealthEvent.next_dose_date.is_(None)
+        ).values(next_dose_date=plan.c.due_date, updated_at=now).returning(HealthEvent.id).cte("scheduled")
+
+        stmt = select(
+            VaccinationProtocol.name,
+            func.count(),
+            select(func.count()).select_from(scheduled).scalar_subquery()
+        ).join(links, links.c.protocol_id == VaccinationProtocol.id).group_by(
+            VaccinationProtocol.name
+        ).add_cte(new_reminders)
+        rows = self.db.execute(stmt).all()
+
+        # La sentencia principal es un SELECT: se marcan a mano las tablas escritas por los CTE
+        events.record_change(self.db, "reminders", "protocol_reminders", "health_events")
+        self._commit()
+
+        by_protocol = {name: count for name, count, _ in rows}
+        return ProtocolPlanResponse(
+            dry_run=False,
+            until=until,
+            total=sum(by_protocol.values()),
+            by_protocol=by_protocol,
+            completed_reminders=completed,
+            next_doses_scheduled=rows[0][2] if rows else 0
+        )
@@ -0,0 +1,79 @@
+# src/repositories/read_models.py
+"""
+Registros de solo lectura para las herramientas del agente y los listados.
+Son NamedTuple con las columnas justas que se muestran: sin identity map, sin seguimiento
+de cambios y sin relaciones que carguen otras tablas. No se pueden modificar ni guardar;
+para escribir se usan los modelos ORM.
+"""
+from datetime import date
+from typing import List, NamedTuple, Optional, Type
+from uuid import UUID
+
+from src.models.health_event import EventTypeEnum
+from src.models.cattle import GenderEnum
+
+
+class CattleRow(NamedTuple):
+    id: UUID
+    name: str
+    lote: str
+    breed: Optional[str]
+    gender: GenderEnum
+    weight: Optional[float]
+    birth_date: Optional[date]
+    fecha_ultimo_parto: Optional[date]
+
+
+class ReminderRow(NamedTuple):
+    id: UUID
+    cattle_id: Optional[UUID]
+    title: str
+    description: Optional[str]
+    reminder_date: date
+    reminder_type: str
+    status: str
+
+
+class HealthEventRow(NamedTuple):
+    id: UUID
+    cattle_id: UUID
+    event_type: EventTypeEnum
+    disease_name: Optional[str]
+    medicine_name: Optional[str]
+    application_date: date
+    next_dose_date: Optional[date]
+    dosage: Optional[str]
+    veterinarian_name: Optional[str]
+    notes: Optional[str]
+
+
+class HeatEventRow(NamedTuple):
+    id: UUID
+    cattle_id: UUID
+    heat_date: date
+    allows_mounting: Optional[bool]
+    was_inseminated: Optional[bool]
+    insemination_date: Optional[date]
+    pregnancy_confirmed: Optional[bool]
+    comportamiento: Optional[str]
+
+
+class UpcomingDoseRow(NamedTuple):
+    lote: str
+    cattle_name: str
+    next_dose_date: date
+    event_type: EventTypeEnum
+    medicine_name: Optional[str]
+    dosage: Optional[str]
+
+
+class PregnancyRow(NamedTuple):
+    lote: str
+    cattle_name: str
+    heat_date: date
+    insemination_date: Optional[date]
+
+
+def columns_for(model, record: Type[NamedTuple]) -> List:
+    """Columnas del modelo con los nombres de los campos del registro, en el mismo orden"""
+    return [getattr(model, field) for field in record._fields]
@@ -0,0 +1,140 @@
+# src/repositories/read_repository.py
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import bindparam, select
+
+from src.models.cattle import Cattle
+from src.models.health_event import EventTypeEnum, HealthEvent
+from src.models.heat_event import HeatEventModel
+from src.models.reminder import Reminder
+from src.repositories.base import BaseRepository, top_n_rows_per_group
+from src.repositories.read_models import (
+    CattleRow,
+    HealthEventRow,
+    HeatEventRow,
+    PregnancyRow,
+    ReminderRow,
+    UpcomingDoseRow,
+    columns_for
+)
+from src.schemas.reminder import ReminderStatusEnum
+
+
+CATTLE_COLUMNS = columns_for(Cattle, CattleRow)
+REMINDER_COLUMNS = columns_for(Reminder, ReminderRow)
+HEALTH_EVENT_COLUMNS = columns_for(HealthEvent, HealthEventRow)
+HEAT_EVENT_COLUMNS = columns_for(HeatEventModel, HeatEventRow)
+
+# Sentencias de cada turno del chat, construidas una sola vez con parámetros ligados.
+# Los IN usan parámetros "expanding": la misma sentencia compilada sirve para cualquier número de ids
+_CATTLE_BY_ID = select(*CATTLE_COLUMNS).where(Cattle.id == bindparam("cattle_id"))
+_CATTLE_BY_IDS = select(*CATTLE_COLUMNS).where(Cattle.id.in_(bindparam("cattle_ids", expanding=True)))
+_REMINDERS_BY_CATTLE_IDS = top_n_rows_per_group(
+    REMINDER_COLUMNS,
+    Reminder.cattle_id,
+    [Reminder.reminder_date, Reminder.id],
+    bindparam("per_cattle"),
+    Reminder.cattle_id.in_(bindparam("cattle_ids", expanding=True))
+)
+_HEAT_EVENTS_BY_CATTLE_IDS = top_n_rows_per_group(
+    HEAT_EVENT_COLUMNS,
+    HeatEventModel.cattle_id,
+    [HeatEventModel.heat_date.desc(), HeatEventModel.id],
+    bindparam("per_cattle"),
+    HeatEventModel.cattle_id.in_(bindparam("cattle_ids", expanding=True))
+)
+
+
+class ReadRepository(BaseRepository):
+    """
+    Consultas de solo lectura para las herramientas del agente: seleccionan solo las columnas
+    que se muestran y devuelven registros inmutables (ver read_models), no entidades ORM.
+    """
+
+    def cattle(self, limit: int = 50, gender: Optional[str] = None) -> List[CattleRow]:
+        """Ganado ordenado por lote, opcionalmente de un género"""
+        stmt = select(*CATTLE_COLUMNS).order_by(Cattle.lote).limit(limit)
+        if gender:
+            stmt = stmt.where(Cattle.gender == gender)
+        return [CattleRow._make(row) for row in self.db.execute(stmt)]
+
+    def cattle_by_id(self, cattle_id: UUID) -> Optional[CattleRow]:
+        row = self.db.execute(_CATTLE_BY_ID, {"cattle_id": cattle_id}).first()
+        return CattleRow._make(row) if row else None
+
+    def cattle_by_ids(self, cattle_ids: List[UUID]) -> List[CattleRow]:
+        if not cattle_ids:
+            return []
+        return [CattleRow._make(row) for row in self.db.execute(_CATTLE_BY_IDS, {"cattle_ids": cattle_ids})]
+
+    def pending_reminders(self, limit: int = 50) -> List[ReminderRow]:
+        """Recordatorios pendientes por fecha"""
+        stmt = select(*REMINDER_COLUMNS).where(
+            Reminder.status == ReminderStatusEnum.pending.value
+        ).order_by(Reminder.reminder_date).limit(limit)
+        return [ReminderRow._make(row) for row in self.db.execute(stmt)]
+
+    def reminders_by_cattle_ids(self, cattle_ids: List[UUID], per_cattle: int = 20) -> List[ReminderRow]:
+        """Hasta `per_cattle` recordatorios de cada ganado en una sola consulta, ordenados por fecha"""
+        if not cattle_ids:
+            return []
+        rows = self.db.execute(_REMINDERS_BY_CATTLE_IDS, {"cattle_ids": cattle_ids, "per_cattle": per_cattle})
+        return [ReminderRow._make(row) for row in rows]
+
+    def health_events_by_cattle_ids(
+        self,
+        cattle_ids: List[UUID],
+        per_cattle: int = 20,
+        event_type: Optional[EventTypeEnum] = None,
+        medicine_name: Optional[str] = None
+    ) -> List[HealthEventRow]:
+        """Los `per_cattle` eventos de salud más recientes de cada ganado en una sola consulta"""
+        if not cattle_ids:
+            return []
+        conditions = [HealthEvent.cattle_id.in_(cattle_ids)]
+        if event_type:
+            conditions.append(HealthEvent.event_type == event_type)
+        if medicine_name:
+            conditions.append(HealthEvent.medicine_name.ilike(f"%{medicine_name}%"))
+        stmt = top_n_rows_per_group(
+            HEALTH_EVENT_COLUMNS,
+            HealthEvent.cattle_id,
+            [HealthEvent.application_date.desc(), HealthEvent.id],
+            per_cattle,
+            *conditions
+        )
+        return [HealthEventRow._make(row) for row in self.db.execute(stmt)]
+
+    def heat_events_by_cattle_ids(self, cattle_ids: List[UUID], per_cattle: int = 20) -> List[HeatEventRow]:
+        """Los `per_cattle` celos más recientes de cada ganado en una sola consulta"""
+        if not cattle_ids:
+            return []
+        rows = self.db.execute(_HEAT_EVENTS_BY_CATTLE_IDS, {"cattle_ids": cattle_ids, "per_cattle": per_cattle})
+        return [HeatEventRow._make(row) for row in rows]
+
+    def upcoming_doses(self, current_date: date, limit: int = 100) -> List[UpcomingDoseRow]:
+        """Próximas dosis con el lote y el nombre del animal en la misma consulta"""
+        stmt = select(
+            Cattle.lote,
+            Cattle.name,
+            HealthEvent.next_dose_date,
+            HealthEvent.event_type,
+            HealthEvent.medicine_name,
+            HealthEvent.dosage
+        ).join(Cattle, Cattle.id == HealthEvent.cattle_id).where(
+            HealthEvent.next_dose_date >= current_date
+        ).order_by(HealthEvent.next_dose_date).limit(limit)
+        return [UpcomingDoseRow._make(row) for row in self.db.execute(stmt)]
+
+    def confirmed_pregnancies(self, limit: int = 50) -> List[PregnancyRow]:
+        """Celos con embarazo confirmado, con el lote y el nombre del animal"""
+        stmt = select(
+            Cattle.lote,
+            Cattle.name,
+            HeatEventModel.heat_date,
+            HeatEventModel.insemination_date
+        ).join(Cattle, Cattle.id == HeatEventModel.cattle_id).where(
+            HeatEventModel.pregnancy_confirmed.is_(True)
+        ).order_by(HeatEventModel.insemination_date.desc()).limit(limit)
+        return [PregnancyRow._make(row) for row in self.db.execute(stmt)]
@@ -1,30 +1,68 @@
 # src/repositories/reminder_repository.py
-from typing import List, Optional
+import heapq
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
-from datetime import date
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from datetime import date, datetime
+from sqlalchemy.orm import Session, noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import bindparam, func, and_, select, insert, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from src.core.recurrence import iter_occurrences
+from src.models.cattle import Cattle
 from src.models.reminder import Reminder
-from src.schemas.reminder import ReminderCreate, ReminderUpdate, ReminderStatusEnum, ReminderTypeEnum
+from src.models.reminder_notification import ReminderNotification
+from src.models.reminder_recurrence import ReminderOccurrence, ReminderRecurrence
+from src.schemas.reminder import (
+    ReminderCreate,
+    ReminderUpdate,
+    ReminderBatchUpdate,
+    ReminderBulkResponse,
+    ReminderOccurrenceResponse,
+    ReminderStatusEnum,
+    ReminderTypeEnum
+)
+from src.repositories.base import BaseRepository, BATCH_SIZE, chunked, top_n_per_group
+from src.repositories.pagination import paginate, count_rows
 
 
-class ReminderRepository:
-    
-    def __init__(self, db: Session):
-        self.db = db
+# Recordatorios de un animal por fecha: sentencia construida una vez (ver cattle_repository)
+_BY_CATTLE = select(Reminder).where(
+    Reminder.cattle_id == bindparam("cattle_id")
+).order_by(Reminder.reminder_date).offset(bindparam("skip")).limit(bindparam("limit"))
+
+
+class ReminderRepository(BaseRepository):
     
     def create(self, reminder_data: ReminderCreate) -> Reminder:
-        """Crea un nuevo recordatorio"""
-        db_reminder = Reminder(**reminder_data.model_dump())
-        self.db.add(db_reminder)
-        self.db.commit()
-        self.db.refresh(db_reminder)
+        """Crea un nuevo recordatorio (con su regla de repetición si la trae)"""
+        db_reminder = self.db.scalars(
+            insert(Reminder).returning(Reminder), [reminder_data.model_dump(exclude={"recurrence"})]
+        ).one()
+        self._add_recurrences([db_reminder], [reminder_data])
+        self._commit()
         return db_reminder
     
+    def _add_recurrences(self, reminders: Sequence[Reminder], items: Sequence[ReminderCreate]) -> None:
+        """Guarda las reglas de repetición de los recordatorios recién creados que las traen"""
+        rows = [
+            {"reminder_id": reminder.id, "start_date": reminder.reminder_date, **item.recurrence.model_dump()}
+            for reminder, item in zip(reminders, items)
+            if item.recurrence
+        ]
+        rules = {}
+        if rows:
+            rules = {
+                rule.reminder_id: rule
+                for rule in self.db.scalars(insert(ReminderRecurrence).returning(ReminderRecurrence), rows)
+            }
+        for reminder in reminders:
+            set_committed_value(reminder, "recurrence", rules.get(reminder.id))
+    
     def get_by_id(self, reminder_id: UUID) -> Optional[Reminder]:
-        """Obtiene un recordatorio por su ID"""
-        return self.db.query(Reminder).filter(Reminder.id == reminder_id).first()
+        """Obtiene un recordatorio por su ID (sin consulta si ya está cargado en la sesión)"""
+        return self.db.get(Reminder, reminder_id)
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Reminder]:
         """Obtiene todos los recordatorios con paginación"""
@@ -32,9 +70,20 @@ class ReminderRepository:
     
     def get_by_cattle_id(self, cattle_id: UUID, skip: int = 0, limit: int = 100) -> List[Reminder]:
         """Obtiene todos los recordatorios de un ganado específico"""
-        return self.db.query(Reminder).filter(
-            Reminder.cattle_id == cattle_id
-        ).order_by(Reminder.reminder_date).offset(skip).limit(limit).all()
+        return list(self.db.scalars(_BY_CATTLE, {"cattle_id": cattle_id, "skip": skip, "limit": limit}))
+    
+    def get_by_cattle_ids(self, cattle_ids: List[UUID], per_cattle: int = 20) -> List[Reminder]:
+        """Obtiene hasta `per_cattle` recordatorios de cada ganado en una sola consulta, ordenados por fecha"""
+        if not cattle_ids:
+            return []
+        stmt = top_n_per_group(
+            Reminder,
+            Reminder.cattle_id,
+            [Reminder.reminder_date, Reminder.id],
+            per_cattle,
+            Reminder.cattle_id.in_(cattle_ids)
+        )
+        return list(self.db.scalars(stmt))
     
     def get_by_status(self, status: ReminderStatusEnum, skip: int = 0, limit: int = 100) -> List[Reminder]:
         """Obtiene recordatorios por estado"""
@@ -52,25 +101,148 @@ class ReminderRepository:
             Reminder.reminder_type == reminder_type.value
         ).order_by(Reminder.reminder_date).offset(skip).limit(limit).all()
     
-    def get_upcoming(self, days: int = 7, skip: int = 0, limit: int = 100) -> List[Reminder]:
-        """Obtiene recordatorios próximos en los siguientes X días"""
-        end_date = date.today() + timedelta(days=days)
-        return self.db.query(Reminder).filter(
-            and_(
-                Reminder.status == "pending",
-                Reminder.reminder_date >= date.today(),
-                Reminder.reminder_date <= end_date
-            )
-        ).order_by(Reminder.reminder_date).offset(skip).limit(limit).all()
+    def get_upcoming(
+        self,
+        days: int = 7,
+        skip: int = 0,
+        limit: int = 100,
+        today: Optional[date] = None
+    ) -> List[ReminderOccurrenceResponse]:
+        """Ocurrencias pendientes en los siguientes X días: recordatorios únicos y fechas de las series"""
+        today = today or date.today()
+        return self.get_pending_occurrences(today, today + timedelta(days=days), skip, limit)
     
-    def get_overdue(self, skip: int = 0, limit: int = 100) -> List[Reminder]:
-        """Obtiene recordatorios vencidos (pendientes con fecha pasada)"""
-        return self.db.query(Reminder).filter(
-            and_(
-                Reminder.status == "pending",
-                Reminder.reminder_date < date.today()
-            )
-        ).order_by(Reminder.reminder_date).offset(skip).limit(limit).all()
+    def get_overdue(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        today: Optional[date] = None
+    ) -> List[ReminderOccurrenceResponse]:
+        """Ocurrencias vencidas (pendientes con fecha pasada), incluidas las de las series sin completar"""
+        today = today or date.today()
+        return self.get_pending_occurrences(None, today - timedelta(days=1), skip, limit)
+    
+    def get_pending_occurrences(
+        self,
+        start: Optional[date],
+        end: date,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        changed_since: Optional[datetime] = None
+    ) -> List[ReminderOccurrenceResponse]:
+        """
+        Mezcla por fecha los recordatorios únicos con las ocurrencias de las series en [start, end].
+        Las series se expanden con generadores desde su primera ocurrencia abierta (reminder_date)
+        y solo se consumen hasta `skip + limit` elementos; no se guarda ninguna fila futura.
+        Con `changed_since` solo considera los recordatorios modificados desde ese instante.
+        """
+        wanted = skip + limit if limit is not None else None
+        conditions = [Reminder.status == ReminderStatusEnum.pending.value, Reminder.reminder_date <= end]
+        if changed_since:
+            conditions.append(Reminder.updated_at >= changed_since)
+        one_off = select(Reminder).options(noload(Reminder.recurrence)).where(*conditions, ~Reminder.recurrence.has())
+        if start:
+            one_off = one_off.where(Reminder.reminder_date >= start)
+        one_off = one_off.order_by(Reminder.reminder_date, Reminder.id).limit(wanted)
+        
+        series = list(self.db.scalars(select(Reminder).where(*conditions, Reminder.recurrence.has())))
+        closed = self._closed_occurrences([reminder.id for reminder in series], start, end)
+        
+        streams = [(_occurrence(reminder, reminder.reminder_date) for reminder in self.db.scalars(one_off))]
+        streams.extend(
+            _series_occurrences(reminder, max(start or reminder.reminder_date, reminder.reminder_date), end, closed.get(reminder.id, set()))
+            for reminder in series
+        )
+        merged = heapq.merge(*streams, key=lambda occurrence: occurrence.reminder_date)
+        return list(islice(merged, skip, wanted))
+    
+    def _closed_occurrences(self, reminder_ids: List[UUID], start: Optional[date], end: date) -> Dict[UUID, Set[date]]:
+        """Fechas completadas o canceladas de cada serie dentro de la ventana"""
+        if not reminder_ids:
+            return {}
+        stmt = select(ReminderOccurrence.reminder_id, ReminderOccurrence.occurrence_date).where(
+            ReminderOccurrence.reminder_id.in_(reminder_ids),
+            ReminderOccurrence.occurrence_date <= end
+        )
+        if start:
+            stmt = stmt.where(ReminderOccurrence.occurrence_date >= start)
+        closed = {}
+        for reminder_id, occurrence_date in self.db.execute(stmt):
+            closed.setdefault(reminder_id, set()).add(occurrence_date)
+        return closed
+    
+    def get_notified(self, start: date, end: date) -> Set[Tuple[UUID, date]]:
+        """Ocurrencias de la ventana que ya se notificaron"""
+        return set(self.db.execute(
+            select(ReminderNotification.reminder_id, ReminderNotification.occurrence_date)
+            .where(ReminderNotification.occurrence_date.between(start, end))
+        ).tuples())
+    
+    def mark_notified(self, keys: Iterable[Tuple[UUID, date]]) -> None:
+        """Registra ocurrencias como notificadas (idempotente)"""
+        rows = [{"reminder_id": reminder_id, "occurrence_date": day, "notified_at": datetime.utcnow()} for reminder_id, day in keys]
+        if rows:
+            self.db.execute(pg_insert(ReminderNotification).on_conflict_do_nothing(), rows)
+            self._commit()
+    
+    def get_changed_ids(self, since: datetime) -> Set[UUID]:
+        """Recordatorios modificados desde `since`, con cualquier estado o fecha"""
+        return set(self.db.scalars(select(Reminder.id).where(Reminder.updated_at >= since)))
+    
+    def get_pending_ids(self, reminder_ids: Iterable[UUID]) -> Set[UUID]:
+        """De los IDs recibidos, los que siguen existiendo y pendientes"""
+        reminder_ids = list(reminder_ids)
+        if not reminder_ids:
+            return set()
+        return set(self.db.scalars(select(Reminder.id).where(
+            Reminder.id.in_(reminder_ids),
+            Reminder.status == ReminderStatusEnum.pending.value
+        )))
+    
+    def is_occurrence(self, reminder: Reminder, occurrence_date: date) -> bool:
+        """Indica si `occurrence_date` es una fecha de la serie del recordatorio"""
+        rule = reminder.recurrence
+        return rule is not None and any(iter_occurrences(
+            rule.start_date, rule.frequency, rule.interval, occurrence_date, occurrence_date, rule.until, rule.count
+        ))
+    
+    def set_occurrence_status(self, reminder: Reminder, occurrence_date: date, status: ReminderStatusEnum) -> Reminder:
+        """
+        Completa o cancela una sola ocurrencia de una serie (la única fila que se guarda por ocurrencia)
+        y mueve reminder_date a la siguiente ocurrencia abierta. Si la serie terminó la marca completada.
+        """
+        db_reminder = self._close_occurrences(reminder, [occurrence_date], status)
+        self._commit()
+        return db_reminder
+    
+    def _close_occurrences(self, reminder: Reminder, occurrence_dates: List[date], status: ReminderStatusEnum) -> Reminder:
+        """Guarda el estado de varias ocurrencias de una serie y avanza su reminder_date, sin confirmar"""
+        completed_at = datetime.utcnow() if status == ReminderStatusEnum.completed else None
+        stmt = pg_insert(ReminderOccurrence).values([
+            {"reminder_id": reminder.id, "occurrence_date": day, "status": status.value, "completed_at": completed_at}
+            for day in occurrence_dates
+        ])
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=[ReminderOccurrence.reminder_id, ReminderOccurrence.occurrence_date],
+            set_={"status": stmt.excluded.status, "completed_at": stmt.excluded.completed_at}
+        ))
+        
+        rule = reminder.recurrence
+        cursor = min(reminder.reminder_date, *occurrence_dates)
+        closed = self._closed_occurrences([reminder.id], cursor, date.max).get(reminder.id, set())
+        next_open = next(
+            (day for day in iter_occurrences(rule.start_date, rule.frequency, rule.interval, cursor, date.max, rule.until, rule.count)
+             if day not in closed),
+            None
+        )
+        if next_open:
+            values = {"reminder_date": next_open}
+        else:
+            values = {"status": ReminderStatusEnum.completed.value, "completed_at": datetime.utcnow()}
+        return self.db.scalars(
+            update(Reminder).where(Reminder.id == reminder.id).values(**values).returning(Reminder),
+            execution_options={"populate_existing": True}
+        ).one()
     
     def get_by_date_range(self, start_date: date, end_date: date, skip: int = 0, limit: int = 100) -> List[Reminder]:
         """Obtiene recordatorios en un rango de fechas"""
@@ -81,6 +253,32 @@ class ReminderRepository:
             )
         ).order_by(Reminder.reminder_date).offset(skip).limit(limit).all()
     
+    def list_page(
+        self,
+        cattle_id: Optional[UUID] = None,
+        status: Optional[ReminderStatusEnum] = None,
+        reminder_type: Optional[ReminderTypeEnum] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[Reminder], int, Optional[str]]:
+        """Lista recordatorios con filtros y paginación por cursor ordenada por fecha"""
+        stmt = select(Reminder)
+        if cattle_id:
+            stmt = stmt.where(Reminder.cattle_id == cattle_id)
+        if status:
+            stmt = stmt.where(Reminder.status == status.value)
+        if reminder_type:
+            stmt = stmt.where(Reminder.reminder_type == reminder_type.value)
+        if start_date:
+            stmt = stmt.where(Reminder.reminder_date >= start_date)
+        if end_date:
+            stmt = stmt.where(Reminder.reminder_date <= end_date)
+        
+        items, next_cursor = paginate(self.db, stmt, [Reminder.reminder_date, Reminder.id], cursor, limit)
+        return items, count_rows(self.db, stmt), next_cursor
+    
     def count(self) -> int:
         """Cuenta el total de recordatorios"""
         return self.db.query(func.count(Reminder.id)).scalar()
@@ -102,53 +300,231 @@ class ReminderRepository:
     
     def update(self, reminder_id: UUID, reminder_data: ReminderUpdate) -> Optional[Reminder]:
         """Actualiza un recordatorio"""
-        db_reminder = self.get_by_id(reminder_id)
-        if not db_reminder:
-            return None
-        
         update_data = reminder_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_reminder, field, value)
+        if not update_data:
+            return self.get_by_id(reminder_id)
         
-        self.db.commit()
-        self.db.refresh(db_reminder)
+        db_reminder = self.db.scalars(
+            update(Reminder).where(Reminder.id == reminder_id).values(**update_data).returning(Reminder)
+        ).one_or_none()
+        self._commit()
         return db_reminder
     
     def mark_completed(self, reminder_id: UUID) -> Optional[Reminder]:
-        """Marca un recordatorio como completado"""
-        from datetime import datetime
-        db_reminder = self.get_by_id(reminder_id)
-        if not db_reminder:
-            return None
-        
-        db_reminder.status = "completed"
-        db_reminder.completed_at = datetime.utcnow()
-        
-        self.db.commit()
-        self.db.refresh(db_reminder)
-        return db_reminder
+        """Marca un recordatorio como completado; en una serie completa solo su ocurrencia actual"""
+        reminder = self.get_by_id(reminder_id)
+        if reminder and reminder.recurrence and reminder.status == ReminderStatusEnum.pending.value:
+            return self.set_occurrence_status(reminder, reminder.reminder_date, ReminderStatusEnum.completed)
+        return self._set_status(reminder_id, status="completed", completed_at=datetime.utcnow())
     
     def mark_cancelled(self, reminder_id: UUID) -> Optional[Reminder]:
-        """Marca un recordatorio como cancelado"""
-        db_reminder = self.get_by_id(reminder_id)
-        if not db_reminder:
+        """Marca un recordatorio como cancelado; en una serie termina la repetición"""
+        return self._set_status(reminder_id, status="cancelled")
+    
+    def _set_status(self, reminder_id: UUID, **values) -> Optional[Reminder]:
+        db_reminder = self.db.scalars(
+            update(Reminder).where(Reminder.id == reminder_id).values(**values).returning(Reminder),
+            execution_options={"populate_existing": True}
+        ).one_or_none()
+        self._commit()
+        return db_reminder
+    
+    def _pending_filter(
+        self,
+        reminder_type: Optional[ReminderTypeEnum] = None,
+        lotes: Optional[List[str]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        series: Optional[bool] = False
+    ) -> list:
+        """
+        Condiciones para seleccionar recordatorios pendientes en las operaciones masivas: únicos, series (`series`)
+        o ambos (`series=None`, solo sin fechas).
+        En una serie reminder_date es solo su primera ocurrencia abierta, así que las fechas no filtran la fila:
+        se descartan las que empiezan después de date_to y sus ocurrencias se filtran con _series_in_range.
+        """
+        conditions = [Reminder.status == ReminderStatusEnum.pending.value]
+        if series is not None:
+            conditions.append(Reminder.recurrence.has() if series else ~Reminder.recurrence.has())
+        if reminder_type:
+            conditions.append(Reminder.reminder_type == reminder_type.value)
+        if lotes:
+            conditions.append(Reminder.cattle_id.in_(select(Cattle.id).where(Cattle.lote.in_(lotes))))
+        if date_from and not series:
+            conditions.append(Reminder.reminder_date >= date_from)
+        if date_to:
+            conditions.append(Reminder.reminder_date <= date_to)
+        return conditions
+    
+    def _series_in_range(self, conditions: list, date_from: Optional[date], date_to: date) -> List[Tuple[Reminder, List[date]]]:
+        """Series que cumplen `conditions` con sus ocurrencias abiertas entre date_from y date_to"""
+        series = list(self.db.scalars(select(Reminder).options(selectinload(Reminder.recurrence)).where(*conditions)))
+        closed = self._closed_occurrences([reminder.id for reminder in series], date_from, date_to)
+        found = []
+        for reminder in series:
+            start = max(date_from or reminder.reminder_date, reminder.reminder_date)
+            days = [
+                occurrence.reminder_date
+                for occurrence in _series_occurrences(reminder, start, date_to, closed.get(reminder.id, set()))
+            ]
+            if days:
+                found.append((reminder, days))
+        return found
+    
+    def _count_series(self, conditions: list, date_from: Optional[date], date_to: Optional[date]) -> int:
+        """Series del filtro afectadas por las fechas (todas si no hay fecha final)"""
+        if date_to:
+            return len(self._series_in_range(conditions, date_from, date_to))
+        return self.db.scalar(select(func.count(Reminder.id)).where(*conditions))
+    
+    def _bulk_update(self, conditions: list, **values) -> int:
+        result = self.db.execute(
+            update(Reminder).where(*conditions).values(**values),
+            execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+    
+    def _close_series_in_range(
+        self,
+        status: ReminderStatusEnum,
+        reminder_type: Optional[ReminderTypeEnum],
+        lotes: Optional[List[str]],
+        date_from: Optional[date],
+        date_to: Optional[date]
+    ) -> Tuple[int, int]:
+        """
+        Completa o cancela las ocurrencias de las series dentro de las fechas.
+        Sin fecha final la serie no tiene un número finito de ocurrencias y se omite.
+        Devuelve (ocurrencias cambiadas, series omitidas)
+        """
+        conditions = self._pending_filter(reminder_type, lotes, date_from, date_to, series=True)
+        if not date_to:
+            return 0, self._count_series(conditions, date_from, date_to)
+        changed = 0
+        for reminder, days in self._series_in_range(conditions, date_from, date_to):
+            self._close_occurrences(reminder, days, status)
+            changed += len(days)
+        return changed, 0
+    
+    def complete_many(
+        self,
+        reminder_type: Optional[ReminderTypeEnum] = None,
+        lotes: Optional[List[str]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> ReminderBulkResponse:
+        """
+        Marca como completados los recordatorios pendientes que cumplan el filtro y, en las series,
+        sus ocurrencias dentro de las fechas (cada una cuenta como un recordatorio)
+        """
+        conditions = self._pending_filter(reminder_type, lotes, date_from, date_to)
+        updated = self._bulk_update(conditions, status=ReminderStatusEnum.completed.value, completed_at=datetime.utcnow())
+        occurrences, skipped = self._close_series_in_range(ReminderStatusEnum.completed, reminder_type, lotes, date_from, date_to)
+        self._commit()
+        return ReminderBulkResponse(updated=updated + occurrences, series_skipped=skipped)
+    
+    def cancel_many(
+        self,
+        reminder_type: Optional[ReminderTypeEnum] = None,
+        lotes: Optional[List[str]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> ReminderBulkResponse:
+        """
+        Cancela los recordatorios pendientes que cumplan el filtro. Con fechas, en las series solo se
+        cancelan sus ocurrencias dentro del rango; sin fechas las series dejan de repetirse
+        """
+        if not date_from and not date_to:
+            conditions = self._pending_filter(reminder_type, lotes, series=None)
+            updated = self._bulk_update(conditions, status=ReminderStatusEnum.cancelled.value)
+            self._commit()
+            return ReminderBulkResponse(updated=updated)
+        
+        conditions = self._pending_filter(reminder_type, lotes, date_from, date_to)
+        updated = self._bulk_update(conditions, status=ReminderStatusEnum.cancelled.value)
+        occurrences, skipped = self._close_series_in_range(ReminderStatusEnum.cancelled, reminder_type, lotes, date_from, date_to)
+        self._commit()
+        return ReminderBulkResponse(updated=updated + occurrences, series_skipped=skipped)
+    
+    def reschedule_many(
+        self,
+        days: int,
+        reminder_type: Optional[ReminderTypeEnum] = None,
+        lotes: Optional[List[str]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> ReminderBulkResponse:
+        """
+        Mueve `days` días (negativo para adelantar) los recordatorios pendientes que cumplan el filtro.
+        Las series no se mueven en bloque: se cuentan como omitidas
+        """
+        conditions = self._pending_filter(reminder_type, lotes, date_from, date_to)
+        updated = self._bulk_update(conditions, reminder_date=Reminder.reminder_date + days)
+        series_conditions = self._pending_filter(reminder_type, lotes, date_from, date_to, series=True)
+        skipped = self._count_series(series_conditions, date_from, date_to)
+        self._commit()
+        return ReminderBulkResponse(updated=updated, series_skipped=skipped)
+    
+    def create_many(self, items: List[ReminderCreate], batch_size: int = BATCH_SIZE) -> List[Reminder]:
+        """Crea varios recordatorios en una sola transacción"""
+        rows = [item.model_dump(exclude={"recurrence"}) for item in items]
+        created = []
+        for batch in chunked(rows, batch_size):
+            created.extend(self.db.scalars(
+                insert(Reminder).returning(Reminder, sort_by_parameter_order=True), batch
+            ).all())
+        self._add_recurrences(created, items)
+        self._commit()
+        return created
+    
+    def update_many(self, items: List[ReminderBatchUpdate]) -> Optional[List[Reminder]]:
+        """Actualiza varios recordatorios en una sola transacción. Devuelve None si algún ID no existe"""
+        ids = [item.id for item in items]
+        found = {e.id: e for e in self.db.scalars(select(Reminder).where(Reminder.id.in_(ids)))}
+        if len(found) != len(set(ids)):
             return None
         
-        db_reminder.status = "cancelled"
+        for item in items:
+            db_item = found[item.id]
+            for field, value in item.model_dump(exclude_unset=True, exclude={"id"}).items():
+                setattr(db_item, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_reminder)
-        return db_reminder
+        self.db.flush()
+        self._commit()
+        return [found[item.id] for item in items]
+    
+    def delete_many(self, ids: List[UUID]) -> int:
+        """Elimina varios recordatorios en una sola sentencia"""
+        result = self.db.execute(delete(Reminder).where(Reminder.id.in_(ids)))
+        self._commit()
+        return result.rowcount
     
     def delete(self, reminder_id: UUID) -> bool:
         """Elimina un recordatorio"""
-        db_reminder = self.get_by_id(reminder_id)
-        if not db_reminder:
-            return False
-        
-        self.db.delete(db_reminder)
-        self.db.commit()
-        return True
+        result = self.db.execute(delete(Reminder).where(Reminder.id == reminder_id))
+        self._commit()
+        return result.rowcount > 0
 
 
 from datetime import timedelta
+
+
+def _occurrence(reminder: Reminder, occurrence_date: date) -> ReminderOccurrenceResponse:
+    return ReminderOccurrenceResponse(
+        reminder_id=reminder.id,
+        title=reminder.title,
+        description=reminder.description,
+        reminder_date=occurrence_date,
+        reminder_type=reminder.reminder_type,
+        cattle_id=reminder.cattle_id,
+        health_event_id=reminder.health_event_id,
+        recurring=reminder.recurrence is not None
+    )
+
+
+def _series_occurrences(reminder: Reminder, start: date, end: date, closed: Set[date]) -> Iterator[ReminderOccurrenceResponse]:
+    """Ocurrencias abiertas de una serie entre start y end, en orden y generadas bajo demanda"""
+    rule = reminder.recurrence
+    for occurrence_date in iter_occurrences(rule.start_date, rule.frequency, rule.interval, start, end, rule.until, rule.count):
+        if occurrence_date not in closed:
+            yield _occurrence(reminder, occurrence_date)
@@ -0,0 +1,202 @@
+# src/repositories/reproduction_repository.py
+from datetime import date
+from typing import Optional
+from sqlalchemy import Float, Integer, and_, case, cast, func, literal_column, select, tuple_, type_coerce
+from sqlalchemy.orm import Session
+
+from src.core.reproduction import GESTATION_DAYS, HEAT_CYCLE_DAYS
+from src.models.cattle import Cattle, GenderEnum
+from src.models.heat_event import HeatEventModel
+from src.schemas.reproduction import (
+    ConceptionRateByBreed,
+    ConceptionRateByPeriod,
+    KpiPeriodEnum,
+    ReproductiveKPIs
+)
+
+
+# Un intervalo entre celos de más de 3 ciclos no se cuenta como celos perdidos
+# (suele ser gestación o anestro posparto)
+MAX_MISSED_CYCLES = 3
+
+
+def _days_between(later, earlier):
+    """Diferencia en días entre dos fechas (date - date devuelve un entero en PostgreSQL)"""
+    return type_coerce(later - earlier, Integer)
+
+
+def _in_range(column, start_date: Optional[date], end_date: Optional[date]):
+    conditions = []
+    if start_date:
+        conditions.append(column >= start_date)
+    if end_date:
+        conditions.append(column <= end_date)
+    return and_(True, *conditions)
+
+
+def _ratio(numerator, denominator):
+    return cast(numerator, Float) / func.nullif(denominator, 0)
+
+
+class ReproductionRepository:
+    """
+    Indicadores reproductivos calculados en la base de datos con funciones de ventana.
+
+    - Concepción: inseminación con preñez confirmada.
+    - Intervalo entre partos: días entre concepciones consecutivas del mismo animal
+      (la gestación dura lo mismo, así que equivale al intervalo entre partos).
+    - Días abiertos: del parto anterior (registrado o estimado) a la concepción.
+    - Servicios por concepción: inseminaciones desde la concepción anterior.
+    - Tasa de detección de celos: celos registrados / celos esperados según los intervalos.
+    El rango de fechas se aplica a la fecha del evento; las ventanas miran todo el historial
+    para que el primer evento del rango conozca a su anterior.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _inseminations(self, breed: Optional[str]):
+        confirmed = case((HeatEventModel.pregnancy_confirmed.is_(True), 1), else_=0)
+        stmt = select(
+            HeatEventModel.cattle_id,
+            Cattle.breed,
+            Cattle.fecha_ultimo_parto,
+            HeatEventModel.insemination_date,
+            HeatEventModel.pregnancy_confirmed,
+            # Número de concepciones anteriores: identifica el periodo de servicio de cada inseminación
+            func.coalesce(func.sum(confirmed).over(
+                partition_by=HeatEventModel.cattle_id,
+                order_by=HeatEventModel.insemination_date,
+                rows=(None, -1)
+            ), 0).label("service_period")
+        ).join(Cattle, Cattle.id == HeatEventModel.cattle_id).where(
+            HeatEventModel.was_inseminated.is_(True),
+            HeatEventModel.insemination_date.is_not(None)
+        )
+        if breed:
+            stmt = stmt.where(Cattle.breed == breed)
+        return stmt.cte("inseminations")
+
+    def _scalar_kpis(self, inseminations, start_date, end_date, breed):
+        # Concepciones con la concepción anterior del mismo animal
+        conceptions = select(
+            inseminations.c.insemination_date.label("conception_date"),
+            inseminations.c.fecha_ultimo_parto,
+            func.lag(inseminations.c.insemination_date).over(
+                partition_by=inseminations.c.cattle_id,
+                order_by=inseminations.c.insemination_date
+            ).label("previous_conception")
+        ).where(inseminations.c.pregnancy_confirmed.is_(True)).cte("conceptions")
+
+        in_range = _in_range(conceptions.c.conception_date, start_date, end_date)
+        # Parto anterior: el registrado si es previo a la concepción, o el estimado desde la concepción anterior
+        previous_calving = func.greatest(
+            conceptions.c.previous_conception + GESTATION_DAYS,
+            case((conceptions.c.fecha_ultimo_parto < conceptions.c.conception_date, conceptions.c.fecha_ultimo_parto))
+        )
+        conception_kpis = select(
+            func.avg(_days_between(conceptions.c.conception_date, conceptions.c.previous_conception)).label("calving_interval"),
+            func.avg(_days_between(conceptions.c.conception_date, previous_calving)).label("days_open")
+        ).where(in_range).subquery()
+
+        periods = select(
+            func.count().label("services"),
+            func.max(inseminations.c.insemination_date).filter(
+                inseminations.c.pregnancy_confirmed.is_(True)
+            ).label("conception_date")
+        ).group_by(inseminations.c.cattle_id, inseminations.c.service_period).subquery()
+        services_per_conception = select(
+            _ratio(func.sum(periods.c.services), func.count())
+        ).where(
+            periods.c.conception_date.is_not(None),
+            _in_range(periods.c.conception_date, start_date, end_date)
+        ).scalar_subquery()
+
+        results = select(
+            func.count().filter(inseminations.c.pregnancy_confirmed.is_(True)).label("conceptions"),
+            func.count().label("inseminations"),
+            func.count().filter(inseminations.c.pregnancy_confirmed.is_not(None)).label("with_result")
+        ).where(_in_range(inseminations.c.insemination_date, start_date, end_date)).subquery()
+
+        heats_stmt = select(
+            HeatEventModel.heat_date,
+            _days_between(
+                HeatEventModel.heat_date,
+                func.lag(HeatEventModel.heat_date).over(
+                    partition_by=HeatEventModel.cattle_id,
+                    order_by=HeatEventModel.heat_date
+                )
+            ).label("gap")
+        ).join(Cattle, Cattle.id == HeatEventModel.cattle_id).where(Cattle.gender == GenderEnum.female)
+        if breed:
+            heats_stmt = heats_stmt.where(Cattle.breed == breed)
+        heats = heats_stmt.subquery()
+        # Cada celo cuenta como esperado, más los ciclos que se saltaron desde el anterior
+        expected = case(
+            (heats.c.gap.is_(None), 1),
+            (heats.c.gap > HEAT_CYCLE_DAYS * MAX_MISSED_CYCLES, 1),
+            else_=func.greatest(1, func.round(heats.c.gap / float(HEAT_CYCLE_DAYS)))
+        )
+        heat_detection = select(
+            func.count().label("heats"),
+            _ratio(func.count(), func.sum(expected)).label("heat_detection_rate")
+        ).where(_in_range(heats.c.heat_date, start_date, end_date)).subquery()
+
+        return select(
+            cast(conception_kpis.c.calving_interval, Float).label("calving_interval_days"),
+            cast(conception_kpis.c.days_open, Float).label("days_open"),
+            services_per_conception.label("services_per_conception"),
+            _ratio(results.c.conceptions, results.c.with_result).label("conception_rate"),
+            heat_detection.c.heat_detection_rate,
+            results.c.conceptions,
+            results.c.inseminations,
+            heat_detection.c.heats
+        ).select_from(conception_kpis).join(results, literal_column("true")).join(heat_detection, literal_column("true"))
+
+    def _conception_rate_groups(self, inseminations, start_date, end_date, period: KpiPeriodEnum):
+        period_start = cast(func.date_trunc(KpiPeriodEnum(period).value, inseminations.c.insemination_date), inseminations.c.insemination_date.type)
+        breed = func.coalesce(inseminations.c.breed, "Sin raza")
+        return select(
+            func.grouping(breed).label("by_period"),
+            breed.label("breed"),
+            period_start.label("period_start"),
+            func.count().label("inseminations"),
+            func.count().filter(inseminations.c.pregnancy_confirmed.is_(True)).label("conceptions"),
+            _ratio(
+                func.count().filter(inseminations.c.pregnancy_confirmed.is_(True)),
+                func.count().filter(inseminations.c.pregnancy_confirmed.is_not(None))
+            ).label("conception_rate")
+        ).where(
+            _in_range(inseminations.c.insemination_date, start_date, end_date)
+        ).group_by(
+            func.grouping_sets(tuple_(breed), tuple_(period_start))
+        ).order_by(literal_column("by_period"), literal_column("breed"), literal_column("period_start"))
+
+    def get_kpis(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        breed: Optional[str] = None,
+        period: KpiPeriodEnum = KpiPeriodEnum.month
+    ) -> ReproductiveKPIs:
+        """Indicadores del rango de fechas, opcionalmente de una sola raza"""
+        inseminations = self._inseminations(breed)
+
+        kpis = self.db.execute(self._scalar_kpis(inseminations, start_date, end_date, breed)).mappings().one()
+
+        by_breed, by_period = [], []
+        for row in self.db.execute(self._conception_rate_groups(inseminations, start_date, end_date, period)).mappings():
+            group = dict(row)
+            if group.pop("by_period"):
+                by_period.append(ConceptionRateByPeriod(**group))
+            else:
+                by_breed.append(ConceptionRateByBreed(**group))
+
+        return ReproductiveKPIs(
+            start_date=start_date,
+            end_date=end_date,
+            breed=breed,
+            by_breed=by_breed,
+            by_period=by_period,
+            **kpis
+        )
@@ -0,0 +1,93 @@
+# src/repositories/search_repository.py
+from datetime import date
+from typing import List, Optional
+from sqlalchemy import String, cast, func, literal, select, union_all
+
+from src.infrastructure.text_search import SEARCH_CONFIG, search_query, strip_accents
+from src.models.cattle import Cattle
+from src.models.health_event import HealthEvent, health_event_search_document
+from src.models.heat_event import HeatEventModel, heat_event_search_document
+from src.repositories.base import BaseRepository
+from src.schemas.search import EventSearchHit, SearchSourceEnum
+
+
+# Un fragmento corto por resultado, con las coincidencias marcadas
+HEADLINE_OPTIONS = "MaxFragments=1, MaxWords=18, MinWords=6, StartSel=«, StopSel=»"
+
+
+class SearchRepository(BaseRepository):
+    """Búsqueda de texto completo en notas y enfermedades de salud y en el comportamiento de celo"""
+
+    def search_events(
+        self,
+        text: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        lotes: Optional[List[str]] = None,
+        source: Optional[SearchSourceEnum] = None,
+        limit: int = 20
+    ) -> List[EventSearchHit]:
+        """
+        Eventos cuyo texto coincide con `text`, del más al menos relevante (ts_rank) y después del más reciente.
+        El filtro `@@` usa los índices GIN de expresión de cada tabla: no se recorren los eventos.
+        """
+        query = search_query(text)
+        cattle_ids = select(Cattle.id).where(Cattle.lote.in_(lotes)) if lotes else None
+
+        branches = []
+        if source in (None, SearchSourceEnum.health):
+            stmt = select(
+                literal(SearchSourceEnum.health.value).label("source"),
+                HealthEvent.id.label("event_id"),
+                HealthEvent.cattle_id,
+                HealthEvent.application_date.label("event_date"),
+                cast(HealthEvent.event_type, String).label("event_type"),
+                func.concat_ws(" · ", HealthEvent.disease_name, HealthEvent.medicine_name, HealthEvent.notes).label("body"),
+                func.ts_rank(health_event_search_document, query).label("rank")
+            ).where(health_event_search_document.op("@@")(query))
+            if date_from:
+                stmt = stmt.where(HealthEvent.application_date >= date_from)
+            if date_to:
+                stmt = stmt.where(HealthEvent.application_date <= date_to)
+            if cattle_ids is not None:
+                stmt = stmt.where(HealthEvent.cattle_id.in_(cattle_ids))
+            branches.append(stmt)
+
+        if source in (None, SearchSourceEnum.heat):
+            stmt = select(
+                literal(SearchSourceEnum.heat.value).label("source"),
+                HeatEventModel.id.label("event_id"),
+                HeatEventModel.cattle_id,
+                HeatEventModel.heat_date.label("event_date"),
+                literal("heat").label("event_type"),
+                func.concat_ws(" · ", HeatEventModel.comportamiento, HeatEventModel.vaginal_discharge, HeatEventModel.vulva_swelling).label("body"),
+                func.ts_rank(heat_event_search_document, query).label("rank")
+            ).where(heat_event_search_document.op("@@")(query))
+            if date_from:
+                stmt = stmt.where(HeatEventModel.heat_date >= date_from)
+            if date_to:
+                stmt = stmt.where(HeatEventModel.heat_date <= date_to)
+            if cattle_ids is not None:
+                stmt = stmt.where(HeatEventModel.cattle_id.in_(cattle_ids))
+            branches.append(stmt)
+
+        # Se ordena y corta antes de generar los fragmentos: ts_headline solo se calcula para la página.
+        # El fragmento sale sin tildes, igual que el texto indexado, para que se marquen las coincidencias
+        matches = union_all(*branches).subquery() if len(branches) > 1 else branches[0].subquery()
+        top = select(matches).order_by(matches.c.rank.desc(), matches.c.event_date.desc()).limit(limit).subquery()
+        rows = self.db.execute(
+            select(
+                top.c.source,
+                top.c.event_id,
+                top.c.cattle_id,
+                Cattle.lote,
+                Cattle.name.label("cattle_name"),
+                top.c.event_date,
+                top.c.event_type,
+                func.ts_headline(SEARCH_CONFIG, strip_accents(top.c.body), query, HEADLINE_OPTIONS).label("snippet"),
+                top.c.rank
+            )
+            .join(Cattle, Cattle.id == top.c.cattle_id)
+            .order_by(top.c.rank.desc(), top.c.event_date.desc())
+        ).mappings()
+        return [EventSearchHit(**row) for row in rows]
@@ -0,0 +1,139 @@
+# src/repositories/snapshot_repository.py
+from datetime import date
+from typing import Optional
+from sqlalchemy import JSON, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from src.models.cattle import Cattle
+from src.models.health_event import HealthEvent, EventTypeEnum
+from src.models.heat_event import HeatEventModel
+from src.models.reminder import Reminder
+from src.schemas.snapshot import AnimalSnapshot
+
+
+def _json_object(**columns):
+    """json_build_object con las claves como literales SQL"""
+    args = []
+    for key, column in columns.items():
+        args.extend([literal_column(f"'{key}'"), column])
+    return func.json_build_object(*args, type_=JSON)
+
+
+def _first_items(name: str, data, order_by, *conditions, limit: int):
+    """
+    Los primeros `limit` elementos como arreglo JSON y el total sin recortar (count(*) OVER se
+    calcula antes del LIMIT), en un LATERAL que solo agrega las filas que se muestran.
+    """
+    rows = select(
+        data.label("item"),
+        order_by.label("sort_key"),
+        func.count().over().label("total")
+    ).where(*conditions).order_by(order_by).limit(limit).correlate(Cattle).lateral(f"{name}_rows")
+    return select(
+        func.json_agg(aggregate_order_by(rows.c.item, rows.c.sort_key), type_=JSON).label("data"),
+        func.max(rows.c.total).label("total")
+    ).select_from(rows).lateral(name)
+
+
+def _heat_json():
+    return _json_object(
+        heat_date=HeatEventModel.heat_date,
+        was_inseminated=HeatEventModel.was_inseminated,
+        insemination_date=HeatEventModel.insemination_date,
+        pregnancy_confirmed=HeatEventModel.pregnancy_confirmed
+    )
+
+
+class SnapshotRepository:
+    """Consulta de solo lectura que arma la ficha completa de un animal"""
+
+    # Tope de elementos en las listas de la ficha
+    MAX_ITEMS = 10
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _statement(self, today: date):
+        last_vaccine = select(
+            _json_object(
+                application_date=HealthEvent.application_date,
+                medicine_name=HealthEvent.medicine_name,
+                disease_name=HealthEvent.disease_name,
+                next_dose_date=HealthEvent.next_dose_date
+            ).label("data")
+        ).where(
+            HealthEvent.cattle_id == Cattle.id,
+            HealthEvent.event_type == EventTypeEnum.vaccine
+        ).order_by(HealthEvent.application_date.desc()).limit(1).lateral("last_vaccine")
+
+        upcoming_doses = _first_items(
+            "upcoming_doses",
+            _json_object(
+                next_dose_date=HealthEvent.next_dose_date,
+                event_type=HealthEvent.event_type,
+                medicine_name=HealthEvent.medicine_name,
+                dosage=HealthEvent.dosage
+            ),
+            HealthEvent.next_dose_date,
+            HealthEvent.cattle_id == Cattle.id,
+            HealthEvent.next_dose_date >= today,
+            limit=self.MAX_ITEMS
+        )
+
+        last_heat = select(_heat_json().label("data")).where(
+            HeatEventModel.cattle_id == Cattle.id
+        ).order_by(HeatEventModel.heat_date.desc()).limit(1).lateral("last_heat")
+
+        last_insemination = select(_heat_json().label("data")).where(
+            HeatEventModel.cattle_id == Cattle.id,
+            HeatEventModel.was_inseminated.is_(True)
+        ).order_by(HeatEventModel.insemination_date.desc().nulls_last()).limit(1).lateral("last_insemination")
+
+        pending_reminders = _first_items(
+            "pending_reminders",
+            _json_object(
+                title=Reminder.title,
+                reminder_date=Reminder.reminder_date,
+                reminder_type=Reminder.reminder_type
+            ),
+            Reminder.reminder_date,
+            Reminder.cattle_id == Cattle.id,
+            Reminder.status == "pending",
+            limit=self.MAX_ITEMS
+        )
+
+        return (
+            select(
+                Cattle,
+                last_vaccine.c.data,
+                upcoming_doses.c.data,
+                last_heat.c.data,
+                last_insemination.c.data,
+                pending_reminders.c.data,
+                pending_reminders.c.total
+            )
+            .select_from(Cattle)
+            .outerjoin(last_vaccine, true())
+            .outerjoin(upcoming_doses, true())
+            .outerjoin(last_heat, true())
+            .outerjoin(last_insemination, true())
+            .outerjoin(pending_reminders, true())
+        )
+
+    def get_by_lote(self, lote: str) -> Optional[AnimalSnapshot]:
+        """Ficha del animal (datos, última vacuna, próximas dosis, reproducción y pendientes) en una sola consulta"""
+        row = self.db.execute(self._statement(date.today()).where(Cattle.lote == lote)).first()
+        if not row:
+            return None
+
+        cattle, last_vaccine, upcoming_doses, last_heat, last_insemination, pending_reminders, pending_total = row
+        return AnimalSnapshot(
+            cattle=cattle,
+            last_vaccine=last_vaccine,
+            upcoming_doses=upcoming_doses or [],
+            last_heat=last_heat,
+            last_insemination=last_insemination,
+            pending_reminders=pending_reminders or [],
+            pending_reminders_total=pending_total or 0
+        )
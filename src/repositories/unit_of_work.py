@@ -0,0 +1,50 @@
+# src/repositories/unit_of_work.py
+from sqlalchemy.orm import Session
+
+from src.repositories.cattle_repository import CattleRepository
+from src.repositories.health_event_repository import HealthEventRepository
+from src.repositories.heat_event_repository import HeatEventRepository
+from src.repositories.reminder_repository import ReminderRepository
+
+
+class UnitOfWork:
+    """
+    Agrupa escrituras de varios repositorios en una sola transacción.
+
+    Uso:
+        with UnitOfWork(db) as uow:
+            cattle = uow.cattle.create(cattle_data)
+            uow.reminders.create_many(reminders)
+
+    Hace commit al salir del bloque, o rollback si se lanzó una excepción.
+    Solo dentro del bloque la sesión no expira los objetos al hacer commit: lo devuelto por
+    INSERT/UPDATE ... RETURNING sigue legible después sin un SELECT por objeto.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._expire_on_commit = db.expire_on_commit
+        self.cattle = CattleRepository(db, auto_commit=False)
+        self.health_events = HealthEventRepository(db, auto_commit=False)
+        self.heat_events = HeatEventRepository(db, auto_commit=False)
+        self.reminders = ReminderRepository(db, auto_commit=False)
+
+    def __enter__(self) -> "UnitOfWork":
+        self.db.expire_on_commit = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.db.expire_on_commit = self._expire_on_commit
+        return False
+
+    def commit(self) -> None:
+        self.db.commit()
+
+    def rollback(self) -> None:
+        self.db.rollback()
@@ -0,0 +1,129 @@
+# src/repositories/weight_repository.py
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import Date, Numeric, cast, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.cattle import Cattle
+from src.models.weight_measurement import WeightMeasurement
+from src.repositories.base import BaseRepository, BATCH_SIZE, chunked
+
+
+def _monday(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+class WeightRepository(BaseRepository):
+    """Pesajes: ingesta por lotes, reducción del historial antiguo y series para analítica"""
+
+    def ingest(self, readings: Sequence[Tuple[UUID, date, float]], batch_size: int = BATCH_SIZE) -> Tuple[int, int]:
+        """
+        Guarda lecturas (cattle_id, fecha, peso). Varias lecturas del mismo animal y día se promedian,
+        también con la que ya estuviera guardada. Después actualiza Cattle.weight con el último pesaje
+        de cada animal afectado en una sola sentencia. Devuelve (filas guardadas, ganado actualizado).
+        """
+        totals: Dict[Tuple[UUID, date], List[float]] = defaultdict(lambda: [0.0, 0])
+        for cattle_id, measured_on, weight in readings:
+            total = totals[(cattle_id, measured_on)]
+            total[0] += weight
+            total[1] += 1
+
+        rows = [
+            {"cattle_id": cattle_id, "measured_on": measured_on, "weight": total / count, "samples": count}
+            for (cattle_id, measured_on), (total, count) in totals.items()
+        ]
+        for batch in chunked(rows, batch_size):
+            stmt = insert(WeightMeasurement).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[WeightMeasurement.cattle_id, WeightMeasurement.measured_on],
+                set_={
+                    "weight": (WeightMeasurement.weight * WeightMeasurement.samples + stmt.excluded.weight * stmt.excluded.samples)
+                              / (WeightMeasurement.samples + stmt.excluded.samples),
+                    "samples": WeightMeasurement.samples + stmt.excluded.samples
+                }
+            )
+            self.db.execute(stmt)
+
+        cattle_ids = list({row["cattle_id"] for row in rows})
+        updated = self._refresh_latest_weight(cattle_ids)
+        self._commit()
+        return len(rows), updated
+
+    def _refresh_latest_weight(self, cattle_ids: List[UUID]) -> int:
+        """Copia el último pesaje a Cattle.weight (valor desnormalizado que leen las herramientas)"""
+        if not cattle_ids:
+            return 0
+        latest = select(WeightMeasurement.cattle_id, WeightMeasurement.weight).where(
+            WeightMeasurement.cattle_id.in_(cattle_ids)
+        ).distinct(WeightMeasurement.cattle_id).order_by(
+            WeightMeasurement.cattle_id, WeightMeasurement.measured_on.desc()
+        ).subquery()
+        result = self.db.execute(
+            # REAL -> numeric redondeado para no arrastrar el ruido de precisión simple a Cattle.weight
+            update(Cattle).where(Cattle.id == latest.c.cattle_id).values(weight=func.round(cast(latest.c.weight, Numeric), 2)),
+            execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+
+    def get_history(self, cattle_id: UUID, limit: int = 365) -> List[WeightMeasurement]:
+        """Pesajes de un animal, del más reciente al más antiguo"""
+        return self.db.scalars(
+            select(WeightMeasurement).where(WeightMeasurement.cattle_id == cattle_id)
+            .order_by(WeightMeasurement.measured_on.desc()).limit(limit)
+        ).all()
+
+    def get_herd_series(self, start_date: date, end_date: Optional[date] = None) -> List[Tuple]:
+        """Pesajes de todo el rebaño en el rango, ordenados por animal y fecha, con los datos del animal"""
+        stmt = select(
+            WeightMeasurement.cattle_id,
+            Cattle.lote,
+            Cattle.name,
+            Cattle.breed,
+            WeightMeasurement.measured_on,
+            WeightMeasurement.weight
+        ).join(Cattle, Cattle.id == WeightMeasurement.cattle_id).where(WeightMeasurement.measured_on >= start_date)
+        if end_date:
+            stmt = stmt.where(WeightMeasurement.measured_on <= end_date)
+        return self.db.execute(stmt.order_by(WeightMeasurement.cattle_id, WeightMeasurement.measured_on)).all()
+
+    def downsample(self, keep_daily_days: int = 90, lookback_days: int = 30, today: Optional[date] = None) -> int:
+        """
+        Reduce a un pesaje semanal (promedio ponderado, guardado en el lunes) los datos con más
+        de `keep_daily_days` días. Solo revisa las semanas completas de los últimos `lookback_days`
+        días antes del corte, que son las que quedaron viejas desde la última ejecución.
+        Es idempotente. Devuelve las filas semanales escritas.
+        """
+        today = today or date.today()
+        cutoff = _monday(today - timedelta(days=keep_daily_days))
+        since = _monday(cutoff - timedelta(days=lookback_days))
+        week = cast(func.date_trunc("week", WeightMeasurement.measured_on), Date)
+
+        removed = delete(WeightMeasurement).where(
+            WeightMeasurement.measured_on >= since,
+            WeightMeasurement.measured_on < cutoff
+        ).returning(
+            WeightMeasurement.cattle_id,
+            week.label("week"),
+            WeightMeasurement.weight,
+            WeightMeasurement.samples
+        ).cte("removed")
+
+        weekly = select(
+            removed.c.cattle_id,
+            removed.c.week,
+            func.sum(removed.c.weight * removed.c.samples) / func.sum(removed.c.samples),
+            func.sum(removed.c.samples)
+        ).group_by(removed.c.cattle_id, removed.c.week)
+
+        stmt = insert(WeightMeasurement).from_select(
+            ["cattle_id", "measured_on", "weight", "samples"], weekly
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WeightMeasurement.cattle_id, WeightMeasurement.measured_on],
+            set_={"weight": stmt.excluded.weight, "samples": stmt.excluded.samples}
+        )
+        result = self.db.execute(stmt)
+        self._commit()
+        return result.rowcount
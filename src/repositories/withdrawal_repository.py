@@ -0,0 +1,81 @@
+# src/repositories/withdrawal_repository.py
+from datetime import date
+from typing import List, Optional
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.cattle import Cattle
+from src.models.withdrawal import MedicineWithdrawal, WithdrawalPeriod
+from src.repositories.base import BaseRepository
+from src.schemas.withdrawal import AnimalWithdrawal, MedicineWithdrawalUpdate, WithdrawalProductEnum
+
+
+def normalize_medicine(name: str) -> str:
+    """Misma normalización que aplican los triggers a health_events.medicine_name"""
+    return name.strip().lower()
+
+
+class WithdrawalRepository(BaseRepository):
+    """Catálogo de días de retiro por medicamento y consulta de animales en retiro"""
+
+    def get_medicines(self) -> List[MedicineWithdrawal]:
+        return self.db.scalars(select(MedicineWithdrawal).order_by(MedicineWithdrawal.medicine)).all()
+
+    def upsert_medicine(self, medicine: str, data: MedicineWithdrawalUpdate) -> MedicineWithdrawal:
+        """Crea o actualiza los días de retiro; el trigger recalcula los periodos de ese medicamento"""
+        stmt = insert(MedicineWithdrawal).values(medicine=normalize_medicine(medicine), **data.model_dump())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MedicineWithdrawal.medicine],
+            set_={**data.model_dump(), "updated_at": func.now()}
+        ).returning(MedicineWithdrawal)
+        item = self.db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        self._commit()
+        return item
+
+    def delete_medicine(self, medicine: str) -> bool:
+        result = self.db.execute(
+            delete(MedicineWithdrawal).where(MedicineWithdrawal.medicine == normalize_medicine(medicine))
+        )
+        self._commit()
+        return result.rowcount > 0
+
+    def get_in_withdrawal(
+        self,
+        on_date: date,
+        product: Optional[WithdrawalProductEnum] = None,
+        lotes: Optional[List[str]] = None
+    ) -> List[AnimalWithdrawal]:
+        """
+        Tratamientos cuyo periodo de retiro contiene `on_date`.
+        Es una búsqueda en el índice GiST de `period` (operador @>), no un recorrido de los eventos.
+        """
+        stmt = select(
+            WithdrawalPeriod.health_event_id,
+            Cattle.lote,
+            Cattle.name,
+            WithdrawalPeriod.medicine,
+            WithdrawalPeriod.product,
+            func.lower(WithdrawalPeriod.period).label("start_date"),
+            func.upper(WithdrawalPeriod.period).label("clear_date")
+        ).join(Cattle, Cattle.id == WithdrawalPeriod.cattle_id).where(
+            WithdrawalPeriod.period.contains(on_date)
+        )
+        if product:
+            stmt = stmt.where(WithdrawalPeriod.product == product.value)
+        if lotes:
+            stmt = stmt.where(Cattle.lote.in_(lotes))
+
+        rows = self.db.execute(stmt.order_by(Cattle.lote, WithdrawalPeriod.product, func.upper(WithdrawalPeriod.period).desc()))
+        return [
+            AnimalWithdrawal(
+                health_event_id=row.health_event_id,
+                lote=row.lote,
+                cattle_name=row.name,
+                medicine=row.medicine,
+                product=row.product,
+                start_date=row.start_date,
+                clear_date=row.clear_date,
+                days_left=(row.clear_date - on_date).days
+            )
+            for row in rows
+        ]
@@ -3,6 +3,7 @@ from src.schemas.cattle import (
     CattleBase,
     CattleCreate,
     CattleUpdate,
+    CattleBatchUpdate,
     CattleResponse,
     CattleListResponse
 )
@@ -12,6 +13,7 @@ from src.schemas.health_event import (
     HealthEventBase,
     HealthEventCreate,
     HealthEventUpdate,
+    HealthEventBatchUpdate,
     HealthEventResponse,
     HealthEventListResponse
 )
@@ -19,6 +21,7 @@ from src.schemas.heat_event import (
     HeatEventBase,
     HeatEventCreate,
     HeatEventUpdate,
+    HeatEventBatchUpdate,
     HeatEventResponse,
     HeatEventListResponse
 )
@@ -26,8 +29,85 @@ from src.schemas.reminder import (
     ReminderTypeEnum,
     ReminderStatusEnum,
     ReminderBase,
+    ReminderRecurrenceCreate,
+    ReminderRecurrenceResponse,
     ReminderCreate,
     ReminderUpdate,
+    ReminderBatchUpdate,
     ReminderResponse,
-    ReminderListResponse
+    ReminderOccurrenceResponse,
+    ReminderListResponse,
+    ReminderBulkFilter,
+    ReminderRescheduleRequest,
+    ReminderBulkResponse
+)
+from src.schemas.batch import BatchDeleteRequest, BatchDeleteResponse
+from src.schemas.snapshot import (
+    SnapshotVaccine,
+    SnapshotDose,
+    SnapshotHeat,
+    SnapshotReminder,
+    AnimalSnapshot
+)
+from src.schemas.agenda import (
+    AgendaItemTypeEnum,
+    AgendaItem,
+    AgendaResponse
+)
+from src.schemas.digest import (
+    DigestReminder,
+    DigestDose,
+    DigestPregnancyCheck,
+    DailyDigestResponse
+)
+from src.schemas.dashboard import HerdSummary
+from src.schemas.heat_prediction import HeatPrediction
+from src.schemas.reproduction import (
+    KpiPeriodEnum,
+    ConceptionRateByBreed,
+    ConceptionRateByPeriod,
+    ReproductiveKPIs
+)
+from src.schemas.demographics import (
+    DemographicsGroup,
+    HerdDemographics
+)
+from src.schemas.weight import (
+    WeightReading,
+    WeightBatchRequest,
+    WeightBatchResponse,
+    WeightMeasurementResponse,
+    WeightHistoryResponse,
+    AnimalGrowth,
+    GrowthReport
+)
+from src.schemas.activity import (
+    ActivityReadingIn,
+    ActivityBatchRequest,
+    DetectedHeat,
+    ActivityBatchResponse
+)
+from src.schemas.outbreak import (
+    OutbreakGroup,
+    DiseaseCluster,
+    OutbreakStatus,
+    OutbreakAlertResponse
+)
+from src.schemas.withdrawal import (
+    WithdrawalProductEnum,
+    MedicineWithdrawalUpdate,
+    MedicineWithdrawalResponse,
+    AnimalWithdrawal,
+    WithdrawalStatus
+)
+from src.schemas.vaccination_protocol import (
+    VaccinationProtocolCreate,
+    VaccinationProtocolUpdate,
+    VaccinationProtocolResponse,
+    PlannedDose,
+    ProtocolPlanResponse
+)
+from src.schemas.search import (
+    SearchSourceEnum,
+    EventSearchHit
 )
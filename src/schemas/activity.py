@@ -0,0 +1,29 @@
+# src/schemas/activity.py
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+from uuid import UUID
+
+
+class ActivityReadingIn(BaseModel):
+    lote: str = Field(..., min_length=1, max_length=50)
+    recorded_at: datetime
+    steps: int = Field(..., ge=0)
+
+
+class ActivityBatchRequest(BaseModel):
+    readings: list[ActivityReadingIn] = Field(..., min_length=1, max_length=50000)
+
+
+class DetectedHeat(BaseModel):
+    heat_event_id: UUID
+    lote: str
+    cattle_name: str
+    heat_date: date
+    activity_ratio: float
+
+
+class ActivityBatchResponse(BaseModel):
+    stored_buckets: int
+    analyzed_buckets: int
+    unknown_lotes: list[str] = []
+    heats_detected: list[DetectedHeat] = []
@@ -0,0 +1,32 @@
+# src/schemas/agenda.py
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+from enum import Enum
+from uuid import UUID
+
+
+class AgendaItemTypeEnum(str, Enum):
+    reminder = "reminder"
+    dose = "dose"
+    pregnancy_check = "pregnancy_check"
+    expected_heat = "expected_heat"
+    calving = "calving"
+
+
+class AgendaItem(BaseModel):
+    item_date: date
+    item_type: AgendaItemTypeEnum
+    title: str
+    detail: Optional[str] = None
+    source_id: UUID
+    cattle_id: Optional[UUID] = None
+    lote: Optional[str] = None
+    cattle_name: Optional[str] = None
+
+
+class AgendaResponse(BaseModel):
+    start_date: date
+    end_date: date
+    total: int
+    items: list[AgendaItem]
@@ -0,0 +1,11 @@
+# src/schemas/batch.py
+from pydantic import BaseModel, Field
+from uuid import UUID
+
+
+class BatchDeleteRequest(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchDeleteResponse(BaseModel):
+    deleted: int
@@ -35,6 +35,10 @@ class CattleUpdate(BaseModel):
     fecha_ultimo_parto: Optional[date] = None
 
 
+class CattleBatchUpdate(CattleUpdate):
+    id: UUID
+
+
 class CattleResponse(CattleBase):
     id: UUID
     created_at: datetime
@@ -46,3 +50,4 @@ class CattleResponse(CattleBase):
 class CattleListResponse(BaseModel):
     total: int
     cattle: list[CattleResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,15 @@
+# src/schemas/dashboard.py
+from pydantic import BaseModel
+from datetime import date
+
+
+class HerdSummary(BaseModel):
+    as_of: date
+    total_cattle: int
+    by_gender: dict[str, int]
+    by_breed: dict[str, int]
+    pregnant: int
+    reminders_pending: int
+    reminders_overdue: int
+    doses_next_7_days: int
+    doses_next_30_days: int
@@ -0,0 +1,26 @@
+# src/schemas/demographics.py
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+
+
+class DemographicsGroup(BaseModel):
+    breed: Optional[str] = None
+    gender: Optional[str] = None
+    count: int
+    age_buckets: dict[str, int]
+    weight_mean: Optional[float] = None
+    weight_median: Optional[float] = None
+    weight_p25: Optional[float] = None
+    weight_p75: Optional[float] = None
+    weight_p90: Optional[float] = None
+
+
+class HerdDemographics(BaseModel):
+    as_of: date
+    breed: Optional[str] = None
+    gender: Optional[str] = None
+    min_age_years: Optional[int] = None
+    max_age_years: Optional[int] = None
+    groups: list[DemographicsGroup]
+    total: DemographicsGroup
@@ -0,0 +1,37 @@
+# src/schemas/digest.py
+from pydantic import BaseModel, ConfigDict
+from datetime import date, datetime
+from typing import Optional
+
+
+class DigestReminder(BaseModel):
+    title: str
+    reminder_date: date
+    reminder_type: str
+    description: Optional[str] = None
+
+
+class DigestDose(BaseModel):
+    cattle_name: str
+    lote: str
+    next_dose_date: date
+    event_type: str
+    medicine_name: Optional[str] = None
+    dosage: Optional[str] = None
+
+
+class DigestPregnancyCheck(BaseModel):
+    cattle_name: str
+    lote: str
+    insemination_date: date
+
+
+class DailyDigestResponse(BaseModel):
+    digest_date: date
+    overdue_reminders: list[DigestReminder]
+    upcoming_doses: list[DigestDose]
+    pending_pregnancy_checks: list[DigestPregnancyCheck]
+    generated_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -55,6 +55,10 @@ class HealthEventUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class HealthEventBatchUpdate(HealthEventUpdate):
+    id: UUID
+
+
 class HealthEventResponse(HealthEventBase):
     id: UUID
     cattle_id: UUID
@@ -67,3 +71,4 @@ class HealthEventResponse(HealthEventBase):
 class HealthEventListResponse(BaseModel):
     total: int
     events: list[HealthEventResponse]
+    next_cursor: Optional[str] = None
@@ -31,6 +31,10 @@ class HeatEventUpdate(BaseModel):
     pregnancy_confirmed: Optional[bool] = None
 
 
+class HeatEventBatchUpdate(HeatEventUpdate):
+    id: UUID
+
+
 class HeatEventResponse(HeatEventBase):
     id: UUID
     cattle_id: UUID
@@ -43,3 +47,4 @@ class HeatEventResponse(HeatEventBase):
 class HeatEventListResponse(BaseModel):
     total: int
     events: list[HeatEventResponse]
+    next_cursor: Optional[str] = None
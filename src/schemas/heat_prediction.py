@@ -0,0 +1,16 @@
+# src/schemas/heat_prediction.py
+from pydantic import BaseModel
+from datetime import date
+from uuid import UUID
+
+
+class HeatPrediction(BaseModel):
+    cattle_id: UUID
+    lote: str
+    cattle_name: str
+    last_heat_date: date
+    last_heat_id: UUID
+    expected_date: date
+    cycle_days: float
+    observed_cycles: int
+    confidence: float
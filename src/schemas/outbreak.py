@@ -0,0 +1,45 @@
+# src/schemas/outbreak.py
+from pydantic import BaseModel, ConfigDict
+from datetime import date, datetime
+from uuid import UUID
+
+
+class OutbreakGroup(BaseModel):
+    scope: str  # 'breed' o 'age_group'
+    value: str
+    animals: int
+    cases: int
+    alert: bool
+
+
+class DiseaseCluster(BaseModel):
+    disease: str
+    animals: int
+    cases: int
+    first_case: date
+    last_case: date
+    lotes: list[str]
+    alert: bool
+    groups: list[OutbreakGroup] = []
+
+
+class OutbreakStatus(BaseModel):
+    since: date
+    window_days: int
+    min_animals: int
+    group_min_animals: int
+    outbreaks: list[DiseaseCluster]
+    watch: list[DiseaseCluster]
+
+
+class OutbreakAlertResponse(BaseModel):
+    id: UUID
+    disease: str
+    scope: str
+    group_value: str
+    animals: int
+    window_days: int
+    raised_on: date
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
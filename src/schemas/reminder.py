@@ -1,10 +1,12 @@
 # src/schemas/reminder.py
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from datetime import date, datetime
 from typing import Optional
 from enum import Enum
 from uuid import UUID
 
+from src.core.recurrence import RecurrenceFrequencyEnum
+
 
 class ReminderTypeEnum(str, Enum):
     vaccine = "vaccine"
@@ -30,8 +32,28 @@ class ReminderBase(BaseModel):
     health_event_id: Optional[UUID] = None
 
 
+class ReminderRecurrenceCreate(BaseModel):
+    frequency: RecurrenceFrequencyEnum
+    interval: int = Field(1, ge=1, le=365)
+    until: Optional[date] = None
+    count: Optional[int] = Field(None, ge=1, le=1000)
+
+
+class ReminderRecurrenceResponse(ReminderRecurrenceCreate):
+    start_date: date
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ReminderCreate(ReminderBase):
-    pass
+    # Con regla de repetición `reminder_date` es la primera ocurrencia
+    recurrence: Optional[ReminderRecurrenceCreate] = None
+
+    @model_validator(mode="after")
+    def check_until(self):
+        if self.recurrence and self.recurrence.until and self.recurrence.until < self.reminder_date:
+            raise ValueError("recurrence.until no puede ser anterior a reminder_date")
+        return self
 
 
 class ReminderUpdate(BaseModel):
@@ -44,16 +66,58 @@ class ReminderUpdate(BaseModel):
     status: Optional[ReminderStatusEnum] = None
 
 
+class ReminderBatchUpdate(ReminderUpdate):
+    id: UUID
+
+
 class ReminderResponse(ReminderBase):
     id: UUID
     status: ReminderStatusEnum
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    recurrence: Optional[ReminderRecurrenceResponse] = None
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class ReminderOccurrenceResponse(BaseModel):
+    """Una ocurrencia pendiente: un recordatorio único o una fecha de una serie"""
+    reminder_id: UUID
+    title: str
+    description: Optional[str] = None
+    reminder_date: date
+    reminder_type: str
+    cattle_id: Optional[UUID] = None
+    health_event_id: Optional[UUID] = None
+    recurring: bool = False
+
+
 class ReminderListResponse(BaseModel):
     total: int
     reminders: list[ReminderResponse]
+    next_cursor: Optional[str] = None
+
+
+class ReminderBulkFilter(BaseModel):
+    reminder_type: Optional[ReminderTypeEnum] = None
+    lotes: Optional[list[str]] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+    @model_validator(mode="after")
+    def require_filter(self):
+        # Evita completar o cancelar por accidente todos los pendientes del rancho
+        if not any([self.reminder_type, self.lotes, self.date_from, self.date_to]):
+            raise ValueError("Se requiere al menos un filtro: reminder_type, lotes, date_from o date_to")
+        return self
+
+
+class ReminderRescheduleRequest(ReminderBulkFilter):
+    days: int = Field(..., ge=-365, le=365)
+
+
+class ReminderBulkResponse(BaseModel):
+    updated: int
+    # Series que coinciden con el filtro pero no se modificaron (reprogramar, o completar sin fecha final)
+    series_skipped: int = 0
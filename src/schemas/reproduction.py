@@ -0,0 +1,41 @@
+# src/schemas/reproduction.py
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+from enum import Enum
+
+
+class KpiPeriodEnum(str, Enum):
+    month = "month"
+    quarter = "quarter"
+    year = "year"
+
+
+class ConceptionRateGroup(BaseModel):
+    inseminations: int
+    conceptions: int
+    conception_rate: Optional[float] = None
+
+
+class ConceptionRateByBreed(ConceptionRateGroup):
+    breed: str
+
+
+class ConceptionRateByPeriod(ConceptionRateGroup):
+    period_start: date
+
+
+class ReproductiveKPIs(BaseModel):
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    breed: Optional[str] = None
+    calving_interval_days: Optional[float] = None
+    days_open: Optional[float] = None
+    services_per_conception: Optional[float] = None
+    conception_rate: Optional[float] = None
+    heat_detection_rate: Optional[float] = None
+    conceptions: int = 0
+    inseminations: int = 0
+    heats: int = 0
+    by_breed: list[ConceptionRateByBreed] = []
+    by_period: list[ConceptionRateByPeriod] = []
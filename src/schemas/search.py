@@ -0,0 +1,24 @@
+# src/schemas/search.py
+from pydantic import BaseModel
+from datetime import date
+from enum import Enum
+from uuid import UUID
+
+
+class SearchSourceEnum(str, Enum):
+    health = "health"
+    heat = "heat"
+
+
+class EventSearchHit(BaseModel):
+    source: SearchSourceEnum
+    event_id: UUID
+    cattle_id: UUID
+    lote: str
+    cattle_name: str
+    event_date: date
+    # Tipo del evento de salud (vaccine, illness...) o "heat"
+    event_type: str
+    # Fragmento del texto con las palabras encontradas entre «»
+    snippet: str
+    rank: float
@@ -0,0 +1,44 @@
+# src/schemas/snapshot.py
+from pydantic import BaseModel
+from datetime import date
+from typing import Optional
+
+from src.schemas.cattle import CattleResponse
+
+
+class SnapshotVaccine(BaseModel):
+    application_date: date
+    medicine_name: Optional[str] = None
+    disease_name: Optional[str] = None
+    next_dose_date: Optional[date] = None
+
+
+class SnapshotDose(BaseModel):
+    next_dose_date: date
+    event_type: str
+    medicine_name: Optional[str] = None
+    dosage: Optional[str] = None
+
+
+class SnapshotHeat(BaseModel):
+    heat_date: date
+    was_inseminated: Optional[bool] = None
+    insemination_date: Optional[date] = None
+    pregnancy_confirmed: Optional[bool] = None
+
+
+class SnapshotReminder(BaseModel):
+    title: str
+    reminder_date: date
+    reminder_type: str
+
+
+class AnimalSnapshot(BaseModel):
+    cattle: CattleResponse
+    last_vaccine: Optional[SnapshotVaccine] = None
+    upcoming_doses: list[SnapshotDose] = []
+    last_heat: Optional[SnapshotHeat] = None
+    last_insemination: Optional[SnapshotHeat] = None
+    pending_reminders: list[SnapshotReminder] = []
+    # Total de pendientes; la lista trae como mucho los primeros SnapshotRepository.MAX_ITEMS
+    pending_reminders_total: int = 0
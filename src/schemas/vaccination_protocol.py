@@ -0,0 +1,76 @@
+# src/schemas/vaccination_protocol.py
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from src.schemas.cattle import GenderEnum
+
+
+class VaccinationProtocolBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    vaccine_name: str = Field(..., min_length=1, max_length=100)
+    disease_name: Optional[str] = Field(None, max_length=100)
+    gender: Optional[GenderEnum] = None
+    breed: Optional[str] = Field(None, max_length=100)
+    min_age_days: int = Field(0, ge=0)
+    max_age_days: Optional[int] = Field(None, ge=0)
+    booster_days: list[int] = Field(default_factory=list, max_length=10)
+    interval_days: Optional[int] = Field(None, ge=1)
+    active: bool = True
+
+    @model_validator(mode="after")
+    def check_ages(self):
+        if self.max_age_days is not None and self.max_age_days < self.min_age_days:
+            raise ValueError("max_age_days no puede ser menor que min_age_days")
+        if any(days < 1 for days in self.booster_days):
+            raise ValueError("Los intervalos de refuerzo deben ser de al menos 1 día")
+        return self
+
+
+class VaccinationProtocolCreate(VaccinationProtocolBase):
+    pass
+
+
+class VaccinationProtocolUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    vaccine_name: Optional[str] = Field(None, min_length=1, max_length=100)
+    disease_name: Optional[str] = Field(None, max_length=100)
+    gender: Optional[GenderEnum] = None
+    breed: Optional[str] = Field(None, max_length=100)
+    min_age_days: Optional[int] = Field(None, ge=0)
+    max_age_days: Optional[int] = Field(None, ge=0)
+    booster_days: Optional[list[int]] = Field(None, max_length=10)
+    interval_days: Optional[int] = Field(None, ge=1)
+    active: Optional[bool] = None
+
+
+class VaccinationProtocolResponse(VaccinationProtocolBase):
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PlannedDose(BaseModel):
+    protocol_name: str
+    vaccine_name: str
+    lote: str
+    cattle_name: str
+    dose_number: int
+    due_date: date
+    last_dose_date: Optional[date] = None
+
+
+class ProtocolPlanResponse(BaseModel):
+    dry_run: bool
+    until: date
+    total: int
+    by_protocol: dict[str, int]
+    # Recordatorios pendientes cerrados porque la dosis ya se registró (solo al aplicar)
+    completed_reminders: int = 0
+    # Eventos de vacuna cuyo next_dose_date vacío se completó con la fecha planificada (solo al aplicar)
+    next_doses_scheduled: int = 0
+    # Muestra de las dosis planificadas (solo en dry-run)
+    items: list[PlannedDose] = []
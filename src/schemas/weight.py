@@ -0,0 +1,57 @@
+# src/schemas/weight.py
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import date
+from typing import Optional
+
+
+class WeightReading(BaseModel):
+    lote: str = Field(..., min_length=1, max_length=50)
+    measured_on: date
+    weight: float = Field(..., gt=0)
+
+
+class WeightBatchRequest(BaseModel):
+    readings: list[WeightReading] = Field(..., min_length=1, max_length=10000)
+
+
+class WeightBatchResponse(BaseModel):
+    stored: int
+    cattle_updated: int
+    unknown_lotes: list[str] = []
+
+
+class WeightMeasurementResponse(BaseModel):
+    measured_on: date
+    weight: float
+    samples: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WeightHistoryResponse(BaseModel):
+    lote: str
+    cattle_name: str
+    current_weight: Optional[float] = None
+    measurements: list[WeightMeasurementResponse]
+
+
+class AnimalGrowth(BaseModel):
+    lote: str
+    cattle_name: str
+    breed: Optional[str] = None
+    first_date: date
+    last_date: date
+    first_weight: float
+    last_weight: float
+    measurements: int
+    adg: float
+
+
+class GrowthReport(BaseModel):
+    start_date: date
+    end_date: date
+    animals_analyzed: int
+    percentiles: dict[str, float]
+    underperformer_threshold: Optional[float] = None
+    underperformers: list[AnimalGrowth]
+    animals: list[AnimalGrowth]
@@ -0,0 +1,40 @@
+# src/schemas/withdrawal.py
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import date, datetime
+from enum import Enum
+from uuid import UUID
+
+
+class WithdrawalProductEnum(str, Enum):
+    milk = "milk"
+    meat = "meat"
+
+
+class MedicineWithdrawalUpdate(BaseModel):
+    milk_days: int = Field(0, ge=0, le=365)
+    meat_days: int = Field(0, ge=0, le=730)
+
+
+class MedicineWithdrawalResponse(MedicineWithdrawalUpdate):
+    medicine: str
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AnimalWithdrawal(BaseModel):
+    health_event_id: UUID
+    lote: str
+    cattle_name: str
+    medicine: str
+    product: WithdrawalProductEnum
+    start_date: date
+    # Primer día en que el producto vuelve a poder venderse
+    clear_date: date
+    days_left: int
+
+
+class WithdrawalStatus(BaseModel):
+    on_date: date
+    animals: int
+    items: list[AnimalWithdrawal]
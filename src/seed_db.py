@@ -6,7 +6,7 @@ import uuid
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database import SessionLocal
-from src.models import Cattle, HealthEvent, HeatEventModel, Reminder
+from src.models import Cattle, HealthEvent, HeatEventModel, Reminder, MedicineWithdrawal
 from src.models.cattle import GenderEnum
 from src.models.health_event import EventTypeEnum, AdministrationRouteEnum
 
@@ -73,6 +73,17 @@ def create_sample_data():
         
         print(f"✅ Creadas 4 cabezas de ganado")
         
+        # ==================== MEDICINE WITHDRAWALS ====================
+        print("\n⏳ Creando días de retiro de medicamentos...")
+        
+        db.add_all([
+            MedicineWithdrawal(medicine="antibiótico cefalexina", milk_days=4, meat_days=10),
+            MedicineWithdrawal(medicine="aftovacuna", milk_days=0, meat_days=21),
+        ])
+        db.flush()
+        
+        print("✅ Creados 2 medicamentos con días de retiro")
+        
         # ==================== HEALTH EVENTS ====================
         print("\n💉 Creando eventos de salud...")
         
@@ -0,0 +1,208 @@
+# src/services/activity_service.py
+import math
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.models.activity import ActivityDetectorState
+from src.models.cattle import GenderEnum
+from src.repositories import ActivityRepository, CattleRepository, HeatEventRepository
+from src.schemas.activity import ActivityBatchResponse, ActivityReadingIn, DetectedHeat
+from src.schemas.heat_event import HeatEventCreate
+
+
+# Duración de cada intervalo de actividad; la línea base se lleva por franja horaria
+ACTIVITY_BUCKET_HOURS = 2
+SLOTS_PER_DAY = 24 // ACTIVITY_BUCKET_HOURS
+
+# Línea base: media móvil exponencial de cada franja con memoria de ~7 días
+BASELINE_SPAN_DAYS = 7
+BASELINE_ALPHA = 2 / (BASELINE_SPAN_DAYS + 1)
+
+# Intervalos necesarios antes de empezar a detectar (3 días)
+WARMUP_BUCKETS = 3 * SLOTS_PER_DAY
+
+# CUSUM sobre la desviación normalizada: holgura por intervalo y umbral de alarma
+CUSUM_K = 0.5
+CUSUM_H = 5.0
+
+# Intervalos con una desviación mayor no actualizan la línea base, para no absorber el propio celo
+BASELINE_MAX_Z = 2.0
+
+# Tras un hueco sin datos mayor a esto se reinicia el acumulado
+MAX_GAP = timedelta(hours=12)
+
+# Días tras una detección en los que no se registra otro celo del mismo animal
+REFRACTORY_DAYS = 10
+
+# Un celo ya registrado a esta distancia de la detección la vuelve innecesaria
+DUPLICATE_WINDOW_DAYS = 2
+
+# Los intervalos se guardan este tiempo; el detector solo necesita su estado
+ACTIVITY_RETENTION_DAYS = 60
+
+
+def bucket_start(recorded_at: datetime) -> datetime:
+    """Inicio (UTC, sin zona horaria) del intervalo al que pertenece la lectura"""
+    if recorded_at.tzinfo:
+        recorded_at = recorded_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return recorded_at.replace(
+        hour=recorded_at.hour - recorded_at.hour % ACTIVITY_BUCKET_HOURS, minute=0, second=0, microsecond=0
+    )
+
+
+def detect_heats(state: ActivityDetectorState, buckets: Sequence[Tuple[datetime, int]]) -> List[Tuple[date, float]]:
+    """
+    Recorre los intervalos de un animal en orden y actualiza su estado (línea base por franja
+    horaria y CUSUM de la actividad normalizada). Devuelve las detecciones (fecha, actividad / línea base).
+    """
+    means = list(state.baseline_mean or [0.0] * SLOTS_PER_DAY)
+    variances = list(state.baseline_var or [0.0] * SLOTS_PER_DAY)
+    cusum = state.cusum or 0.0
+    seen = state.buckets_seen or 0
+    last_bucket = state.last_bucket
+    last_detection = state.last_detection
+    detections = []
+
+    for start, steps in buckets:
+        if last_bucket and start - last_bucket > MAX_GAP:
+            cusum = 0.0
+        last_bucket = start
+        slot = start.hour // ACTIVITY_BUCKET_HOURS
+        mean = means[slot]
+
+        z = 0.0
+        if seen >= WARMUP_BUCKETS:
+            # Piso de la desviación: evita alarmas por ruido en franjas muy quietas
+            std = max(math.sqrt(variances[slot]), 0.1 * mean, 1.0)
+            z = (steps - mean) / std
+            cusum = max(0.0, cusum + z - CUSUM_K)
+            if cusum > CUSUM_H:
+                day = start.date()
+                if last_detection is None or (day - last_detection).days >= REFRACTORY_DAYS:
+                    detections.append((day, steps / mean if mean > 0 else float(steps)))
+                    last_detection = day
+                cusum = 0.0
+
+        if z < BASELINE_MAX_Z:
+            # Al principio pesa más cada dato para que la línea base converja rápido
+            alpha = max(BASELINE_ALPHA, 1.0 / (seen // SLOTS_PER_DAY + 1))
+            diff = steps - mean
+            means[slot] = mean + alpha * diff
+            variances[slot] = (1 - alpha) * (variances[slot] + alpha * diff * diff)
+        seen += 1
+
+    state.baseline_mean = means
+    state.baseline_var = variances
+    state.cusum = cusum
+    state.buckets_seen = seen
+    state.last_bucket = last_bucket
+    state.last_detection = last_detection
+    return detections
+
+
+class ActivityService:
+    """Ingesta de lecturas de collares de actividad con detección automática de celos"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.activity = ActivityRepository(db, auto_commit=False)
+        self.heat_events = HeatEventRepository(db, auto_commit=False)
+
+    def ingest(self, readings: Sequence[ActivityReadingIn]) -> ActivityBatchResponse:
+        """
+        Agrega las lecturas en intervalos, las guarda y analiza los intervalos cerrados de cada hembra.
+        Las detecciones se registran como eventos de celo en la misma transacción.
+        """
+        lotes = list({reading.lote for reading in readings})
+        cattle_by_lote = {cattle.lote: cattle for cattle in CattleRepository(self.db).get_by_lotes(lotes)}
+
+        totals: Dict[Tuple[UUID, datetime], List[int]] = defaultdict(lambda: [0, 0])
+        for reading in readings:
+            cattle = cattle_by_lote.get(reading.lote)
+            if cattle:
+                total = totals[(cattle.id, bucket_start(reading.recorded_at))]
+                total[0] += reading.steps
+                total[1] += 1
+
+        rows = [
+            {"cattle_id": cattle_id, "bucket_start": start, "steps": steps, "samples": samples}
+            for (cattle_id, start), (steps, samples) in totals.items()
+        ]
+        try:
+            self.activity.upsert_buckets(rows)
+            females = {c.id: c for c in cattle_by_lote.values() if c.gender == GenderEnum.female}
+            analyzed, detections = self._analyze([cattle_id for cattle_id in {row["cattle_id"] for row in rows} if cattle_id in females])
+            # La respuesta se arma antes del commit, que expira los objetos de la sesión
+            heats = [
+                DetectedHeat(
+                    heat_event_id=event.id,
+                    lote=females[event.cattle_id].lote,
+                    cattle_name=females[event.cattle_id].name,
+                    heat_date=event.heat_date,
+                    activity_ratio=round(ratio, 1)
+                )
+                for event, ratio in self._create_heat_events(detections)
+            ]
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return ActivityBatchResponse(
+            stored_buckets=len(rows),
+            analyzed_buckets=analyzed,
+            unknown_lotes=sorted(lote for lote in lotes if lote not in cattle_by_lote),
+            heats_detected=heats
+        )
+
+    def _analyze(self, cattle_ids: List[UUID]) -> Tuple[int, List[Tuple[UUID, date, float]]]:
+        """Pasa por el detector los intervalos nuevos de cada animal, salvo el último, que puede seguir abierto"""
+        states = self.activity.lock_states(sorted(cattle_ids))
+        buckets: Dict[UUID, List[Tuple[datetime, int]]] = defaultdict(list)
+        for cattle_id, start, steps in self.activity.get_unprocessed_buckets(list(states)):
+            buckets[cattle_id].append((start, steps))
+
+        analyzed = 0
+        detections = []
+        for cattle_id, series in buckets.items():
+            closed = series[:-1]
+            if closed:
+                analyzed += len(closed)
+                detections.extend((cattle_id, day, ratio) for day, ratio in detect_heats(states[cattle_id], closed))
+        self.db.flush()
+        return analyzed, detections
+
+    def _create_heat_events(self, detections: List[Tuple[UUID, date, float]]) -> List[Tuple]:
+        """Registra como celo cada detección que no tenga ya un celo cargado en fechas cercanas"""
+        if not detections:
+            return []
+        window = timedelta(days=DUPLICATE_WINDOW_DAYS)
+        existing = defaultdict(list)
+        for cattle_id, heat_date in self.activity.get_heat_dates(
+            list({cattle_id for cattle_id, _, _ in detections}),
+            min(day for _, day, _ in detections) - window,
+            max(day for _, day, _ in detections) + window
+        ):
+            existing[cattle_id].append(heat_date)
+
+        new = [
+            (cattle_id, day, ratio) for cattle_id, day, ratio in detections
+            if not any(abs(day - other) <= window for other in existing[cattle_id])
+        ]
+        events = self.heat_events.create_many([
+            HeatEventCreate(
+                cattle_id=cattle_id,
+                heat_date=day,
+                comportamiento=f"Detectado por collar de actividad: {ratio:.1f} veces su actividad habitual"
+            )
+            for cattle_id, day, ratio in new
+        ])
+        return [(event, ratio) for event, (_, _, ratio) in zip(events, new)]
+
+    def purge_old_readings(self) -> int:
+        """Elimina los intervalos más antiguos que ACTIVITY_RETENTION_DAYS"""
+        return ActivityRepository(self.db).delete_before(datetime.utcnow() - timedelta(days=ACTIVITY_RETENTION_DAYS))
@@ -0,0 +1,81 @@
+# src/services/agenda_service.py
+from datetime import date, timedelta
+from typing import List, Optional, Sequence
+from sqlalchemy.orm import Session
+
+from src.infrastructure.cache import WriteInvalidatedCache
+from src.repositories import AgendaRepository
+from src.schemas.agenda import AgendaItem, AgendaItemTypeEnum
+from src.services.heat_prediction_service import HeatPredictionService
+
+
+# Tablas de las que sale la agenda: cualquier escritura confirmada en ellas vacía la caché
+_agenda_cache = WriteInvalidatedCache(tables=("reminders", "health_events", "heat_events", "cattle"))
+
+
+def _agenda_order(item: AgendaItem):
+    return item.item_date, item.item_type.value, item.lote is None, item.lote or ""
+
+
+class AgendaService:
+    """Agenda unificada del rancho con caché diaria"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _expected_heats(self, start_date: date, end_date: date, lotes: Optional[List[str]]) -> List[AgendaItem]:
+        """
+        Celos esperados de la misma predicción que get_expected_heats, con sus exclusiones
+        (preñez, posparto y ciclos sin celo observado), para que ambas respuestas coincidan.
+        """
+        wanted = set(lotes) if lotes else None
+        return [
+            AgendaItem(
+                item_date=prediction.expected_date,
+                item_type=AgendaItemTypeEnum.expected_heat,
+                title="Celo esperado",
+                detail=f"Último celo {prediction.last_heat_date}",
+                source_id=prediction.last_heat_id,
+                cattle_id=prediction.cattle_id,
+                lote=prediction.lote,
+                cattle_name=prediction.cattle_name
+            )
+            for prediction in HeatPredictionService(self.db).forecast().expected_between(start_date, end_date)
+            if wanted is None or prediction.lote in wanted
+        ]
+
+    def _compute(
+        self,
+        start_date: date,
+        end_date: date,
+        item_types: Optional[Sequence[AgendaItemTypeEnum]],
+        lotes: Optional[List[str]]
+    ) -> List[AgendaItem]:
+        items = AgendaRepository(self.db).get_agenda(start_date, end_date, item_types, lotes)
+        if not item_types or AgendaItemTypeEnum.expected_heat in item_types:
+            items.extend(self._expected_heats(start_date, end_date, lotes))
+            items.sort(key=_agenda_order)
+        return items
+
+    def get_agenda(
+        self,
+        start_date: Optional[date] = None,
+        days: int = 7,
+        end_date: Optional[date] = None,
+        item_types: Optional[Sequence[AgendaItemTypeEnum]] = None,
+        lotes: Optional[List[str]] = None
+    ) -> List[AgendaItem]:
+        """Tareas entre `start_date` (hoy por defecto) y `end_date` (o `days` días después)"""
+        start_date = start_date or date.today()
+        end_date = end_date or start_date + timedelta(days=days)
+
+        key = (
+            start_date,
+            end_date,
+            tuple(sorted(item_types)) if item_types else None,
+            tuple(sorted(lotes)) if lotes else None
+        )
+        return _agenda_cache.get_or_compute(
+            key,
+            lambda: self._compute(start_date, end_date, item_types, lotes)
+        )
@@ -6,7 +6,9 @@ from google import genai
 from google.genai import types
 
 from src.core.config import settings
-from src.services.tools import cattle_tools, health_tools, heat_tools, reminder_tools
+from src.services.tool_usage import tool_usage
+from src.services.tools import agenda_tools, analytics_tools, cattle_tools, health_tools, heat_tools, reminder_tools, render, search_tools, weight_tools
+from src.services.tools.payload import build_payload
 
 
 class LivestockTools:
@@ -30,6 +32,26 @@ class LivestockTools:
         """Obtiene información de un ganado por su lote (ej: 'LOTE-001')"""
         return cattle_tools.get_cattle_by_lote_tool(self.db, lote)
 
+    def get_animal_snapshot(self, lote: str):
+        """Ficha completa de UN animal en una sola llamada: datos, última vacuna, próximas dosis, celo/preñez y recordatorios pendientes. Úsala para preguntas generales como '¿cómo está la vaca 504?'"""
+        return cattle_tools.get_animal_snapshot_tool(self.db, lote)
+
+    def get_herd_summary(self):
+        """Resumen general del rancho: total de ganado por género y raza, preñadas, recordatorios pendientes/vencidos y dosis de los próximos 7 y 30 días"""
+        return cattle_tools.get_herd_summary_tool(self.db)
+
+    def get_herd_demographics(self, breed: str = None, gender: str = None, min_age_years: int = None, max_age_years: int = None):
+        """Conteos exactos, edades y pesos (promedio, mediana, percentiles) por raza y género de TODO el rebaño. Úsala para preguntas de cantidades o promedios (ej: '¿cuántas Holstein mayores de 5 años tengo?', 'peso promedio por raza'). gender 'male' o 'female'."""
+        return analytics_tools.get_herd_demographics_tool(self.db, breed, gender, min_age_years, max_age_years)
+
+    def get_weight_history(self, lote: str):
+        """Últimos pesajes de un ganado y su variación de peso"""
+        return weight_tools.get_weight_history_tool(self.db, lote)
+
+    def get_growth_report(self, days: int = 90):
+        """Ganancia diaria de peso de TODO el rebaño en los últimos X días: percentiles y animales rezagados que no están ganando peso"""
+        return weight_tools.get_growth_report_tool(self.db, days)
+
     def get_cattle_by_gender(self, gender: str):
         """Filtra ganado por género ('male' o 'female')"""
         return cattle_tools.get_cattle_by_gender_tool(self.db, gender)
@@ -38,6 +60,26 @@ class LivestockTools:
         """Historial de salud de un ganado"""
         return health_tools.get_health_events_by_cattle_tool(self.db, lote)
 
+    def get_health_events_for_lotes(self, lotes: list[str]):
+        """Historial de salud de VARIOS ganados a la vez (ej: ['LOTE-504', 'LOTE-505'])"""
+        return health_tools.get_health_events_for_lotes_tool(self.db, lotes)
+
+    def get_outbreaks(self):
+        """Detecta posibles brotes: la misma enfermedad o lesión en varios animales en los últimos días, por raza y edad. Úsala para '¿hay algún brote?'"""
+        return health_tools.get_outbreaks_tool(self.db)
+
+    def get_animals_in_withdrawal(self, on_date: str = None, product: str = None):
+        """Animales en periodo de retiro de medicamentos: no se puede vender su leche o carne. on_date 'YYYY-MM-DD' (hoy por defecto), product 'milk' o 'meat'"""
+        return health_tools.get_animals_in_withdrawal_tool(self.db, on_date, product)
+
+    def get_protocol_plan(self, days: int = 30):
+        """Vacunas que tocan en los próximos X días según los protocolos de vacunación del rebaño (primeras dosis, refuerzos y revacunaciones)"""
+        return health_tools.get_protocol_plan_tool(self.db, days)
+
+    def search_events(self, query: str, date_from: str = None, date_to: str = None, lotes: list[str] = None, source: str = None):
+        """Busca palabras en las notas, enfermedades y medicamentos de salud y en el comportamiento de celo (ej: '¿qué vacas tuvieron cojera este año?' -> query='cojera', date_from='AAAA-01-01'). source: 'health' o 'heat'. Fechas 'YYYY-MM-DD'."""
+        return search_tools.search_events_tool(self.db, query, date_from, date_to, lotes, source)
+
     def get_upcoming_vaccines(self, days: int = 30):
         """Vacunas próximas en X días"""
         return health_tools.get_upcoming_vaccines_tool(self.db, days)
@@ -46,6 +88,10 @@ class LivestockTools:
         """Última vacuna de un ganado"""
         return health_tools.get_last_vaccine_tool(self.db, lote, vaccine_name)
 
+    def get_last_vaccine_for_lotes(self, lotes: list[str], vaccine_name: str = None):
+        """Última vacuna de VARIOS ganados a la vez (ej: ['LOTE-504', 'LOTE-505', 'LOTE-506'])"""
+        return health_tools.get_last_vaccine_for_lotes_tool(self.db, lotes, vaccine_name)
+
     def get_all_upcoming_vaccines(self):
         """TODAS las vacunas pendientes"""
         return health_tools.get_all_upcoming_vaccines_tool(self.db)
@@ -62,13 +108,29 @@ class LivestockTools:
         """Ganado que necesita chequeo de embarazo"""
         return heat_tools.get_pending_pregnancy_checks_tool(self.db)
 
+    def get_expected_heats(self, days: int = 7):
+        """Hembras que se espera entren en celo en los próximos X días (predicción según su historial; excluye preñadas y recién paridas)"""
+        return heat_tools.get_expected_heats_tool(self.db, days)
+
+    def get_reproductive_kpis(self, start_date: str = None, end_date: str = None, breed: str = None):
+        """Indicadores reproductivos del rancho: intervalo entre partos, días abiertos, servicios por concepción, tasa de concepción (por raza y mes) y detección de celos. Fechas 'YYYY-MM-DD', raza opcional."""
+        return analytics_tools.get_reproductive_kpis_tool(self.db, start_date, end_date, breed)
+
     def get_last_heat(self, lote: str):
         """Último evento de celo de un ganado"""
         return heat_tools.get_last_heat_tool(self.db, lote)
 
-    def create_reminder(self, title: str, date_str: str, type_str: str = "other", description: str = None, cattle_lote: str = None):
-        """Crea un recordatorio. date_str formato 'YYYY-MM-DD'. type_str: 'vaccine', 'checkup', 'treatment', 'feeding', 'breeding', 'other'."""
-        return reminder_tools.create_reminder_tool(self.db, title, date_str, type_str, description, cattle_lote)
+    def get_last_heat_for_lotes(self, lotes: list[str]):
+        """Último celo de VARIOS ganados a la vez (ej: ['LOTE-504', 'LOTE-505'])"""
+        return heat_tools.get_last_heat_for_lotes_tool(self.db, lotes)
+
+    def get_agenda(self, days: int = 7, start_date: str = None, lotes: list[str] = None):
+        """Agenda completa del rancho por día: recordatorios, dosis, chequeos de preñez, celos esperados y partos previstos. Úsala para '¿qué tengo que hacer hoy/esta semana?'. start_date formato 'YYYY-MM-DD' (hoy por defecto)."""
+        return agenda_tools.get_agenda_tool(self.db, days, start_date, lotes)
+
+    def create_reminder(self, title: str, date_str: str, type_str: str = "other", description: str = None, cattle_lote: str = None, repeat: str = None, until_str: str = None):
+        """Crea un recordatorio. date_str formato 'YYYY-MM-DD'. type_str: 'vaccine', 'checkup', 'treatment', 'feeding', 'breeding', 'other'. Para repetirlo: repeat 'daily', 'weekly', 'monthly' o 'yearly' y opcional until_str 'YYYY-MM-DD'."""
+        return reminder_tools.create_reminder_tool(self.db, title, date_str, type_str, description, cattle_lote, repeat, until_str)
 
     def get_all_reminders(self):
         """Todos los recordatorios pendientes"""
@@ -86,6 +148,22 @@ class LivestockTools:
         """Recordatorios de un ganado específico"""
         return reminder_tools.get_reminders_by_cattle_tool(self.db, lote)
 
+    def get_reminders_for_lotes(self, lotes: list[str]):
+        """Recordatorios de VARIOS ganados a la vez (ej: ['LOTE-504', 'LOTE-505'])"""
+        return reminder_tools.get_reminders_for_lotes_tool(self.db, lotes)
+
+    def complete_reminders(self, type_str: str = None, lotes: list[str] = None, due_today: bool = False, overdue_only: bool = False, date_from: str = None, date_to: str = None):
+        """Completa de una vez todos los recordatorios pendientes que cumplan el filtro (ej: vacunas de hoy de los lotes ['LOTE-504']). Requiere al menos un filtro. Fechas 'YYYY-MM-DD'."""
+        return reminder_tools.complete_reminders_tool(self.db, type_str, lotes, due_today, overdue_only, date_from, date_to)
+
+    def cancel_reminders(self, type_str: str = None, lotes: list[str] = None, due_today: bool = False, overdue_only: bool = False, date_from: str = None, date_to: str = None):
+        """Cancela de una vez todos los recordatorios pendientes que cumplan el filtro. Requiere al menos un filtro. Fechas 'YYYY-MM-DD'."""
+        return reminder_tools.cancel_reminders_tool(self.db, type_str, lotes, due_today, overdue_only, date_from, date_to)
+
+    def reschedule_reminders(self, days: int, type_str: str = None, lotes: list[str] = None, due_today: bool = False, overdue_only: bool = False, date_from: str = None, date_to: str = None):
+        """Mueve `days` días (negativo para adelantar) los recordatorios pendientes que cumplan el filtro (ej: chequeos vencidos +3 días). Requiere al menos un filtro."""
+        return reminder_tools.reschedule_reminders_tool(self.db, days, type_str, lotes, due_today, overdue_only, date_from, date_to)
+
 
 class AgentService:
     """Servicio del agente de IA usando Function Calling nativo"""
@@ -99,7 +177,9 @@ class AgentService:
         return """Eres un experto en gestión ganadera. Tu trabajo es proporcionar información precisa sobre ganado, salud, celo y recordatorios, y ayudar a registrar nueva información.
         
 Usa las herramientas disponibles para responder a las preguntas del usuario.
-Si el usuario menciona un número de lote (ej: "vaca 504"), asume que es "LOTE-504".
+Las herramientas que reciben un lote aceptan también el número ("504", "vaca 504") o el nombre del animal, aunque esté mal escrito: pásalo tal como lo dice el usuario.
+Si pregunta por varios animales a la vez, usa las herramientas "_for_lotes" con la lista completa de lotes en una sola llamada.
+Si pregunta qué hay que hacer en un periodo (hoy, esta semana), usa get_agenda en lugar de combinar varias herramientas.
 NO uses emojis. Sé directo y profesional.
 """
 
@@ -112,20 +192,39 @@ NO uses emojis. Sé directo y profesional.
                 "get_all_cattle": tools_instance.get_all_cattle,
                 "search_cattle_by_name": tools_instance.search_cattle_by_name,
                 "get_cattle_by_lote": tools_instance.get_cattle_by_lote,
+                "get_animal_snapshot": tools_instance.get_animal_snapshot,
+                "get_herd_summary": tools_instance.get_herd_summary,
+                "get_herd_demographics": tools_instance.get_herd_demographics,
+                "get_weight_history": tools_instance.get_weight_history,
+                "get_growth_report": tools_instance.get_growth_report,
                 "get_cattle_by_gender": tools_instance.get_cattle_by_gender,
                 "get_health_events_by_cattle": tools_instance.get_health_events_by_cattle,
+                "get_health_events_for_lotes": tools_instance.get_health_events_for_lotes,
+                "get_outbreaks": tools_instance.get_outbreaks,
+                "get_animals_in_withdrawal": tools_instance.get_animals_in_withdrawal,
+                "get_protocol_plan": tools_instance.get_protocol_plan,
+                "search_events": tools_instance.search_events,
                 "get_upcoming_vaccines": tools_instance.get_upcoming_vaccines,
                 "get_last_vaccine": tools_instance.get_last_vaccine,
+                "get_last_vaccine_for_lotes": tools_instance.get_last_vaccine_for_lotes,
                 "get_all_upcoming_vaccines": tools_instance.get_all_upcoming_vaccines,
                 "get_heat_events_by_cattle": tools_instance.get_heat_events_by_cattle,
                 "get_pregnant_cattle": tools_instance.get_pregnant_cattle,
                 "get_pending_pregnancy_checks": tools_instance.get_pending_pregnancy_checks,
+                "get_expected_heats": tools_instance.get_expected_heats,
+                "get_reproductive_kpis": tools_instance.get_reproductive_kpis,
                 "get_last_heat": tools_instance.get_last_heat,
+                "get_last_heat_for_lotes": tools_instance.get_last_heat_for_lotes,
+                "get_agenda": tools_instance.get_agenda,
                 "create_reminder": tools_instance.create_reminder,
                 "get_all_reminders": tools_instance.get_all_reminders,
                 "get_upcoming_reminders": tools_instance.get_upcoming_reminders,
                 "get_overdue_reminders": tools_instance.get_overdue_reminders,
                 "get_reminders_by_cattle": tools_instance.get_reminders_by_cattle,
+                "get_reminders_for_lotes": tools_instance.get_reminders_for_lotes,
+                "complete_reminders": tools_instance.complete_reminders,
+                "cancel_reminders": tools_instance.cancel_reminders,
+                "reschedule_reminders": tools_instance.reschedule_reminders,
             }
             
             tool_list = list(tool_map.values())
@@ -181,10 +280,15 @@ NO uses emojis. Sé directo y profesional.
 
                 if tool_name in tool_map:
                     try:
-                        result = tool_map[tool_name](**tool_args)
+                        # Una sola fecha de hoy y un solo modo de salida para toda la petición
+                        with render.request_scope():
+                            result = tool_map[tool_name](**tool_args)
                         tool_result_str = str(result)
                     except Exception as e:
-                        tool_result_str = f"Error al ejecutar herramienta: {str(e)}"
+                        result = tool_result_str = f"Error al ejecutar herramienta: {str(e)}"
+                    
+                    # Al modelo se envían las filas como tabla compacta, recortada al presupuesto de tokens
+                    payload = build_payload(result, settings.TOOL_RESULT_TOKEN_BUDGET)
                     
                     # 5. Segunda llamada (Resultado -> Modelo)
                     from google.genai.types import Content, Part
@@ -195,7 +299,7 @@ NO uses emojis. Sé directo y profesional.
                     # Construir respuesta de herramienta correctamente
                     function_content = Content(role="tool", parts=[Part.from_function_response(
                         name=tool_name,
-                        response={"result": tool_result_str}
+                        response={"result": payload.text}
                     )])
                     
                     final_response = self.client.models.generate_content(
@@ -203,12 +307,15 @@ NO uses emojis. Sé directo y profesional.
                         contents=[user_content, model_content, function_content],
                         config=config
                     )
+                    usage = final_response.usage_metadata
+                    tool_usage.record(tool_name, payload, usage.prompt_token_count if usage else None)
                     
                     return {
                         "response": final_response.text,
                         "tool_used": tool_used_name,
                         "tool_params": tool_params,
-                        "tool_result": tool_result_str
+                        "tool_result": tool_result_str,
+                        "tool_tokens": payload.tokens
                     }
             
             return {
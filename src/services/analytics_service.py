@@ -0,0 +1,30 @@
+# src/services/analytics_service.py
+from datetime import date
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from src.infrastructure.cache import WriteInvalidatedCache
+from src.repositories import ReproductionRepository
+from src.schemas.reproduction import KpiPeriodEnum, ReproductiveKPIs
+
+
+_reproduction_cache = WriteInvalidatedCache(tables=("heat_events", "cattle"))
+
+
+class AnalyticsService:
+    """Indicadores del rancho con caché hasta la siguiente escritura en sus tablas de origen"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def reproductive_kpis(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        breed: Optional[str] = None,
+        period: KpiPeriodEnum = KpiPeriodEnum.month
+    ) -> ReproductiveKPIs:
+        return _reproduction_cache.get_or_compute(
+            (start_date, end_date, breed, KpiPeriodEnum(period)),
+            lambda: ReproductionRepository(self.db).get_kpis(start_date, end_date, breed, period)
+        )
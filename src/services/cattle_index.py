@@ -0,0 +1,259 @@
+# src/services/cattle_index.py
+import logging
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure import events
+from src.infrastructure.database import SessionLocal
+from src.repositories import CattleRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Similitud mínima (coeficiente de Dice sobre trigramas) para proponer un nombre parecido
+MIN_SIMILARITY = 0.5
+
+# Ventaja que necesita el mejor candidato sobre el segundo para resolverse sin preguntar
+UNIQUE_MARGIN = 0.1
+
+# Los cambios se leen por updated_at con este solapamiento, para no perder transacciones que confirman tarde
+SYNC_OVERLAP = timedelta(minutes=5)
+
+# Cada cuánto se releen los cambios aunque este proceso no haya escrito (otros workers, scripts, seed)
+REFRESH_INTERVAL = timedelta(seconds=60)
+
+# Palabras con las que se suele acompañar un número de lote ("vaca 504", "lote nº 504")
+_LOTE_WORDS = {"lote", "vaca", "toro", "ternero", "ternera", "novillo", "novilla", "animal", "numero", "num", "no", "n"}
+
+
+class CattleMatch(NamedTuple):
+    id: UUID
+    lote: str
+    name: str
+    score: float
+
+
+def normalize(text: str) -> str:
+    """Minúsculas, sin tildes y con los separadores reducidos a un espacio: 'María-José' -> 'maria jose'"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.findall(r"[a-z0-9ñ]+", stripped))
+
+
+def lote_key(text: str) -> str:
+    """Clave de lote sin separadores ni mayúsculas: 'LOTE-504', 'lote 504' y 'Lote504' coinciden"""
+    return normalize(text).replace(" ", "")
+
+
+def lote_number(text: str) -> Optional[str]:
+    """Número de lote cuando el texto es solo un número con palabras como 'vaca' o 'lote' ('504', 'vaca 504')"""
+    words = re.findall(r"[a-z]+|\d+", normalize(text))
+    numbers = [word for word in words if word.isdigit()]
+    if len(numbers) != 1 or any(not word.isdigit() and word not in _LOTE_WORDS for word in words):
+        return None
+    return numbers[0].lstrip("0") or "0"
+
+
+def trigrams(name: str) -> FrozenSet[str]:
+    """Trigramas de cada palabra con relleno, como pg_trgm: 'ana' -> {'  a', ' an', 'ana', 'na '}"""
+    grams = set()
+    for word in name.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class CattleIndex:
+    """
+    Índice en memoria del proceso para resolver animales sin ir a la base de datos:
+    lote -> id, número de lote -> ids y nombre normalizado -> ids, más un índice invertido de trigramas
+    para encontrar nombres mal escritos ('Margarta' -> 'Margarita') o sin tildes.
+    Se carga al arrancar y relee solo las filas cambiadas tras cada commit propio que toca `cattle`,
+    cada REFRESH_INTERVAL y cuando una búsqueda no encuentra nada, así que también ve las altas,
+    bajas y cambios de nombre hechos por otros procesos.
+    """
+
+    def __init__(self):
+        self._records: Dict[UUID, Tuple[str, str]] = {}
+        self._lotes: Dict[str, UUID] = {}
+        self._numbers: Dict[str, Set[UUID]] = defaultdict(set)
+        self._names: Dict[str, Set[UUID]] = defaultdict(set)
+        self._grams: Dict[str, FrozenSet[str]] = {}
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._loaded = False
+        self._dirty = False
+        self._synced_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        events.subscribe({"cattle"}, self._on_change)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _on_change(self, tables: Set[str]) -> None:
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        """Fuerza a releer los cambios en la próxima consulta (p. ej. si un id del índice ya no existe)"""
+        self._dirty = True
+
+    # --- mantenimiento
+
+    def _remove(self, cattle_id: UUID) -> None:
+        lote, name = self._records.pop(cattle_id)
+        self._lotes.pop(lote_key(lote), None)
+        number = lote_number(lote)
+        if number:
+            self._numbers[number].discard(cattle_id)
+            if not self._numbers[number]:
+                del self._numbers[number]
+        key = normalize(name)
+        self._names[key].discard(cattle_id)
+        if not self._names[key]:
+            del self._names[key]
+            for gram in self._grams.pop(key):
+                self._postings[gram].discard(key)
+                if not self._postings[gram]:
+                    del self._postings[gram]
+
+    def _add(self, cattle_id: UUID, lote: str, name: str) -> None:
+        self._records[cattle_id] = (lote, name)
+        self._lotes[lote_key(lote)] = cattle_id
+        number = lote_number(lote)
+        if number:
+            self._numbers[number].add(cattle_id)
+        key = normalize(name)
+        if key not in self._grams:
+            self._grams[key] = trigrams(key)
+            for gram in self._grams[key]:
+                self._postings[gram].add(key)
+        self._names[key].add(cattle_id)
+
+    def _apply(self, rows: Iterable[Tuple[UUID, str, str]]) -> None:
+        for cattle_id, lote, name in rows:
+            if self._records.get(cattle_id) == (lote, name):
+                continue
+            if cattle_id in self._records:
+                self._remove(cattle_id)
+            self._add(cattle_id, lote, name)
+
+    def _clear(self) -> None:
+        for container in (self._records, self._lotes, self._numbers, self._names, self._grams, self._postings):
+            container.clear()
+
+    def _refresh(self, db: Session, force: bool = False) -> None:
+        """Carga completa la primera vez; después solo las filas cambiadas desde la última lectura"""
+        if self._loaded and not self._dirty and not force and datetime.utcnow() - self._synced_at < REFRESH_INTERVAL:
+            return
+        repo = CattleRepository(db)
+        self._dirty = False
+        synced_at = datetime.utcnow()
+        if self._loaded:
+            self._apply(repo.get_identity_rows(self._synced_at - SYNC_OVERLAP))
+            # Los borrados no dejan filas cambiadas: si el total no cuadra se recarga entero
+            if repo.count() == len(self._records):
+                self._synced_at = synced_at
+                return
+        self._clear()
+        self._apply(repo.get_identity_rows())
+        self._loaded, self._synced_at = True, synced_at
+        logger.info("Índice de ganado cargado: %d animales", len(self._records))
+
+    def load(self) -> None:
+        """Carga inicial con una sesión propia (al arrancar la aplicación)"""
+        db = SessionLocal()
+        try:
+            with self._lock:
+                self._loaded = False
+                self._refresh(db)
+        finally:
+            db.close()
+
+    # --- consultas
+
+    def _match(self, cattle_id: UUID, score: float) -> CattleMatch:
+        lote, name = self._records[cattle_id]
+        return CattleMatch(cattle_id, lote, name, score)
+
+    def _search(self, text: str, limit: int, min_score: float) -> List[CattleMatch]:
+        key = normalize(text)
+        if not key:
+            return []
+        query = trigrams(key)
+        # Trigramas compartidos con cada nombre, contados a partir del índice invertido
+        shared = Counter(name for gram in query for name in self._postings.get(gram, ()))
+        scored = []
+        for name, common in shared.items():
+            score = 2 * common / (len(query) + len(self._grams[name]))
+            # Un nombre que contiene la búsqueda entera ('marga' en 'margarita') cuenta como parecido
+            if name == key:
+                score = 1.0
+            elif f" {key}" in f" {name}":
+                score = max(score, 0.8)
+            if score >= min_score:
+                scored.append((score, name))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        matches = []
+        for score, name in scored:
+            matches.extend(self._match(cattle_id, score) for cattle_id in self._names[name])
+            if len(matches) >= limit:
+                break
+        return sorted(matches, key=lambda match: (-match.score, match.lote))[:limit]
+
+    def search_name(self, db: Session, text: str, limit: int = 10, min_score: float = MIN_SIMILARITY) -> List[CattleMatch]:
+        """Animales cuyo nombre se parece a `text`, del más al menos parecido; ignora tildes y mayúsculas"""
+        with self._lock:
+            self._refresh(db)
+            return self._search(text, limit, min_score)
+
+    def resolve(self, db: Session, text: str, exact: bool = False) -> Optional[CattleMatch]:
+        """
+        Un solo animal a partir de lo que escribe el usuario: lote ('LOTE-504', 'lote 504'),
+        número ('504', 'vaca 504') o nombre, aunque tenga errores. None si no hay ninguno o es ambiguo.
+        Con exact=True el nombre debe coincidir completo (sin contar tildes ni mayúsculas):
+        las herramientas que escriben no adivinan el animal.
+        """
+        with self._lock:
+            self._refresh(db)
+            match = self._resolve(text, exact)
+            if match is None:
+                # Puede ser un animal dado de alta o renombrado por otro proceso: se releen los cambios
+                self._refresh(db, force=True)
+                match = self._resolve(text, exact)
+            return match
+
+    def _resolve(self, text: str, exact: bool) -> Optional[CattleMatch]:
+        cattle_id = self._lotes.get(lote_key(text))
+        if cattle_id:
+            return self._match(cattle_id, 1.0)
+        number = lote_number(text)
+        if number:
+            ids = self._numbers.get(number, ())
+            return self._match(next(iter(ids)), 1.0) if len(ids) == 1 else None
+
+        if exact:
+            ids = self._names.get(normalize(text), ())
+            return self._match(next(iter(ids)), 1.0) if len(ids) == 1 else None
+
+        candidates = self._search(text, 2, MIN_SIMILARITY)
+        if not candidates:
+            return None
+        if len(candidates) == 1 or candidates[0].score - candidates[1].score >= UNIQUE_MARGIN:
+            return candidates[0]
+        return None
+
+    def warm_up(self) -> None:
+        try:
+            self.load()
+        except Exception:
+            logger.exception("No se pudo cargar el índice de ganado; se cargará en la primera consulta")
+
+
+cattle_index = CattleIndex()
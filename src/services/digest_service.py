@@ -0,0 +1,81 @@
+# src/services/digest_service.py
+import logging
+from datetime import date, timedelta
+from typing import Iterable, Optional, Set
+from sqlalchemy.orm import Session
+
+from src.infrastructure import events
+from src.infrastructure.database import SessionLocal
+from src.repositories.digest_repository import DigestRepository
+from src.schemas.digest import DailyDigestResponse
+
+
+logger = logging.getLogger(__name__)
+
+# Tablas de las que depende cada sección del resumen
+SECTION_TABLES = {
+    "overdue_reminders": {"reminders", "reminder_occurrences"},
+    "upcoming_doses": {"health_events", "cattle"},
+    "pending_pregnancy_checks": {"heat_events", "cattle"},
+}
+
+# Días de resúmenes anteriores que se conservan
+KEEP_DAYS = 7
+
+
+class DigestService:
+    """
+    Resumen diario precalculado: se genera de noche. Una escritura solo marca como pendientes
+    las secciones afectadas, que se recalculan en la siguiente lectura (en cualquier proceso).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = DigestRepository(db)
+
+    def build(self, digest_date: Optional[date] = None) -> None:
+        """Genera el resumen completo del día"""
+        digest_date = digest_date or date.today()
+        self.refresh(DigestRepository.SECTIONS, digest_date)
+
+    def refresh(self, sections: Iterable[str], digest_date: Optional[date] = None) -> None:
+        """Recalcula solo las secciones indicadas; si el resumen del día no existe lo genera entero"""
+        digest_date = digest_date or date.today()
+        if self.repo.get(digest_date) is None:
+            sections = DigestRepository.SECTIONS
+        self.repo.save(digest_date, {section: getattr(self.repo, section)(digest_date) for section in sections})
+
+    def get_today(self) -> DailyDigestResponse:
+        """
+        Resumen de hoy; si aún no se generó (p. ej. tras un reinicio) lo genera en ese momento,
+        y si hay secciones marcadas por escrituras recientes las recalcula antes de leerlo
+        """
+        today = date.today()
+        if self.repo.has_stale():
+            sections = self.repo.take_stale()
+            if sections:
+                self.refresh(sections, today)
+        digest = self.repo.get(today)
+        if digest is None:
+            self.build(today)
+            digest = self.repo.get(today)
+        return DailyDigestResponse.model_validate(digest)
+
+    def run_nightly(self) -> None:
+        """Trabajo nocturno: genera el resumen del día y purga los antiguos"""
+        today = date.today()
+        self.build(today)
+        self.repo.delete_before(today - timedelta(days=KEEP_DAYS))
+
+
+def _mark_stale_on_write(tables: Set[str]) -> None:
+    # Solo una marca por sección: el recálculo no se cobra a la escritura, lo hace la próxima lectura
+    sections = [section for section, depends_on in SECTION_TABLES.items() if depends_on & tables]
+    db = SessionLocal()
+    try:
+        DigestRepository(db).mark_stale(sections)
+    finally:
+        db.close()
+
+
+events.subscribe({table for tables in SECTION_TABLES.values() for table in tables}, _mark_stale_on_write)
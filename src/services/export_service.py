@@ -0,0 +1,72 @@
+# src/services/export_service.py
+import csv
+import io
+import json
+import enum
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Sequence
+from uuid import UUID
+
+from sqlalchemy.engine import Row
+
+
+class ExportFormat(str, enum.Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv; charset=utf-8",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def _to_text(value: Any) -> Any:
+    """Convierte valores de la base de datos a tipos serializables"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def iter_csv(rows: Iterable[Row], columns: Sequence[str], chunk_rows: int = 500) -> Iterator[str]:
+    """Genera el CSV en bloques de `chunk_rows` filas para enviarlo como respuesta chunked"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    pending = 0
+    for row in rows:
+        writer.writerow([_to_text(value) for value in row])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows: Iterable[Row], columns: Sequence[str], chunk_rows: int = 500) -> Iterator[str]:
+    """Genera NDJSON (un objeto JSON por línea) en bloques de `chunk_rows` filas"""
+    lines = []
+    for row in rows:
+        record = {column: _to_text(value) for column, value in zip(columns, row)}
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= chunk_rows:
+            yield "\n".join(lines) + "\n"
+            lines = []
+
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def serialize(rows: Iterable[Row], columns: Sequence[str], export_format: ExportFormat) -> Iterator[str]:
+    """Selecciona el serializador según el formato pedido"""
+    if export_format == ExportFormat.ndjson:
+        return iter_ndjson(rows, columns)
+    return iter_csv(rows, columns)
@@ -0,0 +1,116 @@
+# src/services/growth_service.py
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.infrastructure.cache import WriteInvalidatedCache
+from src.repositories import WeightRepository
+from src.schemas.weight import AnimalGrowth, GrowthReport
+
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Por debajo de este percentil de ganancia diaria (o con ganancia <= 0) el animal se marca como rezagado
+UNDERPERFORMER_PERCENTILE = 10
+
+# Días mínimos entre el primer y el último pesaje para estimar la ganancia diaria
+MIN_SPAN_DAYS = 14
+
+
+def analyze_growth(rows: Sequence[Tuple], start_date: date, end_date: date) -> GrowthReport:
+    """
+    Ganancia diaria media (GDM, kg/día) de cada animal como pendiente de mínimos cuadrados
+    de sus pesajes, calculada para todo el rebaño en una sola pasada vectorizada.
+
+    `rows` son (cattle_id, lote, name, breed, measured_on, weight) ordenadas por animal y fecha,
+    como las devuelve WeightRepository.get_herd_series().
+    """
+    empty = GrowthReport(
+        start_date=start_date, end_date=end_date, animals_analyzed=0,
+        percentiles={}, underperformers=[], animals=[]
+    )
+    if not rows:
+        return empty
+
+    cattle_ids, lotes, names, breeds, measured_on, weights = (
+        np.array(column, dtype=object) for column in zip(*rows)
+    )
+    days = np.array(measured_on, dtype="datetime64[D]").astype(np.int64)
+    weights = weights.astype(np.float64)
+
+    # Código 0..n-1 por animal; las filas de cada animal son contiguas
+    starts = np.r_[True, cattle_ids[1:] != cattle_ids[:-1]]
+    codes = np.cumsum(starts) - 1
+    n_animals = int(codes[-1]) + 1
+    first_rows = np.flatnonzero(starts)
+    last_rows = np.r_[first_rows[1:] - 1, len(codes) - 1]
+
+    # Días relativos al primer pesaje de cada animal para que las sumas no pierdan precisión
+    t = (days - days[first_rows][codes]).astype(np.float64)
+    n = np.bincount(codes, minlength=n_animals).astype(np.float64)
+    st = np.bincount(codes, weights=t, minlength=n_animals)
+    sw = np.bincount(codes, weights=weights, minlength=n_animals)
+    stt = np.bincount(codes, weights=t * t, minlength=n_animals)
+    stw = np.bincount(codes, weights=t * weights, minlength=n_animals)
+
+    denominator = n * stt - st * st
+    span = days[last_rows] - days[first_rows]
+    valid = (n >= 2) & (span >= MIN_SPAN_DAYS) & (denominator > 0)
+    adg = np.divide(n * stw - st * sw, denominator, out=np.zeros(n_animals), where=valid)
+
+    selected = np.flatnonzero(valid)
+    if selected.size == 0:
+        return empty
+
+    values = np.percentile(adg[selected], PERCENTILES)
+    percentiles = {f"p{p}": round(float(v), 3) for p, v in zip(PERCENTILES, values)}
+    threshold = float(values[PERCENTILES.index(UNDERPERFORMER_PERCENTILE)])
+    lagging = (adg <= 0) | (adg < threshold)
+
+    # De menor a mayor ganancia: los rezagados quedan al principio
+    selected = selected[np.argsort(adg[selected], kind="stable")]
+    animals = [
+        AnimalGrowth(
+            lote=lotes[last_rows[i]],
+            cattle_name=names[last_rows[i]],
+            breed=breeds[last_rows[i]],
+            first_date=days[first_rows[i]].astype("datetime64[D]").item(),
+            last_date=days[last_rows[i]].astype("datetime64[D]").item(),
+            first_weight=round(float(weights[first_rows[i]]), 1),
+            last_weight=round(float(weights[last_rows[i]]), 1),
+            measurements=int(n[i]),
+            adg=round(float(adg[i]), 3)
+        )
+        for i in selected
+    ]
+    return GrowthReport(
+        start_date=start_date,
+        end_date=end_date,
+        animals_analyzed=len(animals),
+        percentiles=percentiles,
+        underperformer_threshold=round(threshold, 3),
+        underperformers=[animal for animal, i in zip(animals, selected) if lagging[i]],
+        animals=animals
+    )
+
+
+# Se recalcula solo cuando llegan pesajes o cambian los datos del ganado, o al cambiar el día
+_growth_cache = WriteInvalidatedCache(tables=("weight_measurements", "cattle"), maxsize=16)
+
+
+class GrowthService:
+    """Analítica de crecimiento del rebaño a partir del historial de pesajes, con caché"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def report(self, days: int = 90, end_date: Optional[date] = None) -> GrowthReport:
+        """Ganancia diaria de cada animal en los últimos `days` días, percentiles del rebaño y rezagados"""
+        end_date = end_date or date.today()
+        start_date = end_date - timedelta(days=days)
+        return _growth_cache.get_or_compute(
+            (start_date, end_date),
+            lambda: analyze_growth(WeightRepository(self.db).get_herd_series(start_date, end_date), start_date, end_date)
+        )
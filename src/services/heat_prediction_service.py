@@ -0,0 +1,158 @@
+# src/services/heat_prediction_service.py
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.core.reproduction import HEAT_CYCLE_DAYS
+from src.infrastructure.cache import WriteInvalidatedCache
+from src.repositories import HeatEventRepository
+from src.schemas.heat_prediction import HeatPrediction
+
+
+# Intervalos entre celos que se consideran un ciclo completo; fuera de este rango
+# suelen ser celos no detectados (≈ 2 ciclos) o registros duplicados
+MIN_CYCLE_DAYS = 17
+MAX_CYCLE_DAYS = 25
+
+# Tras el parto no se esperan celos durante este periodo
+POSTPARTUM_DAYS = 45
+
+# Ciclos sin celo observado a partir de los cuales ya no se proyecta
+MAX_PROJECTED_CYCLES = 4
+
+
+@dataclass(frozen=True)
+class HeatForecast:
+    """Predicción para todo el rebaño en arreglos paralelos: una posición por animal"""
+    cattle_ids: np.ndarray
+    lotes: np.ndarray
+    names: np.ndarray
+    last_heat: np.ndarray
+    last_heat_ids: np.ndarray
+    expected: np.ndarray
+    cycle_days: np.ndarray
+    observed_cycles: np.ndarray
+    confidence: np.ndarray
+
+    def expected_between(self, start: date, end: date) -> List[HeatPrediction]:
+        """Animales con celo esperado entre `start` y `end`, ordenados por fecha"""
+        mask = (self.expected >= np.datetime64(start)) & (self.expected <= np.datetime64(end))
+        selected = np.flatnonzero(mask)
+        selected = selected[np.argsort(self.expected[selected], kind="stable")]
+        return [
+            HeatPrediction(
+                cattle_id=self.cattle_ids[i],
+                lote=self.lotes[i],
+                cattle_name=self.names[i],
+                last_heat_date=self.last_heat[i].item(),
+                last_heat_id=self.last_heat_ids[i],
+                expected_date=self.expected[i].item(),
+                cycle_days=round(float(self.cycle_days[i]), 1),
+                observed_cycles=int(self.observed_cycles[i]),
+                confidence=round(float(self.confidence[i]), 2)
+            )
+            for i in selected
+        ]
+
+
+def _empty_forecast() -> HeatForecast:
+    empty = np.array([], dtype=object)
+    no_dates = np.array([], dtype="datetime64[D]")
+    return HeatForecast(empty, empty, empty, no_dates, empty, no_dates, np.array([]), np.array([], dtype=np.int64), np.array([]))
+
+
+def predict_heats(rows: Sequence[Tuple], today: date) -> HeatForecast:
+    """
+    Calcula el próximo celo de cada hembra en una sola pasada vectorizada.
+
+    `rows` son (cattle_id, lote, name, fecha_ultimo_parto, heat_date, was_inseminated, pregnancy_confirmed, id)
+    ordenadas por animal y fecha, como las devuelve HeatEventRepository.get_herd_heat_history().
+    """
+    if not rows:
+        return _empty_forecast()
+
+    cattle_ids, lotes, names, calvings, heat_dates, inseminated, confirmed, heat_ids = (
+        np.array(column, dtype=object) for column in zip(*rows)
+    )
+    days = np.array(heat_dates, dtype="datetime64[D]").astype(np.int64)
+
+    # Código 0..n-1 por animal; las filas de cada animal son contiguas
+    starts = np.r_[True, cattle_ids[1:] != cattle_ids[:-1]]
+    codes = np.cumsum(starts) - 1
+    n_animals = int(codes[-1]) + 1
+    last_rows = np.r_[np.flatnonzero(starts)[1:] - 1, len(codes) - 1]
+
+    # Intervalos entre celos consecutivos del mismo animal que caen en un ciclo normal
+    intervals = np.diff(days)
+    valid = (codes[1:] == codes[:-1]) & (intervals >= MIN_CYCLE_DAYS) & (intervals <= MAX_CYCLE_DAYS)
+    interval_codes = codes[1:][valid]
+    interval_days = intervals[valid].astype(np.float64)
+
+    counts = np.bincount(interval_codes, minlength=n_animals)
+    sums = np.bincount(interval_codes, weights=interval_days, minlength=n_animals)
+    squares = np.bincount(interval_codes, weights=interval_days ** 2, minlength=n_animals)
+
+    observed = counts > 0
+    safe_counts = np.maximum(counts, 1)
+    cycle = np.where(observed, sums / safe_counts, float(HEAT_CYCLE_DAYS))
+    variance = np.where(counts > 1, squares / safe_counts - cycle ** 2, 0.0)
+    std = np.sqrt(np.clip(variance, 0.0, None))
+
+    # Próximo múltiplo del ciclo a partir de hoy, contado desde el último celo registrado
+    today_day = np.datetime64(today, "D").astype(np.int64)
+    last = days[last_rows]
+    projected_cycles = np.maximum(1.0, np.ceil((today_day - last) / cycle))
+    expected = last + np.rint(projected_cycles * cycle).astype(np.int64)
+
+    # Más ciclos observados y más regulares => más confianza; cada ciclo sin celo observado la reduce
+    evidence = (counts + 1) / (counts + 3)
+    regularity = 1.0 / (1.0 + std / 2.0)
+    confidence = evidence * regularity / projected_cycles
+
+    # Exclusiones: preñada o pendiente de confirmación tras el último celo, parto reciente o posterior al último celo
+    # Comparación elemento a elemento: las columnas son arreglos de objetos que pueden traer None
+    last_inseminated = inseminated[last_rows] == True
+    not_open = last_inseminated & (confirmed[last_rows] != False)
+    calving = np.array(calvings[last_rows], dtype="datetime64[D]")
+    has_calving = ~np.isnat(calving)
+    calving_day = np.where(has_calving, calving.astype(np.int64), np.iinfo(np.int64).min)
+    postpartum = has_calving & ((calving_day >= last) | (today_day - calving_day < POSTPARTUM_DAYS))
+    stale = projected_cycles > MAX_PROJECTED_CYCLES
+
+    keep = ~(not_open | postpartum | stale)
+    return HeatForecast(
+        cattle_ids=cattle_ids[last_rows][keep],
+        lotes=lotes[last_rows][keep],
+        names=names[last_rows][keep],
+        last_heat=last[keep].astype("datetime64[D]"),
+        last_heat_ids=heat_ids[last_rows][keep],
+        expected=expected[keep].astype("datetime64[D]"),
+        cycle_days=cycle[keep],
+        observed_cycles=counts[keep],
+        confidence=confidence[keep]
+    )
+
+
+# Se recalcula solo cuando cambian los celos o los datos del ganado (partos, género), o al cambiar el día
+_forecast_cache = WriteInvalidatedCache(tables=("heat_events", "cattle"), maxsize=1)
+
+
+class HeatPredictionService:
+    """Predicción de celos del rebaño con caché"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def forecast(self) -> HeatForecast:
+        return _forecast_cache.get_or_compute(
+            "herd",
+            lambda: predict_heats(HeatEventRepository(self.db).get_herd_heat_history(), date.today())
+        )
+
+    def expected_in(self, days: int = 7, start_date: Optional[date] = None) -> List[HeatPrediction]:
+        """Animales con celo esperado en los próximos `days` días"""
+        start_date = start_date or date.today()
+        return self.forecast().expected_between(start_date, start_date + timedelta(days=days))
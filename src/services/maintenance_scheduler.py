@@ -0,0 +1,56 @@
+# src/services/maintenance_scheduler.py
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import SessionLocal
+from src.repositories import WeightRepository
+from src.services.activity_service import ActivityService
+from src.services.digest_service import DigestService
+from src.services.outbreak_service import OutbreakService
+
+
+logger = logging.getLogger(__name__)
+
+# Tareas nocturnas en orden; cada una con su propia sesión para que un fallo no arrastre a las demás
+NIGHTLY_STEPS: Tuple[Tuple[str, Callable[[Session], object]], ...] = (
+    ("resumen diario", lambda db: DigestService(db).run_nightly()),
+    ("reducción de pesajes antiguos", lambda db: WeightRepository(db).downsample()),
+    ("purga de lecturas de actividad", lambda db: ActivityService(db).purge_old_readings()),
+    ("detección de brotes", lambda db: OutbreakService(db).check()),
+    ("purga de conteos de casos", lambda db: OutbreakService(db).purge_old_counts()),
+)
+
+
+def _seconds_until(hour: int) -> float:
+    now = datetime.now()
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+def _run_step(step: Callable[[Session], object]) -> None:
+    db = SessionLocal()
+    try:
+        step(db)
+    finally:
+        db.close()
+
+
+async def run_nightly_maintenance(hour: int) -> None:
+    """
+    Ejecuta las tareas de NIGHTLY_STEPS al arrancar y después cada noche a la hora `hour`.
+    Corre dentro del proceso de la API; cada tarea se ejecuta en un hilo para no bloquear el event loop.
+    """
+    while True:
+        for name, step in NIGHTLY_STEPS:
+            try:
+                await asyncio.to_thread(_run_step, step)
+                logger.info("Tarea nocturna completada: %s", name)
+            except Exception:
+                logger.exception("Error en la tarea nocturna: %s", name)
+        await asyncio.sleep(_seconds_until(hour))
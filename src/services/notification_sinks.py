@@ -0,0 +1,118 @@
+# src/services/notification_sinks.py
+import asyncio
+import json
+import logging
+import smtplib
+import urllib.request
+from email.message import EmailMessage
+from typing import List, Optional, Protocol, Sequence
+
+from src.core.config import Settings
+from src.schemas.reminder import ReminderOccurrenceResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationSink(Protocol):
+    """Destino de los avisos de recordatorios vencidos; recibe lotes de ocurrencias"""
+
+    name: str
+
+    async def send(self, batch: Sequence[ReminderOccurrenceResponse]) -> None: ...
+
+
+def _format_line(occurrence: ReminderOccurrenceResponse) -> str:
+    recurring = " (recurrente)" if occurrence.recurring else ""
+    return f"{occurrence.reminder_date} - {occurrence.title} [{occurrence.reminder_type}]{recurring}"
+
+
+class LogSink:
+    """Escribe los avisos en el log y guarda los últimos lotes en memoria (útil en desarrollo y pruebas)"""
+
+    name = "log"
+
+    def __init__(self, keep_batches: int = 100):
+        self.keep_batches = keep_batches
+        self.batches: List[List[ReminderOccurrenceResponse]] = []
+
+    async def send(self, batch: Sequence[ReminderOccurrenceResponse]) -> None:
+        self.batches = (self.batches + [list(batch)])[-self.keep_batches:]
+        for occurrence in batch:
+            logger.info("Recordatorio: %s", _format_line(occurrence))
+
+
+class WebhookSink:
+    """POST de un JSON con el lote (`{"reminders": [...]}`) a una URL"""
+
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = 10):
+        self.url = url
+        self.timeout = timeout
+
+    def _post(self, body: bytes) -> None:
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    async def send(self, batch: Sequence[ReminderOccurrenceResponse]) -> None:
+        body = json.dumps({"reminders": [occurrence.model_dump(mode="json") for occurrence in batch]}, ensure_ascii=False)
+        # urllib bloquea: se ejecuta en un hilo para no frenar el event loop
+        await asyncio.to_thread(self._post, body.encode())
+
+
+class EmailSink:
+    """Un correo por lote con la lista de recordatorios"""
+
+    name = "email"
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        recipients: List[str],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: float = 30
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+
+    def _send_message(self, message: EmailMessage) -> None:
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.username:
+                smtp.starttls()
+                smtp.login(self.username, self.password or "")
+            smtp.send_message(message)
+
+    async def send(self, batch: Sequence[ReminderOccurrenceResponse]) -> None:
+        message = EmailMessage()
+        message["Subject"] = f"Recordatorios del rancho: {len(batch)} pendientes"
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        message.set_content("\n".join(_format_line(occurrence) for occurrence in batch))
+        await asyncio.to_thread(self._send_message, message)
+
+
+def build_sinks(settings: Settings) -> List[NotificationSink]:
+    """Destinos configurados; sin webhook ni correo se usa el log"""
+    sinks: List[NotificationSink] = []
+    if settings.NOTIFY_WEBHOOK_URL:
+        sinks.append(WebhookSink(settings.NOTIFY_WEBHOOK_URL))
+    if settings.SMTP_HOST and settings.NOTIFY_EMAIL_TO:
+        sinks.append(EmailSink(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            sender=settings.SMTP_FROM,
+            recipients=[address.strip() for address in settings.NOTIFY_EMAIL_TO.split(",") if address.strip()],
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD
+        ))
+    return sinks or [LogSink()]
@@ -0,0 +1,137 @@
+# src/services/outbreak_service.py
+import asyncio
+import logging
+import threading
+from datetime import date, timedelta
+from typing import List, Optional, Set
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.infrastructure import events
+from src.infrastructure.database import SessionLocal
+from src.infrastructure.herd_counters import DISEASE_CASE_RETENTION_DAYS
+from src.models.outbreak import OutbreakAlert
+from src.repositories import OutbreakRepository
+from src.schemas.outbreak import DiseaseCluster, OutbreakGroup, OutbreakStatus
+
+
+logger = logging.getLogger(__name__)
+
+# Enfermedades con al menos estos animales se listan "en observación" aunque no lleguen al umbral
+WATCH_MIN_ANIMALS = 2
+
+
+class OutbreakService:
+    """Detección de brotes sobre los conteos de casos de la ventana reciente"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = OutbreakRepository(db)
+
+    def status(self, today: Optional[date] = None) -> OutbreakStatus:
+        """Enfermedades con casos en la ventana, marcando las que superan el umbral total o de algún grupo"""
+        today = today or date.today()
+        window_days = min(settings.OUTBREAK_WINDOW_DAYS, DISEASE_CASE_RETENTION_DAYS)
+        since = today - timedelta(days=window_days - 1)
+
+        clusters = {}
+        groups = []
+        for row in self.repo.get_window_counts(since, today):
+            if row["no_breed"] and row["no_age"]:
+                clusters[row["disease"]] = DiseaseCluster(
+                    disease=row["disease"],
+                    animals=row["animals"],
+                    cases=row["cases"],
+                    first_case=row["first_case"],
+                    last_case=row["last_case"],
+                    lotes=sorted(row["lotes"]),
+                    alert=row["animals"] >= settings.OUTBREAK_MIN_ANIMALS
+                )
+            else:
+                scope = "breed" if not row["no_breed"] else "age_group"
+                groups.append((row["disease"], OutbreakGroup(
+                    scope=scope,
+                    value=row[scope],
+                    animals=row["animals"],
+                    cases=row["cases"],
+                    alert=row["animals"] >= settings.OUTBREAK_GROUP_MIN_ANIMALS
+                )))
+
+        for disease, group in groups:
+            cluster = clusters[disease]
+            cluster.groups.append(group)
+            cluster.alert = cluster.alert or group.alert
+
+        for cluster in clusters.values():
+            cluster.groups.sort(key=lambda group: (group.scope, -group.animals, group.value))
+
+        ranked = sorted(clusters.values(), key=lambda cluster: (-cluster.animals, cluster.disease))
+        return OutbreakStatus(
+            since=since,
+            window_days=window_days,
+            min_animals=settings.OUTBREAK_MIN_ANIMALS,
+            group_min_animals=settings.OUTBREAK_GROUP_MIN_ANIMALS,
+            outbreaks=[cluster for cluster in ranked if cluster.alert],
+            watch=[cluster for cluster in ranked if not cluster.alert and cluster.animals >= WATCH_MIN_ANIMALS]
+        )
+
+    def check(self) -> List[OutbreakAlert]:
+        """Emite (registra y deja en el log) las alertas nuevas de hoy"""
+        status = self.status()
+        today = date.today()
+        alerts = []
+        for cluster in status.outbreaks:
+            if cluster.animals >= status.min_animals:
+                alerts.append({"disease": cluster.disease, "scope": "disease", "group_value": "", "animals": cluster.animals})
+            alerts.extend(
+                {"disease": cluster.disease, "scope": group.scope, "group_value": group.value, "animals": group.animals}
+                for group in cluster.groups if group.alert
+            )
+
+        created = self.repo.save_alerts([alert | {"window_days": status.window_days, "raised_on": today} for alert in alerts])
+        for alert in created:
+            group = f" ({alert.scope}: {alert.group_value})" if alert.group_value else ""
+            logger.warning(
+                "Posible brote de %s%s: %s animales en %s días", alert.disease, group, alert.animals, alert.window_days
+            )
+        return created
+
+    def purge_old_counts(self) -> int:
+        return self.repo.delete_counts_before(date.today() - timedelta(days=DISEASE_CASE_RETENTION_DAYS))
+
+
+# Escrituras en health_events pendientes de evaluar; se acumulan y se evalúan juntas desde run_outbreak_checks
+_pending = threading.Event()
+
+
+def _mark_pending(tables: Set[str]) -> None:
+    _pending.set()
+
+
+def _check() -> None:
+    db = SessionLocal()
+    try:
+        OutbreakService(db).check()
+    finally:
+        db.close()
+
+
+async def run_outbreak_checks(interval_seconds: int) -> None:
+    """
+    Evalúa los umbrales como mucho una vez cada `interval_seconds` y solo si hubo escrituras
+    en health_events desde la última evaluación. Los triggers ya actualizaron los conteos en la
+    misma transacción; las escrituras de otros procesos se evalúan en la tarea nocturna.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if not _pending.is_set():
+            continue
+        _pending.clear()
+        try:
+            await asyncio.to_thread(_check)
+        except Exception:
+            _pending.set()
+            logger.exception("Error al evaluar los umbrales de brotes")
+
+
+events.subscribe({"health_events"}, _mark_pending)
@@ -0,0 +1,264 @@
+# src/services/reminder_scheduler.py
+import asyncio
+import heapq
+import itertools
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from src.core.config import Settings
+from src.infrastructure import events
+from src.infrastructure.database import SessionLocal
+from src.repositories import ReminderRepository
+from src.repositories.base import chunked
+from src.schemas.reminder import ReminderOccurrenceResponse
+from src.services.notification_sinks import NotificationSink, build_sinks
+
+
+logger = logging.getLogger(__name__)
+
+# Tablas cuyos cambios afectan a la cola
+WATCHED_TABLES = {"reminders", "reminder_recurrences", "reminder_occurrences"}
+
+# Ventana que se mantiene en memoria: desde ayer (avisos perdidos durante un reinicio) hasta HORIZON_DAYS.
+# Se recarga entera al cambiar el día; entre medias solo se aplican los cambios
+CATCHUP_DAYS = 1
+HORIZON_DAYS = 2
+
+# Los cambios se leen por updated_at con este solapamiento, para no perder transacciones que confirman tarde
+SYNC_OVERLAP = timedelta(minutes=5)
+
+# Espera antes de reintentar un lote que ningún destino aceptó, o una lectura fallida
+RETRY_DELAY = timedelta(minutes=5)
+
+OccurrenceKey = Tuple[UUID, date]
+
+
+def _key(occurrence: ReminderOccurrenceResponse) -> OccurrenceKey:
+    return occurrence.reminder_id, occurrence.reminder_date
+
+
+class DueQueue:
+    """
+    Cola de prioridad (heap) de ocurrencias por hora de aviso.
+    Quitar o reemplazar una entrada no toca el heap: la entrada vieja se descarta al llegar a la cima.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, OccurrenceKey]] = []
+        self._entries: Dict[OccurrenceKey, Tuple[datetime, ReminderOccurrenceResponse]] = {}
+        self._by_reminder: Dict[UUID, Set[date]] = defaultdict(set)
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, due_at: datetime, occurrence: ReminderOccurrenceResponse) -> None:
+        key = _key(occurrence)
+        self._entries[key] = (due_at, occurrence)
+        self._by_reminder[occurrence.reminder_id].add(occurrence.reminder_date)
+        heapq.heappush(self._heap, (due_at, next(self._sequence), key))
+        # Compacta cuando las entradas descartadas dominan el heap
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(due_at, seq, key) for due_at, seq, key in self._heap if self._entries.get(key, (None,))[0] == due_at]
+            heapq.heapify(self._heap)
+
+    def discard_reminder(self, reminder_id: UUID) -> None:
+        for day in self._by_reminder.pop(reminder_id, ()):
+            self._entries.pop((reminder_id, day), None)
+
+    def reminder_ids(self) -> Set[UUID]:
+        return set(self._by_reminder)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
+        self._by_reminder.clear()
+
+    def next_due(self) -> Optional[datetime]:
+        """Hora del próximo aviso vigente, o None si la cola está vacía"""
+        while self._heap:
+            due_at, _, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry and entry[0] == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: datetime) -> List[ReminderOccurrenceResponse]:
+        """Saca todas las ocurrencias cuya hora de aviso ya llegó"""
+        due = []
+        while (next_due := self.next_due()) is not None and next_due <= now:
+            _, _, key = heapq.heappop(self._heap)
+            _, occurrence = self._entries.pop(key)
+            days = self._by_reminder[occurrence.reminder_id]
+            days.discard(occurrence.reminder_date)
+            if not days:
+                del self._by_reminder[occurrence.reminder_id]
+            due.append(occurrence)
+        return due
+
+
+class ReminderScheduler:
+    """
+    Avisa de los recordatorios al llegar su día (a `notify_hour`), sin consultar la tabla periódicamente:
+    carga la ventana en una DueQueue, duerme hasta el próximo aviso y se actualiza con cada commit
+    que toca recordatorios leyendo solo las filas cambiadas. Los avisos salen en lotes, repartidos
+    entre workers asíncronos que los envían a todos los destinos a la vez.
+    """
+
+    def __init__(self, sinks: Sequence[NotificationSink], notify_hour: int, batch_size: int = 50, workers: int = 2):
+        self.sinks = list(sinks)
+        self.notify_hour = notify_hour
+        self.batch_size = batch_size
+        self.workers = workers
+        self.queue = DueQueue()
+        self._window: Tuple[date, date] = (date.min, date.min)
+        self._synced_at: Optional[datetime] = None
+        # Enviadas en esta ventana: evita que una sincronización concurrente las vuelva a encolar
+        self._sent: Set[OccurrenceKey] = set()
+        self._dirty = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._batches: Optional[asyncio.Queue] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ReminderScheduler":
+        return cls(
+            build_sinks(settings),
+            notify_hour=settings.NOTIFY_HOUR,
+            batch_size=settings.NOTIFY_BATCH_SIZE,
+            workers=settings.NOTIFY_WORKERS
+        )
+
+    def due_at(self, day: date) -> datetime:
+        return datetime.combine(day, time(hour=self.notify_hour))
+
+    # --- acceso a datos (se ejecuta en un hilo)
+
+    def _read(self, start: date, end: date, changed_since: Optional[datetime], queued: Set[UUID]):
+        db = SessionLocal()
+        try:
+            repo = ReminderRepository(db)
+            occurrences = repo.get_pending_occurrences(start, end, changed_since=changed_since)
+            notified = repo.get_notified(start, end)
+            changed = repo.get_changed_ids(changed_since) if changed_since else set()
+            pending = repo.get_pending_ids(queued)
+            return occurrences, notified, changed, pending
+        finally:
+            db.close()
+
+    def _mark_notified(self, keys: List[OccurrenceKey]) -> None:
+        db = SessionLocal()
+        try:
+            ReminderRepository(db).mark_notified(keys)
+        finally:
+            db.close()
+
+    # --- mantenimiento de la cola
+
+    def _push_all(self, occurrences: Iterable[ReminderOccurrenceResponse], notified: Set[OccurrenceKey]) -> None:
+        for occurrence in occurrences:
+            key = _key(occurrence)
+            if key not in notified and key not in self._sent:
+                self.queue.push(self.due_at(occurrence.reminder_date), occurrence)
+
+    async def _reload(self) -> None:
+        """Carga completa de la ventana; al arrancar y cuando cambia el día"""
+        today = date.today()
+        start, end = today - timedelta(days=CATCHUP_DAYS), today + timedelta(days=HORIZON_DAYS)
+        synced_at = datetime.utcnow()
+        occurrences, notified, _, _ = await asyncio.to_thread(self._read, start, end, None, set())
+        self.queue.clear()
+        self._sent.clear()
+        self._push_all(occurrences, notified)
+        self._window, self._synced_at = (start, end), synced_at
+        logger.info("Cola de recordatorios cargada: %d avisos hasta el %s", len(self.queue), end)
+
+    async def _sync(self) -> None:
+        """Aplica los recordatorios creados, cambiados, completados, cancelados o borrados desde la última lectura"""
+        start, end = self._window
+        synced_at = datetime.utcnow()
+        queued = self.queue.reminder_ids()
+        occurrences, notified, changed, pending = await asyncio.to_thread(
+            self._read, start, end, self._synced_at - SYNC_OVERLAP, queued
+        )
+        for reminder_id in changed | (queued - pending):
+            self.queue.discard_reminder(reminder_id)
+        self._push_all(occurrences, notified)
+        self._synced_at = synced_at
+
+    def _on_change(self, tables: Set[str]) -> None:
+        # Llega desde el hilo que hizo commit: solo se despierta al bucle
+        self._dirty = True
+        if self._loop and self._wake:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    # --- envío
+
+    async def _deliver(self, batch: List[ReminderOccurrenceResponse]) -> None:
+        results = await asyncio.gather(*(sink.send(batch) for sink in self.sinks), return_exceptions=True)
+        failed = [(sink, result) for sink, result in zip(self.sinks, results) if isinstance(result, Exception)]
+        for sink, error in failed:
+            logger.error("Error enviando %d avisos a %s: %s", len(batch), sink.name, error)
+
+        if len(failed) == len(self.sinks):
+            retry_at = datetime.now() + RETRY_DELAY
+            for occurrence in batch:
+                self.queue.push(retry_at, occurrence)
+            self._wake.set()
+            return
+
+        keys = [_key(occurrence) for occurrence in batch]
+        self._sent.update(keys)
+        await asyncio.to_thread(self._mark_notified, keys)
+
+    async def _worker(self) -> None:
+        while True:
+            batch = await self._batches.get()
+            try:
+                await self._deliver(batch)
+            except Exception:
+                logger.exception("Error en el envío de avisos")
+            finally:
+                self._batches.task_done()
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._batches = asyncio.Queue()
+        events.subscribe(WATCHED_TABLES, self._on_change)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        retry_at: Optional[datetime] = None
+        try:
+            while True:
+                # Se limpia antes de mirar _dirty: un cambio que llegue después vuelve a despertar al bucle
+                self._wake.clear()
+                try:
+                    if self._window[0] != date.today() - timedelta(days=CATCHUP_DAYS):
+                        self._dirty = False
+                        await self._reload()
+                    elif self._dirty:
+                        self._dirty = False
+                        await self._sync()
+                    retry_at = None
+                except Exception:
+                    logger.exception("Error leyendo los recordatorios; se reintenta en %s", RETRY_DELAY)
+                    self._dirty = True
+                    retry_at = datetime.now() + RETRY_DELAY
+
+                for batch in chunked(self.queue.pop_due(datetime.now()), self.batch_size):
+                    self._batches.put_nowait(list(batch))
+
+                tomorrow = datetime.combine(date.today() + timedelta(days=1), time.min)
+                wake_at = min(filter(None, (self.queue.next_due(), tomorrow, retry_at)))
+                try:
+                    await asyncio.wait_for(self._wake.wait(), max((wake_at - datetime.now()).total_seconds(), 0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            events.unsubscribe(WATCHED_TABLES, self._on_change)
+            for worker in workers:
+                worker.cancel()
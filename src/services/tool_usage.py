@@ -0,0 +1,62 @@
+# src/services/tool_usage.py
+import logging
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+from src.services.tools.payload import ToolPayload
+
+
+logger = logging.getLogger(__name__)
+
+
+class ToolUsage(NamedTuple):
+    tool: str
+    calls: int
+    # Tokens estimados de la respuesta enviada al modelo
+    tokens_total: int
+    tokens_max: int
+    # Llamadas cuya respuesta se recortó por el presupuesto de tokens
+    trimmed_calls: int
+    rows_total: int
+    rows_sent: int
+    # Tokens de entrada de la segunda llamada según Gemini (pregunta, llamada y respuesta de la herramienta)
+    prompt_tokens_total: int
+
+
+class ToolUsageRegistry:
+    """
+    Costo en tokens de cada herramienta desde que arrancó la API, para ver cuáles inflan la
+    segunda llamada al modelo. Se guarda en memoria: se reinicia con el proceso.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._usage: Dict[str, ToolUsage] = {}
+
+    def record(self, tool: str, payload: ToolPayload, prompt_tokens: Optional[int] = None) -> None:
+        trimmed = payload.rows_sent < payload.rows
+        logger.info(
+            "Herramienta %s: ~%d tokens, %d de %d líneas enviadas%s",
+            tool, payload.tokens, payload.rows_sent, payload.rows,
+            f", {prompt_tokens} tokens de entrada" if prompt_tokens is not None else ""
+        )
+        with self._lock:
+            usage = self._usage.get(tool) or ToolUsage(tool, 0, 0, 0, 0, 0, 0, 0)
+            self._usage[tool] = ToolUsage(
+                tool=tool,
+                calls=usage.calls + 1,
+                tokens_total=usage.tokens_total + payload.tokens,
+                tokens_max=max(usage.tokens_max, payload.tokens),
+                trimmed_calls=usage.trimmed_calls + trimmed,
+                rows_total=usage.rows_total + payload.rows,
+                rows_sent=usage.rows_sent + payload.rows_sent,
+                prompt_tokens_total=usage.prompt_tokens_total + (prompt_tokens or 0)
+            )
+
+    def snapshot(self) -> List[ToolUsage]:
+        """Uso por herramienta, las más costosas primero"""
+        with self._lock:
+            return sorted(self._usage.values(), key=lambda usage: usage.tokens_total, reverse=True)
+
+
+tool_usage = ToolUsageRegistry()
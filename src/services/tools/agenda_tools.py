@@ -0,0 +1,67 @@
+# src/services/tools/agenda_tools.py
+from datetime import date, timedelta
+from itertools import groupby
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+from src.schemas.agenda import AgendaItemTypeEnum
+from src.services.agenda_service import AgendaService
+from src.services.tools.common import missing_lotes_message, resolve_lotes
+from src.services.tools.render import is_compact, render_lines, today
+
+
+ITEM_LABELS = {
+    AgendaItemTypeEnum.reminder: "Recordatorio",
+    AgendaItemTypeEnum.dose: "Dosis",
+    AgendaItemTypeEnum.pregnancy_check: "Chequeo de preñez",
+    AgendaItemTypeEnum.expected_heat: "Celo esperado",
+    AgendaItemTypeEnum.calving: "Parto previsto",
+}
+
+
+def _format_item(item) -> str:
+    label = ITEM_LABELS[item.item_type]
+    line = label if item.title == label else f"{label}: {item.title}"
+    if item.lote:
+        line += f" | {item.cattle_name} ({item.lote})"
+    if item.detail:
+        line += f" | {item.detail}"
+    return line
+
+
+def get_agenda_tool(db: Session, days: int = 7, start_date: str = None, lotes: Optional[List[str]] = None) -> str:
+    """Agenda unificada: todo lo que hay que hacer en el rango de fechas, agrupado por día"""
+    try:
+        start = date.fromisoformat(start_date) if start_date else today()
+    except ValueError:
+        return f"Error: La fecha debe tener formato YYYY-MM-DD. Recibido: {start_date}"
+
+    missing: List[str] = []
+    if lotes:
+        # Lotes, números o nombres: la agenda filtra por el lote exacto
+        cattle_list, missing = resolve_lotes(db, lotes)
+        if not cattle_list:
+            return missing_lotes_message(missing)
+        lotes = [cattle.lote for cattle in cattle_list]
+    footer = missing_lotes_message(missing) if missing else None
+
+    items = AgendaService(db).get_agenda(start_date=start, days=days, lotes=lotes)
+
+    end = start + timedelta(days=days)
+    if not items:
+        empty = f"No hay tareas en la agenda entre {start} y {end}."
+        return f"{empty}\n{footer}" if footer else empty
+
+    current_date = today()
+    header = f"Agenda del {start} al {end} ({len(items)} tareas):"
+    if is_compact():
+        return render_lines(header, (f"{item.item_date} | {_format_item(item)}" for item in items), footer)
+
+    lines = [""]
+    for item_date, day_items in groupby(items, key=lambda item: item.item_date):
+        marker = " (hoy)" if item_date == current_date else ""
+        lines.append(f"📅 {item_date}{marker}")
+        lines.extend(f"   - {_format_item(item)}" for item in day_items)
+        lines.append("")
+
+    return render_lines(header, lines, footer)
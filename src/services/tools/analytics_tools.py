@@ -0,0 +1,99 @@
+# src/services/tools/analytics_tools.py
+from datetime import date
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from src.models.cattle import GenderEnum
+from src.repositories import DemographicsRepository
+from src.services.analytics_service import AnalyticsService
+from src.services.tools.render import render_lines
+
+
+def _days(value: Optional[float]) -> str:
+    return f"{value:.0f} días" if value is not None else "sin datos"
+
+
+def _number(value: Optional[float]) -> str:
+    return f"{value:.1f}" if value is not None else "sin datos"
+
+
+def _percent(value: Optional[float]) -> str:
+    return f"{value:.0%}" if value is not None else "sin datos"
+
+
+def get_reproductive_kpis_tool(db: Session, start_date: str = None, end_date: str = None, breed: str = None) -> str:
+    """Indicadores reproductivos del rancho calculados en una sola llamada"""
+    try:
+        start = date.fromisoformat(start_date) if start_date else None
+        end = date.fromisoformat(end_date) if end_date else None
+    except ValueError:
+        return f"Error: Las fechas deben tener formato YYYY-MM-DD. Recibido: {start_date}, {end_date}"
+    
+    kpis = AnalyticsService(db).reproductive_kpis(start, end, breed)
+    
+    if not kpis.inseminations and not kpis.heats:
+        return "No hay eventos de celo o inseminaciones en el periodo indicado."
+    
+    scope = f" ({breed})" if breed else ""
+    period = f" del {start or 'inicio'} al {end or 'hoy'}" if start or end else ""
+    lines = [
+        f"- Intervalo entre partos: {_days(kpis.calving_interval_days)}",
+        f"- Días abiertos: {_days(kpis.days_open)}",
+        f"- Servicios por concepción: {_number(kpis.services_per_conception)}",
+        f"- Tasa de concepción: {_percent(kpis.conception_rate)} ({kpis.conceptions} de {kpis.inseminations} inseminaciones)",
+        f"- Tasa de detección de celos: {_percent(kpis.heat_detection_rate)} ({kpis.heats} celos registrados)",
+    ]
+    
+    if len(kpis.by_breed) > 1:
+        lines.append("\nTasa de concepción por raza:")
+        lines.extend(
+            f"- {group.breed}: {_percent(group.conception_rate)} ({group.conceptions}/{group.inseminations})"
+            for group in kpis.by_breed
+        )
+    
+    if kpis.by_period:
+        lines.append("\nTasa de concepción por mes:")
+        lines.extend(
+            f"- {group.period_start:%Y-%m}: {_percent(group.conception_rate)} ({group.conceptions}/{group.inseminations})"
+            for group in kpis.by_period
+        )
+    
+    return render_lines(f"Indicadores reproductivos{scope}{period}:", lines)
+
+
+def _weight(value: Optional[float]) -> str:
+    return f"{value:.0f}" if value is not None else "-"
+
+
+def _demographics_row(label: str, group) -> str:
+    ages = " ".join(f"{bucket}:{count}" for bucket, count in group.age_buckets.items() if count)
+    spread = f"{_weight(group.weight_p25)}-{_weight(group.weight_p75)}" if group.weight_p25 is not None else "-"
+    weights = f"{_weight(group.weight_mean)} | {_weight(group.weight_median)} | {spread}"
+    return f"{label} | {group.count} | {ages or '-'} | {weights}"
+
+
+def get_herd_demographics_tool(db: Session, breed: str = None, gender: str = None, min_age_years: int = None, max_age_years: int = None) -> str:
+    """Conteos, edades y pesos del rebaño agregados en la base de datos por raza y género"""
+    try:
+        gender_enum = GenderEnum(gender.lower()) if gender else None
+    except ValueError:
+        return f"Error: Género inválido '{gender}'. Use 'male' o 'female'."
+    
+    demographics = DemographicsRepository(db).get_demographics(breed, gender_enum, min_age_years, max_age_years)
+    
+    filters = [value for value in (
+        breed,
+        gender,
+        f"desde {min_age_years} años" if min_age_years is not None else None,
+        f"hasta {max_age_years} años" if max_age_years is not None else None
+    ) if value]
+    scope = f" ({', '.join(filters)})" if filters else ""
+    
+    if not demographics.total.count:
+        return f"No hay ganado que cumpla los filtros{scope}."
+    
+    lines = ["Raza/Género | N | Edades (años) | Peso prom | Mediana | P25-P75"]
+    lines.extend(_demographics_row(f"{group.breed}/{group.gender}", group) for group in demographics.groups)
+    lines.append(_demographics_row("TOTAL", demographics.total))
+    
+    return render_lines(f"Demografía del rebaño{scope}, pesos en kg:", lines)
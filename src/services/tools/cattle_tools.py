@@ -3,8 +3,41 @@ from typing import List, Optional
 from datetime import date
 from sqlalchemy.orm import Session
 
-from src.repositories import CattleRepository
+from src.repositories import CattleRepository, HerdSummaryRepository, ReadRepository, SnapshotRepository
 from src.schemas.cattle import CattleResponse, CattleCreate, GenderEnum
+from src.services.cattle_index import cattle_index
+from src.services.tools.common import find_cattle, cattle_not_found_message
+from src.services.tools.render import Field, RowTemplate, render_lines, render_record, render_rows, today
+
+
+def _age_years(birth_date: Optional[date], day: date) -> Optional[int]:
+    return (day - birth_date).days // 365 if birth_date else None
+
+
+CATTLE = RowTemplate(
+    icon="-",
+    title=lambda cattle, day: f"{cattle.name} (Lote: {cattle.lote})",
+    title_label="Animal",
+    fields=(
+        Field("Raza", lambda cattle, day: cattle.breed or "No especificada"),
+        Field("Género", lambda cattle, day: cattle.gender.value),
+        Field("Peso", lambda cattle, day: f"{cattle.weight or 'No registrado'} kg"),
+        Field("Edad", lambda cattle, day: f"{_age_years(cattle.birth_date, day)} años" if cattle.birth_date else None),
+    ),
+    field_prefix="  "
+)
+
+CATTLE_DETAIL = RowTemplate(
+    fields=(
+        Field("Lote", "lote"),
+        Field("Raza", lambda cattle, day: cattle.breed or "No especificada"),
+        Field("Género", lambda cattle, day: cattle.gender.value),
+        Field("Peso", lambda cattle, day: f"{cattle.weight or 'No registrado'} kg"),
+        Field("Edad", lambda cattle, day: f"{_age_years(cattle.birth_date, day)} años (Fecha de nacimiento: {cattle.birth_date})" if cattle.birth_date else None),
+        Field("Último parto", lambda cattle, day: cattle.fecha_ultimo_parto),
+    ),
+    field_prefix="- "
+)
 
 
 def create_cattle_tool(db: Session, name: str, lote: str, gender: str, breed: str = None, weight: float = None, birth_date: str = None) -> str:
@@ -48,79 +81,121 @@ def create_cattle_tool(db: Session, name: str, lote: str, gender: str, breed: st
 
 def get_all_cattle_tool(db: Session, limit: int = 50) -> str:
     """Obtiene información de todo el ganado registrado"""
-    repo = CattleRepository(db)
-    cattle_list = repo.get_all(limit=limit)
+    cattle_list = ReadRepository(db).cattle(limit=limit)
     
     if not cattle_list:
         return "No hay ganado registrado en la base de datos."
     
-    result = f"Total de ganado: {repo.count()}\n\n"
-    for cattle in cattle_list:
-        result += f"- {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"  Raza: {cattle.breed or 'No especificada'}\n"
-        result += f"  Género: {cattle.gender.value}\n"
-        result += f"  Peso: {cattle.weight or 'No registrado'} kg\n"
-        if cattle.birth_date:
-            age = (date.today() - cattle.birth_date).days // 365
-            result += f"  Edad: {age} años\n"
-        result += "\n"
-    
-    return result
+    return render_rows(CATTLE, cattle_list, f"Total de ganado: {HerdSummaryRepository(db).get_counter('cattle_total')}")
 
 
 def search_cattle_by_name_tool(db: Session, name: str) -> str:
-    """Busca ganado por nombre"""
-    repo = CattleRepository(db)
-    cattle_list = repo.search_by_name(name, limit=10)
+    """Busca ganado por nombre en el índice en memoria: ignora tildes y tolera errores ('Margarta' -> 'Margarita')"""
+    matches = cattle_index.search_name(db, name, limit=10)
+    by_id = {cattle.id: cattle for cattle in ReadRepository(db).cattle_by_ids([match.id for match in matches])}
+    cattle_list = [by_id[match.id] for match in matches if match.id in by_id]
     
     if not cattle_list:
         return f"No se encontró ningún ganado con el nombre '{name}'."
     
-    result = f"Ganado encontrado con nombre similar a '{name}':\n\n"
-    for cattle in cattle_list:
-        result += f"- {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"  Raza: {cattle.breed}\n"
-        result += f"  Género: {cattle.gender.value}\n"
-        result += f"  Peso: {cattle.weight} kg\n"
-        result += "\n"
-    
-    return result
+    return render_rows(CATTLE, cattle_list, f"Ganado encontrado con nombre similar a '{name}':")
 
 
 def get_cattle_by_lote_tool(db: Session, lote: str) -> str:
     """Obtiene información de un ganado específico por su lote"""
-    repo = CattleRepository(db)
-    cattle = repo.get_by_lote(lote)
+    cattle = find_cattle(db, lote)
     
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
-    
-    result = f"Información del ganado {cattle.name}:\n"
-    result += f"- Lote: {cattle.lote}\n"
-    result += f"- Raza: {cattle.breed or 'No especificada'}\n"
-    result += f"- Género: {cattle.gender.value}\n"
-    result += f"- Peso: {cattle.weight or 'No registrado'} kg\n"
+        return cattle_not_found_message(db, lote)
     
-    if cattle.birth_date:
-        age = (date.today() - cattle.birth_date).days // 365
-        result += f"- Edad: {age} años (Fecha de nacimiento: {cattle.birth_date})\n"
-    
-    if cattle.fecha_ultimo_parto:
-        result += f"- Último parto: {cattle.fecha_ultimo_parto}\n"
-    
-    return result
+    return render_record(CATTLE_DETAIL, cattle, f"Información del ganado {cattle.name}:")
 
 
 def get_cattle_by_gender_tool(db: Session, gender: str) -> str:
     """Obtiene ganado filtrado por género (male o female)"""
-    repo = CattleRepository(db)
-    cattle_list = repo.get_by_gender(gender, limit=50)
+    cattle_list = ReadRepository(db).cattle(limit=50, gender=gender)
     
     if not cattle_list:
         return f"No se encontró ganado de género '{gender}'."
     
-    result = f"Ganado de género {gender}:\n\n"
-    for cattle in cattle_list:
-        result += f"- {cattle.name} (Lote: {cattle.lote}, Raza: {cattle.breed})\n"
+    return render_lines(
+        f"Ganado de género {gender}:\n",
+        (f"- {cattle.name} (Lote: {cattle.lote}, Raza: {cattle.breed})" for cattle in cattle_list)
+    )
+
+
+def get_animal_snapshot_tool(db: Session, lote: str) -> str:
+    """Ficha completa de un animal: datos, vacunas, dosis, reproducción y pendientes en una sola consulta"""
+    match = cattle_index.resolve(db, lote)
+    snapshot = SnapshotRepository(db).get_by_lote(match.lote) if match else None
+    
+    if not snapshot:
+        return cattle_not_found_message(db, lote)
+    
+    cattle = snapshot.cattle
+    current_date = today()
+    
+    lines = [f"- Raza: {cattle.breed or 'No especificada'} | Género: {cattle.gender.value} | Peso: {cattle.weight or 'No registrado'} kg"]
+    if cattle.birth_date:
+        lines.append(f"- Edad: {_age_years(cattle.birth_date, current_date)} años")
+    if cattle.fecha_ultimo_parto:
+        lines.append(f"- Último parto: {cattle.fecha_ultimo_parto}")
+    
+    vaccine = snapshot.last_vaccine
+    if vaccine:
+        target = f" ({vaccine.disease_name})" if vaccine.disease_name else ""
+        lines.append(f"- Última vacuna: {vaccine.application_date} {vaccine.medicine_name or 'No especificada'}{target}")
+    else:
+        lines.append("- Última vacuna: sin registros")
+    
+    if snapshot.upcoming_doses:
+        doses = "; ".join(
+            f"{dose.next_dose_date} {dose.medicine_name or dose.event_type}" for dose in snapshot.upcoming_doses
+        )
+        lines.append(f"- Próximas dosis: {doses}")
+    
+    if snapshot.last_heat:
+        lines.append(f"- Último celo: {snapshot.last_heat.heat_date}")
+    
+    insemination = snapshot.last_insemination
+    if insemination and insemination.insemination_date:
+        calved_after = cattle.fecha_ultimo_parto and cattle.fecha_ultimo_parto >= insemination.insemination_date
+        if calved_after:
+            status = f"parió después de la inseminación del {insemination.insemination_date}"
+        elif insemination.pregnancy_confirmed:
+            status = f"preñada (inseminada {insemination.insemination_date}, ~{(current_date - insemination.insemination_date).days} días de gestación)"
+        elif insemination.pregnancy_confirmed is None:
+            status = f"inseminada {insemination.insemination_date}, pendiente de confirmar preñez"
+        else:
+            status = f"no preñada (inseminación del {insemination.insemination_date})"
+        lines.append(f"- Estado reproductivo: {status}")
+    
+    if snapshot.pending_reminders:
+        shown = len(snapshot.pending_reminders)
+        total = snapshot.pending_reminders_total
+        count = f"{total}, los primeros {shown}" if total > shown else str(total)
+        lines.append(f"- Recordatorios pendientes ({count}):")
+        for reminder in snapshot.pending_reminders:
+            overdue = " (VENCIDO)" if reminder.reminder_date < current_date else ""
+            lines.append(f"  * {reminder.reminder_date} {reminder.title} [{reminder.reminder_type}]{overdue}")
+    else:
+        lines.append("- Recordatorios pendientes: ninguno")
+    
+    return render_lines(f"Ficha de {cattle.name} (Lote: {cattle.lote}):", lines)
+
+
+def get_herd_summary_tool(db: Session) -> str:
+    """Resumen general del rancho leído de los contadores precalculados"""
+    summary = HerdSummaryRepository(db).get_summary()
+    
+    if not summary.total_cattle:
+        return "No hay ganado registrado en la base de datos."
     
-    return result
+    return render_lines(f"Resumen del rancho al {summary.as_of}:", [
+        f"- Total de ganado: {summary.total_cattle}",
+        "- Por género: " + ", ".join(f"{gender}: {count}" for gender, count in sorted(summary.by_gender.items())),
+        "- Por raza: " + ", ".join(f"{breed}: {count}" for breed, count in sorted(summary.by_breed.items())),
+        f"- Preñeces confirmadas: {summary.pregnant}",
+        f"- Recordatorios pendientes: {summary.reminders_pending} ({summary.reminders_overdue} vencidos)",
+        f"- Dosis programadas: {summary.doses_next_7_days} en 7 días, {summary.doses_next_30_days} en 30 días",
+    ])
@@ -0,0 +1,64 @@
+# src/services/tools/common.py
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from src.repositories import ReadRepository
+from src.repositories.read_models import CattleRow
+from src.services.cattle_index import cattle_index
+
+
+def find_cattle(db: Session, text: str, exact: bool = False) -> Optional[CattleRow]:
+    """
+    Resuelve un animal por lote, número ('504', 'vaca 504') o nombre aunque esté mal escrito,
+    con el índice en memoria; solo se consulta la base de datos para leer sus columnas por id.
+    Las herramientas que escriben usan exact=True: sin parecidos, solo el nombre completo.
+    """
+    match = cattle_index.resolve(db, text, exact)
+    cattle = ReadRepository(db).cattle_by_id(match.id) if match else None
+    if match and not cattle:
+        # El índice apuntaba a un animal borrado por otro proceso: se relee y se vuelve a intentar
+        cattle_index.invalidate()
+        match = cattle_index.resolve(db, text, exact)
+        cattle = ReadRepository(db).cattle_by_id(match.id) if match else None
+    return cattle
+
+
+def cattle_not_found_message(db: Session, text: str) -> str:
+    """Mensaje de animal no encontrado con los nombres más parecidos como sugerencia"""
+    suggestions = cattle_index.search_name(db, text, limit=3)
+    message = f"No se encontró ganado con el lote o nombre '{text}'."
+    if suggestions:
+        message += " ¿Quisiste decir " + ", ".join(f"{match.name} ({match.lote})" for match in suggestions) + "?"
+    return message
+
+
+def resolve_lotes(db: Session, lotes: List[str], exact: bool = False) -> Tuple[List[CattleRow], List[str]]:
+    """
+    Resuelve varios lotes (o números y nombres) con el índice en memoria y una sola consulta.
+    Devuelve el ganado en el orden pedido y los lotes que no existen (exact: ver find_cattle).
+    """
+    requested = list(dict.fromkeys(lotes))
+    matches = {text: cattle_index.resolve(db, text, exact) for text in requested}
+    ids = list(dict.fromkeys(match.id for match in matches.values() if match))
+    by_id = {cattle.id: cattle for cattle in ReadRepository(db).cattle_by_ids(ids)}
+    if len(by_id) < len(ids):
+        # Ids del índice que ya no existen (borrados por otro proceso): se releen y se resuelven de nuevo
+        cattle_index.invalidate()
+        matches = {text: cattle_index.resolve(db, text, exact) for text in requested}
+        ids = list(dict.fromkeys(match.id for match in matches.values() if match))
+        by_id = {cattle.id: cattle for cattle in ReadRepository(db).cattle_by_ids(ids)}
+
+    found: dict = {}
+    missing = []
+    for text in requested:
+        match = matches[text]
+        if match and match.id in by_id:
+            # Dos formas de nombrar al mismo animal ('LOTE-504' y '504') cuentan una sola vez
+            found.setdefault(match.id, by_id[match.id])
+        else:
+            missing.append(text)
+    return list(found.values()), missing
+
+
+def missing_lotes_message(missing: List[str]) -> str:
+    return f"No se encontró ganado con los lotes: {', '.join(missing)}."
@@ -1,136 +1,268 @@
 # src/services/tools/health_tools.py
-from typing import Optional
+from typing import List, Optional
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
 
-from src.repositories import HealthEventRepository, CattleRepository
+from src.models.health_event import EventTypeEnum
+from src.repositories import DigestRepository, ProtocolRepository, ReadRepository, WithdrawalRepository
+from src.schemas.digest import DigestDose
+from src.schemas.withdrawal import WithdrawalProductEnum
+from src.services.digest_service import DigestService
+from src.services.outbreak_service import OutbreakService
+from src.services.tools.common import find_cattle, cattle_not_found_message, resolve_lotes, missing_lotes_message
+from src.services.tools.render import Field, RowTemplate, join_sections, render_lines, render_record, render_rows, today
+
+
+HEALTH_EVENT = RowTemplate(
+    icon="📅",
+    title=lambda event, day: f"{event.application_date} - {event.event_type.value.upper()}",
+    title_label="Evento",
+    fields=(
+        Field("Enfermedad", "disease_name"),
+        Field("Medicamento", "medicine_name"),
+        Field("Dosis", "dosage"),
+        Field("Próxima dosis", "next_dose_date"),
+        Field("Veterinario", "veterinarian_name"),
+        Field("Notas", "notes"),
+    )
+)
+
+LAST_VACCINE = RowTemplate(
+    fields=(
+        Field("Fecha de aplicación", "application_date"),
+        Field("Vacuna", lambda vaccine, day: vaccine.medicine_name or "No especificada"),
+        Field("Para", "disease_name"),
+        Field("Próxima dosis", "next_dose_date"),
+        Field("Veterinario", "veterinarian_name"),
+    ),
+    field_prefix="- "
+)
+
+# Dosis del resumen diario (event_type ya es texto) y de la consulta directa (event_type es el enum)
+UPCOMING_DOSE = RowTemplate(
+    icon="📌",
+    title=lambda dose, day: f"{dose.cattle_name} (Lote: {dose.lote})",
+    title_label="Animal",
+    fields=(
+        Field("Fecha", lambda dose, day: f"{dose.next_dose_date} (en {(dose.next_dose_date - day).days} días)"),
+        Field("Tipo", lambda dose, day: getattr(dose.event_type, "value", dose.event_type)),
+        Field("Medicamento", "medicine_name"),
+        Field("Dosis", "dosage"),
+    )
+)
+
+
+def _format_health_history(cattle, events) -> str:
+    return render_rows(HEALTH_EVENT, events, f"Historial de salud de {cattle.name} (Lote: {cattle.lote}):")
+
+
+def _format_last_vaccine(cattle, last_vaccine) -> str:
+    return render_record(LAST_VACCINE, last_vaccine, f"Última vacuna de {cattle.name} (Lote: {cattle.lote}):")
 
 
 def get_health_events_by_cattle_tool(db: Session, lote: str) -> str:
     """Obtiene el historial de eventos de salud de un ganado por su lote"""
-    cattle_repo = CattleRepository(db)
-    cattle = cattle_repo.get_by_lote(lote)
+    cattle = find_cattle(db, lote)
     
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
+        return cattle_not_found_message(db, lote)
     
-    health_repo = HealthEventRepository(db)
-    events = health_repo.get_by_cattle_id(cattle.id, limit=20)
+    events = ReadRepository(db).health_events_by_cattle_ids([cattle.id], per_cattle=20)
     
     if not events:
-        return f"El ganado {cattle.name} (Lote: {lote}) no tiene eventos de salud registrados."
+        return f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene eventos de salud registrados."
     
-    result = f"Historial de salud de {cattle.name} (Lote: {lote}):\n\n"
-    for event in events:
-        result += f"📅 {event.application_date} - {event.event_type.value.upper()}\n"
-        if event.disease_name:
-            result += f"   Enfermedad: {event.disease_name}\n"
-        if event.medicine_name:
-            result += f"   Medicamento: {event.medicine_name}\n"
-        if event.dosage:
-            result += f"   Dosis: {event.dosage}\n"
-        if event.next_dose_date:
-            result += f"   Próxima dosis: {event.next_dose_date}\n"
-        if event.veterinarian_name:
-            result += f"   Veterinario: {event.veterinarian_name}\n"
-        if event.notes:
-            result += f"   Notas: {event.notes}\n"
-        result += "\n"
-    
-    return result
+    return _format_health_history(cattle, events)
 
 
 def get_upcoming_vaccines_tool(db: Session, days: int = 30) -> str:
     """Obtiene las vacunas próximas a aplicar en los próximos X días"""
-    health_repo = HealthEventRepository(db)
-    cattle_repo = CattleRepository(db)
+    current_date = today()
+    limit_date = current_date + timedelta(days=days)
     
-    current_date = date.today()
-    events = health_repo.get_upcoming_doses(current_date, limit=50)
+    if days <= DigestRepository.DOSE_WINDOW_DAYS:
+        # Dentro de la ventana precalculada se responde desde el resumen diario
+        doses = DigestService(db).get_today().upcoming_doses
+    else:
+        doses = [
+            DigestDose(
+                cattle_name=event.cattle_name,
+                lote=event.lote,
+                next_dose_date=event.next_dose_date,
+                event_type=event.event_type.value,
+                medicine_name=event.medicine_name,
+                dosage=event.dosage
+            )
+            for event in ReadRepository(db).upcoming_doses(current_date, limit=50)
+        ]
     
     # Filtrar solo las que están dentro del rango de días
-    upcoming = [e for e in events if e.next_dose_date <= current_date + timedelta(days=days)]
+    upcoming = [dose for dose in doses if dose.next_dose_date <= limit_date]
     
     if not upcoming:
         return f"No hay vacunas programadas para los próximos {days} días."
     
-    result = f"Vacunas y tratamientos programados para los próximos {days} días:\n\n"
-    for event in upcoming:
-        cattle = cattle_repo.get_by_id(event.cattle_id)
-        days_remaining = (event.next_dose_date - current_date).days
-        
-        result += f"📌 {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"   Fecha: {event.next_dose_date} ({days_remaining} días)\n"
-        result += f"   Tipo: {event.event_type.value}\n"
-        if event.medicine_name:
-            result += f"   Medicamento: {event.medicine_name}\n"
-        if event.dosage:
-            result += f"   Dosis: {event.dosage}\n"
-        result += "\n"
-    
-    return result
+    return render_rows(UPCOMING_DOSE, upcoming, f"Vacunas y tratamientos programados para los próximos {days} días:")
 
 
 def get_last_vaccine_tool(db: Session, lote: str, vaccine_name: Optional[str] = None) -> str:
     """Obtiene la última vacuna aplicada a un ganado específico"""
-    cattle_repo = CattleRepository(db)
-    cattle = cattle_repo.get_by_lote(lote)
+    cattle = find_cattle(db, lote)
     
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
-    
-    health_repo = HealthEventRepository(db)
-    events = health_repo.get_by_cattle_id(cattle.id, limit=50)
-    
-    # Filtrar solo vacunas
-    from src.models.health_event import EventTypeEnum
-    vaccines = [e for e in events if e.event_type == EventTypeEnum.vaccine]
+        return cattle_not_found_message(db, lote)
     
-    if vaccine_name:
-        vaccines = [v for v in vaccines if vaccine_name.lower() in (v.medicine_name or '').lower()]
+    vaccines = ReadRepository(db).health_events_by_cattle_ids([cattle.id], 1, EventTypeEnum.vaccine, vaccine_name)
     
     if not vaccines:
         msg = f"vacuna {vaccine_name}" if vaccine_name else "vacunas"
-        return f"El ganado {cattle.name} (Lote: {lote}) no tiene {msg} registradas."
+        return f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene {msg} registradas."
     
-    last_vaccine = vaccines[0]  # Ya están ordenadas por fecha descendente
-    
-    result = f"Última vacuna de {cattle.name} (Lote: {lote}):\n"
-    result += f"- Fecha de aplicación: {last_vaccine.application_date}\n"
-    result += f"- Vacuna: {last_vaccine.medicine_name or 'No especificada'}\n"
-    if last_vaccine.disease_name:
-        result += f"- Para: {last_vaccine.disease_name}\n"
-    if last_vaccine.next_dose_date:
-        result += f"- Próxima dosis: {last_vaccine.next_dose_date}\n"
-    if last_vaccine.veterinarian_name:
-        result += f"- Veterinario: {last_vaccine.veterinarian_name}\n"
-    
-    return result
+    return _format_last_vaccine(cattle, vaccines[0])
 
 
 def get_all_upcoming_vaccines_tool(db: Session) -> str:
     """Obtiene TODAS las próximas vacunas/dosis pendientes de todo el ganado"""
-    health_repo = HealthEventRepository(db)
-    cattle_repo = CattleRepository(db)
-    
-    current_date = date.today()
-    events = health_repo.get_upcoming_doses(current_date, limit=100)
+    events = ReadRepository(db).upcoming_doses(today(), limit=100)
     
     if not events:
         return "No hay vacunas o dosis pendientes programadas."
     
-    result = f"Todas las vacunas y dosis pendientes:\n\n"
+    return render_rows(UPCOMING_DOSE, events, "Todas las vacunas y dosis pendientes:")
+
+
+def get_health_events_for_lotes_tool(db: Session, lotes: List[str], per_cattle: int = 10) -> str:
+    """Historial de salud de varios ganados con una consulta para los lotes y otra para los eventos"""
+    cattle_list, missing = resolve_lotes(db, lotes)
+    if not cattle_list:
+        return missing_lotes_message(missing)
+    
+    events = ReadRepository(db).health_events_by_cattle_ids([c.id for c in cattle_list], per_cattle)
+    by_cattle = {}
     for event in events:
-        cattle = cattle_repo.get_by_id(event.cattle_id)
-        days_remaining = (event.next_dose_date - current_date).days
-        
-        result += f"📌 {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"   Fecha programada: {event.next_dose_date} (en {days_remaining} días)\n"
-        result += f"   Tipo: {event.event_type.value}\n"
-        if event.medicine_name:
-            result += f"   Medicamento: {event.medicine_name}\n"
-        if event.dosage:
-            result += f"   Dosis: {event.dosage}\n"
-        result += "\n"
-    
-    return result
+        by_cattle.setdefault(event.cattle_id, []).append(event)
+    
+    sections = []
+    for cattle in cattle_list:
+        cattle_events = by_cattle.get(cattle.id)
+        if cattle_events:
+            sections.append(_format_health_history(cattle, cattle_events))
+        else:
+            sections.append(f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene eventos de salud registrados.\n")
+    if missing:
+        sections.append(missing_lotes_message(missing))
+    
+    return join_sections(sections)
+
+
+def get_last_vaccine_for_lotes_tool(db: Session, lotes: List[str], vaccine_name: Optional[str] = None) -> str:
+    """Última vacuna de varios ganados con una consulta para los lotes y otra para las vacunas"""
+    cattle_list, missing = resolve_lotes(db, lotes)
+    if not cattle_list:
+        return missing_lotes_message(missing)
+    
+    vaccines = ReadRepository(db).health_events_by_cattle_ids(
+        [c.id for c in cattle_list], 1, EventTypeEnum.vaccine, vaccine_name
+    )
+    by_cattle = {vaccine.cattle_id: vaccine for vaccine in vaccines}
+    msg = f"vacuna {vaccine_name}" if vaccine_name else "vacunas"
+    
+    sections = []
+    for cattle in cattle_list:
+        last_vaccine = by_cattle.get(cattle.id)
+        if last_vaccine:
+            sections.append(_format_last_vaccine(cattle, last_vaccine))
+        else:
+            sections.append(f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene {msg} registradas.\n")
+    if missing:
+        sections.append(missing_lotes_message(missing))
+    
+    return join_sections(sections)
+
+
+def _cluster_groups(cluster) -> str:
+    return ", ".join(f"{group.value} ({group.animals})" for group in cluster.groups if group.animals > 1)
+
+
+CLUSTER = RowTemplate(
+    icon="-",
+    title=lambda cluster, day: f"{cluster.disease}: {cluster.animals} animales, {cluster.cases} casos entre {cluster.first_case} y {cluster.last_case}",
+    title_label="Enfermedad",
+    fields=(
+        Field("Lotes", lambda cluster, day: ", ".join(cluster.lotes)),
+        Field("Concentración por raza/edad", lambda cluster, day: _cluster_groups(cluster)),
+    )
+)
+
+
+def get_outbreaks_tool(db: Session) -> str:
+    """Posibles brotes: enfermedades o lesiones repetidas en varios animales en los últimos días"""
+    status = OutbreakService(db).status()
+    
+    if not status.outbreaks and not status.watch:
+        return f"No hay indicios de brotes: ninguna enfermedad se repite en varios animales en los últimos {status.window_days} días."
+    
+    sections = []
+    if status.outbreaks:
+        header = f"🚨 Posibles brotes (al menos {status.min_animals} animales en el rebaño o {status.group_min_animals} en una misma raza/edad, últimos {status.window_days} días):"
+        sections.append(render_lines(header, (render_record(CLUSTER, cluster).rstrip("\n") for cluster in status.outbreaks)))
+    else:
+        sections.append(f"No se supera el umbral de brote en los últimos {status.window_days} días.")
+    
+    if status.watch:
+        sections.append(render_lines("👀 En observación:", (render_record(CLUSTER, cluster).rstrip("\n") for cluster in status.watch)))
+    
+    return join_sections(sections)
+
+
+def get_animals_in_withdrawal_tool(db: Session, on_date: Optional[str] = None, product: Optional[str] = None) -> str:
+    """Animales en periodo de retiro de medicamentos (leche o carne) en una fecha"""
+    try:
+        day = date.fromisoformat(on_date) if on_date else today()
+    except ValueError:
+        return f"Error: La fecha debe tener formato YYYY-MM-DD. Recibido: {on_date}"
+    try:
+        product_enum = WithdrawalProductEnum(product.lower()) if product else None
+    except ValueError:
+        return f"Error: Producto inválido '{product}'. Use 'milk' (leche) o 'meat' (carne)."
+    
+    items = WithdrawalRepository(db).get_in_withdrawal(day, product_enum)
+    label = {"milk": "leche", "meat": "carne"}
+    scope = f" de {label[product_enum.value]}" if product_enum else ""
+    
+    if not items:
+        return f"Ningún animal está en periodo de retiro{scope} el {day}."
+    
+    by_animal = {}
+    for item in items:
+        by_animal.setdefault((item.lote, item.cattle_name), []).append(item)
+    
+    lines = []
+    for (lote, name), treatments in by_animal.items():
+        lines.append(f"🐮 {name} (Lote: {lote})")
+        lines.extend(
+            f"   {label[item.product.value].capitalize()}: {item.medicine}, libre desde {item.clear_date} ({item.days_left} días)"
+            for item in treatments
+        )
+    
+    return render_lines(f"⚠️ Animales en periodo de retiro{scope} el {day}: {len(by_animal)}\n", lines)
+
+
+def get_protocol_plan_tool(db: Session, days: int = 30) -> str:
+    """Dosis que tocan según los protocolos de vacunación en los próximos días (vista previa, no crea recordatorios)"""
+    if days < 0 or days > 365:
+        return "Error: El número de días debe estar entre 0 y 365."
+    
+    plan = ProtocolRepository(db).preview_plan(horizon_days=days, limit=50)
+    if not plan.total:
+        return f"No hay dosis pendientes de programar según los protocolos hasta el {plan.until}."
+    
+    current_date = today()
+    lines = [f"   {name}: {count}" for name, count in sorted(plan.by_protocol.items())]
+    lines.append("")
+    for dose in plan.items:
+        overdue = " ⚠️ atrasada" if dose.due_date < current_date else ""
+        lines.append(f"📅 {dose.due_date} - {dose.cattle_name} (Lote: {dose.lote}): {dose.vaccine_name}, dosis {dose.dose_number}{overdue}")
+    footer = f"\n... y {plan.total - len(plan.items)} dosis más." if plan.total > len(plan.items) else None
+    
+    return render_lines(f"💉 Dosis según protocolos hasta el {plan.until}: {plan.total}", lines, footer)
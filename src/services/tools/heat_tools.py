@@ -1,111 +1,162 @@
 # src/services/tools/heat_tools.py
-from datetime import date
+from typing import List
 from sqlalchemy.orm import Session
 
-from src.repositories import HeatEventRepository, CattleRepository
+from src.repositories import ReadRepository
+from src.services.digest_service import DigestService
+from src.services.heat_prediction_service import HeatPredictionService
+from src.services.tools.common import find_cattle, cattle_not_found_message, resolve_lotes, missing_lotes_message
+from src.services.tools.render import Field, RowTemplate, join_sections, render_record, render_rows, yes_no
+
+
+def _confirmed(event):
+    """Resultado del chequeo de preñez, solo si la hembra fue inseminada y ya se chequeó"""
+    if event.was_inseminated and event.pregnancy_confirmed is not None:
+        return event.pregnancy_confirmed
+    return None
+
+
+LAST_HEAT = RowTemplate(
+    fields=(
+        Field("Fecha", "heat_date"),
+        Field("Permite monta", lambda heat, day: yes_no(heat.allows_mounting)),
+        Field("Inseminada", lambda heat, day: heat.insemination_date if heat.was_inseminated else None),
+        Field("Embarazo confirmado", lambda heat, day: None if _confirmed(heat) is None else yes_no(_confirmed(heat))),
+        Field("Comportamiento", "comportamiento"),
+    ),
+    field_prefix="- "
+)
+
+HEAT_EVENT = RowTemplate(
+    icon="📅",
+    title=lambda event, day: str(event.heat_date),
+    title_label="Fecha",
+    fields=(
+        Field("Permite monta", lambda event, day: yes_no(event.allows_mounting)),
+        Field("Inseminada", lambda event, day: event.insemination_date if event.was_inseminated else None),
+        Field("Embarazo", lambda event, day: None if _confirmed(event) is None else "Confirmado" if _confirmed(event) else "No confirmado"),
+    )
+)
+
+PREGNANCY = RowTemplate(
+    icon="🐮",
+    title=lambda event, day: f"{event.cattle_name} (Lote: {event.lote})",
+    title_label="Animal",
+    fields=(
+        Field("Fecha de celo", "heat_date"),
+        Field("Fecha de inseminación", "insemination_date"),
+        Field("Días de gestación", lambda event, day: f"~{(day - event.insemination_date).days} días" if event.insemination_date else None),
+    )
+)
+
+PREGNANCY_CHECK = RowTemplate(
+    icon="🐮",
+    title=lambda check, day: f"{check.cattle_name} (Lote: {check.lote})",
+    title_label="Animal",
+    fields=(
+        Field("Inseminada", lambda check, day: f"{check.insemination_date} (hace {(day - check.insemination_date).days} días)"),
+    )
+)
+
+
+def _confidence_level(confidence: float) -> str:
+    return "alta" if confidence >= 0.6 else "media" if confidence >= 0.35 else "baja"
+
+
+EXPECTED_HEAT = RowTemplate(
+    icon="🐮",
+    title=lambda prediction, day: f"{prediction.cattle_name} (Lote: {prediction.lote})",
+    title_label="Animal",
+    fields=(
+        Field("Fecha esperada", "expected_date"),
+        Field("Último celo", "last_heat_date"),
+        Field("Ciclo", lambda prediction, day: f"{prediction.cycle_days} días ({prediction.observed_cycles} ciclos observados)"),
+        Field("Confianza", lambda prediction, day: f"{_confidence_level(prediction.confidence)} ({prediction.confidence})"),
+    )
+)
+
+
+def _format_last_heat(cattle, last_heat) -> str:
+    return render_record(LAST_HEAT, last_heat, f"Último celo de {cattle.name} (Lote: {cattle.lote}):")
 
 
 def get_heat_events_by_cattle_tool(db: Session, lote: str) -> str:
     """Obtiene el historial de eventos de celo de un ganado"""
-    cattle_repo = CattleRepository(db)
-    cattle = cattle_repo.get_by_lote(lote)
+    cattle = find_cattle(db, lote)
     
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
+        return cattle_not_found_message(db, lote)
     
-    heat_repo = HeatEventRepository(db)
-    events = heat_repo.get_by_cattle_id(cattle.id, limit=20)
+    events = ReadRepository(db).heat_events_by_cattle_ids([cattle.id], per_cattle=20)
     
     if not events:
-        return f"El ganado {cattle.name} (Lote: {lote}) no tiene eventos de celo registrados."
-    
-    result = f"Historial de celo de {cattle.name} (Lote: {lote}):\n\n"
-    for event in events:
-        result += f"📅 {event.heat_date}\n"
-        result += f"   Permite monta: {'Sí' if event.allows_mounting else 'No'}\n"
-        if event.was_inseminated:
-            result += f"   ✅ Inseminada: {event.insemination_date}\n"
-            if event.pregnancy_confirmed is not None:
-                status = "✅ Confirmado" if event.pregnancy_confirmed else "❌ No confirmado"
-                result += f"   Embarazo: {status}\n"
-        result += "\n"
+        return f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene eventos de celo registrados."
     
-    return result
+    return render_rows(HEAT_EVENT, events, f"Historial de celo de {cattle.name} (Lote: {cattle.lote}):")
 
 
 def get_pregnant_cattle_tool(db: Session) -> str:
     """Obtiene la lista de ganado con embarazo confirmado"""
-    heat_repo = HeatEventRepository(db)
-    cattle_repo = CattleRepository(db)
-    
-    events = heat_repo.get_confirmed_pregnancies(limit=50)
+    events = ReadRepository(db).confirmed_pregnancies(limit=50)
     
     if not events:
         return "No hay ganado con embarazo confirmado."
     
-    result = "Ganado con embarazo confirmado:\n\n"
-    for event in events:
-        cattle = cattle_repo.get_by_id(event.cattle_id)
-        result += f"🐮 {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"   Fecha de celo: {event.heat_date}\n"
-        result += f"   Fecha de inseminación: {event.insemination_date}\n"
-        
-        if event.insemination_date:
-            days_pregnant = (date.today() - event.insemination_date).days
-            result += f"   Días de gestación: ~{days_pregnant} días\n"
-        
-        result += "\n"
-    
-    return result
+    return render_rows(PREGNANCY, events, "Ganado con embarazo confirmado:")
 
 
 def get_pending_pregnancy_checks_tool(db: Session) -> str:
     """Obtiene ganado inseminado que necesita confirmación de embarazo"""
-    heat_repo = HeatEventRepository(db)
-    cattle_repo = CattleRepository(db)
-    
-    events = heat_repo.get_pending_pregnancy_check(days_after_insemination=45, limit=50)
+    checks = DigestService(db).get_today().pending_pregnancy_checks
     
-    if not events:
+    if not checks:
         return "No hay ganado pendiente de confirmación de embarazo."
     
-    result = "Ganado que necesita confirmación de embarazo:\n\n"
-    for event in events:
-        cattle = cattle_repo.get_by_id(event.cattle_id)
-        days_since = (date.today() - event.insemination_date).days
-        
-        result += f"🐮 {cattle.name} (Lote: {cattle.lote})\n"
-        result += f"   Inseminada: {event.insemination_date} (hace {days_since} días)\n"
-        result += f"   ⚠️ Requiere chequeo de embarazo\n"
-        result += "\n"
-    
-    return result
+    return render_rows(PREGNANCY_CHECK, checks, "⚠️ Ganado que necesita chequeo de embarazo:")
 
 
 def get_last_heat_tool(db: Session, lote: str) -> str:
     """Obtiene el último evento de celo de un ganado"""
-    cattle_repo = CattleRepository(db)
-    cattle = cattle_repo.get_by_lote(lote)
+    cattle = find_cattle(db, lote)
     
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
-    
-    heat_repo = HeatEventRepository(db)
-    last_heat = heat_repo.get_last_heat(cattle.id)
+        return cattle_not_found_message(db, lote)
     
-    if not last_heat:
-        return f"El ganado {cattle.name} (Lote: {lote}) no tiene eventos de celo registrados."
+    heats = ReadRepository(db).heat_events_by_cattle_ids([cattle.id], per_cattle=1)
     
-    result = f"Último celo de {cattle.name} (Lote: {lote}):\n"
-    result += f"- Fecha: {last_heat.heat_date}\n"
-    result += f"- Permite monta: {'Sí' if last_heat.allows_mounting else 'No'}\n"
+    if not heats:
+        return f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene eventos de celo registrados."
     
-    if last_heat.was_inseminated:
-        result += f"- Inseminada: {last_heat.insemination_date}\n"
-        if last_heat.pregnancy_confirmed is not None:
-            result += f"- Embarazo confirmado: {'Sí' if last_heat.pregnancy_confirmed else 'No'}\n"
+    return _format_last_heat(cattle, heats[0])
+
+
+def get_last_heat_for_lotes_tool(db: Session, lotes: List[str]) -> str:
+    """Último celo de varios ganados con una consulta para los lotes y otra para los celos"""
+    cattle_list, missing = resolve_lotes(db, lotes)
+    if not cattle_list:
+        return missing_lotes_message(missing)
+    
+    heats = ReadRepository(db).heat_events_by_cattle_ids([c.id for c in cattle_list], per_cattle=1)
+    by_cattle = {heat.cattle_id: heat for heat in heats}
+    
+    sections = []
+    for cattle in cattle_list:
+        last_heat = by_cattle.get(cattle.id)
+        if last_heat:
+            sections.append(_format_last_heat(cattle, last_heat))
+        else:
+            sections.append(f"El ganado {cattle.name} (Lote: {cattle.lote}) no tiene eventos de celo registrados.\n")
+    if missing:
+        sections.append(missing_lotes_message(missing))
+    
+    return join_sections(sections)
+
+
+def get_expected_heats_tool(db: Session, days: int = 7) -> str:
+    """Hembras que se espera entren en celo en los próximos X días, según su historial de ciclos"""
+    predictions = HeatPredictionService(db).expected_in(days)
     
-    if last_heat.comportamiento:
-        result += f"- Comportamiento: {last_heat.comportamiento}\n"
+    if not predictions:
+        return f"No se esperan celos en los próximos {days} días."
     
-    return result
+    return render_rows(EXPECTED_HEAT, predictions, f"Celos esperados en los próximos {days} días:")
@@ -0,0 +1,108 @@
+# src/services/tools/payload.py
+"""
+Respuesta de las herramientas para la segunda llamada al modelo.
+
+Las filas estructuradas (RowsPart) se envían como tabla: una línea con los nombres de las
+columnas y una línea por fila, sin iconos ni etiquetas repetidas, y sin las columnas que
+están vacías en todas las filas. El texto libre y las cabeceras se envían sin líneas en blanco
+ni emojis, que solo decoran el texto para las personas. El total se recorta al presupuesto de
+tokens con un aviso explícito de cuántas líneas quedaron fuera.
+"""
+import math
+import re
+from typing import Any, Iterator, List, NamedTuple, Tuple
+
+from src.services.tools.render import RowsPart, ToolOutput, field_getters
+
+
+# Caracteres por token: aproximación para texto en español con fechas y números,
+# sin un tokenizador local de Gemini
+CHARS_PER_TOKEN = 4
+SEPARATOR = " | "
+
+# Emojis y símbolos decorativos (con su selector de variante y el espacio que los sigue)
+DECORATION = re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]+ ?")
+
+
+class ToolPayload(NamedTuple):
+    text: str
+    tokens: int
+    # Líneas de datos de la respuesta completa y las que entraron en el presupuesto
+    rows: int
+    rows_sent: int
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _cell(value: Any) -> str:
+    if value is None or value == "":
+        return ""
+    return str(value).replace("\n", " ").replace("|", "/")
+
+
+def table(part: RowsPart) -> Tuple[List[str], List[List[str]]]:
+    """Columnas y celdas de las filas; se quitan las columnas vacías en todas las filas"""
+    template, day = part.template, part.day
+    getters = field_getters(template)
+    columns = [template.title_label or "Registro"] if template.title else []
+    columns.extend(label for label, _, _ in getters)
+    rows = []
+    for row in part.rows:
+        cells = [_cell(template.title(row, day))] if template.title else []
+        cells.extend(_cell(value(row, day) if uses_day else value(row)) for _, value, uses_day in getters)
+        rows.append(cells)
+
+    keep = [index for index in range(len(columns)) if any(cells[index] for cells in rows)]
+    return [columns[index] for index in keep], [[cells[index] for index in keep] for cells in rows]
+
+
+def plain(text: str) -> str:
+    """Texto sin la decoración para las personas"""
+    return DECORATION.sub("", text)
+
+
+def _lines(result: str) -> Iterator[Tuple[str, bool]]:
+    """Líneas de la respuesta para el modelo; el booleano indica si es una línea de datos"""
+    parts = result.parts if isinstance(result, ToolOutput) else (result,)
+    for part in parts:
+        if isinstance(part, RowsPart):
+            columns, rows = table(part)
+            if part.header:
+                yield plain(part.header), False
+            yield SEPARATOR.join(columns), False
+            for cells in rows:
+                yield SEPARATOR.join(cells), True
+            if part.footer:
+                yield plain(part.footer).strip(), False
+        else:
+            for line in part.splitlines():
+                line = plain(line)
+                if line.strip():
+                    yield line, True
+
+
+def build_payload(result: str, token_budget: int) -> ToolPayload:
+    """Respuesta compacta para el modelo, recortada a `token_budget` tokens (estimados)"""
+    # Se reserva espacio para el aviso de recorte
+    budget = token_budget * CHARS_PER_TOKEN - 80
+    output: List[str] = []
+    used = 0
+    rows = rows_sent = 0
+    full = False
+    for line, is_row in _lines(result):
+        rows += is_row
+        if full:
+            continue
+        if used + len(line) + 1 > budget:
+            full = True
+            continue
+        output.append(line)
+        used += len(line) + 1
+        rows_sent += is_row
+
+    if rows > rows_sent:
+        output.append(f"... y {rows - rows_sent} líneas más que no se enviaron (límite de {token_budget} tokens)")
+    text = "\n".join(output)
+    return ToolPayload(text, estimate_tokens(text), rows, rows_sent)
@@ -1,13 +1,66 @@
 # src/services/tools/reminder_tools.py
-from datetime import date
+from datetime import date, timedelta
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
-from src.repositories import ReminderRepository, CattleRepository
-from src.schemas.reminder import ReminderCreate, ReminderTypeEnum
+from src.repositories import ReadRepository, ReminderRepository
+from src.core.recurrence import RecurrenceFrequencyEnum
+from src.schemas.reminder import ReminderBulkResponse, ReminderCreate, ReminderRecurrenceCreate, ReminderTypeEnum
+from src.services.digest_service import DigestService
+from src.services.tools.common import find_cattle, cattle_not_found_message, resolve_lotes, missing_lotes_message
+from src.services.tools.render import Field, RowTemplate, join_sections, render_rows, today
 
 
-def create_reminder_tool(db: Session, title: str, date_str: str, type_str: str = "other", description: str = None, cattle_lote: str = None) -> str:
-    """Crea un nuevo recordatorio"""
+def _reminder_template(icon: str, when, *extra: Field) -> RowTemplate:
+    """Plantilla de recordatorio: icono y texto de la fecha propios de cada listado, tipo y descripción comunes"""
+    return RowTemplate(
+        icon=icon,
+        title=lambda reminder, day: reminder.title,
+        title_label="Recordatorio",
+        fields=(
+            Field("Fecha", when),
+            Field("Tipo", "reminder_type"),
+            Field("Descripción", "description"),
+            *extra,
+        )
+    )
+
+
+CATTLE_REMINDER = RowTemplate(
+    icon="📋",
+    title=lambda reminder, day: reminder.title,
+    title_label="Recordatorio",
+    fields=(
+        Field("Fecha", "reminder_date"),
+        Field("Estado", "status"),
+        Field("Tipo", "reminder_type"),
+        Field("Descripción", "description"),
+    )
+)
+
+PENDING_REMINDER = _reminder_template(
+    "📋",
+    lambda reminder, day: f"{reminder.reminder_date} ({'VENCIDO' if reminder.reminder_date < day else f'en {(reminder.reminder_date - day).days} días'})"
+)
+
+UPCOMING_REMINDER = _reminder_template(
+    "📋",
+    lambda reminder, day: f"{reminder.reminder_date} (en {(reminder.reminder_date - day).days} días)",
+    Field("Se repite", lambda reminder, day: "sí" if reminder.recurring else None)
+)
+
+OVERDUE_REMINDER = _reminder_template(
+    "❗",
+    lambda reminder, day: f"{reminder.reminder_date} (hace {(day - reminder.reminder_date).days} días)"
+)
+
+
+def _format_cattle_reminders(cattle, reminders) -> str:
+    return render_rows(CATTLE_REMINDER, reminders, f"Recordatorios de {cattle.name} (Lote: {cattle.lote}):")
+
+
+def create_reminder_tool(db: Session, title: str, date_str: str, type_str: str = "other", description: str = None, cattle_lote: str = None, repeat: str = None, until_str: str = None) -> str:
+    """Crea un nuevo recordatorio, opcionalmente recurrente (repeat: daily, weekly, monthly, yearly)"""
     try:
         # Validar fecha
         try:
@@ -21,13 +74,28 @@ def create_reminder_tool(db: Session, title: str, date_str: str, type_str: str =
         except ValueError:
             valid_types = [t.value for t in ReminderTypeEnum]
             return f"Error: Tipo inválido '{type_str}'. Tipos válidos: {', '.join(valid_types)}"
+        
+        recurrence = None
+        if repeat:
+            try:
+                frequency = RecurrenceFrequencyEnum(repeat.lower())
+            except ValueError:
+                valid_frequencies = [f.value for f in RecurrenceFrequencyEnum]
+                return f"Error: Repetición inválida '{repeat}'. Valores válidos: {', '.join(valid_frequencies)}"
+            try:
+                until = date.fromisoformat(until_str) if until_str else None
+            except ValueError:
+                return f"Error: La fecha final debe tener formato YYYY-MM-DD. Recibido: {until_str}"
+            if until and until < reminder_date:
+                return "Error: La fecha final de la repetición no puede ser anterior a la primera fecha."
+            recurrence = ReminderRecurrenceCreate(frequency=frequency, until=until)
             
         cattle_id = None
         if cattle_lote:
-            cattle_repo = CattleRepository(db)
-            cattle = cattle_repo.get_by_lote(cattle_lote)
+            # Al escribir no se adivina el animal: un nombre parecido solo se sugiere
+            cattle = find_cattle(db, cattle_lote, exact=True)
             if not cattle:
-                return f"Error: No se encontró ganado con el lote '{cattle_lote}'"
+                return f"Error: {cattle_not_found_message(db, cattle_lote)} No se creó el recordatorio; indica el lote o el nombre completo."
             cattle_id = cattle.id
             
         reminder_data = ReminderCreate(
@@ -35,12 +103,17 @@ def create_reminder_tool(db: Session, title: str, date_str: str, type_str: str =
             description=description,
             reminder_date=reminder_date,
             reminder_type=reminder_type,
-            cattle_id=cattle_id
+            cattle_id=cattle_id,
+            recurrence=recurrence
         )
         
         repo = ReminderRepository(db)
         new_reminder = repo.create(reminder_data)
         
+        if recurrence:
+            labels = {"daily": "cada día", "weekly": "cada semana", "monthly": "cada mes", "yearly": "cada año"}
+            end = f" hasta el {recurrence.until}" if recurrence.until else ""
+            return f"✅ Recordatorio recurrente creado: '{new_reminder.title}' {labels[recurrence.frequency.value]} desde el {new_reminder.reminder_date}{end}"
         return f"✅ Recordatorio creado: '{new_reminder.title}' para el {new_reminder.reminder_date}"
         
     except Exception as e:
@@ -49,25 +122,12 @@ def create_reminder_tool(db: Session, title: str, date_str: str, type_str: str =
 
 def get_all_reminders_tool(db: Session) -> str:
     """Obtiene todos los recordatorios pendientes"""
-    repo = ReminderRepository(db)
-    reminders = repo.get_pending(limit=50)
+    reminders = ReadRepository(db).pending_reminders(limit=50)
     
     if not reminders:
         return "No hay recordatorios pendientes."
     
-    result = "Recordatorios pendientes:\n\n"
-    for reminder in reminders:
-        days_until = (reminder.reminder_date - date.today()).days
-        status_text = "⚠️ VENCIDO" if days_until < 0 else f"en {days_until} días"
-        
-        result += f"📋 {reminder.title}\n"
-        result += f"   Fecha: {reminder.reminder_date} ({status_text})\n"
-        result += f"   Tipo: {reminder.reminder_type}\n"
-        if reminder.description:
-            result += f"   Descripción: {reminder.description}\n"
-        result += "\n"
-    
-    return result
+    return render_rows(PENDING_REMINDER, reminders, "Recordatorios pendientes:")
 
 
 def get_upcoming_reminders_tool(db: Session, days: int = 7) -> str:
@@ -78,64 +138,158 @@ def get_upcoming_reminders_tool(db: Session, days: int = 7) -> str:
     if not reminders:
         return f"No hay recordatorios para los próximos {days} días."
     
-    result = f"Recordatorios para los próximos {days} días:\n\n"
-    for reminder in reminders:
-        days_until = (reminder.reminder_date - date.today()).days
-        
-        result += f"📋 {reminder.title}\n"
-        result += f"   Fecha: {reminder.reminder_date} (en {days_until} días)\n"
-        result += f"   Tipo: {reminder.reminder_type}\n"
-        if reminder.description:
-            result += f"   Descripción: {reminder.description}\n"
-        result += "\n"
-    
-    return result
+    return render_rows(UPCOMING_REMINDER, reminders, f"Recordatorios para los próximos {days} días:")
 
 
 def get_overdue_reminders_tool(db: Session) -> str:
     """Obtiene recordatorios vencidos"""
-    repo = ReminderRepository(db)
-    reminders = repo.get_overdue(limit=50)
+    reminders = DigestService(db).get_today().overdue_reminders
     
     if not reminders:
         return "No hay recordatorios vencidos. ¡Todo al día!"
     
-    result = "⚠️ Recordatorios VENCIDOS:\n\n"
-    for reminder in reminders:
-        days_overdue = (date.today() - reminder.reminder_date).days
-        
-        result += f"❗ {reminder.title}\n"
-        result += f"   Fecha: {reminder.reminder_date} (hace {days_overdue} días)\n"
-        result += f"   Tipo: {reminder.reminder_type}\n"
-        if reminder.description:
-            result += f"   Descripción: {reminder.description}\n"
-        result += "\n"
-    
-    return result
+    return render_rows(OVERDUE_REMINDER, reminders, "⚠️ Recordatorios VENCIDOS:")
 
 
 def get_reminders_by_cattle_tool(db: Session, lote: str) -> str:
     """Obtiene recordatorios de un ganado específico"""
-    cattle_repo = CattleRepository(db)
-    cattle = cattle_repo.get_by_lote(lote)
+    cattle = find_cattle(db, lote)
     
     if not cattle:
-        return f"No se encontró ganado con el lote '{lote}'."
+        return cattle_not_found_message(db, lote)
     
-    reminder_repo = ReminderRepository(db)
-    reminders = reminder_repo.get_by_cattle_id(cattle.id, limit=20)
+    reminders = ReadRepository(db).reminders_by_cattle_ids([cattle.id], per_cattle=20)
     
     if not reminders:
-        return f"No hay recordatorios para {cattle.name} (Lote: {lote})."
+        return f"No hay recordatorios para {cattle.name} (Lote: {cattle.lote})."
+    
+    return _format_cattle_reminders(cattle, reminders)
+
+
+def get_reminders_for_lotes_tool(db: Session, lotes: List[str]) -> str:
+    """Recordatorios de varios ganados con una consulta para los lotes y otra para los recordatorios"""
+    cattle_list, missing = resolve_lotes(db, lotes)
+    if not cattle_list:
+        return missing_lotes_message(missing)
     
-    result = f"Recordatorios de {cattle.name} (Lote: {lote}):\n\n"
+    reminders = ReadRepository(db).reminders_by_cattle_ids([c.id for c in cattle_list], per_cattle=20)
+    by_cattle = {}
     for reminder in reminders:
-        result += f"📋 {reminder.title}\n"
-        result += f"   Fecha: {reminder.reminder_date}\n"
-        result += f"   Estado: {reminder.status}\n"
-        result += f"   Tipo: {reminder.reminder_type}\n"
-        if reminder.description:
-            result += f"   Descripción: {reminder.description}\n"
-        result += "\n"
-    
-    return result
+        by_cattle.setdefault(reminder.cattle_id, []).append(reminder)
+    
+    sections = []
+    for cattle in cattle_list:
+        cattle_reminders = by_cattle.get(cattle.id)
+        if cattle_reminders:
+            sections.append(_format_cattle_reminders(cattle, cattle_reminders))
+        else:
+            sections.append(f"No hay recordatorios para {cattle.name} (Lote: {cattle.lote}).\n")
+    if missing:
+        sections.append(missing_lotes_message(missing))
+    
+    return join_sections(sections)
+
+
+def _parse_bulk_filter(
+    db: Session,
+    type_str: Optional[str],
+    lotes: Optional[List[str]],
+    due_today: bool,
+    overdue_only: bool,
+    date_from: Optional[str],
+    date_to: Optional[str]
+):
+    """
+    Convierte los argumentos de las herramientas masivas en filtros del repositorio.
+    Devuelve (filtros, lotes que no existen, error)
+    """
+    filters = {"reminder_type": None, "lotes": None, "date_from": None, "date_to": None}
+    missing: List[str] = []
+    if lotes:
+        # Solo coincidencias exactas: una operación masiva no debe caer en el animal equivocado
+        cattle_list, missing = resolve_lotes(db, lotes, exact=True)
+        if not cattle_list:
+            return None, missing, f"Error: {missing_lotes_message(missing)} No se modificó ningún recordatorio."
+        filters["lotes"] = [cattle.lote for cattle in cattle_list]
+    
+    if type_str:
+        try:
+            filters["reminder_type"] = ReminderTypeEnum(type_str.lower())
+        except ValueError:
+            valid_types = [t.value for t in ReminderTypeEnum]
+            return None, missing, f"Error: Tipo inválido '{type_str}'. Tipos válidos: {', '.join(valid_types)}"
+    
+    try:
+        if date_from:
+            filters["date_from"] = date.fromisoformat(date_from)
+        if date_to:
+            filters["date_to"] = date.fromisoformat(date_to)
+    except ValueError:
+        return None, missing, "Error: Las fechas deben tener formato YYYY-MM-DD."
+    
+    current_date = today()
+    if due_today:
+        filters["date_from"] = filters["date_to"] = current_date
+    elif overdue_only:
+        filters["date_to"] = current_date - timedelta(days=1)
+    
+    if not any(filters.values()):
+        return None, missing, "Error: Indica al menos un filtro (tipo, lotes, fechas, hoy o vencidos) para no afectar todos los recordatorios."
+    
+    return filters, missing, None
+
+
+def _bulk_reply(result: ReminderBulkResponse, message: str, missing: List[str], skipped_reason: str) -> str:
+    """
+    Resultado de una operación masiva, avisando de las series que coinciden con el filtro
+    pero no se modificaron y de los lotes pedidos que no existen
+    """
+    lines = [message if result.updated else "No hay recordatorios pendientes que cumplan ese filtro."]
+    if result.series_skipped:
+        lines.append(f"⚠️ {result.series_skipped} recordatorios recurrentes no se modificaron: {skipped_reason}")
+    if missing:
+        lines.append(missing_lotes_message(missing))
+    return "\n".join(lines)
+
+
+def complete_reminders_tool(db: Session, type_str: str = None, lotes: List[str] = None, due_today: bool = False, overdue_only: bool = False, date_from: str = None, date_to: str = None) -> str:
+    """Completa en una sola operación los recordatorios pendientes (y las fechas de las series) que cumplan el filtro"""
+    filters, missing, error = _parse_bulk_filter(db, type_str, lotes, due_today, overdue_only, date_from, date_to)
+    if error:
+        return error
+    
+    result = ReminderRepository(db).complete_many(**filters)
+    return _bulk_reply(
+        result, f"✅ {result.updated} recordatorios marcados como completados.", missing,
+        "indica una fecha final para completar sus fechas hasta ese día."
+    )
+
+
+def cancel_reminders_tool(db: Session, type_str: str = None, lotes: List[str] = None, due_today: bool = False, overdue_only: bool = False, date_from: str = None, date_to: str = None) -> str:
+    """Cancela en una sola operación los recordatorios pendientes que cumplan el filtro; con fechas, en las series solo esas fechas"""
+    filters, missing, error = _parse_bulk_filter(db, type_str, lotes, due_today, overdue_only, date_from, date_to)
+    if error:
+        return error
+    
+    result = ReminderRepository(db).cancel_many(**filters)
+    return _bulk_reply(
+        result, f"✅ {result.updated} recordatorios cancelados.", missing,
+        "indica una fecha final para cancelar sus fechas hasta ese día, o cancela la serie sin fechas."
+    )
+
+
+def reschedule_reminders_tool(db: Session, days: int, type_str: str = None, lotes: List[str] = None, due_today: bool = False, overdue_only: bool = False, date_from: str = None, date_to: str = None) -> str:
+    """Reprograma en una sola operación los recordatorios pendientes que cumplan el filtro (las series no se mueven)"""
+    if not days:
+        return "Error: Indica cuántos días mover los recordatorios (positivo para posponer, negativo para adelantar)."
+    
+    filters, missing, error = _parse_bulk_filter(db, type_str, lotes, due_today, overdue_only, date_from, date_to)
+    if error:
+        return error
+    
+    result = ReminderRepository(db).reschedule_many(days, **filters)
+    direction = "pospuestos" if days > 0 else "adelantados"
+    return _bulk_reply(
+        result, f"✅ {result.updated} recordatorios {direction} {abs(days)} días.", missing,
+        "las series no se reprograman en bloque; cambia la fecha de cada una por separado."
+    )
@@ -0,0 +1,173 @@
+# src/services/tools/render.py
+"""
+Formato común de las respuestas de las herramientas.
+
+Cada herramienta declara una plantilla por tipo de fila (título y campos) y la salida se
+arma en una lista que se une una sola vez. La fecha de hoy se fija una vez por petición
+del chat. El modo compacto escribe una fila por línea, para que el modelo lea menos texto.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from src.core.config import settings
+
+
+_request_today: ContextVar[Optional[date]] = ContextVar("request_today", default=None)
+_request_compact: ContextVar[Optional[bool]] = ContextVar("request_compact", default=None)
+
+
+def today() -> date:
+    """Fecha de hoy fijada para la petición en curso (o la del sistema fuera de una petición)"""
+    return _request_today.get() or date.today()
+
+
+def is_compact() -> bool:
+    compact = _request_compact.get()
+    return settings.TOOL_OUTPUT_COMPACT if compact is None else compact
+
+
+@contextmanager
+def request_scope(compact: Optional[bool] = None) -> Iterator[None]:
+    """Fija la fecha de hoy y el modo de salida para todas las herramientas de una petición"""
+    today_token = _request_today.set(date.today())
+    compact_token = _request_compact.set(compact)
+    try:
+        yield
+    finally:
+        _request_today.reset(today_token)
+        _request_compact.reset(compact_token)
+
+
+class Field(NamedTuple):
+    """
+    Campo de una fila: etiqueta y valor. El valor es el nombre de un atributo de la fila o una
+    función (fila, hoy) -> valor. Los valores vacíos (None, '') no se muestran.
+    """
+    label: str
+    value: Union[str, Callable[[Any, date], Any]]
+
+
+class RowTemplate(NamedTuple):
+    # Título de cada fila; sin título, la fila son solo sus campos
+    title: Optional[Callable[[Any, date], str]] = None
+    fields: Tuple[Field, ...] = ()
+    # Prefijo de cada campo en el modo normal
+    field_prefix: str = "   "
+    # Icono delante del título en el texto; no se envía al modelo
+    icon: str = ""
+    # Nombre de la columna del título en la tabla que recibe el modelo (ver payload)
+    title_label: str = ""
+
+
+class RowsPart(NamedTuple):
+    """Filas de una respuesta con su plantilla, para volver a serializarlas en forma de tabla"""
+    template: RowTemplate
+    rows: Sequence[Any]
+    header: Optional[str]
+    footer: Optional[str]
+    day: date
+
+
+class ToolOutput(str):
+    """
+    Texto de la respuesta de una herramienta que además conserva sus partes: filas
+    estructuradas (RowsPart) y texto libre. Es un str, así que se usa como cualquier respuesta.
+    """
+    parts: Tuple[Union[str, RowsPart], ...]
+
+    def __new__(cls, text: str, parts: Iterable[Union[str, RowsPart]]):
+        output = super().__new__(cls, text)
+        output.parts = tuple(parts)
+        return output
+
+
+def yes_no(value: Optional[bool]) -> str:
+    return "Sí" if value else "No"
+
+
+def field_getters(template: RowTemplate) -> List[Tuple[str, Callable, bool]]:
+    """
+    Etiqueta de cada campo y cómo leer su valor, una vez por respuesta.
+    Los atributos se leen con attrgetter, sin una llamada Python por campo y fila.
+    """
+    return [
+        (field.label, attrgetter(field.value), False) if isinstance(field.value, str)
+        else (field.label, field.value, True)
+        for field in template.fields
+    ]
+
+
+def _render(template: RowTemplate, rows: Iterable[Any], lines: List[str], spaced: bool, day: date) -> List[str]:
+    compact = is_compact()
+    prefix = "" if compact else template.field_prefix
+    labels = [(f"{prefix}{label}: ", value, uses_day) for label, value, uses_day in field_getters(template)]
+    title = template.title
+    icon = f"{template.icon} " if template.icon else ""
+    append = lines.append
+    for row in rows:
+        entries = [f"{icon}{title(row, day)}"] if title else []
+        for label, value, uses_day in labels:
+            text = value(row, day) if uses_day else value(row)
+            # 0 y False son valores reales; solo se omiten los vacíos
+            if text is not None and text != "":
+                entries.append(f"{label}{text}")
+        if compact:
+            append(" | ".join(entries))
+        else:
+            lines.extend(entries)
+            if spaced:
+                append("")
+    return lines
+
+
+def render_record(template: RowTemplate, row: Any, header: Optional[str] = None) -> ToolOutput:
+    """Un solo registro: cabecera opcional y los campos de la plantilla"""
+    day = today()
+    lines = _render(template, (row,), [header] if header else [], False, day)
+    lines.append("")
+    return ToolOutput("\n".join(lines), [RowsPart(template, (row,), header, None, day)])
+
+
+def render_rows(
+    template: RowTemplate,
+    rows: Sequence[Any],
+    header: str,
+    footer: Optional[str] = None
+) -> ToolOutput:
+    """
+    Cabecera y una entrada por fila. En modo normal cada fila es un bloque separado por una
+    línea en blanco; en modo compacto, una línea.
+    """
+    day = today()
+    lines = _render(template, rows, [header] if is_compact() else [header, ""], True, day)
+    if footer:
+        lines.append(footer)
+    lines.append("")
+    return ToolOutput("\n".join(lines), [RowsPart(template, rows, header, footer, day)])
+
+
+def render_lines(header: Optional[str], lines: Iterable[str], footer: Optional[str] = None) -> str:
+    """
+    Cabecera y líneas ya formateadas (listados que ocupan una línea por fila en ambos modos).
+    En modo compacto se quitan las líneas en blanco de separación.
+    """
+    output = [header] if header else []
+    output.extend(lines)
+    if footer:
+        output.append(footer)
+    if is_compact():
+        output = [line.strip("\n") for line in output if line.strip()]
+    return "\n".join(output) + "\n"
+
+
+def join_sections(sections: Iterable[str]) -> ToolOutput:
+    """Varias respuestas (una por animal) en una sola salida, conservando sus filas"""
+    sections = list(sections)
+    parts: List[Union[str, RowsPart]] = []
+    for section in sections:
+        parts.extend(section.parts if isinstance(section, ToolOutput) else (section,))
+    text = ("\n" if is_compact() else "\n\n").join(section.rstrip("\n") for section in sections) + "\n"
+    return ToolOutput(text, parts)
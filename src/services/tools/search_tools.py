@@ -0,0 +1,53 @@
+# src/services/tools/search_tools.py
+from datetime import date
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+from src.repositories import SearchRepository
+from src.schemas.search import SearchSourceEnum
+from src.services.tools.common import resolve_lotes, missing_lotes_message
+from src.services.tools.render import is_compact, render_lines
+
+
+SOURCE_LABELS = {SearchSourceEnum.health: "🩺", SearchSourceEnum.heat: "🔥"}
+
+
+def search_events_tool(db: Session, query: str, date_from: str = None, date_to: str = None, lotes: Optional[List[str]] = None, source: str = None) -> str:
+    """Busca texto libre (síntomas, enfermedades, medicamentos, comportamiento) en los eventos de salud y de celo"""
+    try:
+        start = date.fromisoformat(date_from) if date_from else None
+        end = date.fromisoformat(date_to) if date_to else None
+    except ValueError:
+        return f"Error: Las fechas deben tener formato YYYY-MM-DD. Recibido: {date_from} / {date_to}"
+
+    try:
+        source_enum = SearchSourceEnum(source) if source else None
+    except ValueError:
+        return "Error: source debe ser 'health' o 'heat'."
+
+    canonical_lotes = None
+    missing: List[str] = []
+    if lotes:
+        cattle_list, missing = resolve_lotes(db, lotes)
+        if not cattle_list:
+            return missing_lotes_message(missing)
+        canonical_lotes = [cattle.lote for cattle in cattle_list]
+
+    hits = SearchRepository(db).search_events(query, start, end, canonical_lotes, source_enum, limit=20)
+    period = f" entre {start or 'el inicio'} y {end or 'hoy'}" if start or end else ""
+    if not hits:
+        return f"No se encontraron eventos que mencionen '{query}'{period}."
+
+    animals = {hit.lote for hit in hits}
+    separator = " | " if is_compact() else "\n   "
+    lines = [
+        f"{SOURCE_LABELS[hit.source]} {hit.event_date} - {hit.cattle_name} (Lote: {hit.lote}) [{hit.event_type}]{separator}{hit.snippet}"
+        for hit in hits
+    ]
+    footer = f"\n{missing_lotes_message(missing)}" if missing else None
+
+    return render_lines(
+        f"🔍 Eventos que mencionan '{query}'{period}: {len(hits)} en {len(animals)} animales (más relevantes primero)\n",
+        lines,
+        footer
+    )
@@ -0,0 +1,58 @@
+# src/services/tools/weight_tools.py
+from sqlalchemy.orm import Session
+
+from src.repositories import WeightRepository
+from src.services.growth_service import GrowthService
+from src.services.tools.common import find_cattle, cattle_not_found_message
+from src.services.tools.render import render_lines
+
+
+# Rezagados que se listan en la respuesta del agente
+MAX_LISTED = 20
+
+
+def get_weight_history_tool(db: Session, lote: str, limit: int = 10) -> str:
+    """Últimos pesajes de un ganado y su ganancia entre el primero y el último mostrado"""
+    cattle = find_cattle(db, lote)
+    if not cattle:
+        return cattle_not_found_message(db, lote)
+    
+    measurements = WeightRepository(db).get_history(cattle.id, limit)
+    if not measurements:
+        return f"{cattle.name} (Lote: {cattle.lote}) no tiene pesajes registrados."
+    
+    lines = [f"- {measurement.measured_on}: {measurement.weight:.1f} kg" for measurement in measurements]
+    
+    newest, oldest = measurements[0], measurements[-1]
+    days = (newest.measured_on - oldest.measured_on).days
+    footer = None
+    if days > 0:
+        gain = newest.weight - oldest.weight
+        footer = f"\nVariación: {gain:+.1f} kg en {days} días ({gain / days:+.2f} kg/día)"
+    
+    return render_lines(f"⚖️ Pesajes de {cattle.name} (Lote: {cattle.lote}):", lines, footer)
+
+
+def get_growth_report_tool(db: Session, days: int = 90) -> str:
+    """Ganancia diaria media del rebaño en los últimos X días, percentiles y animales rezagados"""
+    report = GrowthService(db).report(days)
+    
+    if not report.animals_analyzed:
+        return f"No hay suficientes pesajes en los últimos {days} días para calcular la ganancia diaria."
+    
+    p = report.percentiles
+    header = f"📈 Crecimiento del {report.start_date} al {report.end_date} ({report.animals_analyzed} animales):"
+    lines = [f"- Ganancia diaria (kg/día): P10 {p['p10']:.2f} | P25 {p['p25']:.2f} | mediana {p['p50']:.2f} | P75 {p['p75']:.2f} | P90 {p['p90']:.2f}"]
+    
+    if not report.underperformers:
+        lines.append("\nNo hay animales rezagados.")
+        return render_lines(header, lines)
+    
+    lines.append(f"\n⚠️ Rezagados (ganancia <= 0 o menor a {report.underperformer_threshold:.2f} kg/día): {len(report.underperformers)}")
+    lines.extend(
+        f"- {animal.cattle_name} (Lote: {animal.lote}): {animal.adg:+.2f} kg/día, {animal.first_weight} → {animal.last_weight} kg"
+        for animal in report.underperformers[:MAX_LISTED]
+    )
+    footer = f"... y {len(report.underperformers) - MAX_LISTED} más" if len(report.underperformers) > MAX_LISTED else None
+    
+    return render_lines(header, lines, footer)
@@ -0,0 +1,7 @@
+# tests/conftest.py
+# Las pruebas cubren funciones puras: no abren conexiones, pero importar src carga la configuración
+import os
+
+os.environ.setdefault("PROJECT_NAME", "Bovara tests")
+os.environ.setdefault("DATABASE_URL", "postgresql+psycopg2://localhost/ganaderia_tests")
+os.environ.setdefault("GOOGLE_API_KEY", "test")
@@ -0,0 +1,56 @@
+# tests/test_activity_detector.py
+from datetime import date, datetime, timedelta
+
+from src.models.activity import ActivityDetectorState
+from src.services.activity_service import (
+    ACTIVITY_BUCKET_HOURS,
+    REFRACTORY_DAYS,
+    SLOTS_PER_DAY,
+    WARMUP_BUCKETS,
+    detect_heats,
+)
+
+
+START = datetime(2026, 1, 1)
+QUIET_STEPS = 300
+HEAT_STEPS = 3000
+
+
+def _buckets(days: int, heat_days=()):
+    """Intervalos con actividad constante y un pico en la franja de las 10:00 de los días indicados"""
+    buckets = []
+    for index in range(days * SLOTS_PER_DAY):
+        start = START + timedelta(hours=ACTIVITY_BUCKET_HOURS * index)
+        heat = index // SLOTS_PER_DAY in heat_days and start.hour == 10
+        buckets.append((start, HEAT_STEPS if heat else QUIET_STEPS))
+    return buckets
+
+
+def test_no_detection_during_warm_up():
+    assert WARMUP_BUCKETS == 3 * SLOTS_PER_DAY
+    state = ActivityDetectorState()
+    assert detect_heats(state, _buckets(3, heat_days=(2,))) == []
+    assert state.buckets_seen == WARMUP_BUCKETS
+    assert state.cusum == 0.0
+
+
+def test_detects_a_peak_after_warm_up():
+    state = ActivityDetectorState()
+    assert detect_heats(state, _buckets(5, heat_days=(3,))) == [(date(2026, 1, 4), 10.0)]
+    assert state.last_detection == date(2026, 1, 4)
+
+
+def test_refractory_period_skips_close_peaks():
+    state = ActivityDetectorState()
+    detections = detect_heats(state, _buckets(20, heat_days=(3, 3 + REFRACTORY_DAYS - 1, 3 + REFRACTORY_DAYS + 4)))
+    assert [day for day, _ in detections] == [date(2026, 1, 4), date(2026, 1, 18)]
+
+
+def test_state_carries_over_between_batches():
+    buckets = _buckets(20, heat_days=(3, 15))
+    whole = detect_heats(ActivityDetectorState(), buckets)
+
+    state = ActivityDetectorState()
+    split = detect_heats(state, buckets[:50]) + detect_heats(state, buckets[50:])
+    assert split == whole
+    assert state.buckets_seen == len(buckets)
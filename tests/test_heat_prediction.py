@@ -0,0 +1,57 @@
+# tests/test_heat_prediction.py
+from datetime import date, timedelta
+from uuid import UUID
+
+from src.core.reproduction import HEAT_CYCLE_DAYS
+from src.services.heat_prediction_service import predict_heats
+
+
+TODAY = date(2026, 3, 1)
+
+
+def _history(cattle_id, heat_dates, calving=None, inseminated=False, confirmed=None):
+    """Filas como las de get_herd_heat_history(); solo el último celo lleva inseminación"""
+    return [
+        (UUID(int=cattle_id), f"LOTE-{cattle_id}", f"Vaca {cattle_id}", calving, day, inseminated and index == len(heat_dates) - 1,
+         confirmed if index == len(heat_dates) - 1 else None, UUID(int=cattle_id * 100 + index))
+        for index, day in enumerate(heat_dates)
+    ]
+
+
+def test_regular_cycles_project_the_next_heat():
+    rows = _history(1, [date(2026, 1, 1), date(2026, 1, 22), date(2026, 2, 12)])
+    forecast = predict_heats(rows, TODAY)
+    [prediction] = forecast.expected_between(TODAY, TODAY + timedelta(days=30))
+    assert prediction.expected_date == date(2026, 3, 5)
+    assert prediction.cycle_days == 21.0
+    assert prediction.observed_cycles == 2
+    assert prediction.last_heat_id == UUID(int=102)
+
+
+def test_missed_heats_are_not_counted_as_cycles():
+    rows = _history(1, [date(2026, 1, 1), date(2026, 2, 12)])
+    [prediction] = predict_heats(rows, TODAY).expected_between(TODAY, TODAY + timedelta(days=30))
+    assert prediction.observed_cycles == 0
+    assert prediction.cycle_days == HEAT_CYCLE_DAYS
+    assert prediction.expected_date == date(2026, 3, 5)
+
+
+def test_excluded_animals():
+    rows = (
+        _history(1, [date(2026, 2, 1)], inseminated=True)
+        + _history(2, [date(2026, 2, 1)], calving=date(2026, 2, 10))
+        + _history(3, [date(2025, 6, 1)])
+        + _history(4, [date(2026, 2, 1)], inseminated=True, confirmed=False)
+    )
+    forecast = predict_heats(rows, TODAY)
+    assert list(forecast.cattle_ids) == [UUID(int=4)]
+
+
+def test_predictions_are_sorted_by_expected_date():
+    rows = _history(1, [date(2026, 2, 20)]) + _history(2, [date(2026, 2, 10)])
+    predictions = predict_heats(rows, TODAY).expected_between(TODAY, TODAY + timedelta(days=30))
+    assert [p.cattle_id for p in predictions] == [UUID(int=2), UUID(int=1)]
+
+
+def test_empty_history():
+    assert predict_heats([], TODAY).expected_between(TODAY, TODAY + timedelta(days=30)) == []
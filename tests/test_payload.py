@@ -0,0 +1,40 @@
+# tests/test_payload.py
+from datetime import date
+from types import SimpleNamespace
+
+from src.services.tools.payload import CHARS_PER_TOKEN, build_payload, estimate_tokens
+from src.services.tools.render import Field, RowsPart, RowTemplate, ToolOutput
+
+
+def test_short_result_is_sent_whole_without_decoration():
+    payload = build_payload("✅ Ganado registrado\n\n- Lote: LOTE-001", token_budget=100)
+    assert payload.text == "Ganado registrado\n- Lote: LOTE-001"
+    assert payload.rows == payload.rows_sent == 2
+    assert payload.tokens == estimate_tokens(payload.text)
+
+
+def test_result_is_cut_at_the_budget_with_a_notice():
+    lines = [f"Línea {index:03d} con datos del animal" for index in range(200)]
+    payload = build_payload("\n".join(lines), token_budget=100)
+
+    sent, notice = payload.text.rsplit("\n", 1)
+    assert payload.rows == 200
+    assert 0 < payload.rows_sent < 200
+    assert sent.splitlines() == lines[:payload.rows_sent]
+    assert len(sent) <= 100 * CHARS_PER_TOKEN
+    assert notice == f"... y {200 - payload.rows_sent} líneas más que no se enviaron (límite de 100 tokens)"
+    assert payload.tokens <= 100
+
+
+def test_rows_are_sent_as_a_table_without_empty_columns():
+    template = RowTemplate(
+        title=lambda row, day: row.name,
+        fields=(Field("Lote", "lote"), Field("Raza", "breed")),
+        icon="🐄",
+        title_label="Nombre"
+    )
+    rows = [SimpleNamespace(name="Margarita", lote="LOTE-001", breed=None), SimpleNamespace(name="Bella", lote="LOTE-002", breed="")]
+    part = RowsPart(template, rows, "📋 Ganado (2):", None, date(2026, 1, 1))
+    payload = build_payload(ToolOutput("", [part]), token_budget=100)
+    assert payload.text == "Ganado (2):\nNombre | Lote\nMargarita | LOTE-001\nBella | LOTE-002"
+    assert payload.rows == payload.rows_sent == 2
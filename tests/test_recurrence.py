@@ -0,0 +1,43 @@
+# tests/test_recurrence.py
+from datetime import date
+
+from src.core.recurrence import RecurrenceFrequencyEnum, iter_occurrences, nth_occurrence
+
+
+MONTHLY = RecurrenceFrequencyEnum.monthly
+YEARLY = RecurrenceFrequencyEnum.yearly
+
+
+def test_monthly_series_uses_last_day_of_shorter_months():
+    occurrences = list(iter_occurrences(date(2026, 1, 31), MONTHLY, 1, date(2026, 1, 1), date(2026, 5, 31)))
+    assert occurrences == [date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30), date(2026, 5, 31)]
+
+
+def test_monthly_series_reaches_feb_29_in_leap_years():
+    assert nth_occurrence(date(2024, 1, 31), MONTHLY, 1, 1) == date(2024, 2, 29)
+    assert nth_occurrence(date(2024, 1, 30), MONTHLY, 1, 1) == date(2024, 2, 29)
+
+
+def test_yearly_series_from_feb_29():
+    occurrences = list(iter_occurrences(date(2024, 2, 29), YEARLY, 1, date(2024, 1, 1), date(2028, 12, 31)))
+    assert occurrences == [date(2024, 2, 29), date(2025, 2, 28), date(2026, 2, 28), date(2027, 2, 28), date(2028, 2, 29)]
+
+
+def test_window_starts_inside_a_clipped_month():
+    # La ocurrencia de febrero queda recortada antes del día 31: la ventana no debe saltársela
+    occurrences = list(iter_occurrences(date(2024, 1, 31), MONTHLY, 1, date(2024, 2, 29), date(2024, 4, 30)))
+    assert occurrences == [date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)]
+
+
+def test_window_far_from_start_keeps_the_day_of_month():
+    occurrences = list(iter_occurrences(date(2020, 1, 31), MONTHLY, 2, date(2026, 8, 1), date(2026, 12, 31)))
+    assert occurrences == [date(2026, 9, 30), date(2026, 11, 30)]
+
+
+def test_count_and_until_end_the_series():
+    assert list(iter_occurrences(date(2026, 1, 31), MONTHLY, 1, date(2026, 2, 1), date(2026, 12, 31), count=3)) == [
+        date(2026, 2, 28), date(2026, 3, 31)
+    ]
+    assert list(iter_occurrences(date(2026, 1, 31), MONTHLY, 1, date(2026, 1, 1), date(2026, 12, 31), until=date(2026, 3, 30))) == [
+        date(2026, 1, 31), date(2026, 2, 28)
+    ]